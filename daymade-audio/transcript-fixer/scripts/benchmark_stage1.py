@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = [
+#     "filelock>=3.13.0",
+#     "jieba>=0.42.1",
+# ]
+# ///
+"""
+Stage 1 benchmark on a synthetic transcript.
+
+Generates a deterministic transcript (default ~2 MB, Chinese-like text with
+speaker lines) and a dictionary (default 5,000 rules, a slice of which is
+planted in the text), then reports:
+
+1. line-number resolution for every hit: the old per-hit
+   `text[:pos].count('\\n') + 1` versus one LineIndex + bisect lookups
+2. end-to-end DictionaryProcessor.process() wall time
+
+No network, no database: everything runs in memory.
+
+Usage:
+    uv run scripts/benchmark_stage1.py
+    uv run scripts/benchmark_stage1.py --size-mb 4 --rules 10000 --hits 40000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.dictionary_processor import DictionaryProcessor
+from utils.line_index import LineIndex
+
+# Rare CJK block: planted rules are the only way a rule can hit.
+_ALPHABET = [chr(cp) for cp in range(0x4E00, 0x4E00 + 3000)]
+
+
+def build_corpus(
+    size_chars: int, rule_count: int, hit_count: int, seed: int
+) -> Tuple[str, Dict[str, str]]:
+    """Return (transcript, corrections) with `hit_count` planted rule hits."""
+    rng = random.Random(seed)
+    corrections: Dict[str, str] = {}
+    while len(corrections) < rule_count:
+        wrong = "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(4, 6)))
+        corrections[wrong] = f"R{len(corrections)}"
+    planted = list(corrections)[: max(1, rule_count // 10)]
+
+    parts: List[str] = []
+    produced = 0
+    hit_every = max(1, size_chars // max(1, hit_count))
+    next_hit = hit_every
+    line_no = 0
+    while produced < size_chars:
+        if produced >= next_hit:
+            word = rng.choice(planted)
+            next_hit += hit_every
+        else:
+            word = "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(1, 3)))
+        parts.append(word)
+        produced += len(word)
+        if rng.random() < 0.03:
+            line_no += 1
+            speaker = f"\n\nSpeaker {line_no % 3 + 1} {line_no // 60:02d}:{line_no % 60:02d}\n"
+            parts.append(speaker)
+            produced += len(speaker)
+    return "".join(parts), corrections
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size-mb", type=float, default=2.0,
+                        help="Transcript size in MB of UTF-8 (default: 2)")
+    parser.add_argument("--rules", type=int, default=5000,
+                        help="Dictionary size (default: 5000)")
+    parser.add_argument("--hits", type=int, default=20000,
+                        help="Planted rule occurrences (default: 20000)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # CJK is 3 bytes per char in UTF-8.
+    size_chars = int(args.size_mb * 1024 * 1024 / 3)
+    text, corrections = build_corpus(size_chars, args.rules, args.hits, args.seed)
+    print(f"transcript: {len(text.encode('utf-8')) / 1e6:.2f} MB, "
+          f"{text.count(chr(10)) + 1} lines; dictionary: {len(corrections)} rules")
+
+    processor = DictionaryProcessor(corrections, [])
+    matcher, _, _ = processor._get_matcher()
+    positions = [pos for pos, _ in matcher.iter_matches(text)]
+    print(f"hits: {len(positions)}")
+
+    legacy, legacy_s = _timed(
+        lambda: [text[:pos].count("\n") + 1 for pos in positions]
+    )
+
+    def indexed():
+        line_index = LineIndex(text)
+        return [line_index.line_of(pos) for pos in positions]
+
+    fast, fast_s = _timed(indexed)
+    assert legacy == fast, "line numbers diverged"
+    print(f"line numbers  prefix-count: {legacy_s:8.3f}s   "
+          f"LineIndex: {fast_s:8.3f}s   speedup: {legacy_s / max(fast_s, 1e-9):.0f}x")
+
+    (_, changes), process_s = _timed(lambda: processor.process(text))
+    print(f"Stage 1 process(): {process_s:.3f}s, {len(changes)} changes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
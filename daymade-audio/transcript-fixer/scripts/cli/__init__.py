@@ -14,6 +14,7 @@ from .commands import (
     cmd_export_corrections,
     cmd_import_corrections,
     cmd_run_correction,
+    cmd_run_batch_correction,
     cmd_review_learned,
     cmd_approve,
     cmd_validate,
@@ -43,6 +44,7 @@ __all__ = [
     'cmd_export_corrections',
     'cmd_import_corrections',
     'cmd_run_correction',
+    'cmd_run_batch_correction',
     'cmd_review_learned',
     'cmd_approve',
     'cmd_validate',
@@ -79,6 +79,31 @@ def create_argument_parser() -> argparse.ArgumentParser:
         "--input", "-i",
         help="Input file"
     )
+    parser.add_argument(
+        "--input-dir",
+        metavar="DIR",
+        dest="input_dir",
+        help="Batch mode: correct every transcript in DIR matching --glob. Loads the "
+             "dictionary once, runs Stage 1 across --jobs worker processes and Stage 2 "
+             "through one shared AI session; writes the usual per-file sidecars plus "
+             "batch_summary.json (per-file status and timings) into --output or DIR"
+    )
+    parser.add_argument(
+        "--glob",
+        metavar="PATTERN",
+        dest="input_glob",
+        default="*.md",
+        help="File pattern for --input-dir, relative to DIR (default: *.md; use "
+             "'**/*.md' to recurse). Sidecars such as *_stage1.md are always skipped"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        metavar="N",
+        default=None,
+        help="Stage 1 worker processes for --input-dir (default: CPU count, capped "
+             "at the number of files; 1 = in-process)"
+    )
     parser.add_argument(
         "--output", "-o",
         help="Output directory"
@@ -90,6 +115,15 @@ def create_argument_parser() -> argparse.ArgumentParser:
         default=3,
         help="Run stage (1=dict, 2=AI, 3=full)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        dest="no_cache",
+        help="Stage 2: bypass the on-disk response cache "
+             "(~/.transcript-fixer/cache/stage2_responses.db). By default a chunk "
+             "whose prompt, context and model are unchanged since an earlier run "
+             "is answered from the cache with no API call"
+    )
     parser.add_argument(
         "--domain", "-d",
         default=None,
@@ -10,11 +10,14 @@ All cmd_* functions take parsed args and execute the requested operation.
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
 import os
 import shutil
 import sys
 import tempfile
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from core import (
@@ -666,22 +669,68 @@ def cmd_import_corrections(args: argparse.Namespace) -> None:
     print(f"   Skipped: {skipped}")
 
 
+def _stage2_response_cache(args: argparse.Namespace, config):
+    """On-disk Stage 2 response cache, or None under --no-cache / when
+    caching is disabled by the enable_caching feature flag."""
+    if getattr(args, "no_cache", False) or not config.features.enable_caching:
+        return None
+    from core.response_cache import CACHE_FILENAME, ResponseCache
+    return ResponseCache(config.paths.cache_dir / CACHE_FILENAME)
+
+
+def _stage2_rate_limiter(config):
+    """Request-rate limit for Stage 2 API calls from resources.rate_limit_*,
+    or None when the enable_rate_limiting feature flag is off."""
+    if not config.features.enable_rate_limiting:
+        return None
+    from utils.rate_limiter import RateLimitConfig, RateLimiter
+    return RateLimiter(RateLimitConfig(
+        max_requests=config.resources.rate_limit_requests,
+        window_seconds=config.resources.rate_limit_window_seconds,
+    ))
+
+
 def cmd_run_correction(args: argparse.Namespace) -> dict | None:
     """Run the correction workflow.
 
     Heavy imports (AIProcessor, diff generator) are loaded only when Stage 2/3
     is requested, keeping --stage 1 startup fast.
     """
-    from core import AIProcessor
-    from core.defaults import API_BASE_URL
-    from utils.diff_generator import generate_full_report
-
     # Validate input file
     input_path = Path(args.input)
     if not input_path.exists():
         print(f"❌ Error: File not found: {input_path}")
         sys.exit(1)
 
+    output_dir, stage1_output_override = _resolve_output_location(args, input_path)
+
+    finalized_status = _auto_finalize_for_run(args, input_path, output_dir)
+    if finalized_status is not None:
+        return finalized_status
+
+    setup = _load_correction_setup(args)
+    try:
+        original_text = _read_input_text(input_path)
+    except _InputRejected as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    try:
+        return _correct_file(
+            args, input_path, output_dir, stage1_output_override, setup, original_text,
+        )
+    except _MissingAPIKey:
+        sys.exit(1)
+
+
+def _resolve_output_location(
+    args: argparse.Namespace, input_path: Path, input_root: Path | None = None,
+) -> tuple[Path, Path | None]:
+    """Return (output_dir, stage1_output_override) and create output_dir.
+
+    input_root is the batch --input-dir: with --output DIR, each file's
+    sidecars go to the same relative subdirectory under DIR, so recursive
+    globs cannot make same-stem files overwrite each other's sidecars.
+    """
     # Setup output location. --output may be a DIRECTORY (the tool writes the
     # <stem>_stage1.md / _changes.md / _needs_review.md sidecars into it) or a
     # FILE path (the corrected Stage 1 output is written directly to that file).
@@ -697,10 +746,19 @@ def cmd_run_correction(args: argparse.Namespace) -> dict | None:
             output_dir = out_arg.parent
         else:
             output_dir = out_arg
+            if input_root is not None:
+                output_dir = output_dir / input_path.parent.relative_to(input_root)
     else:
         output_dir = input_path.parent
     output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir, stage1_output_override
 
+
+def _auto_finalize_for_run(
+    args: argparse.Namespace, input_path: Path, output_dir: Path
+) -> dict | None:
+    """Run the pre-Stage-1 auto-finalize step; return the run's final status
+    when it already completed the run (--stage 1), else None."""
     # Auto-finalize: if a previous Stage 1 run left *_stage1.md behind and it is
     # newer than the input file, promote it to the input file and clean up
     # sidecars before running Stage 1 again. This replaces the manual finalize
@@ -737,7 +795,26 @@ def cmd_run_correction(args: argparse.Namespace) -> dict | None:
                 "stage2_failed_chunks": 0,
                 "stage2_degraded": False,
             }
+    return None
+
 
+@dataclass
+class _CorrectionSetup:
+    """Everything a correction run loads before touching a transcript.
+
+    Built once per invocation; a batch run shares one across every file.
+    """
+    service: CorrectionService
+    domains: list[str] | None
+    corrections: dict[str, str]
+    correction_meta: dict[str, dict]
+    context_rules: list[dict]
+    domain_stats: dict
+    speaker_labels: set[str] = field(default_factory=set)
+
+
+def _load_correction_setup(args: argparse.Namespace) -> _CorrectionSetup:
+    """Open the repository and load corrections, context rules and roster."""
     # Initialize service
     service = _get_service()
 
@@ -827,26 +904,83 @@ def cmd_run_correction(args: argparse.Namespace) -> dict | None:
         else:
             print(f"⚠️  People roster not found: {roster_path}")
 
+    return _CorrectionSetup(
+        service=service,
+        domains=domains,
+        corrections=corrections,
+        correction_meta=correction_meta,
+        context_rules=context_rules,
+        domain_stats=domain_stats,
+        speaker_labels=speaker_labels,
+    )
+
+
+class _InputRejected(Exception):
+    """Input file exceeds the configured resource limits."""
+
+
+class _MissingAPIKey(Exception):
+    """Stage 2 was requested but no API key is configured."""
+
+
+def _read_input_text(input_path: Path) -> str:
+    """Read a transcript, enforcing the configured size limits.
+
+    Raises:
+        _InputRejected: file or text exceeds max_file_size / max_text_length.
+    """
     # Read input file
     print(f"📖 Reading: {input_path.name}")
     runtime_config = get_config()
     file_size = input_path.stat().st_size
     if file_size > runtime_config.resources.max_file_size:
-        print(
-            "❌ Error: input file exceeds configured max_file_size "
+        raise _InputRejected(
+            "input file exceeds configured max_file_size "
             f"({file_size} > {runtime_config.resources.max_file_size} bytes)"
         )
-        sys.exit(1)
     with open(input_path, 'r', encoding='utf-8') as f:
         original_text = f.read()
     if len(original_text) > runtime_config.resources.max_text_length:
-        print(
-            "❌ Error: input text exceeds configured max_text_length "
+        raise _InputRejected(
+            "input text exceeds configured max_text_length "
             f"({len(original_text)} > "
             f"{runtime_config.resources.max_text_length} characters)"
         )
-        sys.exit(1)
     print(f"   File size: {len(original_text):,} characters")
+    return original_text
+
+
+def _correct_file(
+    args: argparse.Namespace,
+    input_path: Path,
+    output_dir: Path,
+    stage1_output_override: Path | None,
+    setup: _CorrectionSetup,
+    original_text: str,
+    *,
+    stage1_result: tuple[str, list] | None = None,
+    ai_processor=None,
+    timings: dict | None = None,
+) -> dict:
+    """Run Stages 1-3 on one already-read transcript and return its status.
+
+    stage1_result lets a batch hand in Stage 1 output computed in a worker
+    process; ai_processor lets it share one Stage 2 processor (and event
+    loop) across files. Both default to today's single-file behaviour.
+    """
+    from core import AIProcessor
+    from core.defaults import API_BASE_URL
+    from utils.diff_generator import generate_full_report
+
+    dry_run = getattr(args, 'dry_run', False)
+    apply_all = getattr(args, 'apply_all', False)
+    service = setup.service
+    domains = setup.domains
+    corrections = setup.corrections
+    correction_meta = setup.correction_meta
+    context_rules = setup.context_rules
+    domain_stats = setup.domain_stats
+    speaker_labels = setup.speaker_labels
 
     # Show domain loading info
     if domains:
@@ -907,7 +1041,10 @@ def cmd_run_correction(args: argparse.Namespace) -> dict | None:
             correction_meta,
             speaker_labels=speaker_labels,
         )
-        stage1_text, stage1_changes = processor.process(original_text, review_mode=review_mode)
+        if stage1_result is not None:
+            stage1_text, stage1_changes = stage1_result
+        else:
+            stage1_text, stage1_changes = processor.process(original_text, review_mode=review_mode)
 
         summary = processor.get_summary(stage1_changes)
         risk_counts = {"low": 0, "medium": 0, "high": 0}
@@ -1027,17 +1164,29 @@ def cmd_run_correction(args: argparse.Namespace) -> dict | None:
             config_dir = config.paths.config_dir
             print(f"   Add it to {config_dir}/config.json under api.api_key,")
             print("   or set GLM_API_KEY or ANTHROPIC_API_KEY environment variable.")
-            sys.exit(1)
-
-        ai_processor = AIProcessor(
-            api_key,
-            base_url=config.api.base_url or API_BASE_URL,
-            max_concurrent=config.resources.max_concurrent_tasks,
-            speaker_labels=speaker_labels,
-        )
+            # Not sys.exit(): a batch run records this per file and still
+            # writes its summary; cmd_run_correction turns it into exit 1.
+            raise _MissingAPIKey("API key not configured")
+
+        if ai_processor is None:
+            ai_processor = AIProcessor(
+                api_key,
+                base_url=config.api.base_url or API_BASE_URL,
+                max_concurrent=config.resources.max_concurrent_tasks,
+                speaker_labels=speaker_labels,
+                response_cache=_stage2_response_cache(args, config),
+                rate_limiter=_stage2_rate_limiter(config),
+            )
+        stage2_started = time.perf_counter()
         stage2_text, stage2_changes = ai_processor.process(stage1_text)
+        if timings is not None:
+            timings["stage2_s"] = round(time.perf_counter() - stage2_started, 3)
         stage2_failed_chunks = ai_processor.failed_chunks
         stage2_total_chunks = ai_processor.total_chunks
+        cache_hits = getattr(ai_processor, "cache_hits", 0)
+        if cache_hits:
+            print(f"♻️  {cache_hits}/{stage2_total_chunks} chunks "
+                  "answered from the response cache")
 
         models_used = sorted(ai_processor.models_used)
         if len(models_used) == 1:
@@ -1181,6 +1330,221 @@ def cmd_run_correction(args: argparse.Namespace) -> dict | None:
     }
 
 
+# Batch mode: one warm setup, Stage 1 in a process pool, Stage 2 on one loop.
+BATCH_SUMMARY_FILENAME = "batch_summary.json"
+
+# Per-worker DictionaryProcessor: built once by the pool initializer so the
+# dictionary automaton and context-rule bundle compile once per worker, not
+# once per file.
+_stage1_worker_processor: DictionaryProcessor | None = None
+
+
+def _init_stage1_worker(
+    corrections: dict[str, str],
+    context_rules: list[dict],
+    correction_meta: dict[str, dict],
+    speaker_labels: set[str],
+) -> None:
+    global _stage1_worker_processor
+    _stage1_worker_processor = DictionaryProcessor(
+        corrections, context_rules, correction_meta, speaker_labels=speaker_labels,
+    )
+
+
+def _stage1_worker(text: str, review_mode: bool) -> tuple[str, list, float]:
+    """Stage 1 for one transcript inside a pool worker."""
+    started = time.perf_counter()
+    stage1_text, changes = _stage1_worker_processor.process(text, review_mode=review_mode)
+    return stage1_text, changes, time.perf_counter() - started
+
+
+def _collect_batch_inputs(input_dir: Path, pattern: str) -> list[Path]:
+    """Transcripts under input_dir matching pattern, minus our own sidecars
+    (a rerun must not feed *_stage1.md / *_changes.md back in as inputs)."""
+    return sorted(
+        path for path in input_dir.glob(pattern)
+        if path.is_file()
+        and not any(path.name.endswith(suffix) for suffix in STAGE1_SIDECAR_SUFFIXES)
+    )
+
+
+def _run_stage1_batch(
+    setup: _CorrectionSetup, texts: list[str], review_mode: bool, jobs: int,
+) -> list[tuple[str, list, float] | BaseException]:
+    """Stage 1 for every text, in input order. A failed file yields its
+    exception instead of aborting the batch."""
+    initargs = (
+        setup.corrections, setup.context_rules, setup.correction_meta,
+        setup.speaker_labels,
+    )
+    results: list[tuple[str, list, float] | BaseException] = []
+    if jobs <= 1 or len(texts) <= 1:
+        _init_stage1_worker(*initargs)
+        for text in texts:
+            try:
+                results.append(_stage1_worker(text, review_mode))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_stage1_worker, initargs=initargs,
+    ) as pool:
+        futures = [pool.submit(_stage1_worker, text, review_mode) for text in texts]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+    return results
+
+
+def cmd_run_batch_correction(args: argparse.Namespace) -> dict:
+    """Run the correction workflow over every transcript in --input-dir.
+
+    Loads the repository, dictionary, context rules and roster ONCE, runs
+    Stage 1 for all files across a process pool (--jobs), then writes each
+    file's sidecars and runs Stage 2/3 in input order through one shared
+    AIProcessorAsync session. Per-file sidecars are exactly what a
+    single-file run writes; a JSON summary with per-file status and timings
+    goes to <output>/batch_summary.json (and stdout under --json).
+    """
+    if args.input:
+        print("❌ Error: --input and --input-dir are mutually exclusive")
+        sys.exit(1)
+    input_dir = Path(args.input_dir)
+    if not input_dir.is_dir():
+        print(f"❌ Error: Directory not found: {input_dir}")
+        sys.exit(1)
+    if args.output:
+        out_arg = Path(args.output)
+        if not out_arg.is_dir() and out_arg.suffix.lower() in ('.md', '.markdown', '.txt'):
+            print("❌ Error: with --input-dir, --output must be a directory")
+            sys.exit(1)
+
+    pattern = getattr(args, "input_glob", None) or "*.md"
+    inputs = _collect_batch_inputs(input_dir, pattern)
+    if not inputs:
+        print(f"❌ Error: no transcripts matching '{pattern}' in {input_dir}")
+        sys.exit(1)
+    jobs = getattr(args, "jobs", None) or min(len(inputs), os.cpu_count() or 1)
+
+    batch_started = time.perf_counter()
+    print(f"📦 Batch: {len(inputs)} transcript(s) from {input_dir} (jobs={jobs})")
+    setup = _load_correction_setup(args)
+    review_mode = not getattr(args, 'apply_all', False)
+    dry_run = getattr(args, 'dry_run', False)
+
+    # Phase 1 (serial): auto-finalize and read. Auto-finalize rewrites the
+    # input file, so it must finish before Stage 1 reads it.
+    entries: list[dict] = []
+    pending: list[tuple[dict, Path, Path, Path | None, str]] = []
+    for input_path in inputs:
+        entry = {"input": str(input_path), "status": None, "error": None, "timings": {}}
+        entries.append(entry)
+        file_started = time.perf_counter()
+        output_dir, stage1_output_override = _resolve_output_location(
+            args, input_path, input_root=input_dir,
+        )
+        finalized_status = _auto_finalize_for_run(args, input_path, output_dir)
+        if finalized_status is not None:
+            entry["status"] = finalized_status
+            entry["timings"]["total_s"] = round(time.perf_counter() - file_started, 3)
+            continue
+        try:
+            original_text = _read_input_text(input_path)
+        except (_InputRejected, OSError, UnicodeDecodeError) as e:
+            print(f"❌ Error: {input_path.name}: {e}")
+            entry["error"] = str(e)
+            continue
+        entry["timings"]["read_s"] = round(time.perf_counter() - file_started, 3)
+        pending.append((entry, input_path, output_dir, stage1_output_override, original_text))
+
+    # Phase 2 (parallel): Stage 1 compute only — no I/O, no printing.
+    stage1_results: list = []
+    if args.stage >= 1 and pending:
+        print(f"🔧 Stage 1 across {min(jobs, len(pending))} worker(s)...")
+        stage1_results = _run_stage1_batch(
+            setup, [item[4] for item in pending], review_mode, jobs,
+        )
+
+    # Phase 3 (serial, input order): sidecars, review queue, Stage 2/3 —
+    # identical to a single-file run, fed with the precomputed Stage 1 result.
+    ai_processor = None
+    config = get_config()
+    if args.stage >= 2 and not dry_run and config.api.api_key:
+        from core import AIProcessor
+        from core.defaults import API_BASE_URL
+        ai_processor = AIProcessor(
+            config.api.api_key,
+            base_url=config.api.base_url or API_BASE_URL,
+            max_concurrent=config.resources.max_concurrent_tasks,
+            speaker_labels=setup.speaker_labels,
+            response_cache=_stage2_response_cache(args, config),
+            rate_limiter=_stage2_rate_limiter(config),
+        )
+    with contextlib.ExitStack() as stack:
+        if ai_processor is not None and hasattr(ai_processor, "shared_session"):
+            stack.enter_context(ai_processor.shared_session())
+        for index, (entry, input_path, output_dir, override, original_text) in enumerate(pending):
+            print()
+            print(f"▶ [{index + 1}/{len(pending)}] {input_path.name}")
+            file_started = time.perf_counter()
+            stage1_result = None
+            if stage1_results:
+                outcome = stage1_results[index]
+                if isinstance(outcome, BaseException):
+                    print(f"❌ Stage 1 failed for {input_path.name}: {outcome}")
+                    entry["error"] = f"stage 1: {outcome}"
+                    continue
+                stage1_text, stage1_changes, stage1_seconds = outcome
+                stage1_result = (stage1_text, stage1_changes)
+                entry["timings"]["stage1_s"] = round(stage1_seconds, 3)
+            try:
+                entry["status"] = _correct_file(
+                    args, input_path, output_dir, override, setup, original_text,
+                    stage1_result=stage1_result,
+                    ai_processor=ai_processor,
+                    timings=entry["timings"],
+                )
+            except Exception as e:
+                print(f"❌ {input_path.name}: {type(e).__name__}: {e}")
+                entry["error"] = f"{type(e).__name__}: {e}"
+            entry["timings"]["total_s"] = round(
+                time.perf_counter() - file_started
+                + entry["timings"].get("read_s", 0.0)
+                + entry["timings"].get("stage1_s", 0.0),
+                3,
+            )
+
+    summary = {
+        "input_dir": str(input_dir),
+        "pattern": pattern,
+        "jobs": jobs,
+        "total_files": len(entries),
+        "succeeded": sum(1 for e in entries if e["error"] is None),
+        "failed": sum(1 for e in entries if e["error"] is not None),
+        "wall_time_s": round(time.perf_counter() - batch_started, 3),
+        "files": entries,
+    }
+    summary_dir = Path(args.output) if args.output else input_dir
+    summary_dir.mkdir(parents=True, exist_ok=True)
+    summary_path = summary_dir / BATCH_SUMMARY_FILENAME
+    if not dry_run:
+        summary_path.write_text(
+            json.dumps(summary, ensure_ascii=False, indent=2) + "\n", encoding="utf-8",
+        )
+    print()
+    print("=" * 60)
+    print(f"📦 Batch complete: {summary['succeeded']}/{summary['total_files']} succeeded "
+          f"in {summary['wall_time_s']:.1f}s")
+    if not dry_run:
+        print(f"🧾 Summary: {summary_path}")
+    return summary
+
+
 def cmd_review_learned(args: argparse.Namespace) -> None:
     """Review learned suggestions."""
     engine = _get_learning_engine()
@@ -1199,7 +1563,12 @@ def cmd_review_learned(args: argparse.Namespace) -> None:
         confidence = suggestion.get("confidence", 0)
         frequency = suggestion.get("frequency", 0)
         print(f"\n{idx}. [{domain}] '{suggestion['from_text']}' -> '{suggestion['to_text']}'")
-        print(f"   Frequency: {frequency} | Confidence: {confidence:.2f}")
+        files = suggestion.get("files") or 0
+        print(
+            f"   Frequency: {frequency}"
+            + (f" | Files: {files}" if files else "")
+            + f" | Confidence: {confidence:.2f}"
+        )
         models = suggestion.get("models") or []
         print(f"   Models: {', '.join(models) if models else 'unknown'}")
 
@@ -13,7 +13,7 @@ Features:
 
 from __future__ import annotations
 
-from typing import Collection, List, Tuple
+from typing import Collection, List, Optional, Tuple
 import httpx
 
 from .ai_utils import (
@@ -26,6 +26,8 @@ from .ai_utils import (
 from .defaults import (
     DEFAULT_MODEL,
     FALLBACK_MODEL,
+    MAX_CHUNK_TOKENS,
+    STAGE2_MAX_OUTPUT_TOKENS,
     API_BASE_URL,
     AUTH_HEADER_NAME,
     ANTHROPIC_VERSION,
@@ -42,6 +44,7 @@ from .protected_spans import (
     restore_speaker_labels,
     reveal_speaker_labels_for_reporting,
 )
+from .response_cache import ResponseCache, response_cache_key
 
 
 class AIProcessor:
@@ -58,7 +61,8 @@ class AIProcessor:
     def __init__(self, api_key: str, model: str = DEFAULT_MODEL,
                  base_url: str = API_BASE_URL,
                  fallback_model: str = FALLBACK_MODEL,
-                 speaker_labels: Collection[str] = ()):
+                 speaker_labels: Collection[str] = (),
+                 response_cache: Optional[ResponseCache] = None):
         """
         Initialize AI processor
 
@@ -68,17 +72,22 @@ class AIProcessor:
             base_url: API base URL
             fallback_model: Fallback model on primary failure
             speaker_labels: Explicit bare labels from a roster/manifest
+            response_cache: Optional on-disk cache of chunk responses; an
+                          identical request is answered without an API call
         """
         self.api_key = api_key
         self.model = model
         self.fallback_model = fallback_model
         self.base_url = base_url
         self.max_chunk_size = 6000  # Characters per chunk
+        self.max_chunk_tokens = MAX_CHUNK_TOKENS  # Estimated tokens per chunk
         self.change_extractor = ChangeExtractor()
         self.models_used: set[str] = set()
         self.speaker_labels = set(speaker_labels)
+        self.response_cache = response_cache
         self.total_chunks = 0
         self.failed_chunks = 0
+        self.cache_hits = 0
 
     def process(self, text: str, context: str = "") -> Tuple[str, List[AIChange]]:
         """
@@ -96,9 +105,12 @@ class AIProcessor:
             ledger_projected_text, self.speaker_labels
         )
         self.models_used.clear()
-        chunks = split_into_chunks(projected_text, self.max_chunk_size)
+        chunks = split_into_chunks(
+            projected_text, self.max_chunk_size, self.max_chunk_tokens
+        )
         self.total_chunks = len(chunks)
         self.failed_chunks = 0
+        self.cache_hits = 0
         corrected_chunks = []
         all_changes = []
 
@@ -187,12 +199,27 @@ class AIProcessor:
 
         data = {
             "model": model,
-            "max_tokens": 8000,
+            "max_tokens": STAGE2_MAX_OUTPUT_TOKENS,
             "temperature": 0.3,
             "messages": [{"role": "user", "content": prompt}]
         }
 
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = response_cache_key(
+                prompt, model,
+                max_tokens=data["max_tokens"], temperature=data["temperature"],
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached
+
         with httpx.Client(timeout=API_TIMEOUT, http2=False) as client:
             response = client.post(url, headers=headers, json=data)
             response.raise_for_status()
-            return parse_anthropic_response(response.json())
+            corrected = parse_anthropic_response(response.json())
+
+        if cache_key is not None:
+            self.response_cache.put(cache_key, model, corrected)
+        return corrected
@@ -23,8 +23,10 @@ from __future__ import annotations
 import asyncio
 import gc
 import logging
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Collection, List, Tuple, Optional, Final
+from typing import Callable, Collection, Iterator, List, Tuple, Optional, Final
 import httpx
 
 from .ai_utils import (
@@ -43,16 +45,20 @@ from .dictionary_processor import (
 from .defaults import (
     DEFAULT_MODEL,
     FALLBACK_MODEL,
+    MAX_CHUNK_TOKENS,
+    STAGE2_MAX_OUTPUT_TOKENS,
     API_BASE_URL,
     AUTH_HEADER_NAME,
     ANTHROPIC_VERSION,
     API_TIMEOUT,
+    STAGE2_TARGET_LATENCY,
 )
 from .protected_spans import (
     mask_speaker_labels,
     restore_speaker_labels,
     reveal_speaker_labels_for_reporting,
 )
+from .response_cache import ResponseCache, response_cache_key
 
 # CRITICAL FIX: Import structured logging and retry logic
 import sys
@@ -60,6 +66,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.logging_config import TimedLogger, ErrorCounter
 from utils.retry_logic import retry_async, RetryConfig
+from utils.concurrency_manager import ConcurrencyConfig, ConcurrencyManager
+from utils.metrics import MetricsCollector, get_metrics
+from utils.rate_limiter import RateLimiter
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -68,6 +77,8 @@ timed_logger = TimedLogger(logger)
 # CRITICAL FIX: Memory management constants
 MAX_CHANGES_TO_TRACK: Final[int] = 10_000  # Fail closed above this audit bound
 MEMORY_WARNING_THRESHOLD: Final[int] = 100  # Warn if >100 chunks
+# Chunks in flight or awaiting in-order emission, per unit of max_concurrent
+STREAM_WINDOW_FACTOR: Final[int] = 2
 
 
 @dataclass(frozen=True)
@@ -96,7 +107,11 @@ class AIProcessorAsync:
                  base_url: str = API_BASE_URL,
                  fallback_model: str = FALLBACK_MODEL,
                  max_concurrent: int = 5,
-                 speaker_labels: Collection[str] = ()):
+                 speaker_labels: Collection[str] = (),
+                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 metrics: Optional[MetricsCollector] = None):
         """
         Initialize AI processor with async support
 
@@ -106,10 +121,21 @@ class AIProcessorAsync:
             base_url: API base URL
             fallback_model: Fallback model on primary failure
             speaker_labels: Explicit bare labels from a roster/manifest
+            progress_callback: Called as (done_chunks, total_chunks) each time
+                          a chunk is finished, in chunk order
+            response_cache: Optional on-disk cache of chunk responses; an
+                          identical request is answered without an API call
+            rate_limiter: Optional request-rate limit applied to every real
+                          API request (cache hits are free)
+            metrics: Collector for the admission gauges (default: the
+                          process-wide utils.metrics collector)
             max_concurrent: Maximum concurrent API requests (default: 5)
                           - Higher = faster but more API load
                           - Lower = slower but more conservative
                           - Recommended: 3-7 for GLM API
+                          The live limit adapts below this ceiling (AIMD):
+                          halved on HTTP 429 or slow responses, +1 per
+                          healthy round
 
         CRITICAL FIX (P1-3): Added shared httpx client for connection pooling
         """
@@ -118,16 +144,48 @@ class AIProcessorAsync:
         self.fallback_model = fallback_model
         self.base_url = base_url
         self.max_chunk_size = 6000  # Characters per chunk
+        self.max_chunk_tokens = MAX_CHUNK_TOKENS  # Estimated tokens per chunk
         self.max_concurrent = max_concurrent  # Concurrency limit
         self.change_extractor = ChangeExtractor()  # For learning from AI results
         self.models_used: set[str] = set()
         self.speaker_labels = set(speaker_labels)
+        self.progress_callback = progress_callback
+        self.response_cache = response_cache
         self.total_chunks = 0
         self.failed_chunks = 0
+        self.cache_hits = 0
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics or get_metrics()
+        self._rate_wait_histogram = self.metrics.register_histogram(
+            "stage2_api_rate_limit_wait_seconds",
+            "Time Stage 2 requests waited for the request-rate limit",
+        )
+        # One admission-control layer for every API attempt: adaptive slot
+        # limit, circuit breaker, and live gauges (stage2_api_limit,
+        # stage2_api_active, stage2_api_queue_depth, ...). The streaming
+        # window already bounds how many chunks can queue, so backpressure
+        # rejection is off; a queued attempt waits at most one API timeout
+        # per window slot ahead of it.
+        self.admission = ConcurrencyManager(
+            ConcurrencyConfig(
+                max_concurrent=max_concurrent,
+                max_concurrent_ceiling=max_concurrent,
+                min_concurrent=1,
+                enable_adaptive_tuning=True,
+                max_response_time=STAGE2_TARGET_LATENCY,
+                enable_backpressure=False,
+                timeout=API_TIMEOUT * (max(1, max_concurrent) * STREAM_WINDOW_FACTOR + 1),
+            ),
+            metrics=self.metrics,
+            name="stage2_api",
+        )
 
         # CRITICAL FIX: Shared client for connection pooling (prevents connection leaks)
         self._http_client: Optional[httpx.AsyncClient] = None
         self._client_lock = asyncio.Lock()
+        # Set while a shared_session() is open: process() then runs on this
+        # long-lived loop instead of a fresh asyncio.run() per call.
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def _get_http_client(self) -> httpx.AsyncClient:
         """
@@ -160,6 +218,38 @@ class AIProcessorAsync:
                 self._http_client = None
                 logger.debug("Closed HTTP client")
 
+    @contextmanager
+    def shared_session(self) -> Iterator["AIProcessorAsync"]:
+        """
+        Keep one event loop (and one pooled HTTP client) alive across calls.
+
+        Inside the block every process() call is scheduled on a single
+        background loop, so a batch of files reuses warm keep-alive
+        connections instead of opening and closing a client per file. The
+        client is closed on that same loop when the block exits.
+        """
+        if self._session_loop is not None:
+            yield self
+            return
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(
+            target=loop.run_forever, name="stage2-event-loop", daemon=True
+        )
+        thread.start()
+        self._session_loop = loop
+        try:
+            yield self
+        finally:
+            self._session_loop = None
+            try:
+                asyncio.run_coroutine_threadsafe(
+                    self._close_http_client(), loop
+                ).result()
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+
     def process(self, text: str, context: str = "") -> Tuple[str, List[AIChange]]:
         """
         Process text with AI corrections (parallel)
@@ -173,6 +263,11 @@ class AIProcessorAsync:
 
         CRITICAL FIX (P1-3): Ensures HTTP client cleanup
         """
+        if self._session_loop is not None:
+            return asyncio.run_coroutine_threadsafe(
+                self._process_async(text, context), self._session_loop
+            ).result()
+
         # Run async processing in sync context
         async def _run_with_cleanup():
             try:
@@ -197,9 +292,12 @@ class AIProcessorAsync:
             ledger_projected_text, self.speaker_labels
         )
         self.models_used.clear()
-        chunks = split_into_chunks(projected_text, self.max_chunk_size)
+        chunks = split_into_chunks(
+            projected_text, self.max_chunk_size, self.max_chunk_tokens
+        )
         self.total_chunks = len(chunks)
         self.failed_chunks = 0
+        self.cache_hits = 0
         all_changes = []
 
         # CRITICAL FIX: Memory warning for large files
@@ -217,92 +315,99 @@ class AIProcessorAsync:
         # CRITICAL FIX: Error rate monitoring
         error_counter = ErrorCounter(threshold=0.3)  # Abort if >30% fail
 
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-
-        # Create tasks for all chunks
-        tasks = [
-            self._process_chunk_with_semaphore(
-                i, chunk, context, semaphore, len(chunks)
-            )
-            for i, chunk in enumerate(chunks, 1)
-        ]
-
-        # Wait for all tasks to complete
-        with timed_logger.timed("batch_processing", total_chunks=len(chunks)):
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Process results (maintaining order)
-        corrected_chunks = []
-        for i, (chunk, result) in enumerate(zip(chunks, results), 1):
-            if isinstance(result, Exception):
+        # Streaming pipeline: at most `window` chunks are in flight or waiting
+        # to be emitted, so intermediate results never scale with the number
+        # of chunks. Each chunk's change extraction (CPU-bound diffing) runs
+        # on a worker thread as soon as its API call returns, while other
+        # requests are still outstanding. Results are emitted strictly in
+        # chunk order, so error accounting, the change list and the
+        # MAX_CHANGES_TO_TRACK guard behave exactly as a gather-then-process
+        # pass would.
+        window = max(1, self.max_concurrent) * STREAM_WINDOW_FACTOR
+        total = len(chunks)
+        corrected_chunks: List[str] = []
+        in_flight: dict[asyncio.Task, int] = {}
+        ready: dict[int, tuple] = {}
+        next_to_launch = 0
+
+        def emit(i: int, chunk: str, outcome, extracted_changes) -> None:
+            if isinstance(outcome, BaseException):
                 logger.error(
-                    f"Chunk {i} raised exception: {result}",
-                    exc_info=True
+                    f"Chunk {i} raised exception: {outcome}",
+                    exc_info=outcome,
                 )
                 corrected_chunks.append(chunk)
                 error_counter.failure()
+                return
 
-            else:
-                if not isinstance(result, ChunkResult):
-                    logger.error(
-                        "Chunk %s returned unexpected result type %s; "
-                        "retaining original text",
-                        i,
-                        type(result).__name__,
-                    )
-                    corrected_chunks.append(chunk)
-                    error_counter.failure()
-                    continue
-
-                corrected_chunks.append(result.text)
-                if result.api_failed:
-                    error_counter.failure()
-                    continue
-
-                error_counter.success()
-                if result.model_used:
-                    self.models_used.add(result.model_used)
-
-                # Extract actual changes for learning
-                if result.text != chunk:
-                    source_for_report = reveal_speaker_labels_for_reporting(
-                        chunk, speaker_spans
-                    )
-                    corrected_for_report = reveal_speaker_labels_for_reporting(
-                        result.text, speaker_spans
-                    )
-                    source_for_report = reveal_ledger_values_for_reporting(
-                        source_for_report, ledger_spans
-                    )
-                    corrected_for_report = reveal_ledger_values_for_reporting(
-                        corrected_for_report, ledger_spans
-                    )
-                    extracted_changes = self.change_extractor.extract_changes(
-                        source_for_report, corrected_for_report
-                    )
+            if not isinstance(outcome, ChunkResult):
+                logger.error(
+                    "Chunk %s returned unexpected result type %s; "
+                    "retaining original text",
+                    i,
+                    type(outcome).__name__,
+                )
+                corrected_chunks.append(chunk)
+                error_counter.failure()
+                return
 
-                    if len(all_changes) + len(extracted_changes) > MAX_CHANGES_TO_TRACK:
-                        raise ValueError(
-                            "Stage 2 produced more than "
-                            f"{MAX_CHANGES_TO_TRACK} auditable changes; refusing "
-                            "to emit modified text with truncated history"
-                        )
-                    for change in extracted_changes:
-                        all_changes.append(AIChange(
-                            chunk_index=i,
-                            from_text=change.from_text,
-                            to_text=change.to_text,
-                            confidence=change.confidence,
-                            context_before=change.context_before,
-                            context_after=change.context_after,
-                            change_type=change.change_type,
-                            learnable=change.learnable,
-                            model=result.model_used,
+            corrected_chunks.append(outcome.text)
+            if outcome.api_failed:
+                error_counter.failure()
+                return
+
+            error_counter.success()
+            if outcome.model_used:
+                self.models_used.add(outcome.model_used)
+
+            if not extracted_changes:
+                return
+            if len(all_changes) + len(extracted_changes) > MAX_CHANGES_TO_TRACK:
+                raise ValueError(
+                    "Stage 2 produced more than "
+                    f"{MAX_CHANGES_TO_TRACK} auditable changes; refusing "
+                    "to emit modified text with truncated history"
+                )
+            for change in extracted_changes:
+                all_changes.append(AIChange(
+                    chunk_index=i,
+                    from_text=change.from_text,
+                    to_text=change.to_text,
+                    confidence=change.confidence,
+                    context_before=change.context_before,
+                    context_after=change.context_after,
+                    change_type=change.change_type,
+                    learnable=change.learnable,
+                    model=outcome.model_used,
+                ))
+
+        with timed_logger.timed("batch_processing", total_chunks=total):
+            try:
+                while len(corrected_chunks) < total:
+                    while (next_to_launch < total
+                           and next_to_launch - len(corrected_chunks) < window):
+                        task = asyncio.create_task(self._stream_chunk(
+                            next_to_launch + 1, chunks[next_to_launch], context,
+                            self.admission, total, speaker_spans, ledger_spans,
                         ))
+                        in_flight[task] = next_to_launch
+                        next_to_launch += 1
 
-                    # CRITICAL FIX: Explicitly release extracted_changes
-                    del extracted_changes
+                    done, _ = await asyncio.wait(
+                        in_flight, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        ready[in_flight.pop(task)] = task.result()
+
+                    while len(corrected_chunks) in ready:
+                        index = len(corrected_chunks)
+                        outcome, extracted_changes = ready.pop(index)
+                        emit(index + 1, chunks[index], outcome, extracted_changes)
+                        del outcome, extracted_changes
+                        self._report_progress(len(corrected_chunks), total)
+            finally:
+                for task in in_flight:
+                    task.cancel()
 
         # CRITICAL FIX: Force garbage collection for large files
         if len(chunks) > MEMORY_WARNING_THRESHOLD:
@@ -324,7 +429,8 @@ class AIProcessorAsync:
         logger.info(
             f"Batch processing completed: total_chunks={len(chunks)}, "
             f"successes={stats['total_successes']}, failures={stats['total_failures']}, "
-            f"failure_rate={stats['window_failure_rate']:.2%}, changes_extracted={len(all_changes)}"
+            f"failure_rate={stats['window_failure_rate']:.2%}, changes_extracted={len(all_changes)}, "
+            f"concurrency_limit={self.admission.config.max_concurrent}/{self.max_concurrent}"
         )
 
         corrected_text = reassemble_corrected_chunks(
@@ -336,100 +442,212 @@ class AIProcessorAsync:
             corrected_text = _restore_ledger_spans(corrected_text, ledger_spans)
         return corrected_text, all_changes
 
+    async def _stream_chunk(
+        self,
+        chunk_index: int,
+        chunk: str,
+        context: str,
+        admission: ConcurrencyManager,
+        total_chunks: int,
+        speaker_spans,
+        ledger_spans,
+    ) -> tuple:
+        """
+        Correct one chunk, then diff it on a worker thread.
+
+        Returns (outcome, extracted_changes): outcome is the ChunkResult or
+        the exception the chunk raised (never propagated, matching the old
+        gather(return_exceptions=True)); extracted_changes is None unless the
+        API succeeded and changed the text.
+        """
+        try:
+            result = await self._process_chunk_with_semaphore(
+                chunk_index, chunk, context, admission, total_chunks
+            )
+        except Exception as e:
+            return e, None
+        if (not isinstance(result, ChunkResult) or result.api_failed
+                or result.text == chunk):
+            return result, None
+        extracted_changes = await asyncio.to_thread(
+            self._extract_chunk_changes,
+            chunk, result.text, speaker_spans, ledger_spans,
+        )
+        return result, extracted_changes
+
+    def _extract_chunk_changes(self, chunk: str, corrected: str,
+                               speaker_spans, ledger_spans):
+        """Diff one chunk against its correction, in report (unmasked) form."""
+        source_for_report = reveal_speaker_labels_for_reporting(
+            chunk, speaker_spans
+        )
+        corrected_for_report = reveal_speaker_labels_for_reporting(
+            corrected, speaker_spans
+        )
+        source_for_report = reveal_ledger_values_for_reporting(
+            source_for_report, ledger_spans
+        )
+        corrected_for_report = reveal_ledger_values_for_reporting(
+            corrected_for_report, ledger_spans
+        )
+        return self.change_extractor.extract_changes(
+            source_for_report, corrected_for_report
+        )
+
+    def _report_progress(self, done: int, total: int) -> None:
+        """Publish incremental progress after each in-order chunk."""
+        admission = self.admission.get_metrics()
+        logger.info(
+            f"Stage 2 progress: {done}/{total} chunks "
+            f"(concurrency limit={admission.current_concurrency}, "
+            f"active={admission.active_operations}, "
+            f"queued={admission.queued_operations}, "
+            f"circuit={admission.circuit_state.value})"
+        )
+        if self.progress_callback is not None:
+            self.progress_callback(done, total)
+
     async def _process_chunk_with_semaphore(
         self,
         chunk_index: int,
         chunk: str,
         context: str,
-        semaphore: asyncio.Semaphore,
+        admission: ConcurrencyManager,
         total_chunks: int
     ) -> ChunkResult:
         """
-        Process chunk with concurrency control.
+        Process chunk with admission control.
+
+        Every API attempt (primary, retries, fallback) separately takes an
+        admission slot, so retry backoff never holds one. The response-cache
+        lookup and the rate-limiter wait happen before the slot is taken, so
+        only the HTTP call itself is timed by the adaptive limit and counted
+        in the active/queued gauges. While the circuit is open an attempt
+        fails fast with CircuitBreakerOpenError, which is not retried: the
+        chunk keeps its original text.
 
         CRITICAL FIX: Now uses structured logging and retry logic
         """
-        async with semaphore:
+        logger.info(
+            f"Processing chunk {chunk_index}/{total_chunks} "
+            f"(length={len(chunk)})"
+        )
+
+        async def admitted(model: str) -> str:
+            cache_key = self._response_cache_key(chunk, context, model)
+            if cache_key is not None:
+                cached = await asyncio.to_thread(self.response_cache.get, cache_key)
+                if cached is not None:
+                    self.cache_hits += 1
+                    return cached
+
+            if self.rate_limiter is not None:
+                waited = await self.rate_limiter.acquire_async()
+                if waited > 0:
+                    self._rate_wait_histogram.observe(waited)
+
+            async with admission.acquire():
+                corrected = await self._process_chunk_async(chunk, context, model)
+
+            if cache_key is not None:
+                await asyncio.to_thread(
+                    self.response_cache.put, cache_key, model, corrected
+                )
+            return corrected
+
+        try:
+            # Use retry logic with exponential backoff
+            @retry_async(RetryConfig(max_attempts=3, base_delay=1.0))
+            async def process_with_retry():
+                return await admitted(self.model)
+
+            with timed_logger.timed("chunk_processing", chunk_index=chunk_index):
+                result = await process_with_retry()
+
             logger.info(
-                f"Processing chunk {chunk_index}/{total_chunks} "
-                f"(length={len(chunk)})"
+                f"Chunk {chunk_index} completed successfully"
             )
+            return ChunkResult(result, model_used=self.model)
 
-            try:
-                # Use retry logic with exponential backoff
-                @retry_async(RetryConfig(max_attempts=3, base_delay=1.0))
-                async def process_with_retry():
-                    return await self._process_chunk_async(chunk, context, self.model)
-
-                with timed_logger.timed("chunk_processing", chunk_index=chunk_index):
-                    result = await process_with_retry()
+        except Exception as e:
+            print(f"[DEBUG] Chunk {chunk_index} primary error: {type(e).__name__}: {e}")
+            logger.warning(
+                f"Chunk {chunk_index} failed with primary model ({type(e).__name__}): {e}",
+                exc_info=True
+            )
 
+            # Retry with fallback model
+            if self.fallback_model and self.fallback_model != self.model:
                 logger.info(
-                    f"Chunk {chunk_index} completed successfully"
+                    f"Retrying chunk {chunk_index} with fallback model: {self.fallback_model}"
                 )
-                return ChunkResult(result, model_used=self.model)
 
-            except Exception as e:
-                print(f"[DEBUG] Chunk {chunk_index} primary error: {type(e).__name__}: {e}")
-                logger.warning(
-                    f"Chunk {chunk_index} failed with primary model ({type(e).__name__}): {e}",
-                    exc_info=True
-                )
+                try:
+                    @retry_async(RetryConfig(max_attempts=2, base_delay=1.0))
+                    async def fallback_with_retry():
+                        return await admitted(self.fallback_model)
 
-                # Retry with fallback model
-                if self.fallback_model and self.fallback_model != self.model:
+                    result = await fallback_with_retry()
                     logger.info(
-                        f"Retrying chunk {chunk_index} with fallback model: {self.fallback_model}"
+                        f"Chunk {chunk_index} succeeded with fallback model"
                     )
+                    return ChunkResult(result, model_used=self.fallback_model)
 
-                    try:
-                        @retry_async(RetryConfig(max_attempts=2, base_delay=1.0))
-                        async def fallback_with_retry():
-                            return await self._process_chunk_async(chunk, context, self.fallback_model)
-
-                        result = await fallback_with_retry()
-                        logger.info(
-                            f"Chunk {chunk_index} succeeded with fallback model"
-                        )
-                        return ChunkResult(result, model_used=self.fallback_model)
-
-                    except Exception as e2:
-                        print(f"[DEBUG] Chunk {chunk_index} fallback error: {type(e2).__name__}: {e2}")
-                        logger.error(
-                            f"Chunk {chunk_index} failed with fallback model ({type(e2).__name__}): {e2}",
-                            exc_info=True
-                        )
-
-                # API fallback: keep original text and warn clearly.
-                print(f"[WARNING] Chunk {chunk_index}: GLM API unavailable after retries; leaving original text unchanged.")
-                print("  To correct without an API, use native mode in Claude Code, or provide a valid API key.")
-
-                logger.warning(
-                    f"Using original text for chunk {chunk_index} after all retries failed"
-                )
-                return ChunkResult(chunk, api_failed=True)
+                except Exception as e2:
+                    print(f"[DEBUG] Chunk {chunk_index} fallback error: {type(e2).__name__}: {e2}")
+                    logger.error(
+                        f"Chunk {chunk_index} failed with fallback model ({type(e2).__name__}): {e2}",
+                        exc_info=True
+                    )
+
+            # API fallback: keep original text and warn clearly.
+            print(f"[WARNING] Chunk {chunk_index}: GLM API unavailable after retries; leaving original text unchanged.")
+            print("  To correct without an API, use native mode in Claude Code, or provide a valid API key.")
+
+            logger.warning(
+                f"Using original text for chunk {chunk_index} after all retries failed"
+            )
+            return ChunkResult(chunk, api_failed=True)
+
+    def _request_body(self, chunk: str, context: str, model: str) -> dict:
+        """Messages API payload for correcting one chunk."""
+        return {
+            "model": model,
+            "max_tokens": STAGE2_MAX_OUTPUT_TOKENS,
+            "temperature": 0.3,
+            "messages": [
+                {"role": "user", "content": build_correction_prompt(chunk, context)}
+            ]
+        }
+
+    def _response_cache_key(
+        self, chunk: str, context: str, model: str
+    ) -> Optional[str]:
+        """Cache key for one chunk's correction, or None without a cache."""
+        if self.response_cache is None:
+            return None
+        data = self._request_body(chunk, context, model)
+        return response_cache_key(
+            data["messages"][0]["content"], model,
+            max_tokens=data["max_tokens"], temperature=data["temperature"],
+        )
 
     async def _process_chunk_async(self, chunk: str, context: str, model: str) -> str:
         """
         Process a single chunk with GLM API (async).
 
+        This is only the HTTP call: the caller checks the response cache and
+        waits on the rate limiter before taking an admission slot for it.
+
         CRITICAL FIX (P1-3): Uses shared HTTP client for connection pooling
         """
-        prompt = build_correction_prompt(chunk, context)
-
         url = f"{self.base_url}/v1/messages"
         headers = {
             "anthropic-version": ANTHROPIC_VERSION,
             AUTH_HEADER_NAME: self.api_key,
             "content-type": "application/json"
         }
-
-        data = {
-            "model": model,
-            "max_tokens": 8000,
-            "temperature": 0.3,
-            "messages": [{"role": "user", "content": prompt}]
-        }
+        data = self._request_body(chunk, context, model)
 
         # CRITICAL FIX: Use shared client instead of creating new one
         # This prevents connection descriptor leaks
@@ -4,18 +4,22 @@ Shared AI Correction Utilities
 
 Single source of truth for components used by both sync and async AI processors:
 - AIChange dataclass
-- Text chunking strategy
+- Text chunking strategy (token-budgeted, content-defined boundaries)
 - Correction prompt construction
 - Anthropic-compatible response parsing
 """
 
 from __future__ import annotations
 
+import hashlib
 import re
 from dataclasses import dataclass
-from typing import Any, List, Sequence
+from typing import Any, List, Optional, Sequence, Tuple
 
 from .defaults import MAX_CHUNK_SIZE as DEFAULT_MAX_CHUNK_SIZE
+from .defaults import MAX_CHUNK_TOKENS as DEFAULT_MAX_CHUNK_TOKENS
+
+_SENTENCE_END_RE = re.compile(r'[。！？\n]')
 
 
 class AIAPIError(Exception):
@@ -41,62 +45,185 @@ class AIChange:
     model: str | None = None
 
 
-def split_into_chunks(text: str, max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE) -> List[str]:
+class TextChunk(str):
+    """A chunk's text plus where it sits in the text it was split from.
+
+    A ``str`` subclass so every existing consumer (prompting, diffing,
+    equality checks) keeps working unchanged; ``reassemble_corrected_chunks``
+    uses ``start`` to splice results back without searching.
+    """
+
+    __slots__ = ("start",)
+
+    def __new__(cls, text: str, start: int) -> "TextChunk":
+        chunk = super().__new__(cls, text)
+        chunk.start = start
+        return chunk
+
+    def __getnewargs__(self):
+        return (str(self), self.start)
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self)
+
+
+# CJK ideographs, kana, hangul, CJK punctuation and fullwidth forms: one
+# token each in the BPE vocabularies Stage 2 talks to.
+_WIDE_CHARS = "\u3000-\u9fff\uac00-\ud7af\uf900-\ufaff\uff00-\uffef"
+_WORD_RE = re.compile(r"[A-Za-z]+")
+_DIGITS_RE = re.compile(r"[0-9]+")
+_ASCII_PUNCT_RE = re.compile(r"[!-/:-@\[-`{-~]")
+_WIDE_RE = re.compile(f"[{_WIDE_CHARS}]")
+_OTHER_RE = re.compile(f"[^\x00-\x7f{_WIDE_CHARS}]+")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap conservative token estimate, no tokenizer needed.
+
+    ASCII words count one token per four letters, digit runs one per three
+    digits, and ASCII punctuation one each (timestamps like ``[00:12:34]``
+    are token-dense). CJK characters count one each. Any other non-ASCII
+    character (emoji, accented Latin, Cyrillic, ...) counts its UTF-8 byte
+    length, the byte-fallback worst case. Whitespace is free. The estimate
+    can therefore exceed ``len(text)``, which is what lets the token budget
+    bind independently of the character cap.
+    """
+    tokens = sum((len(word) + 3) // 4 for word in _WORD_RE.findall(text))
+    tokens += sum((len(run) + 2) // 3 for run in _DIGITS_RE.findall(text))
+    tokens += len(_ASCII_PUNCT_RE.findall(text))
+    tokens += len(_WIDE_RE.findall(text))
+    tokens += sum(len(run.encode("utf-8")) for run in _OTHER_RE.findall(text))
+    return tokens
+
+
+# Content-defined boundaries never cut a chunk below _CUT_MIN_FILL of the
+# budget; past that, a unit is a cut point with probability proportional to
+# its share of the budget, scaled by _CUT_TARGET_FILL. Tuned so the chunk
+# count (Stage 2 calls) stays close to greedy packing; see _is_cut_point.
+_CUT_TARGET_FILL = 0.08
+_CUT_MIN_FILL = 0.9
+
+
+def _is_cut_point(unit: str, unit_fill: float) -> bool:
+    """Content-defined boundary test for one unit (paragraph or sentence).
+
+    The decision depends only on the unit's own text, so inserting or
+    editing text moves boundaries only until the next cut point; everything
+    after it is chunked exactly as before. A unit is a cut point with
+    probability proportional to the share of the budget it fills, so past
+    _CUT_MIN_FILL a chunk runs on for about _CUT_TARGET_FILL of the budget
+    before a cut (or the hard limit) ends it.
+    """
+    digest = hashlib.blake2b(unit.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") < (unit_fill / _CUT_TARGET_FILL) * 2 ** 64
+
+
+def _pack_units(
+    text: str,
+    units: Sequence[Tuple[int, int]],
+    max_chars: int,
+    max_tokens: int,
+    gap_tokens: int,
+    chunks: List[TextChunk],
+) -> None:
+    """Pack consecutive (start, end) units into chunks of text[start:end].
+
+    A chunk closes before a unit that would break either budget (hard
+    limit), or after a content-defined cut point once it is at least
+    _CUT_MIN_FILL full.
+    """
+    chunk_start: Optional[int] = None
+    chunk_end = 0
+    chunk_tokens = 0
+    for unit_start, unit_end in units:
+        unit = text[unit_start:unit_end]
+        unit_tokens = estimate_tokens(unit)
+        if chunk_start is not None and (
+            unit_end - chunk_start > max_chars
+            or chunk_tokens + gap_tokens + unit_tokens > max_tokens
+        ):
+            chunks.append(TextChunk(text[chunk_start:chunk_end], chunk_start))
+            chunk_start = None
+        if chunk_start is None:
+            chunk_start = unit_start
+            chunk_tokens = unit_tokens
+        else:
+            chunk_tokens += gap_tokens + unit_tokens
+        chunk_end = unit_end
+        chunk_fill = max((chunk_end - chunk_start) / max_chars, chunk_tokens / max_tokens)
+        unit_fill = max(len(unit) / max_chars, unit_tokens / max_tokens)
+        if chunk_fill >= _CUT_MIN_FILL and _is_cut_point(unit, unit_fill):
+            chunks.append(TextChunk(text[chunk_start:chunk_end], chunk_start))
+            chunk_start = None
+    if chunk_start is not None:
+        chunks.append(TextChunk(text[chunk_start:chunk_end], chunk_start))
+
+
+def _sentence_units(
+    text: str, start: int, end: int, max_piece: int
+) -> List[Tuple[int, int]]:
+    """Split text[start:end] after each sentence terminator; slice any
+    unpunctuated run longer than max_piece deterministically."""
+    units: List[Tuple[int, int]] = []
+    cursor = start
+    for match in _SENTENCE_END_RE.finditer(text, start, end):
+        units.append((cursor, match.end()))
+        cursor = match.end()
+    if cursor < end or not units:
+        units.append((cursor, end))
+    pieces: List[Tuple[int, int]] = []
+    for unit_start, unit_end in units:
+        for piece_start in range(unit_start, unit_end, max_piece):
+            pieces.append((piece_start, min(piece_start + max_piece, unit_end)))
+        if unit_start == unit_end:
+            pieces.append((unit_start, unit_end))
+    return pieces
+
+
+def split_into_chunks(
+    text: str,
+    max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
+    max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+) -> List[TextChunk]:
     """
     Split text into processable chunks.
 
     Strategy:
-    - Split by double newlines (paragraphs)
-    - Keep chunks under max_chunk_size
-    - Don't split mid-paragraph if possible
+    - Units are paragraphs (split by double newlines); a paragraph over
+      budget is split by sentence, and an unpunctuated run by fixed slices
+    - Every chunk stays within max_chunk_size characters AND
+      max_chunk_tokens estimated tokens
+    - Boundaries are content-defined (see _is_cut_point), so an edit near
+      the top of a transcript does not reshuffle every later chunk
+    - Each chunk is an exact slice of ``text`` and records its offset
     """
-    paragraphs = text.split('\n\n')
-    chunks = []
-    current_chunk = []
-    current_length = 0
-
-    for para in paragraphs:
-        para_length = len(para)
-
-        # If single paragraph exceeds limit, force split by sentences
-        if para_length > max_chunk_size:
-            if current_chunk:
-                chunks.append('\n\n'.join(current_chunk))
-                current_chunk = []
-                current_length = 0
-
-            sentences = re.split(r'([。！？\n])', para)
-            temp_para = ""
-            for i in range(0, len(sentences), 2):
-                sentence = sentences[i] + (sentences[i + 1] if i + 1 < len(sentences) else "")
-                # An unpunctuated run can itself exceed the limit. Slice it
-                # deterministically instead of emitting one oversized request.
-                pieces = [
-                    sentence[start:start + max_chunk_size]
-                    for start in range(0, len(sentence), max_chunk_size)
-                ] or [""]
-                for piece in pieces:
-                    if len(temp_para) + len(piece) > max_chunk_size:
-                        if temp_para:
-                            chunks.append(temp_para)
-                        temp_para = piece
-                    else:
-                        temp_para += piece
-            if temp_para:
-                chunks.append(temp_para)
-
-        # Normal case: accumulate paragraphs
-        elif current_length + para_length > max_chunk_size and current_chunk:
-            chunks.append('\n\n'.join(current_chunk))
-            current_chunk = [para]
-            current_length = para_length
+    max_piece = max(1, min(max_chunk_size, max_chunk_tokens))
+    paragraphs: List[Tuple[int, int]] = []
+    cursor = 0
+    while True:
+        gap = text.find("\n\n", cursor)
+        if gap == -1:
+            paragraphs.append((cursor, len(text)))
+            break
+        paragraphs.append((cursor, gap))
+        cursor = gap + 2
+
+    chunks: List[TextChunk] = []
+    run: List[Tuple[int, int]] = []
+    for para_start, para_end in paragraphs:
+        if (para_end - para_start > max_chunk_size
+                or estimate_tokens(text[para_start:para_end]) > max_chunk_tokens):
+            _pack_units(text, run, max_chunk_size, max_chunk_tokens, 1, chunks)
+            run = []
+            _pack_units(
+                text, _sentence_units(text, para_start, para_end, max_piece),
+                max_chunk_size, max_chunk_tokens, 0, chunks,
+            )
         else:
-            current_chunk.append(para)
-            current_length += para_length + 2  # +2 for \n\n
-
-    if current_chunk:
-        chunks.append('\n\n'.join(current_chunk))
-
+            run.append((para_start, para_end))
+    _pack_units(text, run, max_chunk_size, max_chunk_tokens, 1, chunks)
     return chunks
 
 
@@ -110,8 +237,10 @@ def reassemble_corrected_chunks(
     ``split_into_chunks`` omits the separators between chunks. Joining with a
     hard-coded delimiter therefore changes the source whenever a long paragraph
     is split by sentence, including the failure path where every chunk falls
-    back to its original text. Locate each source chunk in order and carry the
-    untouched text between chunks forward verbatim.
+    back to its original text. Each source chunk is anchored in the original
+    text — at its recorded offset for a ``TextChunk``, by an in-order search
+    otherwise — and the untouched text between chunks is carried forward
+    verbatim.
 
     Raises:
         ValueError: If the result list does not correspond to the source chunks,
@@ -129,7 +258,12 @@ def reassemble_corrected_chunks(
         zip(source_chunks, corrected_chunks),
         start=1,
     ):
-        start = original_text.find(source_chunk, cursor)
+        if isinstance(source_chunk, TextChunk):
+            start = source_chunk.start
+            if start < cursor or not original_text.startswith(source_chunk, start):
+                start = -1
+        else:
+            start = original_text.find(source_chunk, cursor)
         if start == -1:
             raise ValueError(
                 "Cannot reassemble AI output: "
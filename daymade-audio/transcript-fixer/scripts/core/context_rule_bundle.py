@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Context Rule Bundle - compile Stage 1 context rules once per rules version
+
+SINGLE RESPONSIBILITY: Turn the raw rows from
+CorrectionService.load_context_rules() into validated, compiled scan passes,
+and cache the result per process keyed by a version stamp of the rules.
+
+A pass is one regex scan over the text:
+- a regex rule (anything with metacharacters: lookarounds, classes, ...) is
+  its own pass, exactly as before
+- consecutive LITERAL rules are merged into one alternation when doing so
+  cannot change the result. Sequential application is only equivalent to a
+  single scan if no rule can see another's effect, so a literal joins a
+  merged pass only when its pattern shares no overlap (containment or
+  suffix/prefix) with any other member's pattern or any earlier member's
+  replacement, and nothing involved contains a newline (line numbers of
+  later rules would otherwise shift). A deletion (empty replacement) splices
+  its neighbours together and can create a match of any later rule, so it
+  always closes its pass. Anything else starts a new pass.
+
+Batch runs over hundreds of transcripts therefore compile the rules once and
+scan each transcript once per pass rather than once per rule.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
+_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True)
+class CompiledContextRule:
+    """One validated context rule."""
+    pattern: str
+    replacement: str
+    description: str
+
+    @property
+    def rule_name(self) -> str:
+        return self.description or self.pattern
+
+
+@dataclass
+class RulePass:
+    """One scan: a single regex rule, or several merged literal rules."""
+    regex: re.Pattern
+    rules: List[CompiledContextRule]
+    # literal text -> rule, only for merged passes
+    by_text: Optional[Dict[str, CompiledContextRule]] = None
+
+    def rule_for(self, matched: str) -> CompiledContextRule:
+        if self.by_text is None:
+            return self.rules[0]
+        return self.by_text[matched]
+
+
+@dataclass
+class ContextRuleBundle:
+    """All context rules of one rules version, ready to scan."""
+    version: str
+    passes: List[RulePass] = field(default_factory=list)
+
+    @property
+    def rule_count(self) -> int:
+        return sum(len(p.rules) for p in self.passes)
+
+
+def context_rules_version(rules: Sequence[Dict]) -> str:
+    """Stable stamp over the ordered (pattern, replacement, description) rows.
+
+    Any edit to the active rules table — insert, delete, priority reorder,
+    is_active toggle, replacement change — changes the loaded rows and
+    therefore the stamp.
+    """
+    payload = json.dumps(
+        [[r["pattern"], r["replacement"], r.get("description") or ""] for r in rules],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _is_literal(pattern: str) -> bool:
+    return bool(pattern) and not any(ch in _REGEX_METACHARS for ch in pattern)
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """True if a and b can share characters at any alignment."""
+    if not a or not b:
+        return False
+    if a in b or b in a:
+        return True
+    shortest = min(len(a), len(b))
+    for k in range(1, shortest):
+        if a.endswith(b[:k]) or b.endswith(a[:k]):
+            return True
+    return False
+
+
+def _can_join(group: List[CompiledContextRule], rule: CompiledContextRule) -> bool:
+    if "\n" in rule.pattern or "\n" in rule.replacement:
+        return False
+    for member in group:
+        # Deleting text joins its neighbours, which can form a match of any
+        # later rule ("那嗯个" becomes "那个"), so nothing joins after it.
+        if not member.replacement:
+            return False
+        if _overlaps(member.pattern, rule.pattern):
+            return False
+        # An earlier member's output must not create (or extend into) a match
+        # of this later rule.
+        if _overlaps(member.replacement, rule.pattern):
+            return False
+    return True
+
+
+def _flush(group: List[CompiledContextRule], passes: List[RulePass]) -> None:
+    if not group:
+        return
+    if len(group) == 1:
+        rule = group[0]
+        passes.append(RulePass(regex=re.compile(rule.pattern), rules=[rule]))
+        return
+    # Longest first is irrelevant for correctness (members never overlap) but
+    # keeps the alternation deterministic.
+    alternation = "|".join(
+        re.escape(r.pattern) for r in sorted(group, key=lambda r: (-len(r.pattern), r.pattern))
+    )
+    passes.append(RulePass(
+        regex=re.compile(alternation),
+        rules=list(group),
+        by_text={r.pattern: r for r in group},
+    ))
+
+
+def compile_context_rules(rules: Sequence[Dict]) -> ContextRuleBundle:
+    """Validate and compile rules in priority order.
+
+    Raises:
+        ValueError: a pattern is not a valid regular expression. The message
+            names the rule so the row can be fixed in context_rules.
+    """
+    passes: List[RulePass] = []
+    group: List[CompiledContextRule] = []
+    for raw in rules:
+        rule = CompiledContextRule(
+            pattern=raw["pattern"],
+            replacement=raw["replacement"],
+            description=raw.get("description") or "",
+        )
+        if _is_literal(rule.pattern):
+            if not _can_join(group, rule):
+                _flush(group, passes)
+                group = []
+                if "\n" in rule.pattern or "\n" in rule.replacement:
+                    _flush([rule], passes)
+                    continue
+            group.append(rule)
+            continue
+
+        _flush(group, passes)
+        group = []
+        try:
+            regex = re.compile(rule.pattern)
+        except re.error as e:
+            raise ValueError(
+                f"context rule {rule.pattern!r} ({rule.description or 'no description'}) "
+                f"is not a valid regular expression: {e}"
+            ) from e
+        passes.append(RulePass(regex=regex, rules=[rule]))
+    _flush(group, passes)
+    return ContextRuleBundle(version=context_rules_version(rules), passes=passes)
+
+
+_bundle_cache: "OrderedDict[str, ContextRuleBundle]" = OrderedDict()
+_bundle_cache_lock = threading.Lock()
+
+
+def get_context_rule_bundle(rules: Sequence[Dict]) -> ContextRuleBundle:
+    """Return the compiled bundle for these rules, compiling at most once per
+    rules version per process."""
+    version = context_rules_version(rules)
+    with _bundle_cache_lock:
+        bundle = _bundle_cache.get(version)
+        if bundle is not None:
+            _bundle_cache.move_to_end(version)
+            return bundle
+    bundle = compile_context_rules(rules)
+    with _bundle_cache_lock:
+        _bundle_cache[version] = bundle
+        while len(_bundle_cache) > _CACHE_SIZE:
+            _bundle_cache.popitem(last=False)
+    return bundle
+
+
+def clear_context_rule_cache() -> None:
+    """Drop every cached bundle (tests, or after editing rules in-process)."""
+    with _bundle_cache_lock:
+        _bundle_cache.clear()
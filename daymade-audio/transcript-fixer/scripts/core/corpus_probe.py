@@ -27,6 +27,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional
 
+from utils.line_index import LineIndex
+
 
 @dataclass
 class ProbeSample:
@@ -71,17 +73,29 @@ def probe_corpus(
         rel = str(path.relative_to(corpus_dir))
         result.total += count
         result.per_file.append((rel, count))
+        # Jump hit to hit with str.find and resolve lines by bisect instead of
+        # splitting the whole file; lines follow splitlines() so the sampled
+        # line numbers and windows are what they always were.
+        line_index = LineIndex(text, universal=True)
         taken = 0
-        for line_no, line in enumerate(text.splitlines(), start=1):
-            if taken >= sample_per_file or len(result.samples) >= sample_total:
+        search_from = 0
+        while taken < sample_per_file and len(result.samples) < sample_total:
+            pos = text.find(term, search_from)
+            if pos < 0:
                 break
-            idx = line.find(term)
-            if idx < 0:
+            line_no = line_index.line_of(pos)
+            line_start, line_end = line_index.line_bounds(line_no)
+            if pos + len(term) > line_end:
+                # Straddles a line break: splitlines() never saw it as a hit.
+                search_from = pos + 1
                 continue
+            line = text[line_start:line_end]
+            idx = pos - line_start
             lo = max(0, idx - window)
             hi = idx + len(term) + window
             result.samples.append(ProbeSample(rel, line_no, line[lo:hi]))
             taken += 1
+            search_from = line_end + 1
     return result
 
 
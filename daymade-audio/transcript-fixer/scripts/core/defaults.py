@@ -27,7 +27,16 @@ ANTHROPIC_VERSION: Final[str] = "2023-06-01"
 # Processing defaults
 API_TIMEOUT: Final[float] = 60.0
 API_MAX_RETRIES: Final[int] = 3
+# Mean Stage 2 API latency the adaptive concurrency limit aims to stay under
+# (more than 1.5x this halves the limit; at or below it the limit grows by 1)
+STAGE2_TARGET_LATENCY: Final[float] = 30.0
 MAX_CHUNK_SIZE: Final[int] = 6000
+# Stage 2 reply budget (the request's max_tokens). The corrected chunk comes
+# back roughly token-for-token, so a chunk's estimated tokens must leave
+# headroom under it; this binds on token-dense text (emoji, non-CJK scripts,
+# timestamps and punctuation) long before MAX_CHUNK_SIZE does.
+STAGE2_MAX_OUTPUT_TOKENS: Final[int] = 8000
+MAX_CHUNK_TOKENS: Final[int] = STAGE2_MAX_OUTPUT_TOKENS * 3 // 4
 DEFAULT_DOMAIN: Final[str] = "general"
 
 # Filesystem security
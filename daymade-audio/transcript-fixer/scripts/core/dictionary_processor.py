@@ -13,6 +13,7 @@ Features:
 
 from __future__ import annotations
 
+import heapq
 import re
 import sys
 import logging
@@ -22,6 +23,9 @@ from dataclasses import dataclass
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.common_words import ALL_COMMON_WORDS, is_likely_valid_phrase
+from utils.line_index import LineIndex
+from core.context_rule_bundle import ContextRuleBundle, get_context_rule_bundle
+from core.multi_pattern import MultiPatternMatcher
 from core.protected_spans import mask_speaker_labels, restore_speaker_labels
 
 logger = logging.getLogger(__name__)
@@ -202,6 +206,13 @@ class DictionaryProcessor:
         self.context_rules = context_rules
         self.correction_meta = correction_meta or {}
         self.speaker_labels = speaker_labels or set()
+        # Compiled lazily on first use and reused for every file this
+        # processor handles; rebuilt only if `corrections` is swapped out.
+        self._matcher: Optional[MultiPatternMatcher] = None
+        self._rule_order: Dict[str, int] = {}
+        self._rule_keys: List[str] = []
+        self._matcher_source: Optional[Dict[str, str]] = None
+        self._matcher_size = -1
 
     def process(self, text: str, review_mode: bool = False) -> Tuple[str, List[Change]]:
         """
@@ -257,26 +268,31 @@ class DictionaryProcessor:
         changes = []
         corrected = text
 
-        for rule in self.context_rules:
-            pattern = rule["pattern"]
-            replacement = rule["replacement"]
-            description = rule.get("description", "")
-
+        for rule_pass in self._get_context_bundle().passes:
             # Position-aware rebuild so risky matches can be selectively kept.
+            # A merged pass holds several literal rules that provably cannot
+            # interact; their changes are regrouped per rule so the list reads
+            # exactly as if each rule had run on its own.
+            per_rule: Dict[int, List[Change]] = {}
             result_parts = []
             search_start = 0
-            for match in re.finditer(pattern, corrected):
+            line_index = None
+            for match in rule_pass.regex.finditer(corrected):
                 matched = match.group(0)
-                line_num = corrected[:match.start()].count('\n') + 1
+                rule = rule_pass.rule_for(matched)
+                replacement = rule.replacement
+                if line_index is None:
+                    line_index = LineIndex(corrected)
+                line_num = line_index.line_of(match.start())
                 # Use the same risk classifier as dictionary rules so context
                 # rules do not bypass the common-word / length safety layers.
                 risk = self._assess_risk(matched, replacement)
-                changes.append(Change(
+                per_rule.setdefault(id(rule), []).append(Change(
                     line_number=line_num,
                     from_text=matched,
                     to_text=replacement,
                     rule_type="context_rule",
-                    rule_name=description or pattern,
+                    rule_name=rule.rule_name,
                     risk=risk,
                 ))
                 result_parts.append(corrected[search_start:match.start()])
@@ -285,11 +301,34 @@ class DictionaryProcessor:
                 else:
                     result_parts.append(replacement)   # apply
                 search_start = match.end()
+            if line_index is None:
+                continue  # no match: nothing to rebuild
             result_parts.append(corrected[search_start:])
             corrected = "".join(result_parts)
+            for rule in rule_pass.rules:
+                changes.extend(per_rule.get(id(rule), ()))
 
         return corrected, changes
 
+    def _get_context_bundle(self) -> ContextRuleBundle:
+        """Return the compiled context rules. Bundles are cached per process
+        by rules version, so every processor (and every file) built from the
+        same rules table shares one compilation."""
+        return get_context_rule_bundle(self.context_rules)
+
+    def _get_matcher(self) -> Tuple[MultiPatternMatcher, Dict[str, int], List[str]]:
+        """Return the dictionary automaton, compiling it on first use."""
+        if (self._matcher is None
+                or self._matcher_source is not self.corrections
+                or self._matcher_size != len(self.corrections)):
+            keys = list(self.corrections)
+            self._matcher = MultiPatternMatcher(keys)
+            self._rule_order = {wrong: idx for idx, wrong in enumerate(keys)}
+            self._rule_keys = keys
+            self._matcher_source = self.corrections
+            self._matcher_size = len(self.corrections)
+        return self._matcher, self._rule_order, self._rule_keys
+
     def _apply_dictionary(self, text: str, review_mode: bool = False) -> Tuple[str, List[Change]]:
         """
         Apply dictionary replacements with substring safety checks.
@@ -300,11 +339,30 @@ class DictionaryProcessor:
            This applies to ALL rules regardless of length.
         2. Boundary check (short rules only, <=3 chars): if the match is inside
            a longer common word, skip to prevent collateral damage.
+
+        Rules still run one at a time in dictionary order (a later rule sees
+        earlier rules' output), but only rules that can actually match are
+        visited: one automaton scan seeds the candidate set, and after each
+        applied rule only the windows around its replacements are rescanned
+        for occurrences the replacement created. Any other occurrence
+        already existed in the seed scan, so output and Change lists are
+        identical to trying every rule in turn.
         """
         changes = []
         corrected = text
-
-        for wrong, correct in self.corrections.items():
+        matcher, rule_order, rule_keys = self._get_matcher()
+        if not len(matcher):
+            return corrected, changes
+
+        pending = [rule_order[wrong] for wrong in matcher.find_patterns(corrected)]
+        heapq.heapify(pending)
+        queued = set(pending)
+        reach = matcher.max_len - 1
+
+        while pending:
+            idx = heapq.heappop(pending)
+            wrong = rule_keys[idx]
+            correct = self.corrections[wrong]
             if wrong not in corrected:
                 continue
 
@@ -312,24 +370,36 @@ class DictionaryProcessor:
             # the superset check. Short rules additionally get the
             # boundary check against common words.
             needs_boundary_check = len(wrong) <= 3
+            applied_spans: List[Tuple[int, int]] = []
             corrected, new_changes = self._apply_with_safety_checks(
                 corrected, wrong, correct, needs_boundary_check,
-                review_mode=review_mode,
+                review_mode=review_mode, applied_spans=applied_spans,
             )
             changes.extend(new_changes)
 
+            for start, end in applied_spans:
+                for found in matcher.find_patterns(
+                    corrected, max(0, start - reach), min(len(corrected), end + reach)
+                ):
+                    later = rule_order[found]
+                    if later > idx and later not in queued:
+                        queued.add(later)
+                        heapq.heappush(pending, later)
+
         return corrected, changes
 
     def _find_occurrences(self, text: str, target: str) -> List[int]:
         """Find all line numbers where target appears in text."""
         occurrences = []
         start = 0
+        line_index = None
         while True:
             pos = text.find(target, start)
             if pos == -1:
                 break
-            line_num = text[:pos].count('\n') + 1
-            occurrences.append(line_num)
+            if line_index is None:
+                line_index = LineIndex(text)
+            occurrences.append(line_index.line_of(pos))
             start = pos + len(target)
         return occurrences
 
@@ -340,6 +410,7 @@ class DictionaryProcessor:
         correct: str,
         check_boundaries: bool,
         review_mode: bool = False,
+        applied_spans: Optional[List[Tuple[int, int]]] = None,
     ) -> Tuple[str, List[Change]]:
         """
         Apply replacement at each match position with safety layers.
@@ -354,10 +425,15 @@ class DictionaryProcessor:
         3. Risk classification: low/medium/high based on confidence and
            common-word membership. In review_mode, high/medium changes are
            tracked but not applied.
+
+        If applied_spans is given, the (start, end) of every inserted
+        replacement in the returned text is appended to it.
         """
         changes = []
         result_parts = []
         search_start = 0
+        out_len = 0
+        line_index = None
 
         while search_start < len(text):
             pos = text.find(wrong, search_start)
@@ -370,6 +446,7 @@ class DictionaryProcessor:
             # duplication. Check if to_text already exists at this position.
             if self._already_corrected(text, pos, wrong, correct):
                 result_parts.append(text[search_start:pos + len(wrong)])
+                out_len += pos + len(wrong) - search_start
                 search_start = pos + len(wrong)
                 logger.debug(
                     f"Skipped '{wrong}' at pos {pos}: "
@@ -382,6 +459,7 @@ class DictionaryProcessor:
                 text, pos, wrong
             ):
                 result_parts.append(text[search_start:pos + len(wrong)])
+                out_len += pos + len(wrong) - search_start
                 search_start = pos + len(wrong)
                 logger.debug(
                     f"Skipped '{wrong}' at pos {pos}: part of longer word"
@@ -389,7 +467,9 @@ class DictionaryProcessor:
                 continue
 
             # Safe to replace (or record for review)
-            line_num = text[:pos].count('\n') + 1
+            if line_index is None:
+                line_index = LineIndex(text)
+            line_num = line_index.line_of(pos)
             risk = self._assess_risk(wrong, correct)
 
             changes.append(Change(
@@ -404,11 +484,16 @@ class DictionaryProcessor:
             if review_mode and risk in ("medium", "high"):
                 # Track but do not apply
                 result_parts.append(text[search_start:pos + len(wrong)])
+                out_len += pos + len(wrong) - search_start
                 search_start = pos + len(wrong)
                 continue
 
             result_parts.append(text[search_start:pos])
             result_parts.append(correct)
+            out_len += pos - search_start
+            if applied_spans is not None:
+                applied_spans.append((out_len, out_len + len(correct)))
+            out_len += len(correct)
             search_start = pos + len(wrong)
 
         return "".join(result_parts), changes
@@ -15,6 +15,16 @@ CRITICAL FIX (P1-1): Thread-safe file operations with file locking
 - Prevents race conditions in concurrent access
 - Atomic read-modify-write operations
 - Cross-platform file locking support
+
+Incremental SQLite aggregation:
+- learning_pattern_aggregates holds one row per (from_text, to_text) with
+  frequency, recorded-confidence totals, first/last seen, distinct file count,
+  model set and the earliest examples
+- learning_aggregate_state keeps a high-water mark on correction_changes.id;
+  each analysis folds only rows above it, so cost tracks new history rather
+  than the lifetime of the database
+- Triggers flag a full rebuild when already-folded history is edited or
+  deleted (legacy backfills, retention cleanup)
 """
 
 from __future__ import annotations
@@ -23,10 +33,10 @@ import json
 import logging
 import sqlite3
 from pathlib import Path
-from typing import Any, List, Dict, Optional
+from typing import Any, Iterable, List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 from collections import defaultdict
-from contextlib import contextmanager
+from contextlib import closing, contextmanager
 from datetime import datetime, timezone
 
 # CRITICAL FIX: Import file locking
@@ -42,6 +52,75 @@ from .correction_repository import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Examples kept per pattern (earliest occurrences)
+MAX_PATTERN_EXAMPLES = 5
+
+# Owned by the engine rather than schema.sql: the aggregates are a derived
+# cache of correction_changes and can be dropped and rebuilt at any time.
+_AGGREGATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS learning_aggregate_state (
+    id INTEGER PRIMARY KEY CHECK(id = 1),
+    high_water_mark INTEGER NOT NULL DEFAULT 0,
+    needs_rebuild INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO learning_aggregate_state (id) VALUES (1);
+
+CREATE TABLE IF NOT EXISTS learning_pattern_aggregates (
+    from_text TEXT NOT NULL,
+    to_text TEXT NOT NULL,
+    frequency INTEGER NOT NULL,
+    file_count INTEGER NOT NULL DEFAULT 0,
+    confidence_sum REAL NOT NULL DEFAULT 0,
+    confidence_count INTEGER NOT NULL DEFAULT 0,
+    confidence_invalid INTEGER NOT NULL DEFAULT 0,
+    first_seen TEXT,
+    first_change_id INTEGER,
+    last_seen TEXT,
+    last_change_id INTEGER,
+    domain TEXT NOT NULL DEFAULT 'general',
+    models TEXT NOT NULL DEFAULT '[]',
+    examples TEXT NOT NULL DEFAULT '[]',
+    PRIMARY KEY (from_text, to_text)
+) WITHOUT ROWID;
+
+-- Suggestion analysis only reads patterns at or above MIN_FREQUENCY
+CREATE INDEX IF NOT EXISTS idx_learning_aggregates_frequency
+    ON learning_pattern_aggregates(frequency, first_seen, first_change_id);
+
+CREATE TABLE IF NOT EXISTS learning_pattern_files (
+    from_text TEXT NOT NULL,
+    to_text TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    PRIMARY KEY (from_text, to_text, filename)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_learning_changes_update
+AFTER UPDATE ON correction_changes
+WHEN OLD.id <= (SELECT high_water_mark FROM learning_aggregate_state WHERE id = 1)
+BEGIN
+    UPDATE learning_aggregate_state SET needs_rebuild = 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_learning_changes_delete
+AFTER DELETE ON correction_changes
+WHEN OLD.id <= (SELECT high_water_mark FROM learning_aggregate_state WHERE id = 1)
+BEGIN
+    UPDATE learning_aggregate_state SET needs_rebuild = 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_learning_history_update
+AFTER UPDATE OF filename, domain, run_timestamp, success ON correction_history
+BEGIN
+    UPDATE learning_aggregate_state SET needs_rebuild = 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_learning_history_delete
+AFTER DELETE ON correction_history
+BEGIN
+    UPDATE learning_aggregate_state SET needs_rebuild = 1 WHERE id = 1;
+END;
+"""
+
 
 def _is_replayable_learning_pair(from_text: object, to_text: object) -> bool:
     """Reject empty, formatting-only, and punctuation-only dictionary pairs."""
@@ -84,6 +163,157 @@ class Suggestion:
     status: str  # "pending", "approved", "rejected"
     domain: str = "general"
     models: List[str] = field(default_factory=list)
+    files: int = 0  # Distinct files the pattern was seen in
+
+
+@dataclass
+class _PatternAggregate:
+    """Running totals for one (from_text, to_text) pattern.
+
+    Occurrences can be folded in any order: first/last seen and the kept
+    examples are chosen by each occurrence's order key, not arrival order.
+    """
+    from_text: str
+    to_text: str
+    frequency: int = 0
+    file_count: int = 0
+    confidence_sum: float = 0.0
+    confidence_count: int = 0
+    confidence_invalid: int = 0
+    first_key: Optional[Tuple] = None
+    last_key: Optional[Tuple] = None
+    domain: str = "general"
+    models: set = field(default_factory=set)
+    examples: List[Tuple[Tuple, Dict]] = field(default_factory=list)
+
+    def add(self, key: Tuple, occurrence: Dict, new_file: bool) -> None:
+        self.frequency += 1
+        if new_file:
+            self.file_count += 1
+        confidence = occurrence.get("confidence")
+        if confidence is not None:
+            confidence = float(confidence)
+            self.confidence_sum += confidence
+            self.confidence_count += 1
+            if not 0.0 <= confidence <= 1.0:
+                self.confidence_invalid += 1
+        model = occurrence.get("model")
+        if isinstance(model, str) and model.strip():
+            self.models.add(model)
+        if self.first_key is None or key < self.first_key:
+            self.first_key = key
+            self.domain = occurrence.get("domain") or "general"
+        if self.last_key is None or key > self.last_key:
+            self.last_key = key
+        if (
+            len(self.examples) < MAX_PATTERN_EXAMPLES
+            or key < self.examples[-1][0]
+        ):
+            self.examples.append((key, occurrence))
+            self.examples.sort(key=lambda item: item[0])
+            del self.examples[MAX_PATTERN_EXAMPLES:]
+
+    def confidence(self) -> float:
+        return _confidence_from_totals(
+            self.frequency,
+            self.confidence_sum,
+            self.confidence_count,
+            self.confidence_invalid,
+        )
+
+    def to_suggestion(self, confidence: float) -> Suggestion:
+        return Suggestion(
+            from_text=self.from_text,
+            to_text=self.to_text,
+            frequency=self.frequency,
+            confidence=confidence,
+            examples=[dict(example) for _key, example in self.examples],
+            first_seen=self.first_key[0],
+            last_seen=self.last_key[0],
+            status="pending",
+            domain=self.domain,
+            models=sorted(self.models),
+            files=self.file_count,
+        )
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "_PatternAggregate":
+        return cls(
+            from_text=row["from_text"],
+            to_text=row["to_text"],
+            frequency=row["frequency"],
+            file_count=row["file_count"],
+            confidence_sum=row["confidence_sum"],
+            confidence_count=row["confidence_count"],
+            confidence_invalid=row["confidence_invalid"],
+            first_key=(row["first_seen"], row["first_change_id"]),
+            last_key=(row["last_seen"], row["last_change_id"]),
+            domain=row["domain"],
+            models=set(json.loads(row["models"])),
+            examples=[
+                (tuple(key), example)
+                for key, example in json.loads(row["examples"])
+            ],
+        )
+
+    def to_row(self) -> Tuple:
+        return (
+            self.from_text,
+            self.to_text,
+            self.frequency,
+            self.file_count,
+            self.confidence_sum,
+            self.confidence_count,
+            self.confidence_invalid,
+            self.first_key[0],
+            self.first_key[1],
+            self.last_key[0],
+            self.last_key[1],
+            self.domain,
+            json.dumps(sorted(self.models), ensure_ascii=False),
+            json.dumps(
+                [[list(key), example] for key, example in self.examples],
+                ensure_ascii=False,
+            ),
+        )
+
+
+def _confidence_from_totals(
+    frequency: int,
+    recorded_sum: float,
+    recorded_count: int,
+    invalid_count: int = 0,
+) -> float:
+    """Pattern confidence from persisted per-change confidence totals."""
+    # New history rows persist the confidence emitted with each actual
+    # change. Use that evidence directly so a 0.99 correction does not
+    # silently become a frequency-derived 0.83 after a restart. Legacy
+    # JSON/SQLite rows have no value; only that all-legacy case uses the
+    # historical heuristic below.
+    if recorded_count:
+        if invalid_count:
+            raise ValueError("Persisted correction confidence must be between 0 and 1")
+        # Keep persisted confidence stable across repeated identical rows;
+        # raw floating-point averaging can turn 0.99 into
+        # 0.9900000000000001 in JSON and exact audit comparisons.
+        return round(recorded_sum / recorded_count, 6)
+
+    # Legacy fallback: base confidence from frequency.
+    frequency_score = min(frequency / 10.0, 1.0)
+
+    # Consistency: always the same from→to mapping
+    consistency_score = 1.0  # Already consistent by grouping
+
+    # Recency: more recent = higher
+    # (Simplified: assume chronological order)
+    recency_score = 0.9 if frequency > 1 else 0.8
+
+    # Weighted average
+    return (
+        0.5 * frequency_score +
+        0.3 * consistency_score +
+        0.2 * recency_score
+    )
 
 
 class LearningEngine:
@@ -200,41 +430,27 @@ class LearningEngine:
         Returns:
             List of new suggestions for user review
         """
-        # Load all history
-        patterns = self._extract_patterns()
+        # Aggregate all history (incrementally when SQLite-backed)
+        patterns = self._aggregate_patterns()
 
         # Filter rejected patterns
         rejected = self._load_rejected()
-        patterns = {k: v for k, v in patterns.items()
-                   if k not in rejected}
 
         # Generate suggestions
         suggestions = []
-        for (from_text, to_text), occurrences in patterns.items():
-            frequency = len(occurrences)
+        for aggregate in patterns:
+            if (aggregate.from_text, aggregate.to_text) in rejected:
+                continue
 
-            if frequency < self.MIN_FREQUENCY:
+            if aggregate.frequency < self.MIN_FREQUENCY:
                 continue
 
-            confidence = self._calculate_confidence(occurrences)
+            confidence = aggregate.confidence()
 
             if confidence < self.MIN_CONFIDENCE:
                 continue
 
-            suggestion = Suggestion(
-                from_text=from_text,
-                to_text=to_text,
-                frequency=frequency,
-                confidence=confidence,
-                examples=occurrences[:5],  # Top 5 examples
-                first_seen=occurrences[0]["timestamp"],
-                last_seen=occurrences[-1]["timestamp"],
-                status="pending",
-                domain=occurrences[0].get("domain", "general"),
-                models=_models_for_occurrences(occurrences),
-            )
-
-            suggestions.append(suggestion)
+            suggestions.append(aggregate.to_suggestion(confidence))
 
         # Save new suggestions
         if suggestions:
@@ -318,12 +534,42 @@ class LearningEngine:
         """List all pending suggestions"""
         return self._load_pending_suggestions()
 
-    def _extract_patterns(self) -> Dict[tuple, List[Dict]]:
-        """Extract all correction patterns from history"""
+    def _aggregate_patterns(self) -> List[_PatternAggregate]:
+        """Aggregate all correction patterns, in first-seen order"""
         if self.db_path and self.db_path.exists():
-            return self._extract_patterns_from_sqlite()
+            return self._aggregate_patterns_from_sqlite()
 
-        return self._extract_patterns_from_json()
+        return self._aggregate_occurrences(
+            self._extract_patterns_from_json().items()
+        )
+
+    @staticmethod
+    def _aggregate_occurrences(
+        patterns: Iterable[Tuple[tuple, List[Dict]]],
+    ) -> List[_PatternAggregate]:
+        """Fold grouped occurrence lists (list order is first-seen order)."""
+        aggregates = []
+        for (from_text, to_text), occurrences in patterns:
+            aggregate = _PatternAggregate(from_text, to_text)
+            files = set()
+            for index, occurrence in enumerate(occurrences):
+                file = occurrence.get("file")
+                aggregate.add(
+                    (occurrence["timestamp"], index),
+                    occurrence,
+                    new_file=file not in files,
+                )
+                files.add(file)
+            # Keep list order authoritative for legacy JSON history
+            aggregate.first_key = (occurrences[0]["timestamp"], 0)
+            aggregate.last_key = (occurrences[-1]["timestamp"], len(occurrences) - 1)
+            aggregate.domain = occurrences[0].get("domain") or "general"
+            aggregate.examples = [
+                ((occurrence["timestamp"], index), occurrence)
+                for index, occurrence in enumerate(occurrences[:MAX_PATTERN_EXAMPLES])
+            ]
+            aggregates.append(aggregate)
+        return aggregates
 
     def _extract_patterns_from_json(self) -> Dict[tuple, List[Dict]]:
         """Extract correction patterns from legacy JSON history files."""
@@ -361,13 +607,73 @@ class LearningEngine:
 
         return patterns
 
-    def _extract_patterns_from_sqlite(self) -> Dict[tuple, List[Dict]]:
-        """Extract AI correction patterns from SQLite correction history."""
-        patterns = defaultdict(list)
+    def _aggregate_patterns_from_sqlite(self) -> List[_PatternAggregate]:
+        """
+        Bring the SQLite pattern aggregates up to date and return candidates.
 
+        Folds only correction_changes rows above the stored high-water mark,
+        then reads back patterns that can reach both suggestion thresholds.
+        """
         assert self.db_path is not None
-        query = """
+        try:
+            with closing(sqlite3.connect(self.db_path, timeout=30)) as conn:
+                conn.row_factory = sqlite3.Row
+                conn.executescript(_AGGREGATE_SCHEMA)
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._fold_new_changes(conn)
+                    conn.commit()
+                except BaseException:
+                    conn.rollback()
+                    raise
+                # Loose confidence pre-filter; the exact (rounded) check
+                # happens in analyze_and_suggest.
+                rows = conn.execute(
+                    """
+                    SELECT * FROM learning_pattern_aggregates
+                    WHERE frequency >= ?
+                      AND (
+                        confidence_count = 0
+                        OR confidence_invalid > 0
+                        OR confidence_sum >= (? - 1e-6) * confidence_count
+                      )
+                    ORDER BY first_seen ASC, first_change_id ASC
+                    """,
+                    (self.MIN_FREQUENCY, self.MIN_CONFIDENCE),
+                ).fetchall()
+        except sqlite3.Error as e:
+            raise RuntimeError(
+                f"Could not read SQLite correction history: {e}"
+            ) from e
+
+        return [_PatternAggregate.from_row(row) for row in rows]
+
+    def _fold_new_changes(self, conn: sqlite3.Connection) -> None:
+        """Fold learnable AI changes above the high-water mark (caller holds
+        the write transaction)."""
+        high_water_mark, needs_rebuild = conn.execute(
+            "SELECT high_water_mark, needs_rebuild FROM learning_aggregate_state "
+            "WHERE id = 1"
+        ).fetchone()
+        max_id = conn.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM correction_changes"
+        ).fetchone()[0]
+        rebuilding = bool(needs_rebuild or high_water_mark > max_id)
+        if rebuilding:
+            logger.info("Rebuilding learning pattern aggregates from history")
+            conn.execute("DELETE FROM learning_pattern_aggregates")
+            conn.execute("DELETE FROM learning_pattern_files")
+            high_water_mark = 0
+        if max_id == high_water_mark:
+            conn.execute(
+                "UPDATE learning_aggregate_state SET needs_rebuild = 0 WHERE id = 1"
+            )
+            return
+
+        cursor = conn.execute(
+            """
             SELECT
+                c.id,
                 h.filename,
                 h.domain,
                 h.run_timestamp,
@@ -380,51 +686,118 @@ class LearningEngine:
                 c.model
             FROM correction_changes c
             JOIN correction_history h ON h.id = c.history_id
-            WHERE c.rule_type = 'ai'
+            WHERE c.id > ? AND c.id <= ?
+              AND c.rule_type = 'ai'
               AND c.learnable = 1
               AND c.change_type <> 'formatting'
               AND trim(c.from_text) <> ''
               AND trim(c.to_text) <> ''
               AND h.success = 1
-            ORDER BY h.run_timestamp ASC, c.id ASC
-        """
-
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                rows = conn.execute(query).fetchall()
-        except sqlite3.Error as e:
-            raise RuntimeError(
-                f"Could not read SQLite correction history: {e}"
-            ) from e
+            ORDER BY c.id ASC
+            """,
+            (high_water_mark, max_id),
+        )
 
-        for row in rows:
+        touched: Dict[tuple, _PatternAggregate] = {}
+        # (from_text, to_text, filename) triples first seen in this pass;
+        # on a rebuild the files table starts empty, so no lookups needed.
+        new_files: set = set()
+        folded = 0
+        for row in cursor:
             if not _is_replayable_learning_pair(
                 row["from_text"], row["to_text"]
             ):
                 continue
             key = (row["from_text"], row["to_text"])
-            context = " ".join(
-                part for part in [
-                    row["context_before"],
-                    row["from_text"],
-                    "->",
-                    row["to_text"],
-                    row["context_after"],
-                ]
-                if part
+            aggregate = touched.get(key)
+            if aggregate is None:
+                existing = conn.execute(
+                    """
+                    SELECT * FROM learning_pattern_aggregates
+                    WHERE from_text = ? AND to_text = ?
+                    """,
+                    key,
+                ).fetchone()
+                aggregate = (
+                    _PatternAggregate.from_row(existing)
+                    if existing is not None
+                    else _PatternAggregate(*key)
+                )
+                touched[key] = aggregate
+            file_key = (*key, row["filename"])
+            new_file = file_key not in new_files and (
+                rebuilding
+                or conn.execute(
+                    """
+                    SELECT 1 FROM learning_pattern_files
+                    WHERE from_text = ? AND to_text = ? AND filename = ?
+                    """,
+                    file_key,
+                ).fetchone() is None
             )
-            patterns[key].append({
-                "file": row["filename"],
-                "line": row["line_number"] or 0,
-                "context": context,
-                "timestamp": row["run_timestamp"],
-                "confidence": row["confidence"],
-                "model": row["model"],
-                "domain": row["domain"] or "general",
-            })
+            if new_file:
+                new_files.add(file_key)
+            aggregate.add(
+                (row["run_timestamp"], row["id"]),
+                self._sqlite_occurrence(row),
+                new_file=new_file,
+            )
+            folded += 1
+
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO learning_pattern_aggregates (
+                from_text, to_text, frequency, file_count,
+                confidence_sum, confidence_count, confidence_invalid,
+                first_seen, first_change_id, last_seen, last_change_id,
+                domain, models, examples
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [aggregate.to_row() for aggregate in touched.values()],
+        )
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO learning_pattern_files
+                (from_text, to_text, filename)
+            VALUES (?, ?, ?)
+            """,
+            new_files,
+        )
+        conn.execute(
+            """
+            UPDATE learning_aggregate_state
+            SET high_water_mark = ?, needs_rebuild = 0
+            WHERE id = 1
+            """,
+            (max_id,),
+        )
+        logger.debug(
+            f"Folded {folded} learnable changes into {len(touched)} patterns "
+            f"(correction_changes.id {high_water_mark + 1}..{max_id})"
+        )
 
-        return patterns
+    @staticmethod
+    def _sqlite_occurrence(row: sqlite3.Row) -> Dict:
+        """One correction_changes row as a suggestion example."""
+        context = " ".join(
+            part for part in [
+                row["context_before"],
+                row["from_text"],
+                "->",
+                row["to_text"],
+                row["context_after"],
+            ]
+            if part
+        )
+        return {
+            "file": row["filename"],
+            "line": row["line_number"] or 0,
+            "context": context,
+            "timestamp": row["run_timestamp"],
+            "confidence": row["confidence"],
+            "model": row["model"],
+            "domain": row["domain"] or "general",
+        }
 
     def _calculate_confidence(self, occurrences: List[Dict]) -> float:
         """
@@ -435,43 +808,18 @@ class LearningEngine:
         - Consistency (always same correction = higher)
         - Recency (recent occurrences = higher)
         """
-        # New history rows persist the confidence emitted with each actual
-        # change. Use that evidence directly so a 0.99 correction does not
-        # silently become a frequency-derived 0.83 after a restart. Legacy
-        # JSON/SQLite rows have no value; only that all-legacy case uses the
-        # historical heuristic below.
         recorded = [
             float(item["confidence"])
             for item in occurrences
             if item.get("confidence") is not None
         ]
-        if recorded:
-            if any(not 0.0 <= value <= 1.0 for value in recorded):
-                raise ValueError("Persisted correction confidence must be between 0 and 1")
-            # Keep persisted confidence stable across repeated identical rows;
-            # raw floating-point averaging can turn 0.99 into
-            # 0.9900000000000001 in JSON and exact audit comparisons.
-            return round(sum(recorded) / len(recorded), 6)
-
-        # Legacy fallback: base confidence from frequency.
-        frequency_score = min(len(occurrences) / 10.0, 1.0)
-
-        # Consistency: always the same from→to mapping
-        consistency_score = 1.0  # Already consistent by grouping
-
-        # Recency: more recent = higher
-        # (Simplified: assume chronological order)
-        recency_score = 0.9 if len(occurrences) > 1 else 0.8
-
-        # Weighted average
-        confidence = (
-            0.5 * frequency_score +
-            0.3 * consistency_score +
-            0.2 * recency_score
+        return _confidence_from_totals(
+            len(occurrences),
+            sum(recorded),
+            len(recorded),
+            sum(1 for value in recorded if not 0.0 <= value <= 1.0),
         )
 
-        return confidence
-
     def _load_pending_suggestions_unlocked(self) -> List[Dict]:
         """
         Load pending suggestions from file (UNLOCKED - caller must hold lock).
@@ -550,6 +898,10 @@ class LearningEngine:
                 float(current.get("confidence", 0) or 0),
                 float(normalized.get("confidence", 0) or 0),
             )
+            current["files"] = max(
+                int(current.get("files", 0) or 0),
+                int(normalized.get("files", 0) or 0),
+            )
 
             existing_examples = current.get("examples") or []
             for example in normalized.get("examples") or []:
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Multi-Pattern Matcher - one scan finds every dictionary key present in a text
+
+SINGLE RESPONSIBILITY: Answer "which of these N literal patterns occur in this
+text (or in this window of it)?" without N separate `str.find` passes.
+
+Classic Aho-Corasick: the patterns form a trie, each state gets a failure link
+to its longest proper suffix that is also a trie path, and each state's output
+list carries every pattern ending there (its own plus those inherited through
+the failure chain). A scan is one pass over the text with amortised O(1) work
+per character, plus O(1) per reported hit — independent of how many patterns
+the dictionary holds.
+
+Compile once per loaded dictionary (DictionaryProcessor does this lazily) and
+reuse the matcher across files.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+class MultiPatternMatcher:
+    """Aho-Corasick automaton over a fixed set of literal patterns."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: frozenset = frozenset(p for p in patterns if p)
+        self.max_len = max((len(p) for p in self.patterns), default=0)
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[str, ...]] = [()]
+        for pattern in sorted(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    outputs.append(())
+                state = nxt
+            outputs[state] = (pattern,)
+
+        # Breadth-first failure links; outputs inherit the failure state's
+        # outputs so a scan never has to walk the failure chain to report.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                if outputs[fail[nxt]]:
+                    outputs[nxt] = outputs[nxt] + outputs[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def iter_matches(
+        self, text: str, start: int = 0, end: Optional[int] = None
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (position, pattern) for every occurrence, overlapping included.
+
+        Only occurrences lying entirely inside text[start:end] are reported,
+        in order of their end position.
+        """
+        if not self.patterns:
+            return
+        if end is None:
+            end = len(text)
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        segment = text if (start == 0 and end == len(text)) else text[start:end]
+        for i, ch in enumerate(segment, start):
+            while True:
+                nxt = goto[state].get(ch)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            found = outputs[state]
+            if found:
+                for pattern in found:
+                    yield i + 1 - len(pattern), pattern
+
+    def find_patterns(
+        self, text: str, start: int = 0, end: Optional[int] = None
+    ) -> Set[str]:
+        """Return the set of patterns occurring inside text[start:end]."""
+        return {pattern for _, pattern in self.iter_matches(text, start, end)}
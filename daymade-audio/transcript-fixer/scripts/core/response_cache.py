@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Response Cache - content-addressed store for Stage 2 chunk corrections
+
+SINGLE RESPONSIBILITY: Remember what the model returned for an exact request
+so an identical request is answered from disk instead of the API.
+
+Re-running Stage 2 on a transcript that was only partially edited re-sends
+every chunk. Most of them are byte-identical to last time, so their answers
+are too (the request is deterministic input; we only ever store successful,
+parsed responses). The key is a SHA-256 over:
+- the rendered build_correction_prompt() output, which covers the chunk text,
+  the prompt template and the context in one value — editing the template
+  changes every key without a manual version bump
+- the model and the sampling parameters sent with it
+- CACHE_FORMAT, bumped if the stored value's meaning ever changes
+
+Storage is one SQLite file under the config cache dir. Every hit refreshes
+`last_used`; when the stored responses exceed `max_bytes`, least recently used
+entries are evicted until the store is back under the budget. Each operation
+opens its own short-lived connection, so the cache is safe to use from worker
+threads and from several concurrent processes.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Final, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT: Final[int] = 1
+CACHE_FILENAME: Final[str] = "stage2_responses.db"
+DEFAULT_MAX_BYTES: Final[int] = 64 * 1024 * 1024
+# Evict down to this fraction of the budget so a full cache does not run an
+# eviction query on every single insert.
+_EVICT_TO: Final[float] = 0.9
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used);
+"""
+
+
+def response_cache_key(prompt: str, model: str, **params: object) -> str:
+    """Content address of one request: prompt, model and sampling params."""
+    payload = json.dumps(
+        [CACHE_FORMAT, model, prompt, sorted(params.items())],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed, size-bounded LRU map from request key to response text."""
+
+    def __init__(self, db_path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=15)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for `key` (refreshing its recency)."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE responses SET last_used = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+                return row[0]
+        except sqlite3.Error as e:
+            # A broken cache must never fail a correction run.
+            logger.warning(f"Stage 2 response cache read failed: {e}")
+            return None
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """Store a successful response, then evict LRU entries over budget."""
+        size = len(response.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO responses
+                        (key, model, response, size, created_at, last_used)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, model, response, size, now, now),
+                )
+                self._evict(conn)
+        except sqlite3.Error as e:
+            logger.warning(f"Stage 2 response cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = int(self.max_bytes * _EVICT_TO)
+        doomed = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used ASC"
+        ):
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        logger.info(f"Stage 2 response cache evicted {len(doomed)} entries")
+
+    def stats(self) -> dict:
+        """Entry count and stored bytes."""
+        with self._connect() as conn:
+            entries, stored = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"entries": entries, "bytes": stored, "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
@@ -42,6 +42,7 @@ from pathlib import Path
 from typing import List, Optional
 
 from core.dictionary_processor import project_without_ledger_values
+from utils.line_index import LineIndex
 
 # A trap pair is a bold mapping AT A BULLET LINE START. 「→」 is canonical;
 # legacy context files used 「≈」 with the same directional convention (left =
@@ -418,27 +419,35 @@ def scan_text(
     # residual. Other frontmatter (keywords/title) remains live because it is an
     # ASR-derived search surface. The shared helper preserves line numbers.
     projected_text = project_without_ledger_values(text)
-    lines = projected_text.splitlines()
+    # One whole-text str.find per variant plus a bisect per hit, instead of a
+    # Python-level loop over every line for every variant. Lines follow
+    # splitlines() so numbering and context windows are unchanged; a variant
+    # containing a line break could never match inside a line, so skip it.
+    line_index = LineIndex(projected_text, universal=True)
     for entry in entries:
         for variant in entry.from_variants:
-            for line_no, line in enumerate(lines, start=1):
-                start = 0
-                while True:
-                    idx = line.find(variant, start)
-                    if idx < 0:
-                        break
-                    lo = max(0, idx - window)
-                    hi = idx + len(variant) + window
-                    hits.append(
-                        TrapHit(
-                            variant=variant,
-                            to_text=entry.to_text,
-                            kind=entry.kind,
-                            line=line_no,
-                            context=line[lo:hi],
-                        )
+            if variant.splitlines() != [variant]:
+                continue
+            start = 0
+            while True:
+                pos = projected_text.find(variant, start)
+                if pos < 0:
+                    break
+                line_no = line_index.line_of(pos)
+                line_start, line_end = line_index.line_bounds(line_no)
+                idx = pos - line_start
+                lo = max(0, idx - window)
+                hi = min(idx + len(variant) + window, line_end - line_start)
+                hits.append(
+                    TrapHit(
+                        variant=variant,
+                        to_text=entry.to_text,
+                        kind=entry.kind,
+                        line=line_no,
+                        context=projected_text[line_start + lo:line_start + hi],
                     )
-                    start = idx + len(variant)
+                )
+                start = pos + len(variant)
     return hits
 
 
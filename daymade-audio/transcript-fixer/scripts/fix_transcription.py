@@ -23,6 +23,9 @@ Usage:
     # Correction workflow
     python fix_transcription.py --input file.md --stage 3
 
+    # Batch: every *.md in a directory, one dictionary load
+    python fix_transcription.py --input-dir ./transcripts --stage 1 --jobs 8
+
     # Manage corrections
     python fix_transcription.py --add "错误" "正确"
     python fix_transcription.py --list
@@ -51,6 +54,7 @@ from cli import (
     cmd_export_corrections,
     cmd_import_corrections,
     cmd_run_correction,
+    cmd_run_batch_correction,
     cmd_review_learned,
     cmd_approve,
     cmd_validate,
@@ -161,6 +165,15 @@ def main() -> None:
         cmd_scan_traps(args)
     elif getattr(args, "probe_term", None):
         cmd_probe(args)
+    elif getattr(args, "input_dir", None):
+        if getattr(args, "json_output", False):
+            # Same --json contract as a single file: the human-readable log
+            # goes to stderr, stdout carries only the batch summary object.
+            with contextlib.redirect_stdout(sys.stderr):
+                summary = cmd_run_batch_correction(args)
+            print(json.dumps(summary, ensure_ascii=False))
+        else:
+            cmd_run_batch_correction(args)
     elif args.input:
         if getattr(args, "json_output", False):
             # --json contract: stdout carries ONLY the machine-readable Stage 1
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Tests for Stage 2 admission control: AIMD concurrency in ConcurrencyManager,
+async rate limiting, and their wiring into AIProcessorAsync.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import core.ai_processor_async as async_module
+from core.ai_processor_async import AIProcessorAsync
+from utils.concurrency_manager import (
+    CircuitBreakerOpenError,
+    ConcurrencyConfig,
+    ConcurrencyManager,
+)
+from utils.metrics import MetricsCollector
+from utils.rate_limiter import RateLimitConfig, RateLimiter
+from utils.retry_logic import RetryConfig, retry_async
+
+
+def _http_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://example.invalid/v1/messages")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+def _adaptive(max_concurrent=8, **overrides) -> ConcurrencyConfig:
+    settings = dict(
+        max_concurrent=max_concurrent,
+        max_concurrent_ceiling=max_concurrent,
+        min_concurrent=1,
+        enable_adaptive_tuning=True,
+        enable_backpressure=False,
+        max_response_time=1.0,
+        adjust_min_samples=4,
+    )
+    settings.update(overrides)
+    return ConcurrencyConfig(**settings)
+
+
+@pytest.mark.asyncio
+async def test_429_halves_the_limit_and_publishes_gauges():
+    metrics = MetricsCollector()
+    manager = ConcurrencyManager(_adaptive(8), metrics=metrics, name="t")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        async with manager.acquire():
+            raise _http_error(429)
+
+    assert manager.config.max_concurrent == 4
+    assert metrics.get_gauge("t_limit").get() == 4
+    assert metrics.get_counter("t_rate_limited_total").get() == 1
+    assert metrics.get_gauge("t_active").get() == 0
+    assert metrics.get_gauge("t_queue_depth").get() == 0
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_do_not_open_the_circuit():
+    manager = ConcurrencyManager(_adaptive(4, circuit_failure_threshold=2))
+    for _ in range(5):
+        with pytest.raises(httpx.HTTPStatusError):
+            async with manager.acquire():
+                raise _http_error(429)
+    async with manager.acquire():
+        pass
+
+
+@pytest.mark.asyncio
+async def test_consecutive_failures_still_open_the_circuit():
+    manager = ConcurrencyManager(_adaptive(4, circuit_failure_threshold=2))
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            async with manager.acquire():
+                raise _http_error(500)
+    with pytest.raises(CircuitBreakerOpenError):
+        async with manager.acquire():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_healthy_rounds_grow_the_limit_back_to_the_ceiling():
+    manager = ConcurrencyManager(_adaptive(4))
+    manager.config.max_concurrent = 1
+    for _ in range(40):
+        async with manager.acquire():
+            pass
+    assert manager.config.max_concurrent == 4
+
+
+@pytest.mark.asyncio
+async def test_lowered_limit_is_enforced_for_queued_operations():
+    manager = ConcurrencyManager(_adaptive(4))
+    with pytest.raises(httpx.HTTPStatusError):
+        async with manager.acquire():
+            raise _http_error(429)
+    manager.config.enable_adaptive_tuning = False  # hold the lowered limit
+    active = 0
+    peak = 0
+
+    async def worker():
+        nonlocal active, peak
+        async with manager.acquire():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(worker() for _ in range(10)))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_acquire_async_waits_without_blocking_the_loop():
+    limiter = RateLimiter(RateLimitConfig(max_requests=2, window_seconds=0.2))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    background = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    waits = [await limiter.acquire_async() for _ in range(4)]
+    elapsed = time.perf_counter() - started
+    background.cancel()
+
+    assert waits[0] == 0 and waits[1] == 0
+    assert elapsed >= 0.15
+    assert ticks > 5
+
+
+@pytest.mark.asyncio
+async def test_processor_backs_off_on_429_and_still_corrects(monkeypatch):
+    monkeypatch.setattr(
+        async_module,
+        "retry_async",
+        lambda config: retry_async(
+            RetryConfig(max_attempts=config.max_attempts, base_delay=0.0, jitter=False)
+        ),
+    )
+    metrics = MetricsCollector()
+    processor = AIProcessorAsync(
+        api_key="test", fallback_model="", max_concurrent=4, metrics=metrics,
+    )
+    processor.max_chunk_size = 12
+    seen = set()
+
+    async def throttled_once(chunk, _context, _model):
+        if chunk not in seen:
+            seen.add(chunk)
+            raise _http_error(429)
+        return chunk.replace("开时", "开始")
+
+    processor._process_chunk_async = throttled_once
+    source = "\n\n".join(f"第{i}段会议开时了" for i in range(6))
+    corrected, _changes = await processor._process_async(source, "")
+
+    assert corrected == source.replace("开时", "开始")
+    assert processor.failed_chunks == 0
+    assert processor.admission.config.max_concurrent == 1
+    assert metrics.get_gauge("stage2_api_limit").get() == 1
+    assert metrics.get_counter("stage2_api_rate_limited_total").get() == 6
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_and_limiter_waits_stay_outside_admission(tmp_path):
+    from core.response_cache import ResponseCache
+
+    processor = AIProcessorAsync(
+        api_key="test", fallback_model="",
+        response_cache=ResponseCache(tmp_path / "cache.db"),
+    )
+    active_while = {"limiter": [], "http": []}
+
+    class Limiter:
+        async def acquire_async(self):
+            active_while["limiter"].append(
+                processor.admission.get_metrics().active_operations
+            )
+            return 0.0
+
+    async def http_call(chunk, _context, _model):
+        active_while["http"].append(
+            processor.admission.get_metrics().active_operations
+        )
+        return chunk.replace("开时", "开始")
+
+    processor.rate_limiter = Limiter()
+    processor._process_chunk_async = http_call
+
+    await processor._process_async("会议开时", "")
+    admitted = processor.admission.get_metrics().total_requests
+    corrected, _changes = await processor._process_async("会议开时", "")
+
+    assert corrected == "会议开始"
+    assert processor.cache_hits == 1
+    assert processor.admission.get_metrics().total_requests == admitted
+    assert active_while == {"limiter": [0], "http": [1]}
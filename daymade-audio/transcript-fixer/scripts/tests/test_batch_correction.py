@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Tests for --input-dir batch mode.
+
+The contract: every file gets exactly the sidecars a single-file run would
+write, the dictionary is loaded once, and batch_summary.json records per-file
+status and timings.
+"""
+
+import json
+import shutil
+import sys
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import cli.commands as commands
+from core.correction_repository import CorrectionRepository
+from core.correction_service import CorrectionService
+from utils.config import Config, DatabaseConfig, PathConfig, reset_config, set_config
+
+TRANSCRIPTS = {
+    "a.md": "克劳锐的能力很强\n我们用克劳锐写代码\n",
+    "b.md": "今天讨论巨升方向\n克劳锐 和 巨升方向\n",
+    "c.md": "没有任何需要修改的内容\n",
+}
+
+
+@pytest.fixture
+def configured(tmp_path):
+    config = Config(
+        database=DatabaseConfig(path=tmp_path / "corrections.db"),
+        paths=PathConfig(
+            config_dir=tmp_path,
+            data_dir=tmp_path / "data",
+            log_dir=tmp_path / "logs",
+            cache_dir=tmp_path / "cache",
+        ),
+    )
+    set_config(config)
+    repository = CorrectionRepository(config.database.path)
+    service = CorrectionService(repository)
+    service.add_correction("克劳锐", "Claude", "batchtest", force=True)
+    service.add_correction("巨升方向", "具身方向", "batchtest", force=True)
+    repository.close()
+    yield tmp_path
+    reset_config()
+
+
+def _args(**overrides):
+    base = dict(
+        input=None, input_dir=None, input_glob="*.md", jobs=None, output=None,
+        stage=1, domain="batchtest", dry_run=False, apply_all=True,
+        changes_file=False, people_roster=None, apply_domain=False,
+    )
+    base.update(overrides)
+    return Namespace(**base)
+
+
+def _write_corpus(directory: Path) -> None:
+    directory.mkdir()
+    for name, text in TRANSCRIPTS.items():
+        (directory / name).write_text(text, encoding="utf-8")
+
+
+def _outputs(directory: Path) -> dict:
+    return {
+        p.name: p.read_text(encoding="utf-8")
+        for p in sorted(directory.iterdir())
+        if p.name != commands.BATCH_SUMMARY_FILENAME
+    }
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_batch_sidecars_match_single_file_runs(configured, jobs):
+    single_dir = configured / "single"
+    batch_dir = configured / "batch"
+    _write_corpus(single_dir)
+    _write_corpus(batch_dir)
+
+    for name in TRANSCRIPTS:
+        commands.cmd_run_correction(_args(input=str(single_dir / name)))
+    summary = commands.cmd_run_batch_correction(_args(input_dir=str(batch_dir), jobs=jobs))
+
+    assert _outputs(batch_dir) == _outputs(single_dir)
+    assert "a_stage1.md" in _outputs(batch_dir)
+    assert summary["total_files"] == 3
+    assert summary["failed"] == 0
+    assert [Path(f["input"]).name for f in summary["files"]] == sorted(TRANSCRIPTS)
+    assert all("stage1_s" in f["timings"] for f in summary["files"])
+    written = json.loads((batch_dir / commands.BATCH_SUMMARY_FILENAME).read_text(encoding="utf-8"))
+    assert written["files"][0]["status"]["applied"] == 2
+
+
+def test_batch_skips_sidecars_and_loads_dictionary_once(configured, monkeypatch):
+    batch_dir = configured / "batch"
+    _write_corpus(batch_dir)
+    commands.cmd_run_batch_correction(_args(input_dir=str(batch_dir), jobs=1))
+
+    calls = []
+    original = commands._load_correction_setup
+    monkeypatch.setattr(
+        commands, "_load_correction_setup",
+        lambda args: calls.append(1) or original(args),
+    )
+    summary = commands.cmd_run_batch_correction(_args(input_dir=str(batch_dir), jobs=1))
+
+    assert calls == [1]
+    assert sorted(Path(f["input"]).name for f in summary["files"]) == sorted(TRANSCRIPTS)
+
+
+def test_batch_rejects_file_output(configured):
+    batch_dir = configured / "batch"
+    _write_corpus(batch_dir)
+    with pytest.raises(SystemExit):
+        commands.cmd_run_batch_correction(
+            _args(input_dir=str(batch_dir), output=str(configured / "out.md"))
+        )
+
+
+def test_recursive_glob_keeps_same_stem_outputs_apart(configured):
+    batch_dir = configured / "batch"
+    for sub in ("day1", "day2"):
+        (batch_dir / sub).mkdir(parents=True)
+    (batch_dir / "day1" / "meeting.md").write_text(TRANSCRIPTS["a.md"], encoding="utf-8")
+    (batch_dir / "day2" / "meeting.md").write_text(TRANSCRIPTS["b.md"], encoding="utf-8")
+    out_dir = configured / "out"
+
+    summary = commands.cmd_run_batch_correction(
+        _args(input_dir=str(batch_dir), input_glob="**/*.md", output=str(out_dir), jobs=1)
+    )
+
+    assert summary["failed"] == 0
+    assert "Claude" in (out_dir / "day1" / "meeting_stage1.md").read_text(encoding="utf-8")
+    assert "具身方向" in (out_dir / "day2" / "meeting_stage1.md").read_text(encoding="utf-8")
+    assert (out_dir / commands.BATCH_SUMMARY_FILENAME).exists()
+
+
+def test_missing_api_key_fails_each_file_but_finishes_the_batch(configured, monkeypatch):
+    monkeypatch.delenv("GLM_API_KEY", raising=False)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    batch_dir = configured / "batch"
+    _write_corpus(batch_dir)
+
+    summary = commands.cmd_run_batch_correction(
+        _args(input_dir=str(batch_dir), stage=2, jobs=1)
+    )
+
+    assert summary["failed"] == len(TRANSCRIPTS)
+    assert all("API key" in f["error"] for f in summary["files"])
+    assert (batch_dir / "a_stage1.md").exists()
+    assert (batch_dir / commands.BATCH_SUMMARY_FILENAME).exists()
+    with pytest.raises(SystemExit):
+        commands.cmd_run_correction(_args(input=str(batch_dir / "c.md"), stage=2))
+
+
+def test_shared_session_reuses_one_event_loop():
+    import asyncio
+    from core.ai_processor_async import AIProcessorAsync
+
+    loops = []
+
+    class RecordingProcessor(AIProcessorAsync):
+        async def _process_async(self, text, context):
+            loops.append(asyncio.get_running_loop())
+            return text.upper(), []
+
+    processor = RecordingProcessor("key")
+    with processor.shared_session():
+        assert processor.process("a") == ("A", [])
+        assert processor.process("b") == ("B", [])
+    assert len(loops) == 2 and loops[0] is loops[1]
+    assert loops[0].is_closed()
+    assert processor.process("c") == ("C", [])
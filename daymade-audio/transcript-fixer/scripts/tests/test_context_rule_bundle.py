@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled context-rule bundle.
+
+Merging literal rules into one scan is only allowed when it cannot change the
+result, so the contract is: output text and Change list identical to applying
+every rule on its own, in priority order. The reference below is the
+pre-bundle loop, kept verbatim.
+"""
+
+import random
+import re
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.context_rule_bundle import (
+    clear_context_rule_cache,
+    compile_context_rules,
+    context_rules_version,
+    get_context_rule_bundle,
+)
+from core.dictionary_processor import Change, DictionaryProcessor
+
+
+def _reference_apply_context_rules(processor, text, review_mode=False):
+    changes = []
+    corrected = text
+    for rule in processor.context_rules:
+        pattern = rule["pattern"]
+        replacement = rule["replacement"]
+        description = rule.get("description", "")
+        result_parts = []
+        search_start = 0
+        for match in re.finditer(pattern, corrected):
+            matched = match.group(0)
+            risk = processor._assess_risk(matched, replacement)
+            changes.append(Change(
+                line_number=corrected[:match.start()].count("\n") + 1,
+                from_text=matched,
+                to_text=replacement,
+                rule_type="context_rule",
+                rule_name=description or pattern,
+                risk=risk,
+            ))
+            result_parts.append(corrected[search_start:match.start()])
+            if review_mode and risk in ("medium", "high"):
+                result_parts.append(matched)
+            else:
+                result_parts.append(replacement)
+            search_start = match.end()
+        result_parts.append(corrected[search_start:])
+        corrected = "".join(result_parts)
+    return corrected, changes
+
+
+def _rule(pattern, replacement, description=""):
+    return {"pattern": pattern, "replacement": replacement, "description": description}
+
+
+class TestBundleCompilation(unittest.TestCase):
+
+    def setUp(self):
+        clear_context_rule_cache()
+
+    def test_non_overlapping_literals_share_one_pass(self):
+        bundle = compile_context_rules([
+            _rule("巨升方向", "具身方向"),
+            _rule("巨升现在", "具身现在"),
+            _rule("近距离的去看", "近距离地去看"),
+        ])
+        self.assertEqual(len(bundle.passes), 1)
+        self.assertEqual(bundle.rule_count, 3)
+
+    def test_regex_rule_splits_literal_groups(self):
+        bundle = compile_context_rules([
+            _rule("巨升方向", "具身方向"),
+            _rule("(?<!产)线数(?!据)", "线束"),
+            _rule("巨升现在", "具身现在"),
+        ])
+        self.assertEqual([len(p.rules) for p in bundle.passes], [1, 1, 1])
+
+    def test_replacement_feeding_later_rule_is_not_merged(self):
+        bundle = compile_context_rules([_rule("甲", "乙丙"), _rule("丙丁", "戊")])
+        self.assertEqual(len(bundle.passes), 2)
+
+    def test_deletion_closes_its_pass(self):
+        bundle = compile_context_rules([_rule("嗯", ""), _rule("那个", "那")])
+        self.assertEqual(len(bundle.passes), 2)
+
+    def test_invalid_regex_names_the_rule(self):
+        with self.assertRaises(ValueError) as ctx:
+            compile_context_rules([_rule("(未闭合", "x", "broken")])
+        self.assertIn("(未闭合", str(ctx.exception))
+
+    def test_bundle_cached_by_rules_version(self):
+        rules = [_rule("巨升方向", "具身方向")]
+        first = get_context_rule_bundle(rules)
+        self.assertIs(get_context_rule_bundle([dict(r) for r in rules]), first)
+        edited = [_rule("巨升方向", "具身的方向")]
+        self.assertNotEqual(context_rules_version(edited), first.version)
+        self.assertIsNot(get_context_rule_bundle(edited), first)
+
+
+class TestBundleMatchesSequentialRules(unittest.TestCase):
+
+    def assert_same_as_reference(self, rules, text, review_mode=False):
+        processor = DictionaryProcessor({}, rules)
+        expected = _reference_apply_context_rules(processor, text, review_mode)
+        actual = processor._apply_context_rules(text, review_mode=review_mode)
+        self.assertEqual(actual, expected)
+
+    def test_production_shaped_rules(self):
+        rules = [
+            _rule("巨升方向", "具身方向", "巨升→具身"),
+            _rule("巨升现在", "具身现在", "巨升→具身"),
+            _rule("近距离的去看", "近距离地去看", "的→地 副词修饰"),
+            _rule("(?<!产)线数(?!据)", "线束", "线数->线束"),
+        ]
+        text = "巨升方向很好\n近距离的去看线数\n产线数据 巨升现在"
+        self.assert_same_as_reference(rules, text)
+        self.assert_same_as_reference(rules, text, review_mode=True)
+
+    def test_deletion_splicing_a_later_match(self):
+        rules = [_rule("嗯", "", "删除语气词"), _rule("那个", "那")]
+        self.assert_same_as_reference(rules, "那嗯个\n那个嗯")
+        processor = DictionaryProcessor({}, rules)
+        self.assertEqual(processor._apply_context_rules("那嗯个")[0], "那")
+
+    def test_randomized_equivalence(self):
+        rng = random.Random(1018)
+        for _ in range(300):
+            rules = []
+            seen = set()
+            for _ in range(rng.randint(1, 6)):
+                if rng.random() < 0.15:
+                    pattern = rng.choice(["a(?=b)", "c+", "(?<!d)e", "[ab]c"])
+                else:
+                    pattern = "".join(rng.choice("abcde") for _ in range(rng.randint(1, 3)))
+                if pattern in seen:
+                    continue
+                seen.add(pattern)
+                replacement = "".join(rng.choice("abcde\n") for _ in range(rng.randint(0, 4)))
+                rules.append(_rule(pattern, replacement, rng.choice(["", "desc"])))
+            text = "".join(rng.choice("abcde\n") for _ in range(rng.randint(0, 50)))
+            review_mode = rng.random() < 0.5
+            with self.subTest(rules=rules, text=text, review_mode=review_mode):
+                self.assert_same_as_reference(rules, text, review_mode)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -319,8 +319,8 @@ class TestAIChunkFailureFidelity:
 
         assert corrected == source
         assert changes == []
-        assert processor.total_chunks == 2
-        assert processor.failed_chunks == 2
+        assert processor.total_chunks == len(split_into_chunks(source, 4)) > 1
+        assert processor.failed_chunks == processor.total_chunks
 
     @pytest.mark.parametrize("blank_text", ["", "   ", "\n\t"])
     def test_blank_api_text_is_a_failure_not_a_correction(self, blank_text):
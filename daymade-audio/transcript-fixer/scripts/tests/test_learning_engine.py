@@ -26,7 +26,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import only what we need to avoid circular dependencies
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from types import SimpleNamespace
 
 # Manually define Suggestion to avoid circular import
@@ -1054,5 +1054,117 @@ class TestLearningCli:
         assert auto_approved[0]["models"] == ["fallback-real"]
 
 
+class TestIncrementalAggregation:
+    """SQLite pattern aggregates fold only changes above the high-water mark"""
+
+    @pytest.fixture
+    def db_engine(self, tmp_path):
+        from core.correction_repository import CorrectionRepository
+
+        db_path = tmp_path / "corrections.db"
+        CorrectionRepository(db_path).close()
+        learned_dir = tmp_path / "learned"
+        learned_dir.mkdir()
+        return LearningEngine(tmp_path / "history", learned_dir, db_path=db_path)
+
+    @staticmethod
+    def _record(db_path, filename, pairs, timestamp="2026-07-08 00:00:00"):
+        with sqlite3.connect(db_path) as conn:
+            history_id = conn.execute(
+                """
+                INSERT INTO correction_history
+                (filename, domain, run_timestamp, original_length, stage2_changes, model)
+                VALUES (?, 'tech', ?, 100, ?, 'm')
+                """,
+                (filename, timestamp, len(pairs)),
+            ).lastrowid
+            conn.executemany(
+                """
+                INSERT INTO correction_changes
+                (history_id, line_number, from_text, to_text, rule_type,
+                 confidence, model)
+                VALUES (?, 1, ?, ?, 'ai', 0.9, ?)
+                """,
+                [(history_id, f, t, model) for f, t, model in pairs],
+            )
+        return history_id
+
+    @staticmethod
+    def _state(db_path):
+        with sqlite3.connect(db_path) as conn:
+            return conn.execute(
+                "SELECT high_water_mark, needs_rebuild FROM learning_aggregate_state"
+            ).fetchone()
+
+    def test_new_rows_fold_into_existing_aggregates(self, db_engine):
+        db = db_engine.db_path
+        for index in range(3):
+            self._record(db, f"a-{index}.md", [("巨升", "具身", "primary")])
+        first = db_engine.analyze_and_suggest()
+        assert [(s.frequency, s.files) for s in first] == [(3, 3)]
+        assert self._state(db) == (3, 0)
+
+        self._record(db, "a-0.md", [("巨升", "具身", "fallback")] * 2,
+                     timestamp="2026-07-09 00:00:00")
+        second = db_engine.analyze_and_suggest()
+
+        assert self._state(db) == (5, 0)
+        suggestion = second[0]
+        assert suggestion.frequency == 5
+        assert suggestion.files == 3
+        assert suggestion.models == ["fallback", "primary"]
+        assert suggestion.confidence == pytest.approx(0.9)
+        assert suggestion.first_seen == "2026-07-08 00:00:00"
+        assert suggestion.last_seen == "2026-07-09 00:00:00"
+        assert [e["file"] for e in suggestion.examples] == [
+            "a-0.md", "a-1.md", "a-2.md", "a-0.md", "a-0.md",
+        ]
+
+    def test_incremental_result_matches_a_full_rebuild(self, db_engine):
+        db = db_engine.db_path
+        for index in range(12):
+            pairs = [("巨升", "具身", "m"), ("克劳锐", "Claude", f"m{index % 2}")]
+            self._record(db, f"b-{index % 4}.md", pairs,
+                         timestamp=f"2026-07-{index + 1:02d} 00:00:00")
+            if index % 5 == 0:
+                db_engine.analyze_and_suggest()
+        incremental = [asdict(s) for s in db_engine.analyze_and_suggest()]
+
+        with sqlite3.connect(db) as conn:
+            conn.execute("UPDATE learning_aggregate_state SET needs_rebuild = 1")
+        rebuilt = [asdict(s) for s in db_engine.analyze_and_suggest()]
+
+        assert incremental == rebuilt
+        assert [(s["from_text"], s["frequency"]) for s in rebuilt] == [
+            ("巨升", 12), ("克劳锐", 12),
+        ]
+
+    def test_deleting_folded_history_triggers_a_rebuild(self, db_engine):
+        db = db_engine.db_path
+        doomed = [
+            self._record(db, f"c-{index}.md", [("巨升", "具身", "m")])
+            for index in range(4)
+        ]
+        assert db_engine.analyze_and_suggest()[0].frequency == 4
+
+        with sqlite3.connect(db) as conn:
+            conn.execute("DELETE FROM correction_changes WHERE history_id = ?", (doomed[0],))
+            conn.execute("DELETE FROM correction_history WHERE id = ?", (doomed[0],))
+        assert self._state(db)[1] == 1
+
+        assert db_engine.analyze_and_suggest()[0].frequency == 3
+        assert self._state(db) == (4, 0)
+
+    def test_flipping_a_learnable_flag_is_not_missed(self, db_engine):
+        db = db_engine.db_path
+        for index in range(3):
+            self._record(db, f"d-{index}.md", [("巨升", "具身", "m")])
+        assert db_engine.analyze_and_suggest()
+
+        with sqlite3.connect(db) as conn:
+            conn.execute("UPDATE correction_changes SET learnable = 0 WHERE id = 1")
+        assert db_engine.analyze_and_suggest() == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])
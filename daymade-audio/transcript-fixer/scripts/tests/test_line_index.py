@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Tests for utils.line_index — must agree with the idioms it replaces."""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.line_index import LineIndex
+
+
+class TestLineIndex(unittest.TestCase):
+
+    def test_matches_prefix_newline_count(self):
+        rng = random.Random(3)
+        text = "".join(rng.choice("ab\n\r") for _ in range(2000))
+        index = LineIndex(text)
+        for pos in range(len(text) + 1):
+            self.assertEqual(index.line_of(pos), text[:pos].count("\n") + 1)
+
+    def test_universal_lines_match_splitlines(self):
+        text = "一\r\n二\r三 四\n\n五\x0c六"
+        index = LineIndex(text, universal=True)
+        lines = text.splitlines()
+        for line_no, line in enumerate(lines, start=1):
+            self.assertEqual(index.line_text(line_no), line)
+        self.assertEqual(index.line_of(text.index("五")), 6)
+
+    def test_line_bounds_exclude_separator(self):
+        index = LineIndex("ab\ncd")
+        self.assertEqual(index.line_bounds(1), (0, 2))
+        self.assertEqual(index.line_bounds(2), (3, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the bounded-memory, mergeable Histogram and its Prometheus export.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.metrics import (
+    SKETCH_MAX_BINS,
+    SKETCH_RELATIVE_ACCURACY,
+    Histogram,
+    MetricsCollector,
+)
+
+
+def _latencies(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [rng.lognormvariate(-1.0, 1.2) for _ in range(n)]
+
+
+def test_percentiles_stay_within_relative_accuracy():
+    values = _latencies(20000)
+    histogram = Histogram("h")
+    for value in values:
+        histogram.observe(value)
+
+    ordered = sorted(values)
+    for p in (0.5, 0.9, 0.95, 0.99):
+        exact = ordered[int(len(ordered) * p)]
+        assert histogram.get_percentile(p) == pytest.approx(
+            exact, rel=SKETCH_RELATIVE_ACCURACY
+        )
+    assert histogram.get_mean() == pytest.approx(sum(values) / len(values))
+    assert histogram.get_percentile(0.0) == min(values)
+    assert histogram.get_percentile(1.0) == max(values)
+
+
+def test_memory_is_bounded_for_unbounded_ranges():
+    histogram = Histogram("h")
+    values = [mantissa * 10.0 ** exponent
+              for exponent in range(-300, 300)
+              for mantissa in (1.0, 1.5, 3.0, 7.0)]
+    for value in values:
+        histogram.observe(value)
+    assert len(histogram._positive.bins) <= SKETCH_MAX_BINS
+    assert histogram.get_count() == len(values)
+    # Collapsing only costs resolution at the low end
+    assert histogram.get_percentile(0.99) == pytest.approx(
+        values[int(len(values) * 0.99)], rel=SKETCH_RELATIVE_ACCURACY
+    )
+
+
+def test_zero_and_negative_values():
+    histogram = Histogram("h")
+    for value in (-2.0, -1.0, 0.0, 0.0, 1.0, 2.0):
+        histogram.observe(value)
+    assert histogram.get_percentile(0.0) == -2.0
+    assert histogram.get_percentile(0.4) == 0.0
+    assert histogram.get_percentile(0.99) == 2.0
+
+
+def test_buckets_are_cumulative_and_end_with_inf():
+    histogram = Histogram("h", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.get_buckets() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+
+
+def test_merging_worker_states_matches_a_single_histogram():
+    values = _latencies(9000, seed=11)
+    combined = Histogram("h")
+    for value in values:
+        combined.observe(value)
+
+    parent = MetricsCollector()
+    for worker in range(3):
+        collector = MetricsCollector()
+        collector.get_counter("requests_total").inc(10)
+        histogram = collector.get_histogram("request_duration_seconds")
+        for value in values[worker::3]:
+            histogram.observe(value)
+        # States cross process boundaries as JSON
+        parent.merge_state(json.loads(json.dumps(collector.export_state())))
+
+    merged = parent.get_histogram("request_duration_seconds")
+    assert merged.get_count() == len(values)
+    assert merged.get_buckets() == combined.get_buckets()
+    for p in (0.5, 0.95, 0.99):
+        assert merged.get_percentile(p) == combined.get_percentile(p)
+    assert parent.get_counter("requests_total").get() == 30
+
+
+def test_merge_rejects_incompatible_histograms():
+    with pytest.raises(ValueError, match="bucket bounds"):
+        Histogram("a", buckets=(1.0,)).merge(Histogram("b", buckets=(2.0,)))
+
+
+def test_prometheus_export_has_proper_bucket_series():
+    collector = MetricsCollector()
+    histogram = collector.register_histogram("latency_seconds", "Latency", buckets=(0.5, 1.0))
+    histogram._labels = {"stage": "2"}
+    for value in (0.2, 0.7, 3.0):
+        histogram.observe(value)
+
+    text = collector.to_prometheus()
+    series = [line.rsplit(" ", 1)[0] for line in text.splitlines()
+              if line.startswith("latency_seconds")]
+    assert series == [
+        'latency_seconds_bucket{stage="2",le="0.5"} 1',
+        'latency_seconds_bucket{stage="2",le="1.0"} 2',
+        'latency_seconds_bucket{stage="2",le="+Inf"} 3',
+        'latency_seconds_count{stage="2"} 3',
+        'latency_seconds_sum{stage="2"} 3.9',
+    ]
+    assert "# TYPE latency_seconds histogram" in text
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the Stage 1 multi-pattern engine.
+
+The automaton must be a pure speed-up: output text and Change lists have to be
+identical to the per-rule str.find engine it replaced, including rule chains
+(a replacement creating a later rule's match) and the superset/boundary/risk
+safety layers. The reference below is that engine, kept verbatim.
+"""
+
+import random
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.dictionary_processor import DictionaryProcessor
+from core.multi_pattern import MultiPatternMatcher
+
+
+def _reference_apply_dictionary(processor, text, review_mode=False):
+    """The pre-automaton loop: every rule rescans the whole text in order."""
+    changes = []
+    corrected = text
+    for wrong, correct in processor.corrections.items():
+        if wrong not in corrected:
+            continue
+        corrected, new_changes = processor._apply_with_safety_checks(
+            corrected, wrong, correct, len(wrong) <= 3, review_mode=review_mode,
+        )
+        changes.extend(new_changes)
+    return corrected, changes
+
+
+class TestMultiPatternMatcher(unittest.TestCase):
+
+    def test_reports_overlapping_and_prefix_hits(self):
+        matcher = MultiPatternMatcher(["ab", "abcd", "b", "现金流", "金流"])
+        hits = sorted(matcher.iter_matches("abcd 现金流"))
+        self.assertEqual(
+            hits,
+            [(0, "ab"), (0, "abcd"), (1, "b"), (5, "现金流"), (6, "金流")],
+        )
+
+    def test_window_excludes_partial_occurrences(self):
+        matcher = MultiPatternMatcher(["abc"])
+        self.assertEqual(matcher.find_patterns("xabcx", 0, 3), set())
+        self.assertEqual(matcher.find_patterns("xabcx", 1, 4), {"abc"})
+
+    def test_regex_metacharacters_are_literal(self):
+        matcher = MultiPatternMatcher(["a.b", "(x)", "[y]"])
+        self.assertEqual(matcher.find_patterns("axb (x) [y]"), {"(x)", "[y]"})
+
+    def test_empty_pattern_set(self):
+        matcher = MultiPatternMatcher([])
+        self.assertEqual(matcher.find_patterns("anything"), set())
+
+
+class TestAutomatonMatchesReferenceEngine(unittest.TestCase):
+
+    def assert_same_as_reference(self, corrections, text, review_mode=False, meta=None):
+        processor = DictionaryProcessor(corrections, [], correction_meta=meta)
+        expected = _reference_apply_dictionary(processor, text, review_mode)
+        actual = processor._apply_dictionary(text, review_mode=review_mode)
+        self.assertEqual(actual[0], expected[0])
+        self.assertEqual(actual[1], expected[1])
+
+    def test_chained_rules_follow_dictionary_order(self):
+        # "克劳" → "Claude" then "Claude的" → "Claude 的": the second rule
+        # only matches text the first one produced.
+        corrections = {"克劳锐": "Claude", "Claude的": "Claude 的"}
+        self.assert_same_as_reference(corrections, "克劳锐的能力\n克劳锐的\n")
+
+    def test_earlier_rule_does_not_see_later_output(self):
+        corrections = {"BB": "X", "AA": "BB"}
+        self.assert_same_as_reference(corrections, "AA AA BB")
+
+    def test_superset_skip_preserved(self):
+        corrections = {"金流": "现金流"}
+        self.assert_same_as_reference(corrections, "现金流和金流\n金流")
+
+    def test_review_mode_deferrals_preserved(self):
+        corrections = {"天差": "天才", "克劳锐": "Claude", "ab": "abc"}
+        meta = {"克劳锐": {"confidence": 0.8}}
+        text = "天差地别 天差 克劳锐\nab abc"
+        self.assert_same_as_reference(corrections, text, review_mode=True, meta=meta)
+        self.assert_same_as_reference(corrections, text, review_mode=False, meta=meta)
+
+    def test_processor_reuses_compiled_matcher(self):
+        processor = DictionaryProcessor({"克劳锐": "Claude"}, [])
+        processor.process("克劳锐")
+        matcher = processor._matcher
+        processor.process("又一个克劳锐")
+        self.assertIs(processor._matcher, matcher)
+
+    def test_randomized_equivalence(self):
+        rng = random.Random(20261018)
+        alphabet = "abcde\n"
+        for _ in range(300):
+            corrections = {}
+            for _ in range(rng.randint(1, 8)):
+                wrong = "".join(rng.choice("abcde") for _ in range(rng.randint(1, 4)))
+                correct = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))
+                if wrong != correct:
+                    corrections[wrong] = correct
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+            review_mode = rng.random() < 0.5
+            with self.subTest(corrections=corrections, text=text, review_mode=review_mode):
+                self.assert_same_as_reference(corrections, text, review_mode)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for the Stage 2 response cache and its wiring into both AI processors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.ai_processor import AIProcessor
+from core.ai_processor_async import AIProcessorAsync
+from core.ai_utils import build_correction_prompt
+from core.response_cache import ResponseCache, response_cache_key
+
+
+class _Response:
+    def __init__(self, text):
+        self._text = text
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return {"content": [{"type": "text", "text": self._text}]}
+
+
+def test_key_covers_prompt_model_and_params():
+    prompt = build_correction_prompt("会议开时", "")
+    base = response_cache_key(prompt, "m", max_tokens=8000, temperature=0.3)
+    assert base == response_cache_key(prompt, "m", temperature=0.3, max_tokens=8000)
+    assert base != response_cache_key(prompt, "other", max_tokens=8000, temperature=0.3)
+    assert base != response_cache_key(prompt, "m", max_tokens=8000, temperature=0.5)
+    assert base != response_cache_key(
+        build_correction_prompt("会议开时", "finance"), "m",
+        max_tokens=8000, temperature=0.3,
+    )
+
+
+def test_get_put_roundtrip_and_persistence(tmp_path):
+    db = tmp_path / "cache.db"
+    ResponseCache(db).put("k", "m", "会议开始")
+    assert ResponseCache(db).get("k") == "会议开始"
+    assert ResponseCache(db).get("missing") is None
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.db", max_bytes=300)
+    cache.put("a", "m", "a" * 100)
+    cache.put("b", "m", "b" * 100)
+    assert cache.get("a") is not None  # a is now more recent than b
+    cache.put("c", "m", "c" * 150)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" * 100
+    assert cache.get("c") == "c" * 150
+    assert cache.stats()["bytes"] <= 300
+
+
+def test_sync_processor_serves_repeat_chunks_from_cache(tmp_path, monkeypatch):
+    calls = []
+
+    class Client:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def post(self, _url, headers, json):
+            calls.append(json["model"])
+            return _Response("会议开始")
+
+    monkeypatch.setattr("core.ai_processor.httpx.Client", Client)
+    cache = ResponseCache(tmp_path / "cache.db")
+    processor = AIProcessor(api_key="test", fallback_model="", response_cache=cache)
+
+    assert processor.process("会议开时") == processor.process("会议开时")
+    assert len(calls) == 1
+    assert processor.cache_hits == 1
+    assert processor.models_used == {processor.model}
+
+
+@pytest.mark.asyncio
+async def test_async_processor_serves_repeat_chunks_from_cache(tmp_path):
+    calls = []
+
+    class Client:
+        async def post(self, _url, headers, json):
+            calls.append(json["model"])
+            return _Response("会议开始")
+
+    cache = ResponseCache(tmp_path / "cache.db")
+    processor = AIProcessorAsync(api_key="test", fallback_model="", response_cache=cache)
+
+    async def get_client():
+        return Client()
+
+    processor._get_http_client = get_client
+    first = await processor._process_async("会议开时", "")
+    second = await processor._process_async("会议开时", "")
+
+    assert first == second
+    assert first[0] == "会议开始"
+    assert len(calls) == 1
+    assert processor.cache_hits == 1
+
+
+def test_failed_responses_are_not_cached(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.db")
+    processor = AIProcessorAsync(api_key="test", fallback_model="", response_cache=cache)
+
+    class Client:
+        async def post(self, *_args, **_kwargs):
+            raise RuntimeError("down")
+
+    async def get_client():
+        return Client()
+
+    processor._get_http_client = get_client
+    with pytest.raises(RuntimeError):
+        asyncio.run(processor._process_chunk_async("会议开时", "", "m"))
+    assert cache.stats()["entries"] == 0
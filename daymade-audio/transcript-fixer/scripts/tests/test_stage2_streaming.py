@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming Stage 2 pipeline in AIProcessorAsync.
+
+Chunks finish out of order (randomized per-chunk delays); the pipeline must
+still emit text, changes and progress in chunk order while keeping at most
+max_concurrent * STREAM_WINDOW_FACTOR chunks outstanding.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.ai_processor_async import (
+    STREAM_WINDOW_FACTOR,
+    AIProcessorAsync,
+    ChunkResult,
+)
+
+
+def _source(chunks: int) -> str:
+    return "\n\n".join(f"第{i}段会议开时了" for i in range(chunks))
+
+
+@pytest.mark.asyncio
+async def test_out_of_order_completion_is_emitted_in_chunk_order():
+    source = _source(40)
+    progress = []
+    processor = AIProcessorAsync(
+        api_key="test",
+        fallback_model="",
+        max_concurrent=3,
+        progress_callback=lambda done, total: progress.append((done, total)),
+    )
+    processor.max_chunk_size = 12
+    rng = random.Random(3)
+    outstanding = 0
+    peak = 0
+
+    async def slow_fix(_index, chunk, _context, _semaphore, _total):
+        nonlocal outstanding, peak
+        outstanding += 1
+        peak = max(peak, outstanding)
+        try:
+            await asyncio.sleep(rng.random() / 200)
+            return ChunkResult(chunk.replace("开时", "开始"), model_used="m")
+        finally:
+            outstanding -= 1
+
+    processor._process_chunk_with_semaphore = slow_fix
+    corrected, changes = await processor._process_async(source, "")
+
+    assert corrected == source.replace("开时", "开始")
+    total = processor.total_chunks
+    assert total > 1
+    assert [c.chunk_index for c in changes] == sorted(c.chunk_index for c in changes)
+    assert {c.chunk_index for c in changes} == set(range(1, total + 1))
+    assert progress == [(done, total) for done in range(1, total + 1)]
+    assert peak <= 3 * STREAM_WINDOW_FACTOR
+
+
+@pytest.mark.asyncio
+async def test_raising_chunk_keeps_original_and_the_rest_stream_through():
+    source = _source(6)
+    processor = AIProcessorAsync(api_key="test", fallback_model="", max_concurrent=2)
+    processor.max_chunk_size = 12
+
+    async def fail_second(index, chunk, _context, _semaphore, _total):
+        if index == 2:
+            raise RuntimeError("boom")
+        return ChunkResult(chunk.replace("开时", "开始"), model_used="m")
+
+    processor._process_chunk_with_semaphore = fail_second
+    corrected, changes = await processor._process_async(source, "")
+
+    assert processor.failed_chunks == 1
+    assert 2 not in {c.chunk_index for c in changes}
+    assert corrected.count("开时") == 1
@@ -11,7 +11,8 @@ Features:
 - Request queue management
 - Integration with rate limiter
 - Concurrent operation monitoring
-- Adaptive concurrency tuning
+- Adaptive concurrency tuning (AIMD on latency and HTTP 429)
+- Live limit / active / queue-depth gauges in utils.metrics
 
 Use cases:
 - API request management
@@ -30,9 +31,12 @@ from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional, Dict, Any, Callable, TypeVar, Final
+from typing import Optional, Dict, Any, Callable, TypeVar, Final, TYPE_CHECKING
 from collections import deque
 
+if TYPE_CHECKING:
+    from utils.metrics import MetricsCollector
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -59,6 +63,9 @@ class ConcurrencyConfig:
     enable_adaptive_tuning: bool = False  # Adjust concurrency based on performance
     min_concurrent: int = 2  # Minimum concurrent (for adaptive tuning)
     max_response_time: float = 5.0  # Target max response time (for adaptive tuning)
+    max_concurrent_ceiling: int = 20  # Additive increase never goes above this
+    decrease_factor: float = 0.5  # Multiplicative decrease on congestion
+    adjust_min_samples: int = 10  # Completions between two adjustments
 
 
 @dataclass
@@ -108,6 +115,12 @@ class CircuitBreakerOpenError(Exception):
     pass
 
 
+def is_rate_limited_error(exc: BaseException) -> bool:
+    """True for an HTTP 429 response error (httpx or anything shaped like it)."""
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
 class ConcurrencyManager:
     """
     Production-grade concurrency management with advanced features
@@ -121,18 +134,31 @@ class ConcurrencyManager:
     - Adaptive tuning (optimization)
     """
 
-    def __init__(self, config: ConcurrencyConfig = None):
+    def __init__(self, config: ConcurrencyConfig = None,
+                 metrics: Optional[MetricsCollector] = None,
+                 name: str = "concurrency"):
         """
         Initialize concurrency manager
 
         Args:
             config: Concurrency configuration
+            metrics: Optional collector that receives live gauges
+                     (<name>_limit, <name>_active, <name>_queue_depth,
+                     <name>_circuit_open) and counters
+                     (<name>_rate_limited_total, <name>_limit_changes_total)
+            name: Metric name prefix
         """
         self.config = config or ConcurrencyConfig()
-
-        # Semaphore for concurrency limiting
-        self._semaphore = asyncio.Semaphore(self.config.max_concurrent)
+        self.name = name
+
+        # Async slots: a resizable gate (an asyncio.Semaphore cannot shrink or
+        # grow). Waiters are plain futures of the running loop, so one manager
+        # can serve successive asyncio.run() loops. Only touched from the
+        # event loop thread.
+        self._active_slots = 0
+        self._slot_waiters: deque = deque()
         self._sync_semaphore = threading.Semaphore(self.config.max_concurrent)
+        self._completions_since_adjust = 0
 
         # Queue for pending requests
         self._queue: deque = deque(maxlen=self.config.max_queue_size)
@@ -154,8 +180,74 @@ class ConcurrencyManager:
         self._circuit_successes = 0
         self._circuit_lock = threading.Lock()
 
+        self._gauges = None
+        if metrics is not None:
+            self._gauges = {
+                "limit": metrics.register_gauge(
+                    f"{name}_limit", "Current adaptive concurrency limit"),
+                "active": metrics.register_gauge(
+                    f"{name}_active", "Operations holding a concurrency slot"),
+                "queued": metrics.register_gauge(
+                    f"{name}_queue_depth", "Operations waiting for a concurrency slot"),
+                "circuit_open": metrics.register_gauge(
+                    f"{name}_circuit_open", "1 while the circuit breaker is open"),
+            }
+            self._rate_limited_counter = metrics.register_counter(
+                f"{name}_rate_limited_total", "Operations rejected upstream with HTTP 429")
+            self._limit_changes_counter = metrics.register_counter(
+                f"{name}_limit_changes_total", "Adaptive concurrency limit changes")
+            self._publish_gauges()
+
         logger.info(f"ConcurrencyManager initialized: max_concurrent={self.config.max_concurrent}")
 
+    def _publish_gauges(self) -> None:
+        """Push limit / active / queue depth / circuit state to the collector"""
+        if self._gauges is None:
+            return
+        with self._metrics_lock:
+            limit = self._metrics.current_concurrency
+            active = self._metrics.active_operations
+            queued = self._metrics.queued_operations
+        self._gauges["limit"].set(limit)
+        self._gauges["active"].set(active)
+        self._gauges["queued"].set(queued)
+        self._gauges["circuit_open"].set(
+            1 if self._circuit_state == CircuitState.OPEN else 0
+        )
+
+    async def _acquire_slot(self) -> None:
+        """Wait (FIFO) until fewer than config.max_concurrent slots are held"""
+        if not self._slot_waiters and self._active_slots < self.config.max_concurrent:
+            self._active_slots += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._slot_waiters.append(waiter)
+        try:
+            # _wake_slot_waiters() takes the slot on our behalf before
+            # resolving the future.
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release_slot()
+            else:
+                try:
+                    self._slot_waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+    def _release_slot(self) -> None:
+        self._active_slots -= 1
+        self._wake_slot_waiters()
+
+    def _wake_slot_waiters(self) -> None:
+        while self._slot_waiters and self._active_slots < self.config.max_concurrent:
+            waiter = self._slot_waiters.popleft()
+            if waiter.done():
+                continue
+            self._active_slots += 1
+            waiter.set_result(None)
+
     def _check_circuit_breaker(self) -> None:
         """Check circuit breaker state and potentially transition"""
         if not self.config.enable_circuit_breaker:
@@ -186,7 +278,11 @@ class ConcurrencyManager:
             return
 
         with self._circuit_lock:
-            if self._circuit_state == CircuitState.HALF_OPEN:
+            if self._circuit_state == CircuitState.CLOSED:
+                # The threshold counts consecutive failures; a success in
+                # between means the service is answering.
+                self._circuit_failures = 0
+            elif self._circuit_state == CircuitState.HALF_OPEN:
                 self._circuit_successes += 1
                 if self._circuit_successes >= self.config.circuit_success_threshold:
                     logger.info("Circuit breaker: HALF_OPEN -> CLOSED (recovered)")
@@ -230,49 +326,77 @@ class ConcurrencyManager:
                 with self._metrics_lock:
                     self._metrics.avg_response_time_ms = avg
 
-    def _adjust_concurrency(self) -> None:
-        """Adaptive concurrency tuning based on performance"""
+    def _adjust_concurrency(self, rate_limited: bool = False) -> None:
+        """
+        Adaptive concurrency tuning (AIMD).
+
+        - Multiplicative decrease (x decrease_factor, floor min_concurrent)
+          at once on an HTTP 429, or when the mean response time since the
+          last adjustment exceeds 1.5x max_response_time
+        - Additive increase (+1, capped at max_concurrent_ceiling) when that
+          mean is within max_response_time
+
+        Latency is judged once per max(limit, adjust_min_samples) completions
+        so one adjustment is observed before the next is made.
+        """
         if not self.config.enable_adaptive_tuning:
             return
 
         with self._response_times_lock:
-            if len(self._response_times) < 10:
-                return  # Not enough data
-
-            avg_time = sum(self._response_times) / len(self._response_times)
-            target_time = self.config.max_response_time * 1000  # Convert to ms
-
             current_concurrency = self.config.max_concurrent
-
-            if avg_time > target_time * 1.5:
-                # Response time too high - decrease concurrency
+            if rate_limited:
+                reason = "rate limited (HTTP 429)"
                 new_concurrency = max(
                     self.config.min_concurrent,
-                    current_concurrency - 1
+                    int(current_concurrency * self.config.decrease_factor)
                 )
-                if new_concurrency != current_concurrency:
-                    logger.info(
-                        f"Adaptive tuning: Decreasing concurrency "
-                        f"{current_concurrency} -> {new_concurrency} "
-                        f"(avg response time: {avg_time:.1f}ms)"
+            else:
+                self._completions_since_adjust += 1
+                window = max(current_concurrency, self.config.adjust_min_samples)
+                if (self._completions_since_adjust < window
+                        or len(self._response_times) < min(window, self._response_times.maxlen)):
+                    return
+
+                recent = list(self._response_times)[-self._completions_since_adjust:]
+                avg_time = sum(recent) / len(recent)
+                target_time = self.config.max_response_time * 1000  # Convert to ms
+                reason = f"avg response time: {avg_time:.1f}ms"
+
+                if avg_time > target_time * 1.5:
+                    # Response time too high - back off multiplicatively
+                    new_concurrency = max(
+                        self.config.min_concurrent,
+                        int(current_concurrency * self.config.decrease_factor)
                     )
-                    self.config.max_concurrent = new_concurrency
-                    # Note: Can't easily adjust asyncio.Semaphore,
-                    # would need to recreate it
-
-            elif avg_time < target_time * 0.5:
-                # Response time low - can increase concurrency
-                new_concurrency = min(
-                    20,  # Hard cap
-                    current_concurrency + 1
-                )
-                if new_concurrency != current_concurrency:
-                    logger.info(
-                        f"Adaptive tuning: Increasing concurrency "
-                        f"{current_concurrency} -> {new_concurrency} "
-                        f"(avg response time: {avg_time:.1f}ms)"
+                elif avg_time <= target_time:
+                    # Healthy - probe one more slot
+                    new_concurrency = min(
+                        self.config.max_concurrent_ceiling,
+                        current_concurrency + 1
                     )
-                    self.config.max_concurrent = new_concurrency
+                else:
+                    new_concurrency = current_concurrency
+
+            self._completions_since_adjust = 0
+            if new_concurrency != current_concurrency:
+                # Samples taken at the old limit say nothing about the new one
+                self._response_times.clear()
+
+        if new_concurrency == current_concurrency:
+            return
+        logger.info(
+            f"Adaptive tuning: {'Decreasing' if new_concurrency < current_concurrency else 'Increasing'} "
+            f"concurrency {current_concurrency} -> {new_concurrency} ({reason})"
+        )
+        self.config.max_concurrent = new_concurrency
+        with self._metrics_lock:
+            self._metrics.current_concurrency = new_concurrency
+        if self._gauges is not None:
+            self._limit_changes_counter.inc()
+        # A raised limit admits queued operations right away; a lowered one
+        # takes effect as held slots are released.
+        self._wake_slot_waiters()
+        self._publish_gauges()
 
     @asynccontextmanager
     async def acquire(self, timeout: Optional[float] = None):
@@ -311,6 +435,7 @@ class ConcurrencyManager:
         with self._metrics_lock:
             self._metrics.queued_operations += 1
             self._metrics.total_requests += 1
+        self._publish_gauges()
 
         # asyncio.timeout was added in Python 3.11, while this bundle's
         # declared floor is 3.10. A loop timer cancels the owning task across
@@ -330,14 +455,16 @@ class ConcurrencyManager:
             timeout, cancel_for_timeout
         )
         acquired = False
+        rate_limited = False
         try:
-            await self._semaphore.acquire()
+            await self._acquire_slot()
             acquired = True
 
             # Update active metrics after a successful acquisition.
             with self._metrics_lock:
                 self._metrics.queued_operations -= 1
                 self._metrics.active_operations += 1
+            self._publish_gauges()
 
             operation_start = time.time()
             try:
@@ -351,9 +478,15 @@ class ConcurrencyManager:
                 with self._metrics_lock:
                     self._metrics.successful_requests += 1
 
-            except Exception:
-                # Record failure
-                self._record_failure()
+            except Exception as e:
+                # A 429 is congestion, not an outage: it shrinks the limit
+                # but does not count towards opening the circuit.
+                rate_limited = is_rate_limited_error(e)
+                if rate_limited:
+                    if self._gauges is not None:
+                        self._rate_limited_counter.inc()
+                else:
+                    self._record_failure()
 
                 with self._metrics_lock:
                     self._metrics.failed_requests += 1
@@ -361,26 +494,29 @@ class ConcurrencyManager:
                 raise
 
             finally:
-                self._semaphore.release()
+                self._release_slot()
 
                 # Update active metrics
                 with self._metrics_lock:
                     self._metrics.active_operations -= 1
 
                 # Adaptive tuning
-                self._adjust_concurrency()
+                self._adjust_concurrency(rate_limited)
+                self._publish_gauges()
 
         except asyncio.CancelledError:
             if not timeout_fired:
                 if not acquired:
                     with self._metrics_lock:
                         self._metrics.queued_operations -= 1
+                    self._publish_gauges()
                 raise
 
             with self._metrics_lock:
                 self._metrics.timeout_requests += 1
                 if not acquired:
                     self._metrics.queued_operations -= 1
+            self._publish_gauges()
 
             elapsed = time.time() - start_time
             raise asyncio.TimeoutError(
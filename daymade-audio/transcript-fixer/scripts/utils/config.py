@@ -277,6 +277,7 @@ class Config:
         features = FeatureFlags(
             enable_learning=_env_bool("TRANSCRIPT_FIXER_ENABLE_LEARNING", True),
             enable_metrics=_env_bool("TRANSCRIPT_FIXER_ENABLE_METRICS", True),
+            enable_caching=_env_bool("TRANSCRIPT_FIXER_ENABLE_CACHING", True),
             enable_auto_approval=_env_bool("TRANSCRIPT_FIXER_AUTO_APPROVE", False),
         )
 
@@ -368,6 +369,7 @@ class Config:
         features = FeatureFlags(
             enable_learning=features_data.get("enable_learning", True),
             enable_metrics=features_data.get("enable_metrics", True),
+            enable_caching=features_data.get("enable_caching", True),
             enable_auto_approval=features_data.get("enable_auto_approval", False),
         )
 
@@ -421,6 +423,7 @@ class Config:
             "features": {
                 "enable_learning": self.features.enable_learning,
                 "enable_metrics": self.features.enable_metrics,
+                "enable_caching": self.features.enable_caching,
                 "enable_auto_approval": self.features.enable_auto_approval,
             },
             "debug": self.debug,
@@ -564,6 +567,12 @@ def get_config() -> Config:
                 "TRANSCRIPT_FIXER_ENABLE_METRICS", True
             )
 
+        env_caching = os.getenv("TRANSCRIPT_FIXER_ENABLE_CACHING")
+        if env_caching is not None:
+            _config.features.enable_caching = _env_bool(
+                "TRANSCRIPT_FIXER_ENABLE_CACHING", True
+            )
+
         env_auto_approve = os.getenv("TRANSCRIPT_FIXER_AUTO_APPROVE")
         if env_auto_approve is not None:
             _config.features.enable_auto_approval = _env_bool(
@@ -633,6 +642,7 @@ CONFIG_FILE_TEMPLATE: Final[str] = """{
   "features": {
     "enable_learning": true,
     "enable_metrics": true,
+    "enable_caching": true,
     "enable_auto_approval": false
   },
   "debug": false
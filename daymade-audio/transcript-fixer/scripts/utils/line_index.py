@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Line Index - offset → line-number lookup without rescanning prefixes
+
+SINGLE RESPONSIBILITY: Map character offsets in one text to 1-based line
+numbers (and line bounds) in O(log lines) per lookup.
+
+`text[:pos].count('\\n') + 1` copies and rescans the whole prefix for every
+hit, which turns a scan with many hits over a long transcript quadratic. The
+index records every line start once, then answers each lookup with bisect.
+
+Two line models are supported, matching the two idioms it replaces:
+- default: lines end at '\\n' only (`str.count('\\n')` semantics)
+- universal=True: lines end at every `str.splitlines()` boundary, with '\\r\\n'
+  counted once, so callers that enumerated `splitlines()` keep their numbering
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from typing import List, Tuple
+
+# Exactly the boundaries str.splitlines() honours; '\r\n' first so it is one.
+_UNIVERSAL_NEWLINE_RE = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+_NEWLINE_RE = re.compile("\n")
+
+
+class LineIndex:
+    """Sorted line-start offsets for one immutable text."""
+
+    __slots__ = ("text", "_starts", "_ends")
+
+    def __init__(self, text: str, *, universal: bool = False):
+        self.text = text
+        pattern = _UNIVERSAL_NEWLINE_RE if universal else _NEWLINE_RE
+        starts: List[int] = [0]
+        ends: List[int] = []
+        for match in pattern.finditer(text):
+            ends.append(match.start())
+            starts.append(match.end())
+        ends.append(len(text))
+        self._starts = starts
+        self._ends = ends
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def line_of(self, pos: int) -> int:
+        """1-based line number containing offset `pos`."""
+        return bisect_right(self._starts, pos)
+
+    def line_bounds(self, line_no: int) -> Tuple[int, int]:
+        """(start, end) offsets of a 1-based line, separator excluded."""
+        return self._starts[line_no - 1], self._ends[line_no - 1]
+
+    def line_text(self, line_no: int) -> str:
+        start, end = self.line_bounds(line_no)
+        return self.text[start:end]
@@ -17,24 +17,38 @@ Metrics Types:
 - Gauge: Point-in-time value (e.g., active connections)
 - Histogram: Distribution of values (e.g., response times)
 - Summary: Statistical summary (e.g., percentiles)
+
+Histograms keep constant memory regardless of how long the process lives:
+fixed Prometheus `le` buckets (exact cumulative counts for `_bucket`
+series) plus a DDSketch-style log-bucketed sketch for percentiles with a
+bounded relative error. observe() is O(1); both structures merge by adding
+counts, so snapshots from worker processes combine exactly
+(MetricsCollector.export_state / merge_state).
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import threading
 import time
+from bisect import bisect_left
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Deque, Final
+from typing import Any, Dict, List, Optional, Deque, Final, Sequence, Tuple
 from contextlib import contextmanager
 import json
 
 logger = logging.getLogger(__name__)
 
 # Configuration constants
-MAX_HISTOGRAM_SAMPLES: Final[int] = 1000  # Keep last 1000 samples per histogram
+# Prometheus default latency buckets (seconds); +Inf is implicit
+DEFAULT_HISTOGRAM_BUCKETS: Final[Tuple[float, ...]] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+SKETCH_RELATIVE_ACCURACY: Final[float] = 0.01  # Percentiles within ±1% of the true value
+SKETCH_MAX_BINS: Final[int] = 2048  # Lowest bins collapse beyond this (bounded memory)
 MAX_TIMESERIES_POINTS: Final[int] = 100   # Keep last 100 time series points
 PERCENTILES: Final[List[float]] = [0.5, 0.9, 0.95, 0.99]  # P50, P90, P95, P99
 
@@ -69,6 +83,8 @@ class MetricSnapshot:
     samples: Optional[int] = None
     sum: Optional[float] = None
     percentiles: Optional[Dict[str, float]] = None
+    # Cumulative (upper_bound, count) pairs, +Inf last
+    buckets: Optional[List[Tuple[float, int]]] = None
 
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
@@ -86,9 +102,19 @@ class MetricSnapshot:
             result['sum'] = self.sum
         if self.percentiles:
             result['percentiles'] = self.percentiles
+        if self.buckets is not None:
+            result['buckets'] = [
+                {'le': _format_le(bound), 'count': count}
+                for bound, count in self.buckets
+            ]
         return result
 
 
+def _format_le(bound: float) -> str:
+    """Prometheus `le` label value"""
+    return "+Inf" if math.isinf(bound) else repr(float(bound))
+
+
 class Counter:
     """
     Counter metric - monotonically increasing value.
@@ -174,28 +200,101 @@ class Gauge:
         )
 
 
+class _LogStore:
+    """Sparse log-indexed bin counts for one sign of a DDSketch"""
+
+    __slots__ = ("bins", "max_bins")
+
+    def __init__(self, max_bins: int):
+        self.bins: Dict[int, int] = {}
+        self.max_bins = max_bins
+
+    def add(self, index: int, count: int = 1) -> None:
+        self.bins[index] = self.bins.get(index, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+    def _collapse(self) -> None:
+        """Fold the lowest bins together (DDSketch's bounded-memory rule):
+        only the smallest values lose resolution, upper percentiles stay exact."""
+        ordered = sorted(self.bins)
+        excess = len(ordered) - self.max_bins
+        target = ordered[excess]
+        folded = sum(self.bins.pop(i) for i in ordered[:excess])
+        self.bins[target] += folded
+
+    def merge(self, other: "_LogStore") -> None:
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+        if len(self.bins) > self.max_bins:
+            self._collapse()
+
+
 class Histogram:
     """
     Histogram metric - tracks distribution of values.
 
     Use for: request latency, response sizes, processing times
+
+    Constant memory and O(1) observe: fixed `le` buckets for Prometheus plus
+    a DDSketch (log-bucketed counts, relative error SKETCH_RELATIVE_ACCURACY)
+    for percentiles. Two histograms with the same buckets and accuracy merge
+    exactly by adding counts.
     """
 
-    def __init__(self, name: str, help_text: str = ""):
+    def __init__(self, name: str, help_text: str = "",
+                 buckets: Sequence[float] = DEFAULT_HISTOGRAM_BUCKETS,
+                 relative_accuracy: float = SKETCH_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        bounds = sorted(float(b) for b in buckets if not math.isinf(b))
+        if len(set(bounds)) != len(bounds):
+            raise ValueError("histogram buckets must be unique")
         self.name = name
         self.help_text = help_text
-        self._samples: Deque[float] = deque(maxlen=MAX_HISTOGRAM_SAMPLES)
+        self.bounds: Tuple[float, ...] = tuple(bounds)
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        # Values closer to zero than this share the zero bin
+        self._min_indexable = 1e-9
+        self._bucket_counts = [0] * (len(self.bounds) + 1)  # last = +Inf
+        self._positive = _LogStore(SKETCH_MAX_BINS)
+        self._negative = _LogStore(SKETCH_MAX_BINS)
+        self._zero_count = 0
         self._count = 0
         self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
         self._lock = threading.Lock()
         self._labels: Dict[str, str] = {}
 
+    def _index(self, magnitude: float) -> int:
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, index: int) -> float:
+        # Midpoint of (gamma^(i-1), gamma^i] in relative terms
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
     def observe(self, value: float) -> None:
         """Record a new observation"""
+        value = float(value)
+        if math.isnan(value):
+            return
         with self._lock:
-            self._samples.append(value)
+            self._bucket_counts[bisect_left(self.bounds, value)] += 1
+            if value > self._min_indexable:
+                self._positive.add(self._index(value))
+            elif value < -self._min_indexable:
+                self._negative.add(self._index(-value))
+            else:
+                self._zero_count += 1
             self._count += 1
             self._sum += value
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
 
     def get_percentile(self, percentile: float) -> float:
         """
@@ -203,15 +302,42 @@ class Histogram:
 
         Args:
             percentile: Value between 0 and 1 (e.g., 0.95 for P95)
+
+        Returns the value at rank int(count * percentile), within
+        relative_accuracy of the exact sample (0.0 when empty).
         """
         with self._lock:
-            if not self._samples:
-                return 0.0
-
-            sorted_samples = sorted(self._samples)
-            index = int(len(sorted_samples) * percentile)
-            index = max(0, min(index, len(sorted_samples) - 1))
-            return sorted_samples[index]
+            return self._percentile_locked(percentile)
+
+    def _percentile_locked(self, percentile: float) -> float:
+        if self._count == 0:
+            return 0.0
+        rank = max(0, min(int(self._count * percentile), self._count - 1))
+        # The extremes are tracked exactly
+        if rank == 0:
+            return self._min
+        if rank == self._count - 1:
+            return self._max
+        seen = 0
+        result = None
+        for index in sorted(self._negative.bins, reverse=True):
+            seen += self._negative.bins[index]
+            if seen > rank:
+                result = -self._value(index)
+                break
+        if result is None:
+            seen += self._zero_count
+            if seen > rank:
+                result = 0.0
+        if result is None:
+            for index in sorted(self._positive.bins):
+                seen += self._positive.bins[index]
+                if seen > rank:
+                    result = self._value(index)
+                    break
+        if result is None:
+            result = self._max
+        return max(self._min, min(result, self._max))
 
     def get_mean(self) -> float:
         """Calculate mean value"""
@@ -220,23 +346,93 @@ class Histogram:
                 return 0.0
             return self._sum / self._count
 
+    def get_count(self) -> int:
+        """Total observations"""
+        with self._lock:
+            return self._count
+
+    def get_buckets(self) -> List[Tuple[float, int]]:
+        """Cumulative (upper_bound, count) pairs ending with +Inf"""
+        with self._lock:
+            return self._cumulative_locked()
+
+    def _cumulative_locked(self) -> List[Tuple[float, int]]:
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.bounds + (math.inf,), self._bucket_counts):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative
+
+    def _check_compatible(self, bounds: Sequence[float], relative_accuracy: float) -> None:
+        if tuple(bounds) != self.bounds or relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f"Cannot merge histogram {self.name!r}: bucket bounds or "
+                "relative accuracy differ"
+            )
+
+    def merge(self, other: "Histogram") -> None:
+        """Add another histogram's observations to this one"""
+        self.merge_state(other.to_state())
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serialisable state, for shipping across process boundaries"""
+        with self._lock:
+            return {
+                "bounds": list(self.bounds),
+                "relative_accuracy": self.relative_accuracy,
+                "bucket_counts": list(self._bucket_counts),
+                "positive": {str(i): c for i, c in self._positive.bins.items()},
+                "negative": {str(i): c for i, c in self._negative.bins.items()},
+                "zero_count": self._zero_count,
+                "count": self._count,
+                "sum": self._sum,
+                "min": self._min if self._count else None,
+                "max": self._max if self._count else None,
+            }
+
+    def merge_state(self, state: Dict[str, Any]) -> None:
+        """Merge a to_state() dict (e.g. from a worker process)"""
+        self._check_compatible(state["bounds"], state["relative_accuracy"])
+        positive = _LogStore(SKETCH_MAX_BINS)
+        positive.bins = {int(i): c for i, c in state["positive"].items()}
+        negative = _LogStore(SKETCH_MAX_BINS)
+        negative.bins = {int(i): c for i, c in state["negative"].items()}
+        with self._lock:
+            for i, count in enumerate(state["bucket_counts"]):
+                self._bucket_counts[i] += count
+            self._positive.merge(positive)
+            self._negative.merge(negative)
+            self._zero_count += state["zero_count"]
+            self._count += state["count"]
+            self._sum += state["sum"]
+            if state["count"]:
+                self._min = min(self._min, state["min"])
+                self._max = max(self._max, state["max"])
+
     def snapshot(self) -> MetricSnapshot:
-        """Get current snapshot with percentiles"""
-        percentiles = {
-            f"p{int(p * 100)}": self.get_percentile(p)
-            for p in PERCENTILES
-        }
+        """Get current snapshot with percentiles and cumulative buckets"""
+        with self._lock:
+            percentiles = {
+                f"p{int(p * 100)}": self._percentile_locked(p)
+                for p in PERCENTILES
+            }
+            count = self._count
+            total = self._sum
+            mean = total / count if count else 0.0
+            buckets = self._cumulative_locked()
 
         return MetricSnapshot(
             name=self.name,
             type=MetricType.HISTOGRAM,
-            value=self.get_mean(),
+            value=mean,
             labels=self._labels.copy(),
             help_text=self.help_text,
             timestamp=time.time(),
-            samples=len(self._samples),
-            sum=self._sum,
-            percentiles=percentiles
+            samples=count,
+            sum=total,
+            percentiles=percentiles,
+            buckets=buckets,
         )
 
 
@@ -293,11 +489,12 @@ class MetricsCollector:
                 self._gauges[name] = Gauge(name, help_text)
             return self._gauges[name]
 
-    def register_histogram(self, name: str, help_text: str = "") -> Histogram:
+    def register_histogram(self, name: str, help_text: str = "",
+                           buckets: Sequence[float] = DEFAULT_HISTOGRAM_BUCKETS) -> Histogram:
         """Register a new histogram metric"""
         with self._lock:
             if name not in self._histograms:
-                self._histograms[name] = Histogram(name, help_text)
+                self._histograms[name] = Histogram(name, help_text, buckets=buckets)
             return self._histograms[name]
 
     def get_counter(self, name: str) -> Optional[Counter]:
@@ -389,6 +586,49 @@ class MetricsCollector:
 
         return snapshots
 
+    def export_state(self) -> Dict[str, Any]:
+        """
+        Mergeable, JSON-serialisable state of every metric.
+
+        Worker processes return this to the parent, which folds it in with
+        merge_state(); histogram merges are exact (bucket counts add).
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            histograms = dict(self._histograms)
+        return {
+            "counters": {n: {"help": c.help_text, "value": c.get()} for n, c in counters.items()},
+            "gauges": {n: {"help": g.help_text, "value": g.get()} for n, g in gauges.items()},
+            "histograms": {
+                n: {"help": h.help_text, "state": h.to_state()}
+                for n, h in histograms.items()
+            },
+        }
+
+    def merge_state(self, state: Dict[str, Any]) -> None:
+        """
+        Fold another collector's export_state() into this one.
+
+        Counters and histograms add. Gauges add too, which is the right
+        aggregate for the per-process levels tracked here (active tasks,
+        queue depth) when summing over workers.
+        """
+        for name, entry in state.get("counters", {}).items():
+            value = entry["value"]
+            if value:
+                self.register_counter(name, entry.get("help", "")).inc(value)
+        for name, entry in state.get("gauges", {}).items():
+            value = entry["value"]
+            if value:
+                self.register_gauge(name, entry.get("help", "")).inc(value)
+        for name, entry in state.get("histograms", {}).items():
+            hist_state = entry["state"]
+            histogram = self.register_histogram(
+                name, entry.get("help", ""), buckets=hist_state["bounds"]
+            )
+            histogram.merge_state(hist_state)
+
     def to_json(self) -> str:
         """Export all metrics as JSON"""
         snapshots = self.get_all_snapshots()
@@ -422,12 +662,14 @@ class MetricsCollector:
             if labels_str:
                 labels_str = f"{{{labels_str}}}"
 
-            # For histograms, export percentiles
-            if snapshot.type == MetricType.HISTOGRAM and snapshot.percentiles:
-                for pct_name, pct_value in snapshot.percentiles.items():
+            # For histograms, export cumulative buckets
+            if snapshot.type == MetricType.HISTOGRAM and snapshot.buckets is not None:
+                label_pairs = [f'{k}="{v}"' for k, v in snapshot.labels.items()]
+                for bound, count in snapshot.buckets:
+                    bucket_labels = ",".join(label_pairs + [f'le="{_format_le(bound)}"'])
                     lines.append(
-                        f'{snapshot.name}_bucket{{le="{pct_name}"}}{labels_str} '
-                        f'{pct_value} {int(snapshot.timestamp * 1000)}'
+                        f'{snapshot.name}_bucket{{{bucket_labels}}} '
+                        f'{count} {int(snapshot.timestamp * 1000)}'
                     )
                 lines.append(
                     f'{snapshot.name}_count{labels_str} '
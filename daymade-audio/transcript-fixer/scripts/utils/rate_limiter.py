@@ -22,6 +22,7 @@ Use cases:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import threading
 import time
@@ -321,6 +322,42 @@ class RateLimiter:
         """
         return self._impl.acquire(tokens=tokens, blocking=blocking, timeout=timeout)
 
+    async def acquire_async(self, tokens: int = 1, timeout: Optional[float] = None) -> float:
+        """
+        Async acquire: waits with asyncio.sleep so the event loop keeps
+        serving other requests while this one is throttled.
+
+        Args:
+            tokens: Number of requests (default: 1)
+            timeout: Maximum wait time in seconds (default: None = forever)
+
+        Returns:
+            Seconds spent waiting for capacity
+
+        Raises:
+            RateLimitExceeded: If timeout elapses before capacity is available
+        """
+        if self._impl.acquire(tokens=tokens, blocking=False):
+            return 0.0
+        start_time = time.time()
+        while not self._impl.acquire(tokens=tokens, blocking=False):
+            if isinstance(self._impl, TokenBucketLimiter):
+                shortfall = tokens - self._impl.get_available_tokens()
+                retry_after = max(shortfall / self._impl.refill_rate, 0.001)
+            else:
+                retry_after = 0.1
+            elapsed = time.time() - start_time
+            if timeout is not None and elapsed >= timeout:
+                raise RateLimitExceeded(
+                    f"Rate limit exceeded: no capacity within {timeout}s",
+                    retry_after=retry_after
+                )
+            wait_time = min(retry_after, 0.1)  # Re-check at least every 100ms
+            if timeout is not None:
+                wait_time = min(wait_time, timeout - elapsed)
+            await asyncio.sleep(wait_time)
+        return time.time() - start_time
+
     @contextmanager
     def limit(self, tokens: int = 1):
         """
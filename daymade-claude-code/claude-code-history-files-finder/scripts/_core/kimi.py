@@ -48,10 +48,11 @@ import argparse
 import json
 import os
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
 from typing import Any, Optional
 
+from .index import SessionIndex, session_index_for
 from .model import Conversation, ProviderResult
 from .parse import TimestampRange, parse_timestamp, workspace_matches
 from .text import (
@@ -204,6 +205,8 @@ def scan_kimi_session(
     session_dir: Path,
     index_workdirs: Optional[dict[str, str]] = None,
     max_title_chars: int = 120,
+    *,
+    index: Optional[SessionIndex] = None,
 ) -> KimiSessionSummary:
     """Summarize one Kimi session: state.json first, wire JSONL as fallback.
 
@@ -213,9 +216,47 @@ def scan_kimi_session(
     prompt for the title, min/max ``time`` for the range). Subagent wires only
     extend the time-range fallback; they are runs of the same session, not
     separate conversations.
+
+    With ``index``, the summary is cached against the fingerprints of
+    ``state.json`` and every wire file. ``state.json`` is rewritten in place,
+    so a changed session is rescanned rather than resumed. The
+    ``kimi.json`` workdir fallback is applied after the lookup because it
+    lives outside the session directory.
     """
-    state = load_kimi_state(session_dir)
     main_wire, subagent_wires = kimi_wire_files(session_dir)
+    wires = ([main_wire] if main_wire else []) + subagent_wires
+    if index is None:
+        summary = _scan_kimi_session(
+            session_dir, main_wire, subagent_wires, max_title_chars
+        )
+    else:
+        summary = KimiSessionSummary(
+            **index.cached(
+                "kimi-session",
+                session_dir,
+                {"max_title_chars": max_title_chars},
+                [session_dir / "state.json", *wires],
+                lambda: asdict(
+                    _scan_kimi_session(
+                        session_dir, main_wire, subagent_wires, max_title_chars
+                    )
+                ),
+            )
+        )
+    if not summary.cwd and index_workdirs:
+        cwd = index_workdirs.get(summary.session_id, "")
+        if cwd:
+            summary = replace(summary, cwd=cwd)
+    return summary
+
+
+def _scan_kimi_session(
+    session_dir: Path,
+    main_wire: Optional[Path],
+    subagent_wires: list[Path],
+    max_title_chars: int,
+) -> KimiSessionSummary:
+    state = load_kimi_state(session_dir)
 
     session_id = session_dir.name
     cwd = ""
@@ -253,9 +294,6 @@ def scan_kimi_session(
                 if better and (title is None or len(better) > len(title)):
                     title = better
 
-    if not cwd and index_workdirs:
-        cwd = index_workdirs.get(session_id, "")
-
     if title is None or len(title) < 4 or created_at is None or updated_at is None:
         wire_title: Optional[str] = None
         timestamps = TimestampRange()
@@ -313,10 +351,13 @@ def collect_kimi(args: argparse.Namespace, home: Path) -> ProviderResult:
             f"Kimi CLI sessions directory not found: {home / 'sessions'}"
         )
         return result
-    index = load_kimi_session_index(home)
+    workdirs = load_kimi_session_index(home)
+    session_index = session_index_for(args)
     metadata_backends: set[str] = set()
     for session_dir in iter_kimi_session_dirs(home):
-        summary = scan_kimi_session(session_dir, index, args.max_title_chars)
+        summary = scan_kimi_session(
+            session_dir, workdirs, args.max_title_chars, index=session_index
+        )
         metadata_backends.add(summary.metadata_source)
         if summary.archived and not args.include_archived:
             result.excluded_archived += 1
@@ -19,7 +19,9 @@ never covers.
 
 import hashlib
 import json
+import mmap
 import os
+import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -43,6 +45,7 @@ from _core.kimi import (  # noqa: E402
     scan_kimi_session,
 )  # noqa: E402
 from _core.homes import home_label  # noqa: E402
+from _core.index import SessionIndex, session_index_for  # noqa: E402
 from _core.parse import (  # noqa: E402
     TimestampRange,
     format_timestamp,
@@ -58,25 +61,27 @@ from _core.sources import (  # noqa: E402
     discover_claude_sources,
 )
 from _core.text import (  # noqa: E402
-    SearchSegment,
     extract_text,
     files_possibly_matching,
     is_automated_title,
-    iter_jsonl,
+    iter_jsonl_reverse,
     keywords_are_raw_byte_safe,
     searchable_segments,
 )
-
-
-def _record_identity(record: Dict[str, Any]) -> str:
-    """Return a stable identity for record-level union across session copies."""
-    canonical = json.dumps(
-        record,
-        ensure_ascii=False,
-        sort_keys=True,
-        separators=(",", ":"),
-    ).encode("utf-8")
-    return "sha256:" + hashlib.sha256(canonical).hexdigest()
+from search_index import (  # noqa: E402
+    IndexedCandidates,
+    SearchIndex,
+    default_search_index_path,
+)
+from search_scan import (  # noqa: E402
+    codex_searchable_segments,
+    kimi_searchable_segments,
+    resolve_jobs,
+    run_sharded,
+    scan_claude_copy,
+    scan_codex_file,
+    scan_kimi_wire,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -98,6 +103,8 @@ TAIL_EMPTY = "empty"
 
 _INTERRUPTED_MARKER = "[Request interrupted by user"
 _NET_ERROR_PREFIX = "API Error"
+_PLAIN_TOOL_ID_RE = re.compile(r"[A-Za-z0-9_-]+")
+_ESCAPED_PRINTABLE_RE = re.compile(rb"\\u00[2-7][0-9A-Fa-f]")
 
 
 @dataclass
@@ -111,21 +118,61 @@ class SessionTail:
     last_assistant_timestamp: Optional[float]
 
 
-def classify_session_tail(path: Path) -> SessionTail:
-    """Classify a session's ending state by streaming its records once.
+def _ids_absent_before(path: Path, offset: int, tool_use_ids: set) -> bool:
+    """True when no byte before ``offset`` can belong to a record naming any id.
 
-    Resolves tool_use/tool_result across the *whole* file as a true
-    set-difference, not an incremental add/discard in file order: a
-    tool_result can be written before the tool_use record it answers (see
-    "Tool Use / Tool Result Ordering" in references/session_file_format.md).
-    A single-pass ``discard-then-add`` was tried first and is NOT actually
+    A tool_result may sit anywhere earlier in the file (even before its
+    tool_use), so an id still unresolved in the tail is only proven pending
+    once the unread prefix is ruled out. A raw byte search does that without
+    decoding it. It only answers "absent" for plain ``[A-Za-z0-9_-]`` ids,
+    and only when the prefix holds no ``\\u00XX`` escape of a printable
+    ASCII character (the one way a writer could spell such an id other than
+    verbatim); anything else returns False and the caller keeps reading.
+    """
+    if not all(
+        isinstance(tool_use_id, str) and _PLAIN_TOOL_ID_RE.fullmatch(tool_use_id)
+        for tool_use_id in tool_use_ids
+    ):
+        return False
+    try:
+        with path.open("rb") as handle, mmap.mmap(
+            handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as data:
+            if _ESCAPED_PRINTABLE_RE.search(data, 0, offset):
+                return False
+            return all(
+                data.find(tool_use_id.encode("ascii"), 0, offset) < 0
+                for tool_use_id in tool_use_ids
+            )
+    except (OSError, ValueError):
+        return False
+
+
+def classify_session_tail(path: Path) -> SessionTail:
+    """Classify a session's ending state by reading its records back from EOF.
+
+    Every field is a "last occurrence" (last relevant record, last assistant
+    record, last assistant timestamp, last real user text), so records are
+    read in reverse via ``iter_jsonl_reverse`` and reading stops as soon as
+    all of them are known — triage cost follows the size of the final turn,
+    not of the file. The one fact that can live arbitrarily far back is
+    whether a tool_use of the final turn was ever answered; see below.
+
+    Resolves tool_use/tool_result as a true set-difference, not an
+    incremental add/discard in file order: a tool_result can be written
+    before the tool_use record it answers (see "Tool Use / Tool Result
+    Ordering" in references/session_file_format.md). A single-pass
+    ``discard-then-add`` was tried first and is NOT actually
     order-independent — ``discard()`` on an id not yet seen is a silent
     no-op, so a tool_result appearing before its tool_use left the id
     "pending" even though it was genuinely resolved (verified against real
     session data, 2026-08: 11/14 files hitting this ordering had their
-    final `kind` flipped). Accumulating two never-mutated sets and diffing
-    them once at the end is immune to this, because neither operation can
-    ever silently miss the other regardless of which came first in the file.
+    final `kind` flipped). Accumulating never-mutated sets and diffing them
+    is immune to this, because neither operation can ever silently miss the
+    other regardless of which came first in the file. The same ordering is
+    why an id still unresolved when the tail is done is only reported
+    pending after ``_ids_absent_before`` rules out the unread prefix;
+    otherwise reading continues to the start of the file.
 
     Classification is also computed from the RAW content of the LAST
     assistant record only, not from state that could carry over from an
@@ -134,33 +181,37 @@ def classify_session_tail(path: Path) -> SessionTail:
     holding an earlier turn's already-answered reply, misreporting a session
     that crashed before responding to its latest question as `done`.
 
-    The interruption marker is checked the same way: `tail_is_interrupt` is
-    reset by any later user or assistant record, so it only survives to the
-    end of the loop when the marker is the LAST relevant record in the file.
-    A mid-session Ctrl+C that the conversation continued past is not a tail
-    interruption — treating "marker appears anywhere" as equivalent to "the
-    session ended on interruption" was tried first and false-positived on
-    exactly that shape (verified against real session data, 2026-08).
+    The interruption marker is checked the same way: only the LAST relevant
+    (user or assistant) record decides `tail_is_interrupt`. A mid-session
+    Ctrl+C that the conversation continued past is not a tail interruption —
+    treating "marker appears anywhere" as equivalent to "the session ended
+    on interruption" was tried first and false-positived on exactly that
+    shape (verified against real session data, 2026-08).
     """
-    all_tool_use_ids: set = set()
+    final_tool_use_ids: set = set()
     all_resolved_tool_use_ids: set = set()
-    last_user_text = ""
+    last_user_text: Optional[str] = None
     last_assistant_content: Any = None
+    last_assistant_seen = False
     last_assistant_timestamp: Optional[float] = None
-    tail_is_interrupt = False
+    tail_is_interrupt: Optional[bool] = None
+    prefix_checked = False
 
-    for record in iter_jsonl(path):
+    for record, offset in iter_jsonl_reverse(path):
         record_type = record.get("type")
         message = record.get("message")
         content = message.get("content") if isinstance(message, dict) else None
 
         if record_type == "user" and not record.get("isMeta"):
             if isinstance(content, str) and _INTERRUPTED_MARKER in content:
-                tail_is_interrupt = True
+                if tail_is_interrupt is None:
+                    tail_is_interrupt = True
                 continue
-            tail_is_interrupt = False
+            if tail_is_interrupt is None:
+                tail_is_interrupt = False
             if isinstance(content, str):
-                last_user_text = content
+                if last_user_text is None:
+                    last_user_text = content
             elif isinstance(content, list):
                 is_tool_result_only = bool(content) and all(
                     isinstance(block, dict) and block.get("type") == "tool_result"
@@ -173,25 +224,44 @@ def classify_session_tail(path: Path) -> SessionTail:
                         tool_use_id = block.get("tool_use_id")
                         if tool_use_id is not None:
                             all_resolved_tool_use_ids.add(tool_use_id)
-                if not is_tool_result_only:
+                if not is_tool_result_only and last_user_text is None:
                     text = extract_text(content)
                     if text:
                         last_user_text = text
 
         elif record_type == "assistant":
-            tail_is_interrupt = False
-            parsed_ts = parse_timestamp(record.get("timestamp"))
-            if parsed_ts is not None:
-                last_assistant_timestamp = parsed_ts
-            last_assistant_content = content
-            if isinstance(content, list):
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "tool_use":
-                        tool_use_id = block.get("id")
-                        if tool_use_id is not None:
-                            all_tool_use_ids.add(tool_use_id)
-
-    pending_tool_use_ids = all_tool_use_ids - all_resolved_tool_use_ids
+            if tail_is_interrupt is None:
+                tail_is_interrupt = False
+            if last_assistant_timestamp is None:
+                last_assistant_timestamp = parse_timestamp(record.get("timestamp"))
+            if not last_assistant_seen:
+                last_assistant_seen = True
+                last_assistant_content = content
+                if isinstance(content, list):
+                    for block in content:
+                        if isinstance(block, dict) and block.get("type") == "tool_use":
+                            tool_use_id = block.get("id")
+                            if tool_use_id is not None:
+                                final_tool_use_ids.add(tool_use_id)
+
+        if (
+            tail_is_interrupt is None
+            or not last_assistant_seen
+            or last_assistant_timestamp is None
+            or last_user_text is None
+        ):
+            continue
+        unresolved = final_tool_use_ids - all_resolved_tool_use_ids
+        if not unresolved:
+            break
+        if not prefix_checked:
+            prefix_checked = True
+            if _ids_absent_before(path, offset, unresolved):
+                break
+
+    last_user_text = last_user_text or ""
+    tail_is_interrupt = bool(tail_is_interrupt)
+    pending_tool_use_ids = final_tool_use_ids - all_resolved_tool_use_ids
 
     last_assistant_kind = "none"
     last_assistant_text = ""
@@ -274,71 +344,15 @@ def classify_session_tail(path: Path) -> SessionTail:
 # JSONL files under <CODEX_HOME>/sessions/<YYYY>/<MM>/<DD>/ plus
 # <CODEX_HOME>/archived_sessions/. Their record schema is NOT the Claude one
 # (response_item/event_msg/session_meta, not user/assistant/queue-operation),
-# so searchable_segments() does not apply. The extractor below covers the
-# user-visible payload of each response_item variant. event_msg user/agent
-# message records are deliberate strict mirrors of response_item message text
-# (verified 2026-07-16: 26/26 and 104/104 subset on a real rollout), so they
-# are skipped to avoid double-counting.
+# so searchable_segments() does not apply. codex_searchable_segments (in
+# search_scan.py, next to the per-file scanners the --jobs workers import)
+# covers the user-visible payload of each response_item variant. event_msg
+# user/agent message records are deliberate strict mirrors of response_item
+# message text (verified 2026-07-16: 26/26 and 104/104 subset on a real
+# rollout), so they are skipped to avoid double-counting.
 # ---------------------------------------------------------------------------
 
 
-def _flatten_strings(value: Any) -> List[str]:
-    """Flatten nested str/list/dict content into plain strings."""
-    if isinstance(value, str):
-        return [value]
-    if isinstance(value, list):
-        return [part for item in value for part in _flatten_strings(item)]
-    if isinstance(value, dict):
-        return [part for item in value.values() for part in _flatten_strings(item)]
-    return []
-
-
-def codex_searchable_segments(record: Dict[str, Any]) -> List[SearchSegment]:
-    """Extract searchable text fields from one Codex rollout record."""
-    segments: List[SearchSegment] = []
-
-    def add(source: str, value: Any) -> None:
-        for text_value in _flatten_strings(value):
-            segments.append(SearchSegment(source=source, text=text_value))
-
-    if record.get("type") == "compacted":
-        # Compaction records carry a summary of earlier conversation content.
-        payload = record.get("payload")
-        if isinstance(payload, dict):
-            add("summary", payload.get("message"))
-        return list(dict.fromkeys(segments))
-
-    if record.get("type") != "response_item":
-        return segments
-    payload = record.get("payload")
-    if not isinstance(payload, dict):
-        return segments
-    payload_type = payload.get("type")
-    if payload_type == "message":
-        for block in payload.get("content") or []:
-            if isinstance(block, dict) and block.get("type") in {
-                "input_text",
-                "output_text",
-            }:
-                add("message", block.get("text"))
-    elif payload_type == "reasoning":
-        for block in payload.get("summary") or []:
-            if isinstance(block, dict) and block.get("type") == "summary_text":
-                add("thinking", block.get("text"))
-    elif payload_type in {"function_call", "custom_tool_call"}:
-        name = payload.get("name")
-        source = (
-            f"tool_input:{name}"
-            if isinstance(name, str) and name
-            else "tool_input"
-        )
-        add(source, payload.get("arguments"))
-        add(source, payload.get("input"))
-    elif payload_type in {"function_call_output", "custom_tool_call_output"}:
-        add("tool_result", payload.get("output"))
-    return list(dict.fromkeys(segments))
-
-
 def discover_codex_rollouts(codex_home: Path) -> List[Path]:
     """Enumerate Codex rollout files under a Codex home (sessions + archived)."""
     rollouts: List[Path] = []
@@ -383,6 +397,31 @@ def repeated_copy_sizes(copies: List[Dict[str, Any]]) -> set:
     return {size for size, count in sizes.items() if count > 1}
 
 
+def session_copies(ref: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Every physical copy of a session ref (a bare ref is its own copy)."""
+    return ref.get("copies") or [
+        {
+            "path": ref["path"],
+            "source": ref["sources"][0],
+            "created_at": ref["created_at"],
+            "updated_at": ref["updated_at"],
+        }
+    ]
+
+
+def copy_digest(
+    path: Path, sizes_worth_hashing: set, cache: Dict[Path, Optional[str]]
+) -> Optional[str]:
+    """Content digest of a copy whose size repeats within its session, else None."""
+    if path not in cache:
+        try:
+            size: Optional[int] = path.stat().st_size
+        except OSError:
+            size = None
+        cache[path] = file_content_digest(path) if size in sizes_worth_hashing else None
+    return cache[path]
+
+
 def search_codex_rollouts(
     rollouts: List[Path],
     keywords: List[str],
@@ -392,6 +431,7 @@ def search_codex_rollouts(
     project_path: Optional[str] = None,
     exclude_ids: Optional[set] = None,
     use_prefilter: bool = True,
+    jobs: int = 1,
 ) -> List[Dict[str, Any]]:
     """Search Codex rollouts for keywords, one match dict per session.
 
@@ -412,6 +452,9 @@ def search_codex_rollouts(
     (which would otherwise collapse onto ``match_range``) and, under a date
     window, ``excluded_untimed``. See the comment at the ``line_keywords``
     assignment below; the disabling is unconditional and a test enforces it.
+
+    ``jobs`` > 1 parses the selected rollouts in a process pool; each one is
+    independent, and matches are assembled in traversal order either way.
     """
     search_keywords = [
         (keyword, keyword if case_sensitive else keyword.casefold())
@@ -440,6 +483,7 @@ def search_codex_rollouts(
     # so that layer stays safe and stays on.
     line_keywords = None
 
+    selected: List[tuple] = []
     for path in rollouts:
         try:
             meta = codex_meta_from_rollout(path)
@@ -469,72 +513,35 @@ def search_codex_rollouts(
                 cwd, project_path, recursive=True
             ):
                 continue
+        selected.append((path, sid, cwd))
 
-        keyword_counts: Dict[str, int] = defaultdict(int)
-        total_mentions = 0
-        match_sources: set[str] = set()
-        session_range = TimestampRange()
-        match_range = TimestampRange()
-        excluded_untimed = 0
-        try:
-            for record in iter_jsonl(path, line_keywords=line_keywords):
-                record_timestamp = parse_timestamp(record.get("timestamp"))
-                if record_timestamp is not None:
-                    session_range.observe(record_timestamp)
-                if record.get("type") == "session_meta" and isinstance(
-                    record.get("payload"), dict
-                ):
-                    meta_timestamp = parse_timestamp(
-                        record["payload"].get("timestamp")
-                    )
-                    if meta_timestamp is not None:
-                        session_range.observe(meta_timestamp)
-                if from_timestamp is not None or to_timestamp is not None:
-                    if record_timestamp is None:
-                        excluded_untimed += 1
-                        continue
-                    if not timestamp_in_window(
-                        record_timestamp, from_timestamp, to_timestamp
-                    ):
-                        continue
-                record_counts: Dict[str, int] = defaultdict(int)
-                record_sources: set[str] = set()
-                for segment in codex_searchable_segments(record):
-                    search_text = (
-                        segment.text if case_sensitive else segment.text.casefold()
-                    )
-                    for keyword, search_keyword in search_keywords:
-                        count = search_text.count(search_keyword)
-                        if count > 0:
-                            record_counts[keyword] += count
-                            record_sources.add(segment.source)
-                record_mentions = sum(record_counts.values())
-                if not record_mentions:
-                    continue
-                for keyword, count in record_counts.items():
-                    keyword_counts[keyword] += count
-                total_mentions += record_mentions
-                match_sources.update(record_sources)
-                if record_timestamp is not None:
-                    match_range.observe(record_timestamp)
-        except (OSError, UnicodeError) as e:
-            print(f"Warning: Error processing {path}: {e}", file=sys.stderr)
+    scan_args = (
+        search_keywords, case_sensitive, from_timestamp, to_timestamp, line_keywords
+    )
+    scans = run_sharded(
+        scan_codex_file,
+        {path: (path, *scan_args) for path, _sid, _cwd in selected},
+        jobs,
+    )
+    for path, sid, cwd in selected:
+        scan = scans.get(path) or scan_codex_file(path, *scan_args)
+        if scan.error is not None:
+            print(f"Warning: Error processing {path}: {scan.error}", file=sys.stderr)
             continue
-
-        if total_mentions > 0:
+        if scan.total_mentions > 0:
             matches.append(
                 {
                     "session_id": sid,
                     "path": path,
                     "cwd": cwd,
-                    "total_mentions": total_mentions,
-                    "keyword_counts": dict(keyword_counts),
-                    "match_sources": sorted(match_sources),
-                    "created_at": session_range.earliest,
-                    "updated_at": session_range.latest,
-                    "match_created_at": match_range.earliest,
-                    "match_updated_at": match_range.latest,
-                    "excluded_untimed_records": excluded_untimed,
+                    "total_mentions": scan.total_mentions,
+                    "keyword_counts": scan.keyword_counts,
+                    "match_sources": scan.match_sources,
+                    "created_at": scan.session_range.earliest,
+                    "updated_at": scan.session_range.latest,
+                    "match_created_at": scan.match_range.earliest,
+                    "match_updated_at": scan.match_range.latest,
+                    "excluded_untimed_records": scan.excluded_untimed,
                 }
             )
 
@@ -573,74 +580,6 @@ def search_codex_rollouts(
 # ---------------------------------------------------------------------------
 
 
-def _kimi_flatten_payload(value: Any) -> List[str]:
-    """Flatten nested Kimi payload content, dropping structural identifier keys.
-
-    Same principle as text.py's searchable_segments excluding id/signature
-    keys: UUID-class fields (turnId, toolCallId, …) are unique per record, so
-    indexing them only manufactures false-positive hits and dilutes the match
-    source attribution (independent review, 2026-08).
-    """
-    if isinstance(value, str):
-        return [value]
-    if isinstance(value, list):
-        return [part for item in value for part in _kimi_flatten_payload(item)]
-    if isinstance(value, dict):
-        return [
-            part
-            for key, item in value.items()
-            if key not in _KIMI_STRUCTURAL_KEYS
-            for part in _kimi_flatten_payload(item)
-        ]
-    return []
-
-
-_KIMI_STRUCTURAL_KEYS = frozenset(
-    {
-        "type",
-        "id",
-        "uuid",
-        "stepUuid",
-        "turnId",
-        "toolCallId",
-        "parentUuid",
-        "callId",
-    }
-)
-
-
-def kimi_searchable_segments(record: Dict[str, Any]) -> List[SearchSegment]:
-    """Extract searchable text fields from one Kimi wire.jsonl record."""
-    segments: List[SearchSegment] = []
-
-    def add(source: str, value: Any) -> None:
-        for text_value in _kimi_flatten_payload(value):
-            segments.append(SearchSegment(source=source, text=text_value))
-
-    record_type = record.get("type")
-    if record_type in {"turn.prompt", "turn.steer"}:
-        add("prompt", record.get("input"))
-    elif record_type == "context.append_message":
-        message = record.get("message")
-        if isinstance(message, dict):
-            add("message", message.get("content"))
-            add("tool_input", message.get("toolCalls"))
-    elif record_type == "context.append_loop_event":
-        event = record.get("event")
-        if isinstance(event, dict):
-            event_type = event.get("type")
-            if event_type == "content.part":
-                add("message", event)
-            elif event_type == "tool.call":
-                add("tool_input", event)
-            elif event_type == "tool.result":
-                add("tool_result", event)
-            # step.begin / step.end carry no conversation text.
-    elif record_type == "plugin.session_start":
-        add("plugin", record.get("content"))
-    return list(dict.fromkeys(segments))
-
-
 def discover_kimi_wires(kimi_home: Path) -> List[tuple]:
     """Enumerate (session_dir, agent_name, wire_path) triples under a Kimi home."""
     wires: List[tuple] = []
@@ -661,6 +600,8 @@ def search_kimi_wires(
     project_path: Optional[str] = None,
     exclude_ids: Optional[set] = None,
     use_prefilter: bool = True,
+    jobs: int = 1,
+    index: Optional[SessionIndex] = None,
 ) -> List[Dict[str, Any]]:
     """Search Kimi wire files for keywords, one match dict per SESSION.
 
@@ -675,6 +616,10 @@ def search_kimi_wires(
     out whole wires, but a session's range spans ALL its wires — so when any
     wire of a session matched, the remaining wires are re-read for their time
     ranges only (no keyword work), keeping the displayed range exact.
+
+    ``jobs`` > 1 parses the candidate wires in a process pool; per-wire
+    partials are folded into their session in discovery order either way.
+    ``index`` caches the matched sessions' titles (None scans them directly).
     """
     search_keywords = [
         (keyword, keyword if case_sensitive else keyword.casefold())
@@ -696,7 +641,7 @@ def search_kimi_wires(
     for session_dir, agent_name, wire_path in wires:
         sessions.setdefault(session_dir, []).append((agent_name, wire_path))
 
-    matches: List[Dict[str, Any]] = []
+    selected: List[tuple] = []
     for session_dir, agent_wires in sessions.items():
         state = load_kimi_state(session_dir) or {}
         session_id = state.get("id") if isinstance(state.get("id"), str) else None
@@ -711,7 +656,24 @@ def search_kimi_wires(
         if project_path is not None:
             if not cwd or not workspace_matches(cwd, project_path, recursive=True):
                 continue
+        selected.append((session_dir, session_id, cwd, agent_wires))
 
+    scan_args = (
+        search_keywords, case_sensitive, from_timestamp, to_timestamp, line_keywords
+    )
+    scans = run_sharded(
+        scan_kimi_wire,
+        {
+            wire_path: (wire_path, agent_name, *scan_args)
+            for _dir, _sid, _cwd, agent_wires in selected
+            for agent_name, wire_path in agent_wires
+            if matched_files is None or wire_path in matched_files
+        },
+        jobs,
+    )
+
+    matches: List[Dict[str, Any]] = []
+    for session_dir, session_id, cwd, agent_wires in selected:
         keyword_counts: Dict[str, int] = defaultdict(int)
         total_mentions = 0
         match_sources: set = set()
@@ -724,46 +686,26 @@ def search_kimi_wires(
             if matched_files is not None and wire_path not in matched_files:
                 skipped_wires.append(wire_path)
                 continue
-            try:
-                for record in iter_jsonl(wire_path, line_keywords=line_keywords):
-                    record_timestamp = parse_timestamp(record.get("time"))
-                    if record_timestamp is None and record.get("type") == "metadata":
-                        record_timestamp = parse_timestamp(record.get("created_at"))
-                    if record_timestamp is not None:
-                        session_range.observe(record_timestamp)
-                    if from_timestamp is not None or to_timestamp is not None:
-                        if record_timestamp is None:
-                            excluded_untimed += 1
-                            continue
-                        if not timestamp_in_window(
-                            record_timestamp, from_timestamp, to_timestamp
-                        ):
-                            continue
-                    record_counts: Dict[str, int] = defaultdict(int)
-                    record_sources: set = set()
-                    for segment in kimi_searchable_segments(record):
-                        search_text = (
-                            segment.text
-                            if case_sensitive
-                            else segment.text.casefold()
-                        )
-                        for keyword, search_keyword in search_keywords:
-                            count = search_text.count(search_keyword)
-                            if count > 0:
-                                record_counts[keyword] += count
-                                record_sources.add(f"{agent_name}:{segment.source}")
-                    record_mentions = sum(record_counts.values())
-                    if not record_mentions:
-                        continue
-                    for keyword, count in record_counts.items():
-                        keyword_counts[keyword] += count
-                    total_mentions += record_mentions
-                    match_sources.update(record_sources)
-                    if record_timestamp is not None:
-                        match_range.observe(record_timestamp)
-            except (OSError, UnicodeError) as e:
-                print(f"Warning: Error processing {wire_path}: {e}", file=sys.stderr)
-                continue
+            scan = scans.get(wire_path) or scan_kimi_wire(
+                wire_path, agent_name, *scan_args
+            )
+            # Records read before an error still count, as in a single pass.
+            for keyword, count in scan.keyword_counts.items():
+                keyword_counts[keyword] += count
+            total_mentions += scan.total_mentions
+            match_sources.update(scan.match_sources)
+            for value in (scan.session_range.earliest, scan.session_range.latest):
+                if value is not None:
+                    session_range.observe(value)
+            for value in (scan.match_range.earliest, scan.match_range.latest):
+                if value is not None:
+                    match_range.observe(value)
+            excluded_untimed += scan.excluded_untimed
+            if scan.error is not None:
+                print(
+                    f"Warning: Error processing {wire_path}: {scan.error}",
+                    file=sys.stderr,
+                )
 
         if total_mentions > 0:
             # A prefiltered-out wire can still hold earlier/later records of
@@ -781,7 +723,9 @@ def search_kimi_wires(
                 {
                     "session_id": session_id,
                     "path": session_dir,
-                    "title": scan_kimi_session(session_dir).title,
+                    "title": scan_kimi_session(
+                        session_dir, index=index
+                    ).title,
                     "cwd": cwd or "",
                     "total_mentions": total_mentions,
                     "keyword_counts": dict(keyword_counts),
@@ -814,6 +758,7 @@ class SessionAnalyzer:
         homes: Optional[List[Path]] = None,
         sources: Optional[List[HistorySource]] = None,
         warnings: Optional[List[str]] = None,
+        index: Optional[SessionIndex] = None,
     ):
         """
         Initialize analyzer.
@@ -827,6 +772,9 @@ class SessionAnalyzer:
                 "search nothing", it must NOT silently fall back to full
                 discovery (that would turn a scope-narrowing flag into the
                 widest possible scope).
+            index: Persistent session metadata index used to skip re-parsing
+                unchanged transcripts. None (the default) scans every file;
+                the CLI passes ``session_index_for(args)``.
         """
         if homes is not None and sources is not None:
             raise ValueError("Pass homes or sources, not both")
@@ -847,6 +795,7 @@ class SessionAnalyzer:
             warnings = (warnings or []) + discovered_warnings
         self.homes = [source.home for source in self.sources]
         self.warnings = list(warnings or [])
+        self.index = index
 
     def find_project_sessions(self, project_path: str) -> List[Dict[str, Any]]:
         """
@@ -915,6 +864,7 @@ class SessionAnalyzer:
                 group[1].append((source, project_dir))
 
         by_id: Dict[str, Dict[str, Any]] = {}
+        index = self.index
         for scan_dir, group_members in groups.values():
             group_sources = [source for source, _nominal_dir in group_members]
             # any(...) — not group_sources[0].kind — because "at least one
@@ -928,7 +878,7 @@ class SessionAnalyzer:
             for file in scan_dir.glob("*.jsonl"):
                 if file.name.startswith("agent-"):
                     continue
-                summary = scan_claude_session(file)
+                summary = scan_claude_session(file, index=index)
                 sid = summary.session_id
                 copies = [
                     {
@@ -1146,6 +1096,8 @@ class SessionAnalyzer:
         from_timestamp: Optional[float] = None,
         to_timestamp: Optional[float] = None,
         use_prefilter: bool = True,
+        search_index: Optional[SearchIndex] = None,
+        jobs: int = 1,
     ) -> List[Dict[str, Any]]:
         """
         Search sessions for keywords.
@@ -1162,6 +1114,13 @@ class SessionAnalyzer:
                 cannot contain any keyword (see ``files_possibly_matching``).
                 Forced off automatically when a date window is active — see
                 below for why.
+            search_index: Optional n-gram index (``--use-index``). Copies it
+                proves cannot match are skipped — also for non-ASCII keywords
+                and inside a date window, where the raw-byte pre-filter cannot
+                help; every other copy still goes through the full matcher.
+                See ``search_index.py``.
+            jobs: Worker processes for parsing candidate copies (``--jobs``).
+                Results are identical to the serial pass.
 
         Returns:
             List of match dicts (session ref + match counts), most mentions
@@ -1180,6 +1139,7 @@ class SessionAnalyzer:
         # contain a matchable record.
         use_prefilter = use_prefilter and from_timestamp is None and to_timestamp is None
         matched_files: Optional[set[Path]] = None
+        indexed: Optional[IndexedCandidates] = None
         # Always case-folded regardless of `case_sensitive`: casefold-matching
         # is a strict superset of exact-case matching (anything an exact-case
         # check would find, casefold-matching finds too), so it is always a
@@ -1194,17 +1154,30 @@ class SessionAnalyzer:
             if use_prefilter and keywords_are_raw_byte_safe(keywords)
             else None
         )
+        all_copy_paths = [
+            copy["path"] for ref in session_refs for copy in session_copies(ref)
+        ]
+        if search_index is not None:
+            # Unlike the raw-byte pre-filter, the index may also skip copies
+            # inside a date window: it reports each skipped copy's untimed
+            # record identities, so excluded_untimed_count stays exact.
+            indexed = search_index.candidates(
+                all_copy_paths, keywords, from_timestamp, to_timestamp
+            )
         if use_prefilter:
-            all_copy_paths = [
-                copy["path"]
-                for ref in session_refs
-                for copy in (
-                    ref.get("copies")
-                    or [{"path": ref["path"], "source": ref["sources"][0]}]
-                )
-            ]
             matched_files = files_possibly_matching(
-                all_copy_paths, keywords, case_sensitive=case_sensitive
+                [
+                    path
+                    for path in all_copy_paths
+                    if indexed is None or path not in indexed.skippable
+                ],
+                keywords,
+                case_sensitive=case_sensitive,
+            )
+
+        def ruled_out(path: Path) -> bool:
+            return (matched_files is not None and path not in matched_files) or (
+                indexed is not None and path in indexed.skippable
             )
 
         matches: List[Dict[str, Any]] = []
@@ -1212,6 +1185,32 @@ class SessionAnalyzer:
             (keyword, keyword if case_sensitive else keyword.casefold())
             for keyword in keywords
         ]
+        scan_args = (
+            search_keywords, case_sensitive, from_timestamp, to_timestamp, line_keywords
+        )
+        digests: Dict[Path, Optional[str]] = {}
+        # --jobs: parse every copy the loop below would parse (the first copy
+        # of each distinct content per session) in a process pool up front.
+        # The loop then replays each copy's events in the original order, so
+        # record dedupe, untimed counting and twin reuse see exactly what a
+        # serial pass sees; a copy without a prefetched scan is parsed inline.
+        tasks: Dict[Path, tuple] = {}
+        if jobs > 1:
+            for ref in session_refs:
+                copies = session_copies(ref)
+                sizes_worth_hashing = repeated_copy_sizes(copies)
+                seen_digests: set[str] = set()
+                for copy in copies:
+                    session_file = copy["path"]
+                    if ruled_out(session_file):
+                        continue
+                    digest = copy_digest(session_file, sizes_worth_hashing, digests)
+                    if digest is not None:
+                        if digest in seen_digests:
+                            continue
+                        seen_digests.add(digest)
+                    tasks[session_file] = (session_file, *scan_args)
+        scans = run_sharded(scan_claude_copy, tasks, jobs)
 
         for ref in session_refs:
             keyword_counts = defaultdict(int)
@@ -1225,21 +1224,14 @@ class SessionAnalyzer:
             matched_file_history_paths: set[str] = set()
             matching_copies: List[Dict[str, Any]] = []
 
-            copies = ref.get("copies") or [
-                {
-                    "path": ref["path"],
-                    "source": ref["sources"][0],
-                    "created_at": ref["created_at"],
-                    "updated_at": ref["updated_at"],
-                }
-            ]
+            copies = session_copies(ref)
             # Archive copies of one session are routinely byte-identical: a
             # registered long-term backup snapshots the same .jsonl every run,
             # so one session commonly carries a dozen copies with a single
             # distinct content (measured on a real project: 46 of 60 sampled
             # multi-copy sessions held 13 copies and exactly 1 content; that
             # redundancy was 85% of the corpus's bytes). Parsing all of them
-            # costs Nx for one session's worth of records — _record_identity
+            # costs Nx for one session's worth of records — record_identity
             # dedupes them straight back down afterwards.
             #
             # A byte-identical copy therefore has a fully predictable outcome:
@@ -1262,16 +1254,21 @@ class SessionAnalyzer:
                     # above for why skipping it here (no date window active)
                     # cannot under-count anything.
                     continue
+                if indexed is not None and session_file in indexed.skippable:
+                    # The index proved no record of this copy inside the
+                    # window can match; only its untimed records still count.
+                    copy_untimed = indexed.untimed.get(session_file, [])
+                    excluded_untimed_count += sum(
+                        1
+                        for identity in copy_untimed
+                        if identity not in excluded_untimed_from_prior_copies
+                    )
+                    excluded_untimed_from_prior_copies.update(copy_untimed)
+                    continue
 
-                copy_digest: Optional[str] = None
-                try:
-                    copy_size = session_file.stat().st_size
-                except OSError:
-                    copy_size = None
-                if copy_size in sizes_worth_hashing:
-                    copy_digest = file_content_digest(session_file)
-                if copy_digest is not None and copy_digest in digest_had_match:
-                    if digest_had_match[copy_digest]:
+                digest = copy_digest(session_file, sizes_worth_hashing, digests)
+                if digest is not None and digest in digest_had_match:
+                    if digest_had_match[digest]:
                         # Same bytes as a copy already processed for this
                         # session: it matched, so this one does too, and every
                         # one of its records was already counted.
@@ -1289,108 +1286,58 @@ class SessionAnalyzer:
                 copy_new_mentions = 0
                 copy_untimed_records: set[str] = set()
                 copy_matched_records: set[str] = set()
-                try:
-                    records = iter_jsonl(session_file, line_keywords=line_keywords)
-                    for data in records:
-                        record_identity = _record_identity(data)
-                        record_timestamp = parse_timestamp(data.get("timestamp"))
-                        if (
-                            record_timestamp is None
-                            and data.get("type") == "file-history-snapshot"
-                        ):
-                            snapshot = data.get("snapshot")
-                            if isinstance(snapshot, dict):
-                                record_timestamp = parse_timestamp(
-                                    snapshot.get("timestamp")
-                                )
-                        if from_timestamp is not None or to_timestamp is not None:
-                            if record_timestamp is None:
-                                if record_identity not in excluded_untimed_from_prior_copies:
-                                    excluded_untimed_count += 1
-                                copy_untimed_records.add(record_identity)
-                                continue
-                            if not timestamp_in_window(
-                                record_timestamp, from_timestamp, to_timestamp
-                            ):
-                                continue
-
-                        if data.get("type") == "file-history-snapshot":
-                            snapshot = data.get("snapshot")
-                            tracked = (
-                                snapshot.get("trackedFileBackups")
-                                if isinstance(snapshot, dict)
-                                else None
-                            )
-                            if isinstance(tracked, dict):
-                                for original_path in tracked:
-                                    if not isinstance(original_path, str):
-                                        continue
-                                    path_text = (
-                                        original_path
-                                        if case_sensitive
-                                        else original_path.casefold()
-                                    )
-                                    path_counts = {
-                                        keyword: 1
-                                        for keyword, search_keyword in search_keywords
-                                        if search_keyword in path_text
-                                    }
-                                    if not path_counts:
-                                        continue
-                                    copy_had_match = True
-                                    matching_source_labels.add(source.display_label)
-                                    match_sources.add("file_history_path")
-                                    if record_timestamp is not None:
-                                        match_timestamps.observe(record_timestamp)
-                                    if original_path in matched_file_history_paths:
-                                        continue
-                                    matched_file_history_paths.add(original_path)
-                                    path_mentions = sum(path_counts.values())
-                                    for keyword, count in path_counts.items():
-                                        keyword_counts[keyword] += count
-                                    total_mentions += path_mentions
-                                    copy_new_mentions += path_mentions
-
-                        record_counts = defaultdict(int)
-                        record_sources: set[str] = set()
-                        for segment in searchable_segments(data):
-                            search_text = (
-                                segment.text
-                                if case_sensitive
-                                else segment.text.casefold()
-                            )
-                            for keyword, search_keyword in search_keywords:
-                                count = search_text.count(search_keyword)
-                                if count > 0:
-                                    record_counts[keyword] += count
-                                    record_sources.add(segment.source)
-                        record_mentions = sum(record_counts.values())
-                        if not record_mentions:
+                scan = scans.pop(session_file, None) or scan_claude_copy(
+                    session_file, *scan_args
+                )
+                for event in scan.events:
+                    if event[0] == "untimed":
+                        record_identity = event[1]
+                        if record_identity not in excluded_untimed_from_prior_copies:
+                            excluded_untimed_count += 1
+                        copy_untimed_records.add(record_identity)
+                    elif event[0] == "path":
+                        _kind, original_path, path_counts, timestamp = event
+                        copy_had_match = True
+                        matching_source_labels.add(source.display_label)
+                        match_sources.add("file_history_path")
+                        if timestamp is not None:
+                            match_timestamps.observe(timestamp)
+                        if original_path in matched_file_history_paths:
                             continue
-
+                        matched_file_history_paths.add(original_path)
+                        path_mentions = sum(path_counts.values())
+                        for keyword, count in path_counts.items():
+                            keyword_counts[keyword] += count
+                        total_mentions += path_mentions
+                        copy_new_mentions += path_mentions
+                    else:
+                        (
+                            _kind, record_identity, record_counts, record_sources, timestamp
+                        ) = event
                         copy_had_match = True
                         matching_source_labels.add(source.display_label)
                         copy_matched_records.add(record_identity)
                         if record_identity in matched_records_from_prior_copies:
                             continue
+                        record_mentions = sum(record_counts.values())
                         for keyword, count in record_counts.items():
                             keyword_counts[keyword] += count
                         total_mentions += record_mentions
                         copy_new_mentions += record_mentions
                         match_sources.update(record_sources)
-                        if record_timestamp is not None:
-                            match_timestamps.observe(record_timestamp)
-                except (OSError, UnicodeError) as e:
+                        if timestamp is not None:
+                            match_timestamps.observe(timestamp)
+                if scan.error is not None:
                     print(
-                        f"Warning: Error processing {session_file}: {e}",
+                        f"Warning: Error processing {session_file}: {scan.error}",
                         file=sys.stderr,
                     )
                     continue
 
                 excluded_untimed_from_prior_copies.update(copy_untimed_records)
                 matched_records_from_prior_copies.update(copy_matched_records)
-                if copy_digest is not None:
-                    digest_had_match[copy_digest] = copy_had_match
+                if digest is not None:
+                    digest_had_match[digest] = copy_had_match
                 if copy_had_match:
                     matching_copies.append(
                         {
@@ -1559,6 +1506,14 @@ def _add_home_flags(subparser) -> None:
         "--to-date",
         help="Inclusive end: YYYY-MM-DD (local day) or timezone-qualified ISO datetime",
     )
+    subparser.add_argument(
+        "--no-index",
+        action="store_true",
+        help=(
+            "Re-parse every session instead of using the persistent session "
+            "metadata index (also: CONVERSATION_HISTORY_INDEX=off)"
+        ),
+    )
 
 
 def _sources_for(args) -> tuple:
@@ -1611,7 +1566,9 @@ def _analyzer_or_exit(args) -> "SessionAnalyzer":
             file=sys.stderr,
         )
         sys.exit(1)
-    return SessionAnalyzer(sources=sources, warnings=warnings)
+    return SessionAnalyzer(
+        sources=sources, warnings=warnings, index=session_index_for(args)
+    )
 
 
 def _parse_date_window(args, parser) -> tuple[Optional[float], Optional[float]]:
@@ -1947,6 +1904,25 @@ def main():
         "pre-filter's neutrality on an ASCII query, or to rule it out when "
         "diagnosing a suspected missed match.",
     )
+    search_parser.add_argument(
+        "--use-index",
+        action="store_true",
+        help="Use (and incrementally update) a persistent n-gram index of "
+        "extracted record text under the user cache dir to skip session "
+        "copies that cannot match. Unlike the pre-filter it also works for "
+        "CJK/non-ASCII keywords and with --from-date/--to-date. Candidates "
+        "are still verified by the full matcher, so results are identical; "
+        "building the index costs a few full parses, once per tree.",
+    )
+    search_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Parse candidate session files in N worker processes (0 = one "
+        "per CPU; default 1). Workers return per-file partial counts that are "
+        "merged in the serial order, so output is identical for every N.",
+    )
     _add_home_flags(search_parser)
 
     # Stats command
@@ -2083,8 +2059,9 @@ def main():
         excluded_generic = 0
         excluded_prefix = 0
         scanned = []
+        index = analyzer.index
         for ref in sessions:
-            summary = scan_claude_session(ref["path"])
+            summary = scan_claude_session(ref["path"], index=index)
             if not args.include_automated and is_automated_title(summary.title):
                 excluded_generic += 1
                 continue
@@ -2189,18 +2166,28 @@ def main():
             f"Searching {len(sessions)} session(s) across {len(analyzer.sources)} "
             f"source(s) [{source_summary}]{scope_desc} for: {', '.join(args.keywords)}\n"
         )
-        matches = (
-            analyzer.search_sessions(
-                sessions,
-                args.keywords,
-                args.case_sensitive,
-                from_timestamp,
-                to_timestamp,
-                not args.no_prefilter,
-            )
-            if sessions
-            else []
+        jobs = resolve_jobs(args.jobs)
+        search_index = (
+            SearchIndex(default_search_index_path()) if args.use_index else None
         )
+        try:
+            matches = (
+                analyzer.search_sessions(
+                    sessions,
+                    args.keywords,
+                    args.case_sensitive,
+                    from_timestamp,
+                    to_timestamp,
+                    not args.no_prefilter,
+                    search_index,
+                    jobs,
+                )
+                if sessions
+                else []
+            )
+        finally:
+            if search_index is not None:
+                search_index.close()
 
         codex_matches: List[Dict[str, Any]] = []
         codex_home: Optional[Path] = None
@@ -2220,6 +2207,7 @@ def main():
                 None if args.all_projects else args.project_path,
                 set(args.exclude_session),
                 not args.no_prefilter,
+                jobs,
             )
 
         kimi_matches: List[Dict[str, Any]] = []
@@ -2240,6 +2228,8 @@ def main():
                 None if args.all_projects else args.project_path,
                 set(args.exclude_session),
                 not args.no_prefilter,
+                jobs,
+                index=session_index_for(args),
             )
 
         if matches:
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = []
+# ///
+"""
+JSONL decoding benchmark on a synthetic Claude session corpus.
+
+Generates a deterministic tree of session files (default ~1 GB) shaped like a
+tool-heavy Claude Code history: short prompts, assistant turns with tool_use
+blocks, tool results whose ``toolUseResult`` carries most of the bytes, and
+file-history snapshots. Then reports, per installed JSON backend:
+
+1. full-record iteration: the previous text-mode ``iter_jsonl`` (decode,
+   re-encode every line to count bytes, ``json.loads``) versus the binary
+   ``iter_jsonl``
+2. the session metadata scan behind every listing (``scan_claude_session``)
+   with whole records versus the ``ClaudeSessionScan.fields`` projection
+
+Every variant's output is checked against the stdlib reference. Install
+orjson and/or msgspec to include them (``uv run --with orjson --with msgspec``).
+
+Usage:
+    uv run scripts/benchmark_jsonl_decode.py
+    uv run scripts/benchmark_jsonl_decode.py --size-mb 200 --dir /tmp/corpus
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from _core.claude import ClaudeSessionScan  # noqa: E402
+from _core.index import _run_scan  # noqa: E402
+from _core.text import (  # noqa: E402
+    JSON_BACKEND_ENV,
+    JSON_BACKENDS,
+    _importable,
+    iter_jsonl,
+)
+
+_WORDS = (
+    "refactor the parser cache index session archive deploy roadmap budget "
+    "会议 纪要 预算 测试 部署 修复 构建 日志"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _session_records(rng: random.Random, session_id: str, turns: int) -> Iterator[dict]:
+    clock = 1_767_225_600 + rng.randint(0, 10_000_000)
+    cwd = f"/work/project-{rng.randint(1, 40)}"
+
+    def stamp() -> str:
+        nonlocal clock
+        clock += rng.randint(1, 90)
+        return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(clock))
+
+    base = {"sessionId": session_id, "cwd": cwd, "version": "2.1.0"}
+    for turn in range(turns):
+        yield {
+            **base,
+            "type": "user",
+            "uuid": f"{session_id}-u{turn}",
+            "timestamp": stamp(),
+            "message": {"role": "user", "content": _sentence(rng, rng.randint(5, 40))},
+        }
+        tool_id = f"toolu_{session_id[:8]}_{turn}"
+        yield {
+            **base,
+            "type": "assistant",
+            "uuid": f"{session_id}-a{turn}",
+            "timestamp": stamp(),
+            "message": {
+                "role": "assistant",
+                "content": [
+                    {"type": "text", "text": _sentence(rng, rng.randint(20, 120))},
+                    {
+                        "type": "tool_use",
+                        "id": tool_id,
+                        "name": "Bash",
+                        "input": {"command": _sentence(rng, 8)},
+                    },
+                ],
+            },
+        }
+        output = _sentence(rng, rng.randint(400, 6000))
+        yield {
+            **base,
+            "type": "user",
+            "uuid": f"{session_id}-r{turn}",
+            "timestamp": stamp(),
+            "message": {
+                "role": "user",
+                "content": [
+                    {"type": "tool_result", "tool_use_id": tool_id, "content": output}
+                ],
+            },
+            "toolUseResult": {"stdout": output, "stderr": "", "interrupted": False},
+        }
+        if turn % 5 == 4:
+            yield {
+                "type": "file-history-snapshot",
+                "snapshot": {
+                    "timestamp": stamp(),
+                    "trackedFileBackups": {
+                        f"/work/src/module_{n}.py": {"version": n} for n in range(20)
+                    },
+                },
+            }
+
+
+def build_corpus(root: Path, size_bytes: int, seed: int) -> List[Path]:
+    """Write session files under ``root`` until ``size_bytes`` are on disk."""
+    rng = random.Random(seed)
+    paths: List[Path] = []
+    written = 0
+    while written < size_bytes:
+        session_id = f"{rng.getrandbits(128):032x}"
+        path = root / "projects" / f"-work-p{len(paths) % 25}" / f"{session_id}.jsonl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            for record in _session_records(rng, session_id, rng.randint(10, 120)):
+                line = json.dumps(record, ensure_ascii=False) + "\n"
+                handle.write(line)
+                written += len(line.encode("utf-8"))
+        paths.append(path)
+    return paths
+
+
+def legacy_iter_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    """The text-mode reader ``iter_jsonl`` replaced (unbounded form)."""
+    consumed = 0
+    with path.open("r", encoding="utf-8", errors="replace") as handle:
+        for line in handle:
+            consumed += len(line.encode("utf-8", errors="replace"))
+            try:
+                value = json.loads(line)
+            except (json.JSONDecodeError, TypeError):
+                continue
+            if isinstance(value, dict):
+                yield value
+
+
+def _timed(fn: Callable[[], Any]):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def _count_records(reader: Callable[[Path], Iterator[dict]], paths: List[Path]) -> int:
+    return sum(1 for path in paths for _ in reader(path))
+
+
+def _scan(paths: List[Path], fields) -> List[dict]:
+    ClaudeSessionScan.fields = fields
+    results = []
+    for path in paths:
+        scan = ClaudeSessionScan({"max_title_chars": 120, "stem": path.stem})
+        results.append(_run_scan(scan, path, 0, 0)[3])
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size-mb", type=float, default=1024.0,
+                        help="Corpus size in MB (default: 1024)")
+    parser.add_argument("--dir", type=Path,
+                        help="Reuse or create the corpus here instead of a temp dir")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    temp_dir = None
+    root = args.dir
+    if root is None:
+        temp_dir = tempfile.TemporaryDirectory(prefix="jsonl-bench-")
+        root = Path(temp_dir.name)
+    try:
+        paths = sorted(root.glob("projects/*/*.jsonl"))
+        if not paths:
+            paths, build_s = _timed(
+                lambda: build_corpus(root, int(args.size_mb * 1024 * 1024), args.seed)
+            )
+            print(f"generated corpus in {build_s:.1f}s")
+        total = sum(path.stat().st_size for path in paths)
+        print(f"corpus: {total / 1e6:.0f} MB in {len(paths)} session files\n")
+
+        # The stdlib goes first: it is the default and the reference.
+        backends = ["json"] + [
+            name for name in JSON_BACKENDS if name != "json" and _importable(name)
+        ]
+        default_fields = ClaudeSessionScan.fields
+        previous = os.environ.get(JSON_BACKEND_ENV)
+
+        reference_count, legacy_s = _timed(
+            lambda: _count_records(legacy_iter_jsonl, paths)
+        )
+        print(f"{'full records':<32}{'legacy text mode':<18}{legacy_s:8.2f}s")
+        reference_scan = None
+        try:
+            for backend in backends:
+                os.environ[JSON_BACKEND_ENV] = backend
+                count, seconds = _timed(lambda: _count_records(iter_jsonl, paths))
+                assert count == reference_count, f"{backend}: record count diverged"
+                print(f"{'full records':<32}{backend:<18}{seconds:8.2f}s"
+                      f"   {legacy_s / seconds:5.2f}x")
+            print()
+            for backend in backends:
+                os.environ[JSON_BACKEND_ENV] = backend
+                for label, fields in (("whole records", None),
+                                      ("projected", default_fields)):
+                    results, seconds = _timed(lambda: _scan(paths, fields))
+                    if reference_scan is None:
+                        reference_scan, reference_s = results, seconds
+                    assert results == reference_scan, f"{backend}/{label}: scan diverged"
+                    print(f"{'metadata scan, ' + label:<32}{backend:<18}{seconds:8.2f}s"
+                          f"   {reference_s / seconds:5.2f}x")
+        finally:
+            ClaudeSessionScan.fields = default_fields
+            if previous is None:
+                os.environ.pop(JSON_BACKEND_ENV, None)
+            else:
+                os.environ[JSON_BACKEND_ENV] = previous
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,7 +20,7 @@ import tempfile
 from collections import deque
 from datetime import datetime
 from pathlib import Path, PurePosixPath, PureWindowsPath
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
@@ -29,6 +29,8 @@ from _core.sources import (  # noqa: E402
     HistorySourceConfigError,
     discover_claude_sources,
 )
+from _core.text import json_line_decoder  # noqa: E402
+from analyze_sessions import file_content_digest, repeated_copy_sizes  # noqa: E402
 
 
 BACKUP_VERSION_RE = re.compile(r"@v(\d+)$")
@@ -105,6 +107,22 @@ def _metadata_version_hint(metadata: Dict[str, Any]) -> Optional[int]:
     return max(values) if values else None
 
 
+def _raw_line_hash(line: bytes) -> bytes:
+    """Digest of one JSONL line's bytes, ignoring its line terminator."""
+    return hashlib.blake2b(line.rstrip(b"\r\n"), digest_size=16).digest()
+
+
+def _canonical_record_hash(data: Dict[str, Any]) -> str:
+    """Digest of a record's content independent of key order and spacing."""
+    canonical = json.dumps(
+        data,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return hashlib.sha256(canonical).hexdigest()
+
+
 def _inspect_file(path: Path) -> tuple[str, int, int]:
     digest = hashlib.sha256()
     size = 0
@@ -421,6 +439,26 @@ class SessionContentRecovery:
             destination = tombstones if backup_name is None else snapshots
             self._consider_snapshot_entry(destination, candidate, errors)
 
+    @staticmethod
+    def _canonical_hashes(
+        session_files: List[Path],
+        decode: Callable[[bytes], Optional[Dict[str, Any]]],
+    ) -> set[str]:
+        """Canonical hashes of every record in already-scanned copies."""
+        hashes: set[str] = set()
+        for session_file in session_files:
+            try:
+                with session_file.open("rb") as handle:
+                    for line in handle:
+                        data = decode(line)
+                        if data is not None:
+                            hashes.add(_canonical_record_hash(data))
+            except OSError as error:
+                raise RecoveryError(
+                    f"Cannot read session copy {session_file}: {error}"
+                ) from error
+        return hashes
+
     def _scan_session(self) -> Dict[str, Any]:
         if self._scan_result is not None:
             return self._scan_result
@@ -432,18 +470,57 @@ class SessionContentRecovery:
         tombstones: Dict[str, Dict[str, Any]] = {}
         snapshot_error_candidates: Dict[str, List[Dict[str, Any]]] = {}
         session_ids: List[str] = []
-        record_hashes_from_prior_copies: set[str] = set()
         saw_claude_signature = False
         saw_codex_signature = False
         session_files = self._discover_session_files()
 
+        # Archive copies of one session are mostly the same records, so dedupe
+        # is tiered from cheapest to most expensive, and each tier only sees
+        # what the previous one could not decide:
+        #   1. a copy byte-identical to one already scanned (equal size, then
+        #      equal SHA-256) contributes nothing new — only its line and
+        #      duplicate counts, which are the twin's;
+        #   2. a line whose raw bytes match a record line of a prior copy is a
+        #      duplicate without being parsed;
+        #   3. only a line with new bytes is parsed and compared by canonical
+        #      content, which catches records another writer re-serialized.
+        # The canonical set of the prior copies is built only when tier 3
+        # first runs, so a copy that merely repeats lines of earlier ones
+        # (an older archive snapshot of a growing transcript) is never
+        # canonicalized at all.
+        decode = json_line_decoder()
+        sizes_worth_hashing = repeated_copy_sizes(
+            [{"path": session_file} for session_file in session_files]
+        )
+        counts_by_digest: Dict[str, tuple[int, int]] = {}
+        raw_hashes_from_prior_copies: set[bytes] = set()
+        canonical_hashes_from_prior_copies: Optional[set[str]] = None
+        scanned_copies: List[Path] = []
+
         for session_file in session_files:
-            copy_record_hashes: set[str] = set()
             stem = session_file.stem
             if stem and stem not in session_ids:
                 session_ids.append(stem)
             try:
-                handle = session_file.open("r", encoding="utf-8", errors="replace")
+                copy_size: Optional[int] = session_file.stat().st_size
+            except OSError:
+                copy_size = None
+            digest = (
+                file_content_digest(session_file)
+                if copy_size in sizes_worth_hashing
+                else None
+            )
+            if digest is not None and digest in counts_by_digest:
+                line_count, record_count = counts_by_digest[digest]
+                self.stats["total_lines"] += line_count
+                self.stats["duplicate_records_skipped"] += record_count
+                continue
+
+            copy_raw_hashes: set[bytes] = set()
+            copy_canonical_hashes: set[str] = set()
+            line_count = record_count = 0
+            try:
+                handle = session_file.open("rb")
             except OSError as error:
                 raise RecoveryError(
                     f"Cannot read session copy {session_file}: {error}"
@@ -451,24 +528,28 @@ class SessionContentRecovery:
             with handle:
                 for line_num, line in enumerate(handle, 1):
                     self.stats["total_lines"] += 1
-                    try:
-                        data = json.loads(line)
-                    except json.JSONDecodeError:
+                    line_count += 1
+                    raw_hash = _raw_line_hash(line)
+                    if raw_hash in raw_hashes_from_prior_copies:
+                        record_count += 1
+                        self.stats["duplicate_records_skipped"] += 1
                         continue
-                    if not isinstance(data, dict):
+                    data = decode(line)
+                    if data is None:
                         continue
+                    record_count += 1
+                    copy_raw_hashes.add(raw_hash)
 
-                    canonical = json.dumps(
-                        data,
-                        ensure_ascii=False,
-                        sort_keys=True,
-                        separators=(",", ":"),
-                    ).encode("utf-8")
-                    record_hash = hashlib.sha256(canonical).hexdigest()
-                    if record_hash in record_hashes_from_prior_copies:
-                        self.stats["duplicate_records_skipped"] += 1
-                        continue
-                    copy_record_hashes.add(record_hash)
+                    if scanned_copies:
+                        if canonical_hashes_from_prior_copies is None:
+                            canonical_hashes_from_prior_copies = (
+                                self._canonical_hashes(scanned_copies, decode)
+                            )
+                        record_hash = _canonical_record_hash(data)
+                        if record_hash in canonical_hashes_from_prior_copies:
+                            self.stats["duplicate_records_skipped"] += 1
+                            continue
+                        copy_canonical_hashes.add(record_hash)
 
                     record_type = data.get("type")
                     if record_type in self.CODEX_RECORD_TYPES:
@@ -558,7 +639,12 @@ class SessionContentRecovery:
                             )
                             self.stats["edit_calls"] += 1
 
-            record_hashes_from_prior_copies.update(copy_record_hashes)
+            raw_hashes_from_prior_copies.update(copy_raw_hashes)
+            if canonical_hashes_from_prior_copies is not None:
+                canonical_hashes_from_prior_copies.update(copy_canonical_hashes)
+            scanned_copies.append(session_file)
+            if digest is not None:
+                counts_by_digest[digest] = (line_count, record_count)
 
         usable_writes: List[Dict[str, Any]] = []
         for write in writes:
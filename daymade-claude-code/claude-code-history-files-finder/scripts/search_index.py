@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""
+Opt-in inverted index for ``analyze_sessions.py search`` (``--use-index``).
+
+Without it, every search re-runs ``json.loads`` and ``searchable_segments`` on
+every candidate copy. The rg/grep pre-filter (``files_possibly_matching``)
+saves most of that for plain ASCII keywords, but it has to switch itself off
+for CJK and other non-ASCII keywords (see ``keywords_are_raw_byte_safe``) and
+whenever a date window is set, which is exactly when searches are slowest.
+
+This index stores, per session file, which records contain which character
+bigrams of the *extracted, case-folded* search text — the same strings
+``searchable_segments`` yields, plus the original paths of file-history
+snapshots — along with each record's internal timestamp. Bigrams work for
+CJK without a tokenizer: a keyword can only occur in a segment that contains
+every bigram of the keyword. Case folding is per code point, so
+``casefold(keyword)`` is a substring of ``casefold(text)`` whenever either the
+exact-case or the case-insensitive matcher would match; one index serves both.
+
+The index is only ever used to *rule out* a copy: a copy is skipped when no
+record inside the date window holds every bigram of any keyword. Everything
+else is parsed and matched by the real matcher in ``search_sessions``, so the
+Completeness invariant is unchanged — the index can cost precision (a record
+holding the bigrams but not the keyword), never a match. A copy is only
+trusted when its fingerprint is unchanged and every byte of it was indexed
+(a trailing line still being written is not); keywords shorter than one
+bigram disable pruning. For date-windowed searches the index also keeps the
+identity of every untimed record, so skipping a copy still adds exactly what
+the full pass would have added to ``excluded_untimed_records``.
+
+Maintenance is incremental and append-only. Stale files are refreshed during
+the query: a session that only grew is resumed from its last indexed byte and
+its new records get new posting rows; a rewritten file gets a fresh file id
+and its old rows are garbage-collected later. Any SQLite error turns the index
+off for the rest of the process, which falls back to full parsing; a session
+that cannot be read is left to the full matcher.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from _core.index import (
+    INDEX_DIRNAME,
+    FileFingerprint,
+    fingerprint_file,
+    prefix_check,
+    user_cache_dir,
+)
+from _core.parse import parse_timestamp, timestamp_in_window
+from _core.text import json_line_decoder, searchable_segments
+
+# 2: records are split on "\n" only, as iter_jsonl does (1 also split on "\r").
+SEARCH_INDEX_FORMAT = 2
+SEARCH_INDEX_FILENAME = "search-index.sqlite"
+GRAM_SIZE = 2
+# Postings of rewritten files are deleted once this many dead file ids pile
+# up: deleting by file id scans the whole postings table, so batch it.
+COMPACT_AFTER_DEAD_FILES = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    file_id INTEGER NOT NULL UNIQUE,
+    fingerprint TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    resume_check TEXT,
+    records INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS records (
+    file_id INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    timestamp REAL,
+    identity TEXT,
+    PRIMARY KEY (file_id, ordinal)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS postings (
+    gram TEXT NOT NULL,
+    file_id INTEGER NOT NULL,
+    first INTEGER NOT NULL,
+    ordinals BLOB NOT NULL,
+    PRIMARY KEY (gram, file_id, first)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS dead_files (
+    file_id INTEGER PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def default_search_index_path() -> Path:
+    """``<user cache dir>/daymade-conversation-history/search-index.sqlite``."""
+    return user_cache_dir() / INDEX_DIRNAME / SEARCH_INDEX_FILENAME
+
+
+def record_identity(record: Dict[str, Any]) -> str:
+    """Return a stable identity for record-level union across session copies."""
+    canonical = json.dumps(
+        record,
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return "sha256:" + hashlib.sha256(canonical).hexdigest()
+
+
+def record_timestamp(record: Dict[str, Any]) -> Optional[float]:
+    """Internal timestamp of one Claude record, as the search window sees it.
+
+    ``file-history-snapshot`` records carry theirs inside ``snapshot``.
+    """
+    timestamp = parse_timestamp(record.get("timestamp"))
+    if timestamp is None and record.get("type") == "file-history-snapshot":
+        snapshot = record.get("snapshot")
+        if isinstance(snapshot, dict):
+            timestamp = parse_timestamp(snapshot.get("timestamp"))
+    return timestamp
+
+
+def record_search_texts(record: Dict[str, Any]) -> Iterator[str]:
+    """Every string ``search_sessions`` matches keywords against."""
+    for segment in searchable_segments(record):
+        yield segment.text
+    if record.get("type") == "file-history-snapshot":
+        snapshot = record.get("snapshot")
+        tracked = (
+            snapshot.get("trackedFileBackups") if isinstance(snapshot, dict) else None
+        )
+        if isinstance(tracked, dict):
+            for original_path in tracked:
+                if isinstance(original_path, str):
+                    yield original_path
+
+
+def text_grams(text: str) -> Set[str]:
+    folded = text.casefold()
+    return {folded[i : i + GRAM_SIZE] for i in range(len(folded) - GRAM_SIZE + 1)}
+
+
+def keyword_grams(keyword: str) -> Optional[Set[str]]:
+    """Bigrams every matching segment must contain (None: cannot prune)."""
+    if len(keyword.casefold()) < GRAM_SIZE:
+        return None
+    return text_grams(keyword)
+
+
+def _iter_records_from(
+    path: Path, start: int
+) -> Iterator[Tuple[Optional[Dict[str, Any]], int, bool]]:
+    """Yield ``(record, end_offset, complete)`` per line from byte ``start``.
+
+    Lines are split and decoded exactly as ``iter_jsonl`` does (binary, split
+    on ``\\n`` only, ``json_line_decoder``), so the index and the matcher
+    agree on record boundaries, ordinals and offsets. ``record`` is None for
+    a line that is blank, malformed, or not a JSON object.
+    """
+    decode = json_line_decoder()
+    with path.open("rb") as handle:
+        handle.seek(start)
+        offset = start
+        for raw in handle:
+            offset += len(raw)
+            yield decode(raw), offset, raw.endswith(b"\n")
+
+
+@dataclass
+class IndexedCandidates:
+    """What the index proved about one search's copies.
+
+    ``skippable`` copies hold no record in the date window that could match;
+    ``untimed`` lists, per skippable copy and only while a date window is
+    active, the identities of its records without an internal timestamp.
+    """
+
+    skippable: Set[Path] = field(default_factory=set)
+    untimed: Dict[Path, List[str]] = field(default_factory=dict)
+
+
+class SearchIndex:
+    """SQLite-backed n-gram postings over Claude session records."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._broken = False
+        self.fresh = 0
+        self.resumed = 0
+        self.rebuilt = 0
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._broken:
+            return None
+        if self._connection is None:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(
+                    str(self.db_path), timeout=15.0, isolation_level=None
+                )
+                connection.execute("PRAGMA journal_mode = WAL")
+                connection.execute("PRAGMA synchronous = NORMAL")
+                connection.executescript(_SCHEMA)
+                row = connection.execute(
+                    "SELECT value FROM meta WHERE key = 'format'"
+                ).fetchone()
+                if row is None or row[0] != str(SEARCH_INDEX_FORMAT):
+                    connection.execute("BEGIN IMMEDIATE")
+                    for table in ("files", "records", "postings", "dead_files"):
+                        connection.execute(f"DELETE FROM {table}")
+                    connection.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('format', ?)",
+                        (str(SEARCH_INDEX_FORMAT),),
+                    )
+                    connection.execute("COMMIT")
+            except (OSError, sqlite3.Error):
+                self._broken = True
+                return None
+            self._connection = connection
+        return self._connection
+
+    def _fail(self) -> None:
+        self._broken = True
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except sqlite3.Error:
+                pass
+            self._connection = None
+
+    def close(self) -> None:
+        if self._connection is not None:
+            try:
+                self.compact()
+            finally:
+                if self._connection is not None:
+                    self._connection.close()
+                    self._connection = None
+
+    def compact(self, force: bool = False) -> None:
+        """Drop postings of rewritten files once enough have accumulated."""
+        connection = self._connect()
+        if connection is None:
+            return
+        try:
+            (dead,) = connection.execute("SELECT COUNT(*) FROM dead_files").fetchone()
+            if not dead or (dead < COMPACT_AFTER_DEAD_FILES and not force):
+                return
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "DELETE FROM postings WHERE file_id IN (SELECT file_id FROM dead_files)"
+            )
+            connection.execute("DELETE FROM dead_files")
+            connection.execute("COMMIT")
+        except sqlite3.Error:
+            self._fail()
+
+    # -- maintenance -------------------------------------------------------
+
+    def refresh(self, path: Path) -> Optional[int]:
+        """Bring ``path`` up to date; return its file id if fully indexed."""
+        connection = self._connect()
+        if connection is None:
+            return None
+        fingerprint = fingerprint_file(path)
+        if fingerprint is None:
+            return None
+        key = os.path.abspath(path)
+        try:
+            row = connection.execute(
+                "SELECT file_id, fingerprint, offset, resume_check, records "
+                "FROM files WHERE path = ?",
+                (key,),
+            ).fetchone()
+            if row is not None:
+                file_id, stored_fp, offset, resume_check, records = row
+                previous = FileFingerprint.from_json(json.loads(stored_fp))
+                if previous == fingerprint:
+                    self.fresh += 1
+                    return file_id if offset == fingerprint.size else None
+                if (
+                    resume_check is not None
+                    and fingerprint.inode == previous.inode
+                    and fingerprint.size >= previous.size
+                    and prefix_check(path, offset) == json.loads(resume_check)
+                ):
+                    self.resumed += 1
+                    return self._index(
+                        connection, key, path, fingerprint, file_id, offset, records, None
+                    )
+            self.rebuilt += 1
+            return self._index(
+                connection, key, path, fingerprint, None, 0, 0,
+                row[0] if row is not None else None,
+            )
+        except OSError:
+            # An unreadable session is simply not covered; the full matcher
+            # reports it the way it always has.
+            return None
+        except sqlite3.Error:
+            if connection.in_transaction:
+                try:
+                    connection.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+            self._fail()
+            return None
+
+    def _index(
+        self,
+        connection: sqlite3.Connection,
+        key: str,
+        path: Path,
+        fingerprint: FileFingerprint,
+        file_id: Optional[int],
+        start: int,
+        first: int,
+        dead_file_id: Optional[int],
+    ) -> Optional[int]:
+        postings: Dict[str, array] = {}
+        rows: List[Tuple[Optional[float], Optional[str]]] = []
+        offset = start
+        ordinal = first
+        for record, end, complete in _iter_records_from(path, start):
+            if not complete:
+                break
+            if record is not None:
+                timestamp = record_timestamp(record)
+                rows.append(
+                    (timestamp, record_identity(record) if timestamp is None else None)
+                )
+                grams: Set[str] = set()
+                for text in record_search_texts(record):
+                    grams |= text_grams(text)
+                for gram in grams:
+                    postings.setdefault(gram, array("I")).append(ordinal)
+                ordinal += 1
+            offset = end
+
+        connection.execute("BEGIN IMMEDIATE")
+        if dead_file_id is not None:
+            connection.execute(
+                "INSERT OR IGNORE INTO dead_files (file_id) VALUES (?)", (dead_file_id,)
+            )
+            connection.execute("DELETE FROM records WHERE file_id = ?", (dead_file_id,))
+        if file_id is None:
+            (file_id,) = connection.execute(
+                "SELECT COALESCE(MAX(file_id), 0) + 1 FROM "
+                "(SELECT file_id FROM files UNION ALL SELECT file_id FROM dead_files)"
+            ).fetchone()
+        connection.executemany(
+            "INSERT INTO records (file_id, ordinal, timestamp, identity) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                (file_id, first + i, timestamp, identity)
+                for i, (timestamp, identity) in enumerate(rows)
+            ),
+        )
+        if rows:
+            connection.executemany(
+                "INSERT INTO postings (gram, file_id, first, ordinals) VALUES (?, ?, ?, ?)",
+                (
+                    (gram, file_id, first, ordinals.tobytes())
+                    for gram, ordinals in postings.items()
+                ),
+            )
+        connection.execute(
+            "INSERT OR REPLACE INTO files "
+            "(path, file_id, fingerprint, offset, resume_check, records) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                file_id,
+                json.dumps(fingerprint.to_json()),
+                offset,
+                json.dumps(prefix_check(path, offset)),
+                ordinal,
+            ),
+        )
+        connection.execute("COMMIT")
+        # Trusted only if the bytes fingerprinted before reading were all
+        # indexed: a trailing partial line, or an append that landed during
+        # the read, leaves the copy to the full matcher.
+        return file_id if offset == fingerprint.size else None
+
+    # -- queries -----------------------------------------------------------
+
+    def _postings(
+        self, connection: sqlite3.Connection, gram: str, file_ids: Set[int]
+    ) -> Dict[int, Set[int]]:
+        found: Dict[int, Set[int]] = {}
+        for file_id, blob in connection.execute(
+            "SELECT file_id, ordinals FROM postings WHERE gram = ?", (gram,)
+        ):
+            if file_id in file_ids:
+                ordinals = array("I")
+                ordinals.frombytes(blob)
+                found.setdefault(file_id, set()).update(ordinals)
+        return found
+
+    def candidates(
+        self,
+        paths: Iterable[Path],
+        keywords: Iterable[str],
+        from_timestamp: Optional[float] = None,
+        to_timestamp: Optional[float] = None,
+    ) -> IndexedCandidates:
+        """Refresh ``paths`` and report which of them cannot match."""
+        result = IndexedCandidates()
+        covered: Dict[int, Path] = {}
+        for path in paths:
+            file_id = self.refresh(path)
+            if file_id is not None:
+                covered[file_id] = path
+        keyword_gram_sets = [keyword_grams(keyword) for keyword in keywords]
+        connection = self._connect()
+        if (
+            connection is None
+            or not covered
+            or not keyword_gram_sets
+            or any(grams is None for grams in keyword_gram_sets)
+        ):
+            return result
+
+        windowed = from_timestamp is not None or to_timestamp is not None
+        try:
+            hits: Dict[int, Set[int]] = {}
+            for grams in keyword_gram_sets:
+                remaining: Optional[Dict[int, Set[int]]] = None
+                for gram in sorted(grams):
+                    wanted = set(covered) if remaining is None else set(remaining)
+                    found = self._postings(connection, gram, wanted)
+                    remaining = {
+                        file_id: ordinals
+                        if remaining is None
+                        else remaining[file_id] & ordinals
+                        for file_id, ordinals in found.items()
+                    }
+                    remaining = {k: v for k, v in remaining.items() if v}
+                    if not remaining:
+                        break
+                for file_id, ordinals in (remaining or {}).items():
+                    hits.setdefault(file_id, set()).update(ordinals)
+            if windowed:
+                for file_id in list(hits):
+                    in_window = {
+                        ordinal
+                        for ordinal, timestamp in connection.execute(
+                            "SELECT ordinal, timestamp FROM records "
+                            "WHERE file_id = ? AND timestamp IS NOT NULL",
+                            (file_id,),
+                        )
+                        if timestamp_in_window(timestamp, from_timestamp, to_timestamp)
+                    }
+                    if not hits[file_id] & in_window:
+                        del hits[file_id]
+            for file_id, path in covered.items():
+                if file_id in hits:
+                    continue
+                result.skippable.add(path)
+                if windowed:
+                    result.untimed[path] = [
+                        identity
+                        for (identity,) in connection.execute(
+                            "SELECT identity FROM records "
+                            "WHERE file_id = ? AND timestamp IS NULL ORDER BY ordinal",
+                            (file_id,),
+                        )
+                    ]
+        except sqlite3.Error:
+            self._fail()
+            return IndexedCandidates()
+        return result
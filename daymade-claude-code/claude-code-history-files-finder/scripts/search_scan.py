@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Per-file search passes for ``analyze_sessions.py search``.
+
+Each function here parses ONE file (a Claude session copy, a Codex rollout,
+or a Kimi wire) and returns what that file contributes to a search — mention
+counts, match provenance, timestamp ranges and, for Claude, the record
+identities the cross-copy dedupe needs. None of them touch state shared
+between files, which is what lets ``--jobs N`` run them in a process pool:
+the callers in ``analyze_sessions.py`` merge the returned partials in the
+original traversal order, so the serial and parallel paths go through the
+same merge and produce identical output.
+
+They live in their own module (rather than in the script) so pool workers
+can import them by name under every multiprocessing start method.
+"""
+
+from __future__ import annotations
+
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from _core.parse import TimestampRange, parse_timestamp, timestamp_in_window
+from _core.text import SearchSegment, iter_jsonl, searchable_segments
+from search_index import record_identity, record_timestamp
+
+# (keyword as given, keyword as compared) — the second is case-folded unless
+# the search is case-sensitive.
+SearchKeywords = Sequence[Tuple[str, str]]
+
+
+def resolve_jobs(jobs: Optional[int]) -> int:
+    """``--jobs`` value to a worker count: 0 or None means one per CPU."""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+def run_sharded(
+    scan: Callable[..., Any], tasks: Dict[Any, tuple], jobs: int
+) -> Dict[Any, Any]:
+    """Run ``scan(*args)`` for every ``key: args`` in a process pool.
+
+    Returns ``{key: result}``; callers merge in their own order. With one job
+    (or one task) nothing is precomputed and the caller scans inline.
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        return {}
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        futures = {key: pool.submit(scan, *args) for key, args in tasks.items()}
+        return {key: future.result() for key, future in futures.items()}
+
+
+def _count_keywords(
+    segments: List[SearchSegment],
+    search_keywords: SearchKeywords,
+    case_sensitive: bool,
+    source_prefix: str = "",
+) -> Tuple[Dict[str, int], List[str]]:
+    record_counts: Dict[str, int] = defaultdict(int)
+    record_sources: set[str] = set()
+    for segment in segments:
+        search_text = segment.text if case_sensitive else segment.text.casefold()
+        for keyword, search_keyword in search_keywords:
+            count = search_text.count(search_keyword)
+            if count > 0:
+                record_counts[keyword] += count
+                record_sources.add(source_prefix + segment.source)
+    return dict(record_counts), sorted(record_sources)
+
+
+# ---------------------------------------------------------------------------
+# Claude session copies
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ClaudeCopyScan:
+    """Ordered events one Claude session copy contributes to a search.
+
+    ``events`` replays the serial loop exactly:
+    ``("untimed", identity)`` for a record without a timestamp inside a date
+    window, ``("path", original_path, counts, timestamp)`` for a matching
+    file-history path, and ``("record", identity, counts, sources,
+    timestamp)`` for a matching record. ``error`` is set when reading stopped
+    early; the events before it still count, as they always have.
+    """
+
+    events: List[tuple] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def scan_claude_copy(
+    session_file: Path,
+    search_keywords: SearchKeywords,
+    case_sensitive: bool,
+    from_timestamp: Optional[float],
+    to_timestamp: Optional[float],
+    line_keywords: Optional[List[str]],
+) -> ClaudeCopyScan:
+    """Parse one Claude session copy into the events the search merge replays."""
+    result = ClaudeCopyScan()
+    events = result.events
+    windowed = from_timestamp is not None or to_timestamp is not None
+    try:
+        for data in iter_jsonl(session_file, line_keywords=line_keywords):
+            identity = record_identity(data)
+            timestamp = record_timestamp(data)
+            if windowed:
+                if timestamp is None:
+                    events.append(("untimed", identity))
+                    continue
+                if not timestamp_in_window(timestamp, from_timestamp, to_timestamp):
+                    continue
+
+            if data.get("type") == "file-history-snapshot":
+                snapshot = data.get("snapshot")
+                tracked = (
+                    snapshot.get("trackedFileBackups")
+                    if isinstance(snapshot, dict)
+                    else None
+                )
+                if isinstance(tracked, dict):
+                    for original_path in tracked:
+                        if not isinstance(original_path, str):
+                            continue
+                        path_text = (
+                            original_path if case_sensitive else original_path.casefold()
+                        )
+                        path_counts = {
+                            keyword: 1
+                            for keyword, search_keyword in search_keywords
+                            if search_keyword in path_text
+                        }
+                        if path_counts:
+                            events.append(("path", original_path, path_counts, timestamp))
+
+            record_counts, record_sources = _count_keywords(
+                searchable_segments(data), search_keywords, case_sensitive
+            )
+            if record_counts:
+                events.append(
+                    ("record", identity, record_counts, record_sources, timestamp)
+                )
+    except (OSError, UnicodeError) as e:
+        result.error = str(e)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Codex rollouts and Kimi wires
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class FileScan:
+    """What one Codex rollout or Kimi wire contributes to its session."""
+
+    keyword_counts: Dict[str, int] = field(default_factory=dict)
+    total_mentions: int = 0
+    match_sources: List[str] = field(default_factory=list)
+    session_range: TimestampRange = field(default_factory=TimestampRange)
+    match_range: TimestampRange = field(default_factory=TimestampRange)
+    excluded_untimed: int = 0
+    error: Optional[str] = None
+
+
+def _scan_records(
+    path: Path,
+    segments: Callable[[Dict[str, Any]], List[SearchSegment]],
+    timestamps: Callable[[Dict[str, Any]], Tuple[Optional[float], List[float]]],
+    search_keywords: SearchKeywords,
+    case_sensitive: bool,
+    from_timestamp: Optional[float],
+    to_timestamp: Optional[float],
+    line_keywords: Optional[List[str]],
+    source_prefix: str = "",
+) -> FileScan:
+    result = FileScan()
+    keyword_counts: Dict[str, int] = defaultdict(int)
+    match_sources: set[str] = set()
+    try:
+        for record in iter_jsonl(path, line_keywords=line_keywords):
+            timestamp, observed = timestamps(record)
+            for value in observed:
+                result.session_range.observe(value)
+            if from_timestamp is not None or to_timestamp is not None:
+                if timestamp is None:
+                    result.excluded_untimed += 1
+                    continue
+                if not timestamp_in_window(
+                    timestamp, from_timestamp, to_timestamp
+                ):
+                    continue
+            record_counts, record_sources = _count_keywords(
+                segments(record), search_keywords, case_sensitive, source_prefix
+            )
+            if not record_counts:
+                continue
+            for keyword, count in record_counts.items():
+                keyword_counts[keyword] += count
+            result.total_mentions += sum(record_counts.values())
+            match_sources.update(record_sources)
+            if timestamp is not None:
+                result.match_range.observe(timestamp)
+    except (OSError, UnicodeError) as e:
+        result.error = str(e)
+    result.keyword_counts = dict(keyword_counts)
+    result.match_sources = sorted(match_sources)
+    return result
+
+
+def _flatten_strings(value: Any) -> List[str]:
+    """Flatten nested str/list/dict content into plain strings."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [part for item in value for part in _flatten_strings(item)]
+    if isinstance(value, dict):
+        return [part for item in value.values() for part in _flatten_strings(item)]
+    return []
+
+
+def codex_searchable_segments(record: Dict[str, Any]) -> List[SearchSegment]:
+    """Extract searchable text fields from one Codex rollout record."""
+    segments: List[SearchSegment] = []
+
+    def add(source: str, value: Any) -> None:
+        for text_value in _flatten_strings(value):
+            segments.append(SearchSegment(source=source, text=text_value))
+
+    if record.get("type") == "compacted":
+        # Compaction records carry a summary of earlier conversation content.
+        payload = record.get("payload")
+        if isinstance(payload, dict):
+            add("summary", payload.get("message"))
+        return list(dict.fromkeys(segments))
+
+    if record.get("type") != "response_item":
+        return segments
+    payload = record.get("payload")
+    if not isinstance(payload, dict):
+        return segments
+    payload_type = payload.get("type")
+    if payload_type == "message":
+        for block in payload.get("content") or []:
+            if isinstance(block, dict) and block.get("type") in {
+                "input_text",
+                "output_text",
+            }:
+                add("message", block.get("text"))
+    elif payload_type == "reasoning":
+        for block in payload.get("summary") or []:
+            if isinstance(block, dict) and block.get("type") == "summary_text":
+                add("thinking", block.get("text"))
+    elif payload_type in {"function_call", "custom_tool_call"}:
+        name = payload.get("name")
+        source = (
+            f"tool_input:{name}"
+            if isinstance(name, str) and name
+            else "tool_input"
+        )
+        add(source, payload.get("arguments"))
+        add(source, payload.get("input"))
+    elif payload_type in {"function_call_output", "custom_tool_call_output"}:
+        add("tool_result", payload.get("output"))
+    return list(dict.fromkeys(segments))
+
+
+def _codex_timestamps(record: Dict[str, Any]) -> Tuple[Optional[float], List[float]]:
+    timestamp = parse_timestamp(record.get("timestamp"))
+    observed = [timestamp] if timestamp is not None else []
+    if record.get("type") == "session_meta" and isinstance(record.get("payload"), dict):
+        meta_timestamp = parse_timestamp(record["payload"].get("timestamp"))
+        if meta_timestamp is not None:
+            observed.append(meta_timestamp)
+    return timestamp, observed
+
+
+def scan_codex_file(
+    path: Path,
+    search_keywords: SearchKeywords,
+    case_sensitive: bool,
+    from_timestamp: Optional[float],
+    to_timestamp: Optional[float],
+    line_keywords: Optional[List[str]],
+) -> FileScan:
+    return _scan_records(
+        path, codex_searchable_segments, _codex_timestamps,
+        search_keywords, case_sensitive, from_timestamp, to_timestamp,
+        line_keywords,
+    )
+
+
+def _kimi_flatten_payload(value: Any) -> List[str]:
+    """Flatten nested Kimi payload content, dropping structural identifier keys.
+
+    Same principle as text.py's searchable_segments excluding id/signature
+    keys: UUID-class fields (turnId, toolCallId, …) are unique per record, so
+    indexing them only manufactures false-positive hits and dilutes the match
+    source attribution (independent review, 2026-08).
+    """
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [part for item in value for part in _kimi_flatten_payload(item)]
+    if isinstance(value, dict):
+        return [
+            part
+            for key, item in value.items()
+            if key not in _KIMI_STRUCTURAL_KEYS
+            for part in _kimi_flatten_payload(item)
+        ]
+    return []
+
+
+_KIMI_STRUCTURAL_KEYS = frozenset(
+    {
+        "type",
+        "id",
+        "uuid",
+        "stepUuid",
+        "turnId",
+        "toolCallId",
+        "parentUuid",
+        "callId",
+    }
+)
+
+
+def kimi_searchable_segments(record: Dict[str, Any]) -> List[SearchSegment]:
+    """Extract searchable text fields from one Kimi wire.jsonl record."""
+    segments: List[SearchSegment] = []
+
+    def add(source: str, value: Any) -> None:
+        for text_value in _kimi_flatten_payload(value):
+            segments.append(SearchSegment(source=source, text=text_value))
+
+    record_type = record.get("type")
+    if record_type in {"turn.prompt", "turn.steer"}:
+        add("prompt", record.get("input"))
+    elif record_type == "context.append_message":
+        message = record.get("message")
+        if isinstance(message, dict):
+            add("message", message.get("content"))
+            add("tool_input", message.get("toolCalls"))
+    elif record_type == "context.append_loop_event":
+        event = record.get("event")
+        if isinstance(event, dict):
+            event_type = event.get("type")
+            if event_type == "content.part":
+                add("message", event)
+            elif event_type == "tool.call":
+                add("tool_input", event)
+            elif event_type == "tool.result":
+                add("tool_result", event)
+            # step.begin / step.end carry no conversation text.
+    elif record_type == "plugin.session_start":
+        add("plugin", record.get("content"))
+    return list(dict.fromkeys(segments))
+
+
+def _kimi_timestamps(record: Dict[str, Any]) -> Tuple[Optional[float], List[float]]:
+    timestamp = parse_timestamp(record.get("time"))
+    if timestamp is None and record.get("type") == "metadata":
+        timestamp = parse_timestamp(record.get("created_at"))
+    return timestamp, [timestamp] if timestamp is not None else []
+
+
+def scan_kimi_wire(
+    path: Path,
+    agent_name: str,
+    search_keywords: SearchKeywords,
+    case_sensitive: bool,
+    from_timestamp: Optional[float],
+    to_timestamp: Optional[float],
+    line_keywords: Optional[List[str]],
+) -> FileScan:
+    return _scan_records(
+        path, kimi_searchable_segments, _kimi_timestamps,
+        search_keywords, case_sensitive, from_timestamp, to_timestamp,
+        line_keywords, source_prefix=f"{agent_name}:",
+    )
@@ -62,6 +62,7 @@ class SessionAnalyzerTests(unittest.TestCase):
         self.temp_dir = tempfile.TemporaryDirectory()
         self.root = Path(self.temp_dir.name)
         self.user_home = self.root / "user-home"
+        self.index_path = self.root / "session-index.sqlite"
         self.active_home = self.user_home / ".claude"
         self.archive_home = self.root / "conversation-archive"
         self.workspace = self.root / "workspaces" / "demo-project"
@@ -99,7 +100,11 @@ class SessionAnalyzerTests(unittest.TestCase):
             encoding="utf-8",
             capture_output=True,
             check=check,
-            env={**os.environ, "HOME": str(self.user_home)},
+            env={
+                **os.environ,
+                "HOME": str(self.user_home),
+                "CONVERSATION_HISTORY_INDEX": str(self.index_path),
+            },
         )
 
     def seed_structured_events(self) -> tuple[str, str]:
@@ -207,6 +212,18 @@ class SessionAnalyzerTests(unittest.TestCase):
         self.assertIn("archive:full-backup", completed.stdout)
         self.assertNotIn("Modified:", completed.stdout)
 
+    def test_session_index_is_used_unless_opted_out(self) -> None:
+        active_id, _ = self.seed_structured_events()
+        args = ("list", str(self.workspace), "--history-sources", str(self.manifest))
+        opted_out = self.run_cli(*args, "--no-index")
+        self.assertIn(active_id, opted_out.stdout)
+        self.assertFalse(self.index_path.exists())
+
+        indexed = self.run_cli(*args)
+        self.assertTrue(self.index_path.exists())
+        self.assertEqual(indexed.stdout, opted_out.stdout)
+        self.assertEqual(self.run_cli(*args).stdout, opted_out.stdout)
+
     def test_search_covers_structured_event_fields_and_filters_matching_records(self) -> None:
         _, archive_id = self.seed_structured_events()
         completed = self.run_cli(
@@ -960,7 +977,11 @@ class RawBytePrefilterSafetyTests(unittest.TestCase):
             completed = subprocess.run(
                 [sys.executable, str(SCRIPT), "search", str(workspace), keyword],
                 capture_output=True, text=True, check=False,
-                env=dict(os.environ, CLAUDE_CONFIG_DIR=str(home)),
+                env=dict(
+                    os.environ,
+                    CLAUDE_CONFIG_DIR=str(home),
+                    CONVERSATION_HISTORY_INDEX=str(root / "index.sqlite"),
+                ),
             )
             self.assertNotIn("No matches found", completed.stdout,
                              f"lost a match: content={content!r} keyword={keyword!r}")
@@ -987,7 +1008,11 @@ class RawBytePrefilterSafetyTests(unittest.TestCase):
             # ensure_ascii=True is the point of this fixture — do not "fix" it.
             target.write_text(json.dumps(record, ensure_ascii=True) + "\n", encoding="utf-8")
 
-            env = dict(os.environ, CLAUDE_CONFIG_DIR=str(home))
+            env = dict(
+                os.environ,
+                CLAUDE_CONFIG_DIR=str(home),
+                CONVERSATION_HISTORY_INDEX=str(root / "index.sqlite"),
+            )
             for keyword in ("café", "你好"):
                 with self.subTest(keyword=keyword):
                     completed = subprocess.run(
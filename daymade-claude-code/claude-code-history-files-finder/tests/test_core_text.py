@@ -14,16 +14,26 @@ that safety property, not just the happy path.
 
 from __future__ import annotations
 
+import importlib.util
 import json
+import os
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 SKILL_DIR = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(SKILL_DIR / "scripts"))
 
-from _core.text import files_possibly_matching, iter_jsonl  # noqa: E402
+from _core.text import (  # noqa: E402
+    JSON_BACKEND_ENV,
+    JSON_BACKENDS,
+    files_possibly_matching,
+    iter_jsonl,
+    json_backend,
+    json_line_decoder,
+)
 
 
 class FilesPossiblyMatchingTests(unittest.TestCase):
@@ -181,5 +191,76 @@ class IterJsonlLineKeywordsTests(unittest.TestCase):
         self.assertEqual([r["message"] for r in results], ["has needle"])
 
 
+# Lines where orjson/msgspec and the stdlib disagree on what is valid JSON.
+AWKWARD_LINES = [
+    b'{"type": "user", "n": 1}\n',
+    b'{"type": "user", "n": 1}\r\n',
+    b'{"text": "caf\xe9 invalid utf-8"}\n',
+    b'{"score": NaN, "type": "x"}\n',
+    b'{"big": 123456789012345678901234567890}\n',
+    b'{"s": "\\ud800 lone surrogate"}\n',
+    b'{"dup": 1, "dup": 2}\n',
+    b'[1, 2, 3]\n',
+    b'"just a string"\n',
+    b'null\n',
+    b'{"truncated": \n',
+    b'\n',
+]
+
+
+def _installed_backends() -> list[str]:
+    return [
+        name
+        for name in JSON_BACKENDS
+        if name == "json" or importlib.util.find_spec(name) is not None
+    ]
+
+
+class JsonLineDecoderTests(unittest.TestCase):
+    def test_every_installed_backend_matches_the_stdlib(self) -> None:
+        reference = json_line_decoder(backend="json")
+        for backend in _installed_backends():
+            decode = json_line_decoder(backend=backend)
+            for line in AWKWARD_LINES:
+                with self.subTest(backend=backend, line=line):
+                    self.assertEqual(decode(line), reference(line))
+
+    def test_projection_keeps_only_requested_present_keys(self) -> None:
+        line = json.dumps(
+            {"type": "user", "timestamp": "t", "toolUseResult": {"stdout": "x" * 100}}
+        ).encode("utf-8")
+        for backend in _installed_backends():
+            decode = json_line_decoder(("type", "timestamp", "cwd"), backend)
+            with self.subTest(backend=backend):
+                self.assertEqual(decode(line), {"type": "user", "timestamp": "t"})
+                self.assertIsNone(decode(b"[1]\n"))
+
+    def test_environment_selects_the_backend(self) -> None:
+        with mock.patch.dict(os.environ, {JSON_BACKEND_ENV: ""}):
+            self.assertEqual(json_backend(), "json")
+        with mock.patch.dict(os.environ, {JSON_BACKEND_ENV: "no-such-backend"}):
+            self.assertEqual(json_backend(), "json")
+        with mock.patch.dict(os.environ, {JSON_BACKEND_ENV: "auto"}):
+            self.assertEqual(json_backend(), _installed_backends()[0])
+
+    def test_iter_jsonl_counts_raw_bytes_and_projects(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "s.jsonl"
+            path.write_bytes(b"".join(AWKWARD_LINES))
+            records = list(iter_jsonl(path))
+            self.assertEqual(
+                records,
+                [
+                    json_line_decoder(backend="json")(line)
+                    for line in AWKWARD_LINES
+                    if json_line_decoder(backend="json")(line) is not None
+                ],
+            )
+            self.assertEqual(
+                list(iter_jsonl(path, fields=["type"])),
+                [{"type": "user"}, {"type": "user"}, {}, {"type": "x"}, {}, {}, {}],
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -577,7 +577,11 @@ class KimiCliSearchTests(unittest.TestCase):
             encoding="utf-8",
             capture_output=True,
             check=True,
-            env={**os.environ, "HOME": str(self.user_home)},
+            env={
+                **os.environ,
+                "HOME": str(self.user_home),
+                "CONVERSATION_HISTORY_INDEX": str(self.user_home / "index.sqlite"),
+            },
         )
 
     def test_cli_kimi_flag_searches_wires(self) -> None:
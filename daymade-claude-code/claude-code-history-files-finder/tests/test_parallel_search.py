@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Tests for ``search --jobs N``.
+
+Pool workers only return per-file partials; the merge replays them in the
+serial order. Every test therefore runs the same search with one job and with
+several and requires identical results, including cross-copy record dedupe,
+byte-identical copy reuse, untimed-record accounting and keyword order.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SKILL_DIR = Path(__file__).resolve().parents[1]
+SCRIPT = SKILL_DIR / "scripts" / "analyze_sessions.py"
+
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+from search_scan import resolve_jobs  # noqa: E402
+
+
+def load_analyze_module():
+    spec = importlib.util.spec_from_file_location(
+        "analyze_sessions_jobs_under_test", SCRIPT
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_jsonl(path: Path, records: list[dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def message(session_id: str, uuid: str, text: str, timestamp: str | None) -> dict:
+    record = {
+        "type": "user",
+        "uuid": uuid,
+        "sessionId": session_id,
+        "message": {"role": "user", "content": text},
+    }
+    if timestamp is not None:
+        record["timestamp"] = timestamp
+    return record
+
+
+class ParallelSearchTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_analyze_module()
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        env = mock.patch.dict(os.environ, {"CONVERSATION_HISTORY_INDEX": "off"})
+        env.start()
+        self.addCleanup(env.stop)
+        self.active = self.root / "active"
+        self.archive = self.root / "archive"
+        self.backup = self.root / "backup"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def session(self, home: Path, session_id: str) -> Path:
+        return home / "projects" / "-work-demo" / f"{session_id}.jsonl"
+
+    def seed_claude(self) -> None:
+        shared = [
+            message("s-1", "u-1", "Deploy the roadmap", "2026-03-01T09:00:00Z"),
+            message("s-1", "u-2", "roadmap without a timestamp", None),
+            {
+                "type": "file-history-snapshot",
+                "snapshot": {
+                    "timestamp": "2026-03-02T00:00:00Z",
+                    "trackedFileBackups": {"/src/roadmap.py": {"version": 1}},
+                },
+            },
+        ]
+        # Two byte-identical copies plus one that diverged with extra records.
+        write_jsonl(self.session(self.archive, "s-1"), shared)
+        write_jsonl(self.session(self.backup, "s-1"), shared)
+        write_jsonl(
+            self.session(self.active, "s-1"),
+            shared
+            + [
+                message("s-1", "u-3", "预算 and deploy again", "2026-03-05T09:00:00Z"),
+                message("s-1", "u-4", "预算 untimed follow-up", None),
+            ],
+        )
+        for index in range(4):
+            write_jsonl(
+                self.session(self.active, f"s-{index + 2}"),
+                [
+                    message(
+                        f"s-{index + 2}",
+                        f"v-{index}",
+                        "预算 " * index + "unrelated chatter",
+                        f"2026-02-0{index + 1}T00:00:00Z",
+                    )
+                ],
+            )
+
+    def claude_search(self, keywords, jobs, **kwargs):
+        analyzer = self.module.SessionAnalyzer(
+            homes=[self.active, self.archive, self.backup]
+        )
+        refs = analyzer.find_all_projects_sessions()
+        return analyzer.search_sessions(refs, keywords, jobs=jobs, **kwargs)
+
+    def assert_jobs_neutral(self, search, *args, **kwargs):
+        serial = search(*args, jobs=1, **kwargs)
+        parallel = search(*args, jobs=3, **kwargs)
+        self.assertEqual(serial, parallel)
+        for one, other in zip(serial, parallel):
+            self.assertEqual(
+                list(one["keyword_counts"]), list(other["keyword_counts"])
+            )
+        return parallel
+
+    def test_claude_copies_merge_exactly_like_the_serial_pass(self) -> None:
+        self.seed_claude()
+        for keywords in (["roadmap"], ["预算", "deploy"], ["deploy", "预算"], ["absent"]):
+            with self.subTest(keywords=keywords):
+                self.assert_jobs_neutral(
+                    self.claude_search, keywords, use_prefilter=False
+                )
+        matches = self.assert_jobs_neutral(self.claude_search, ["roadmap"])
+        s1 = next(m for m in matches if m["path"].stem == "s-1")
+        self.assertEqual(s1["total_mentions"], 3)
+        self.assertEqual(len(s1["matching_copies"]), 3)
+
+    def test_date_window_untimed_counts_survive_the_pool(self) -> None:
+        self.seed_claude()
+        window = {
+            "from_timestamp": self.module.parse_timestamp("2026-03-03T00:00:00Z"),
+            "to_timestamp": self.module.parse_timestamp("2026-03-31T00:00:00Z"),
+        }
+        matches = self.assert_jobs_neutral(self.claude_search, ["deploy"], **window)
+        self.assertEqual(matches[0]["excluded_untimed_records"], 2)
+
+    def test_codex_rollouts_match_the_serial_pass(self) -> None:
+        codex_home = self.root / "codex"
+        for index in range(3):
+            session_id = f"0000000{index}-aaaa-4aaa-8aaa-aaaaaaaaaaaa"
+            write_jsonl(
+                codex_home
+                / "sessions"
+                / "2026"
+                / "04"
+                / "20"
+                / f"rollout-2026-04-20T10-00-0{index}-{session_id}.jsonl",
+                [
+                    {
+                        "type": "session_meta",
+                        "timestamp": "2026-04-20T10:00:00Z",
+                        "payload": {"id": session_id, "cwd": "/work/demo"},
+                    },
+                    {
+                        "type": "response_item",
+                        "timestamp": f"2026-04-20T10:0{index}:00Z",
+                        "payload": {
+                            "type": "message",
+                            "role": "user",
+                            "content": [
+                                {"type": "input_text", "text": "refactor " * (index + 1)}
+                            ],
+                        },
+                    },
+                ],
+            )
+        rollouts = self.module.discover_codex_rollouts(codex_home)
+        matches = self.assert_jobs_neutral(
+            self.module.search_codex_rollouts, rollouts, ["refactor"]
+        )
+        self.assertEqual(sorted(m["total_mentions"] for m in matches), [1, 2, 3])
+
+    def test_kimi_wires_merge_per_session(self) -> None:
+        kimi_home = self.root / "kimi"
+        session_dir = kimi_home / "sessions" / "wd_demo_0a1b2c" / "session_1"
+        session_dir.mkdir(parents=True)
+        (session_dir / "state.json").write_text(
+            json.dumps({"id": "session_1", "cwd": "/work/demo", "title": "Demo"}),
+            encoding="utf-8",
+        )
+        for offset, agent in enumerate(("main", "helper", "reviewer")):
+            write_jsonl(
+                session_dir / "agents" / agent / "wire.jsonl",
+                [
+                    {
+                        "type": "context.append_message",
+                        "message": {
+                            "role": "user",
+                            "content": [{"type": "text", "text": f"{agent} release notes"}],
+                        },
+                        "time": 1767225600000 + offset * 60000,
+                    }
+                ],
+            )
+        wires = self.module.discover_kimi_wires(kimi_home)
+        matches = self.assert_jobs_neutral(
+            self.module.search_kimi_wires, wires, ["release", "helper"]
+        )
+        self.assertEqual(matches[0]["keyword_counts"], {"release": 3, "helper": 1})
+
+    def test_zero_jobs_means_one_per_cpu(self) -> None:
+        self.assertEqual(resolve_jobs(0), os.cpu_count() or 1)
+        self.assertEqual(resolve_jobs(4), 4)
+        self.assertEqual(resolve_jobs(-2), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -607,6 +607,61 @@ class SessionRecoveryTests(unittest.TestCase):
         self.assertEqual(self.expected_output().read_bytes(), b"archive final")
         self.assertIn("Session copies: 2", completed.stdout)
 
+    def test_archive_copies_are_deduped_without_canonicalizing_repeats(
+        self,
+    ) -> None:
+        records = [
+            write_record(str(self.original), f"v{n}", f"2026-07-01T21:0{n}:00Z")
+            for n in range(4)
+        ]
+        write_jsonl(self.session_file, records)
+        identical = self.root / "archive-a" / self.session_file.name
+        identical.parent.mkdir(parents=True)
+        identical.write_bytes(self.session_file.read_bytes())
+        older = self.root / "archive-b" / self.session_file.name
+        write_jsonl(older, records[:2])
+        copies = [self.session_file, identical, older]
+
+        recovery = SessionContentRecovery(self.session_file, output_dir=self.output_dir)
+        with mock.patch.object(
+            recovery, "_discover_session_files", return_value=copies
+        ), mock.patch(
+            "recover_content._canonical_record_hash",
+            side_effect=AssertionError("canonicalized a repeated record"),
+        ):
+            writes = recovery.extract_write_calls()
+
+        self.assertEqual([write["content"] for write in writes], ["v0", "v1", "v2", "v3"])
+        self.assertEqual(recovery.stats["total_lines"], 10)
+        self.assertEqual(recovery.stats["duplicate_records_skipped"], 6)
+
+    def test_reserialized_archive_copy_is_deduped_by_content(self) -> None:
+        records = [
+            write_record(str(self.original), f"v{n}", f"2026-07-01T21:0{n}:00Z")
+            for n in range(3)
+        ]
+        write_jsonl(self.session_file, records)
+        reserialized = self.root / "archive" / self.session_file.name
+        reserialized.parent.mkdir(parents=True)
+        reserialized.write_text(
+            "".join(
+                json.dumps(record, sort_keys=True, indent=None) + "\n"
+                for record in records + [write_record(str(self.original), "v9", "2026-07-02T00:00:00Z")]
+            ),
+            encoding="utf-8",
+        )
+
+        recovery = SessionContentRecovery(self.session_file, output_dir=self.output_dir)
+        with mock.patch.object(
+            recovery,
+            "_discover_session_files",
+            return_value=[self.session_file, reserialized],
+        ):
+            writes = recovery.extract_write_calls()
+
+        self.assertEqual([write["content"] for write in writes], ["v0", "v1", "v2", "v9"])
+        self.assertEqual(recovery.stats["duplicate_records_skipped"], 3)
+
     def test_report_destination_collision_aborts_before_writing(self) -> None:
         write_jsonl(
             self.session_file,
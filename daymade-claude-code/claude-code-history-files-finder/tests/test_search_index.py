@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Tests for the opt-in n-gram search index (``search --use-index``).
+
+The index may only change how many copies are parsed, never the result, so
+every test compares an indexed search with a plain one over the same tree.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SKILL_DIR = Path(__file__).resolve().parents[1]
+SCRIPT = SKILL_DIR / "scripts" / "analyze_sessions.py"
+
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+from _core.text import iter_jsonl  # noqa: E402
+from search_index import SearchIndex, keyword_grams  # noqa: E402
+
+
+def _load_analyze_module():
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location(
+        "analyze_sessions_index_under_test", SCRIPT
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def append_jsonl(path: Path, records: list[dict], tail: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        handle.write(tail)
+
+
+def message(session_id: str, text: str, timestamp: str | None) -> dict:
+    record = {
+        "type": "user",
+        "sessionId": session_id,
+        "message": {"role": "user", "content": text},
+    }
+    if timestamp is not None:
+        record["timestamp"] = timestamp
+    return record
+
+
+class SearchIndexTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = _load_analyze_module()
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.active = self.root / "active"
+        self.archive = self.root / "archive"
+        self.project = "-work-demo"
+        self.index = SearchIndex(self.root / "search-index.sqlite")
+        self.analyzer = self.module.SessionAnalyzer(homes=[self.active, self.archive])
+
+    def tearDown(self) -> None:
+        self.index.close()
+        self.temp_dir.cleanup()
+
+    def session(self, home: Path, session_id: str) -> Path:
+        return home / "projects" / self.project / f"{session_id}.jsonl"
+
+    def seed(self) -> None:
+        meeting = [
+            message("s-1", "讨论会议纪要和预算", "2026-03-01T09:00:00Z"),
+            message("s-1", "no timestamp on this one", None),
+            message("s-1", "Deploy the ROADMAP draft", "2026-03-05T09:00:00Z"),
+        ]
+        append_jsonl(self.session(self.active, "s-1"), meeting)
+        append_jsonl(self.session(self.archive, "s-1"), meeting)
+        append_jsonl(
+            self.session(self.archive, "s-2"),
+            [
+                message("s-2", "unrelated chatter", "2026-01-01T00:00:00Z"),
+                message("s-2", "another untimed record", None),
+                {
+                    "type": "file-history-snapshot",
+                    "snapshot": {
+                        "timestamp": "2026-02-01T00:00:00Z",
+                        "trackedFileBackups": {"/src/预算表.py": {"version": 1}},
+                    },
+                },
+            ],
+        )
+
+    def search(self, keywords, index=None, **kwargs):
+        refs = self.analyzer.find_all_projects_sessions()
+        return self.analyzer.search_sessions(
+            refs, keywords, search_index=index, **kwargs
+        )
+
+    def assert_same_as_full_parse(self, keywords, **kwargs):
+        plain = self.search(keywords, use_prefilter=False, **kwargs)
+        indexed = self.search(keywords, index=self.index, **kwargs)
+        self.assertEqual(plain, indexed)
+        return indexed
+
+    def test_cjk_and_ascii_queries_match_the_full_parse(self) -> None:
+        self.seed()
+        for keywords in (["会议"], ["预算"], ["roadmap"], ["nothing-here"], ["讨论", "deploy"]):
+            with self.subTest(keywords=keywords):
+                self.assert_same_as_full_parse(keywords)
+        self.assert_same_as_full_parse(["ROADMAP"], case_sensitive=True)
+        self.assert_same_as_full_parse(["roadmap"], case_sensitive=True)
+
+    def test_non_matching_copies_are_skipped(self) -> None:
+        self.seed()
+        candidates = self.index.candidates(
+            [
+                self.session(self.active, "s-1"),
+                self.session(self.archive, "s-1"),
+                self.session(self.archive, "s-2"),
+            ],
+            ["纪要"],
+        )
+        self.assertEqual(candidates.skippable, {self.session(self.archive, "s-2")})
+
+    def test_date_window_keeps_untimed_counts_exact(self) -> None:
+        self.seed()
+        window = {
+            "from_timestamp": self.module.parse_timestamp("2026-03-02T00:00:00Z"),
+            "to_timestamp": self.module.parse_timestamp("2026-03-31T00:00:00Z"),
+        }
+        matches = self.assert_same_as_full_parse(["deploy"], **window)
+        self.assertEqual(matches[0]["excluded_untimed_records"], 1)
+        self.assertEqual(self.assert_same_as_full_parse(["会议"], **window), [])
+
+        candidates = self.index.candidates(
+            [self.session(self.archive, "s-2")], ["预算"], **window
+        )
+        self.assertEqual(
+            len(candidates.untimed[self.session(self.archive, "s-2")]), 1
+        )
+
+    def test_appends_are_indexed_incrementally(self) -> None:
+        self.seed()
+        self.assert_same_as_full_parse(["增量"])
+        append_jsonl(
+            self.session(self.active, "s-1"),
+            [message("s-1", "新的增量内容", "2026-03-06T09:00:00Z")],
+        )
+
+        matches = self.assert_same_as_full_parse(["增量"])
+
+        self.assertEqual(len(matches), 1)
+        self.assertGreaterEqual(self.index.resumed, 1)
+        self.assertEqual(self.index.rebuilt, 3)
+
+    def test_partial_and_rewritten_files_fall_back_to_the_matcher(self) -> None:
+        self.seed()
+        path = self.session(self.archive, "s-2")
+        append_jsonl(path, [], tail=json.dumps(message("s-2", "半行预算", None)))
+        self.assertIsNone(self.index.refresh(path))
+        self.assert_same_as_full_parse(["半行"])
+
+        path.write_text(
+            json.dumps(message("s-2", "rewritten session", "2026-04-01T00:00:00Z"))
+            + "\n",
+            encoding="utf-8",
+        )
+        self.assertIsNotNone(self.index.refresh(path))
+        self.assert_same_as_full_parse(["rewritten"])
+        self.assert_same_as_full_parse(["chatter"])
+
+    def test_records_split_on_newline_only_like_the_matcher(self) -> None:
+        path = self.session(self.archive, "s-3")
+        joined = (
+            json.dumps(message("s-3", "carriage one", None))
+            + "\r"
+            + json.dumps(message("s-3", "carriage two", None))
+        )
+        append_jsonl(path, [message("s-3", "plain untimed", None)], tail=joined + "\n")
+        append_jsonl(path, [message("s-3", "timed", "2026-03-05T09:00:00Z")])
+        window = {
+            "from_timestamp": self.module.parse_timestamp("2026-03-01T00:00:00Z"),
+            "to_timestamp": self.module.parse_timestamp("2026-03-31T00:00:00Z"),
+        }
+
+        candidates = self.index.candidates([path], ["nothing-here"], **window)
+
+        # iter_jsonl reads the \r-joined line as one malformed record.
+        self.assertEqual(len(list(iter_jsonl(path))), 2)
+        self.assertEqual(len(candidates.untimed[path]), 1)
+        self.assert_same_as_full_parse(["carriage"], **window)
+
+    def test_single_character_keywords_disable_pruning(self) -> None:
+        self.seed()
+        self.assertIsNone(keyword_grams("会"))
+        self.assertEqual(
+            self.index.candidates([self.session(self.archive, "s-2")], ["会"]).skippable,
+            set(),
+        )
+        self.assert_same_as_full_parse(["会"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Tests for ``classify_session_tail`` (the ``triage`` command).
+
+The classifier reads records back from EOF and stops once the final turn is
+known. These tests pin both halves: the classification of each ending shape,
+and that reading stops in the tail unless a tool_use/tool_result pair really
+reaches further back.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+SKILL_DIR = Path(__file__).resolve().parents[1]
+SCRIPT = SKILL_DIR / "scripts" / "analyze_sessions.py"
+
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+from _core.text import iter_jsonl, iter_jsonl_reverse  # noqa: E402
+
+
+def load_analyze_module():
+    spec = importlib.util.spec_from_file_location(
+        "analyze_sessions_tail_under_test", SCRIPT
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def user(content, timestamp="2026-05-01T10:00:00Z", **extra) -> dict:
+    return {
+        "type": "user",
+        "timestamp": timestamp,
+        "message": {"role": "user", "content": content},
+        **extra,
+    }
+
+
+def assistant(content, timestamp="2026-05-01T10:00:01Z") -> dict:
+    record = {"type": "assistant", "message": {"role": "assistant", "content": content}}
+    if timestamp is not None:
+        record["timestamp"] = timestamp
+    return record
+
+
+def tool_use(tool_id: str, name: str = "Bash") -> dict:
+    return {"type": "tool_use", "id": tool_id, "name": name, "input": {}}
+
+
+def tool_result(tool_id: str) -> dict:
+    return {"type": "tool_result", "tool_use_id": tool_id, "content": "ok"}
+
+
+FILLER = [
+    user(f"question {n} " + "x" * 2000) if n % 2 == 0 else assistant([{"type": "text", "text": "answer"}])
+    for n in range(200)
+]
+
+
+class SessionTailTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.module = load_analyze_module()
+
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "session.jsonl"
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def write(self, records: list[dict]) -> None:
+        self.path.write_text(
+            "".join(json.dumps(record) + "\n" for record in records), encoding="utf-8"
+        )
+
+    def classify(self):
+        """Classify and return (tail, lowest byte offset the reader reached)."""
+        reached = []
+
+        def tracking(path, **kwargs):
+            for record, offset in iter_jsonl_reverse(path, **kwargs):
+                reached.append(offset)
+                yield record, offset
+
+        with mock.patch.object(self.module, "iter_jsonl_reverse", tracking):
+            tail = self.module.classify_session_tail(self.path)
+        return tail, min(reached, default=0)
+
+    def test_done_session_reads_only_the_final_turn(self) -> None:
+        self.write(FILLER + [user("final question"), assistant([{"type": "text", "text": "All set."}])])
+        tail, reached = self.classify()
+        self.assertEqual(tail.kind, self.module.TAIL_DONE)
+        self.assertEqual(tail.last_user_text, "final question")
+        self.assertEqual(tail.last_assistant_text, "All set.")
+        self.assertGreater(reached, self.path.stat().st_size // 2)
+
+    def test_pending_tool_use_is_proven_from_the_raw_prefix(self) -> None:
+        self.write(FILLER + [user("run it"), assistant([tool_use("toolu_01Pending")])])
+        tail, reached = self.classify()
+        self.assertEqual(tail.kind, self.module.TAIL_STUCK_NO_RESULT)
+        self.assertEqual(tail.last_assistant_text, "[tool_use:Bash]")
+        self.assertGreater(reached, 0)
+
+    def test_tool_result_written_long_before_its_tool_use_still_resolves(self) -> None:
+        self.write(
+            [user([tool_result("toolu_01Early")])]
+            + FILLER
+            + [user("run it"), assistant([tool_use("toolu_01Early", "Edit")])]
+        )
+        tail, reached = self.classify()
+        self.assertEqual(reached, 0)
+        self.assertEqual(tail.kind, self.module.TAIL_STUCK_NO_RESULT)
+        self.assertEqual(
+            tail.last_assistant_text, "[tool_use:Edit] (resolved, no further reply)"
+        )
+
+    def test_escaped_prefix_forces_a_full_read(self) -> None:
+        prefix = '{"type": "user", "message": {"role": "user", "content": "\\u0041"}}\n'
+        self.write(FILLER + [user("run it"), assistant([tool_use("toolu_01Pending")])])
+        self.path.write_text(prefix + self.path.read_text(encoding="utf-8"), encoding="utf-8")
+        tail, reached = self.classify()
+        self.assertEqual(reached, 0)
+        self.assertEqual(tail.last_assistant_kind, "tool_use")
+
+    def test_only_the_last_relevant_record_decides_interruption(self) -> None:
+        marker = "[Request interrupted by user]"
+        self.write(FILLER + [user(marker), user("carry on"), assistant([{"type": "text", "text": "Done."}])])
+        self.assertEqual(self.classify()[0].kind, self.module.TAIL_DONE)
+        self.write(FILLER + [assistant([{"type": "text", "text": "Working"}]), user(marker)])
+        self.assertEqual(self.classify()[0].kind, self.module.TAIL_INTERRUPTED_EXPLICIT)
+
+    def test_missing_fields_fall_back_to_earlier_records(self) -> None:
+        self.write(
+            [user("the only real prompt"), assistant([{"type": "text", "text": "hi"}])]
+            + [user([tool_result("toolu_x")]), assistant([{"type": "thinking"}], timestamp=None)]
+        )
+        tail, reached = self.classify()
+        self.assertEqual(reached, 0)
+        self.assertEqual(tail.kind, self.module.TAIL_STUCK_NO_RESULT)
+        self.assertEqual(tail.last_assistant_kind, "thinking_only")
+        self.assertEqual(tail.last_user_text, "the only real prompt")
+        self.assertEqual(
+            tail.last_assistant_timestamp,
+            self.module.parse_timestamp("2026-05-01T10:00:01Z"),
+        )
+
+    def test_empty_file_is_empty(self) -> None:
+        self.path.write_text("", encoding="utf-8")
+        self.assertEqual(self.classify()[0].kind, self.module.TAIL_EMPTY)
+
+    def test_reverse_reader_mirrors_the_forward_reader(self) -> None:
+        records = FILLER[:20] + [user("tail")]
+        body = "".join(json.dumps(record) + "\n" for record in records)
+        self.path.write_text("not json\n\n" + body.rstrip("\n"), encoding="utf-8")
+        forward = list(iter_jsonl(self.path))
+        for block_size in (1, 97, 4096, 1 << 20):
+            with self.subTest(block_size=block_size):
+                backward = list(iter_jsonl_reverse(self.path, block_size=block_size))
+                self.assertEqual([record for record, _ in backward], forward[::-1])
+                raw = self.path.read_bytes()
+                for record, offset in backward:
+                    self.assertEqual(json.loads(raw[offset:].split(b"\n", 1)[0]), record)
+
+
+if __name__ == "__main__":
+    unittest.main()
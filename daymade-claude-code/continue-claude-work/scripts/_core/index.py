@@ -0,0 +1,497 @@
+"""Persistent, incremental session-metadata index for the local-history skills.
+
+Every inventory used to re-parse each JSONL transcript from byte 0 just to
+rebuild its title, cwd and internal timestamp range. With tens of thousands of
+sessions and multi-GB archives that dominates every listing, even though almost
+none of the files changed since the last run.
+
+This module keeps those per-file summaries in one SQLite file under the user
+cache dir (shared by every skill that bundles the core) and reuses them when the
+file is unchanged. An entry is keyed by ``(kind, absolute path, params)`` and
+validated by a fingerprint: size, ``st_mtime_ns``, inode, and hashes of the
+first and last ``FINGERPRINT_BYTES``. mtime is used only to *invalidate*; it is
+never reported as a conversation time.
+
+A transcript that only grew (same inode, same head, and the bytes before the
+last indexed offset unchanged) is resumed: the scanner's serialized state is
+restored and only the appended lines are read. Scanners stop at the last
+complete line, so a record a writer is still appending is re-read next time
+instead of being counted twice.
+
+The index is a cache, never a source of truth: any SQLite or filesystem error
+disables it for the rest of the process and the caller scans directly. Set
+``CONVERSATION_HISTORY_INDEX=off`` to bypass it, or to a file path to relocate
+it.
+"""
+
+from __future__ import annotations
+
+import abc
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, ClassVar, Iterator, Optional, Sequence
+
+from .text import json_line_decoder
+
+INDEX_ENV = "CONVERSATION_HISTORY_INDEX"
+INDEX_FORMAT = 1
+INDEX_DIRNAME = "daymade-conversation-history"
+INDEX_FILENAME = "session-index.sqlite"
+FINGERPRINT_BYTES = 4096
+# Commit in batches: a cold index over tens of thousands of files must not pay
+# one fsync per session.
+COMMIT_EVERY = 256
+# Entries whose file has not been looked up for this long are dropped.
+STALE_AFTER_SECONDS = 90 * 24 * 3600
+_TOUCH_AFTER_SECONDS = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    params TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    offset INTEGER NOT NULL DEFAULT 0,
+    resume_check TEXT,
+    lines INTEGER NOT NULL DEFAULT 0,
+    state TEXT,
+    result TEXT NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (kind, path, params)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def user_cache_dir() -> Path:
+    """Per-user cache root following each platform's convention."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA")
+        return Path(base) if base else Path.home() / "AppData" / "Local"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches"
+    base = os.environ.get("XDG_CACHE_HOME")
+    return Path(base) if base else Path.home() / ".cache"
+
+
+def default_index_path() -> Optional[Path]:
+    """Index location, or None when disabled via ``CONVERSATION_HISTORY_INDEX``."""
+    configured = os.environ.get(INDEX_ENV, "").strip()
+    if configured.casefold() in {"0", "off", "false", "no", "none"}:
+        return None
+    if configured:
+        return Path(configured).expanduser()
+    return user_cache_dir() / INDEX_DIRNAME / INDEX_FILENAME
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _read_range(handle: Any, start: int, end: int) -> bytes:
+    handle.seek(start)
+    return handle.read(max(0, end - start))
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Cheap identity of one file's content at scan time."""
+
+    size: int
+    mtime_ns: int
+    inode: int
+    head: str
+    tail: str
+
+    def to_json(self) -> list:
+        return [self.size, self.mtime_ns, self.inode, self.head, self.tail]
+
+    @classmethod
+    def from_json(cls, value: Sequence) -> "FileFingerprint":
+        return cls(*value)
+
+
+def fingerprint_file(path: Path) -> Optional[FileFingerprint]:
+    """Stat plus head/tail hashes, or None if the file cannot be read."""
+    try:
+        stat = path.stat()
+        with path.open("rb") as handle:
+            head = handle.read(FINGERPRINT_BYTES)
+            tail = (
+                head
+                if stat.st_size <= FINGERPRINT_BYTES
+                else _read_range(handle, stat.st_size - FINGERPRINT_BYTES, stat.st_size)
+            )
+    except OSError:
+        return None
+    return FileFingerprint(
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        inode=stat.st_ino,
+        head=_digest(head),
+        tail=_digest(tail),
+    )
+
+
+def prefix_check(path: Path, offset: int) -> Optional[list]:
+    """Hashes that prove the first ``offset`` bytes are still in place."""
+    try:
+        with path.open("rb") as handle:
+            head = handle.read(min(offset, FINGERPRINT_BYTES))
+            before = _read_range(handle, max(0, offset - FINGERPRINT_BYTES), offset)
+    except OSError:
+        return None
+    return [offset, _digest(head), _digest(before)]
+
+
+def iter_jsonl_from(
+    path: Path, start: int = 0, fields: Optional[tuple[str, ...]] = None
+) -> Iterator[tuple[Optional[dict[str, Any]], int, bool]]:
+    """Yield ``(record_or_None, end_offset, complete)`` for each line from ``start``.
+
+    Lines are split on ``\\n`` in binary so ``end_offset`` is an exact byte
+    position to resume from. ``record`` is None for blank, invalid, or non-dict
+    lines (they still advance the offset). ``complete`` is False only for a
+    trailing line without a newline, which a writer may still be appending.
+    ``fields`` projects records as in ``text.json_line_decoder``.
+    """
+    decode = json_line_decoder(fields)
+    try:
+        with path.open("rb") as handle:
+            handle.seek(start)
+            offset = start
+            for line in handle:
+                offset += len(line)
+                complete = line.endswith(b"\n")
+                yield (decode(line) if line.strip() else None), offset, complete
+    except (OSError, UnicodeError):
+        return
+
+
+class IncrementalScan(abc.ABC):
+    """A per-file metadata scanner whose progress can be saved and resumed.
+
+    Subclasses set ``kind`` and implement ``feed`` / ``snapshot`` / ``result``;
+    they are abstract, so a subclass missing one fails on construction rather
+    than partway through a scan.
+    ``feed`` receives each parsed record with the byte and line counts consumed
+    through it (so bounded prefix scans stay bounded across resumes). State and
+    result must be JSON-serialisable.
+    """
+
+    kind: ClassVar[str] = ""
+    # Top-level keys ``feed`` reads; None hands it whole records.
+    fields: ClassVar[Optional[tuple[str, ...]]] = None
+
+    def __init__(self, params: dict[str, Any], state: Optional[dict[str, Any]] = None):
+        self.params = params
+
+    @abc.abstractmethod
+    def feed(self, record: dict[str, Any], consumed: int, lines: int) -> None:
+        """Fold one parsed record into the scan state."""
+
+    @abc.abstractmethod
+    def snapshot(self) -> dict[str, Any]:
+        """Return the resumable state as of the last fed record."""
+
+    @abc.abstractmethod
+    def result(self) -> dict[str, Any]:
+        """Return the summary for everything fed so far."""
+
+
+def _run_scan(
+    scan: IncrementalScan, path: Path, start: int, lines: int
+) -> tuple[dict[str, Any], int, int, dict[str, Any]]:
+    """Feed ``path`` from ``start``; return (state, resume offset, lines, result).
+
+    The returned state and offset stop at the last complete line; a trailing
+    partial line is fed only into the result.
+    """
+    state: Optional[dict[str, Any]] = None
+    offset = start
+    for record, end, complete in iter_jsonl_from(path, start, scan.fields):
+        if not complete:
+            state = scan.snapshot()
+        lines += 1
+        if record is not None:
+            scan.feed(record, end, lines)
+        if complete:
+            offset = end
+        else:
+            lines -= 1
+    if state is None:
+        state = scan.snapshot()
+    return state, offset, lines, scan.result()
+
+
+def scan_file(
+    scan_cls: type[IncrementalScan],
+    path: Path,
+    params: dict[str, Any],
+    index: Optional["SessionIndex"] = None,
+) -> dict[str, Any]:
+    """Run ``scan_cls`` over ``path``, through ``index`` when one is given."""
+    if index is not None:
+        cached = index.scan(scan_cls, path, params)
+        if cached is not None:
+            return cached
+    return _run_scan(scan_cls(params), path, 0, 0)[3]
+
+
+class SessionIndex:
+    """SQLite-backed cache of per-session metadata summaries."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pending = 0
+        self._broken = False
+        self.hits = 0
+        self.resumed = 0
+        self.misses = 0
+
+    # -- storage -----------------------------------------------------------
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._broken:
+            return None
+        if self._connection is None:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(str(self.db_path), timeout=5.0)
+                connection.execute("PRAGMA journal_mode = WAL")
+                connection.execute("PRAGMA synchronous = NORMAL")
+                connection.executescript(_SCHEMA)
+                row = connection.execute(
+                    "SELECT value FROM meta WHERE key = 'format'"
+                ).fetchone()
+                if row is None or row[0] != str(INDEX_FORMAT):
+                    connection.execute("DELETE FROM entries")
+                    connection.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('format', ?)",
+                        (str(INDEX_FORMAT),),
+                    )
+                connection.execute(
+                    "DELETE FROM entries WHERE last_seen < ?",
+                    (time.time() - STALE_AFTER_SECONDS,),
+                )
+                connection.commit()
+            except (OSError, sqlite3.Error):
+                self._broken = True
+                return None
+            self._connection = connection
+        return self._connection
+
+    def _fail(self) -> None:
+        self._broken = True
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except sqlite3.Error:
+                pass
+            self._connection = None
+
+    def _write(self, sql: str, values: tuple) -> None:
+        connection = self._connect()
+        if connection is None:
+            return
+        try:
+            connection.execute(sql, values)
+            self._pending += 1
+            if self._pending >= COMMIT_EVERY:
+                connection.commit()
+                self._pending = 0
+        except sqlite3.Error:
+            self._fail()
+
+    def flush(self) -> None:
+        """Commit buffered writes."""
+        if self._connection is None or not self._pending:
+            return
+        try:
+            self._connection.commit()
+            self._pending = 0
+        except sqlite3.Error:
+            self._fail()
+
+    def close(self) -> None:
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _lookup(self, kind: str, key: str, params: str) -> Optional[tuple]:
+        connection = self._connect()
+        if connection is None:
+            return None
+        try:
+            return connection.execute(
+                """
+                SELECT fingerprint, offset, resume_check, lines, state, result, last_seen
+                FROM entries WHERE kind = ? AND path = ? AND params = ?
+                """,
+                (kind, key, params),
+            ).fetchone()
+        except sqlite3.Error:
+            self._fail()
+            return None
+
+    def _touch(self, kind: str, key: str, params: str, last_seen: float) -> None:
+        now = time.time()
+        if now - last_seen > _TOUCH_AFTER_SECONDS:
+            self._write(
+                "UPDATE entries SET last_seen = ? WHERE kind = ? AND path = ? AND params = ?",
+                (now, kind, key, params),
+            )
+
+    def _store(
+        self,
+        kind: str,
+        key: str,
+        params: str,
+        fingerprint: Any,
+        result: dict[str, Any],
+        offset: int = 0,
+        resume_check: Optional[list] = None,
+        lines: int = 0,
+        state: Optional[dict[str, Any]] = None,
+    ) -> None:
+        self._write(
+            """
+            INSERT OR REPLACE INTO entries
+                (kind, path, params, fingerprint, offset, resume_check, lines,
+                 state, result, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                kind,
+                key,
+                params,
+                json.dumps(fingerprint),
+                offset,
+                json.dumps(resume_check) if resume_check is not None else None,
+                lines,
+                json.dumps(state, ensure_ascii=False) if state is not None else None,
+                json.dumps(result, ensure_ascii=False),
+                time.time(),
+            ),
+        )
+
+    # -- lookups -----------------------------------------------------------
+
+    def scan(
+        self, scan_cls: type[IncrementalScan], path: Path, params: dict[str, Any]
+    ) -> Optional[dict[str, Any]]:
+        """Cached result for one JSONL file, resuming appended files.
+
+        Returns None when the index is unusable so the caller scans directly.
+        """
+        if self._connect() is None:
+            return None
+        fingerprint = fingerprint_file(path)
+        if fingerprint is None:
+            return None
+        kind = scan_cls.kind
+        key = os.path.abspath(path)
+        params_key = json.dumps(params, sort_keys=True)
+        row = self._lookup(kind, key, params_key)
+
+        scan: IncrementalScan
+        start = lines = 0
+        if row is not None:
+            stored_fp, offset, resume_check, stored_lines, state, result, last_seen = row
+            if FileFingerprint.from_json(json.loads(stored_fp)) == fingerprint:
+                self.hits += 1
+                self._touch(kind, key, params_key, last_seen)
+                return json.loads(result)
+            previous = FileFingerprint.from_json(json.loads(stored_fp))
+            if (
+                state is not None
+                and resume_check is not None
+                and fingerprint.inode == previous.inode
+                and fingerprint.size >= previous.size
+                and prefix_check(path, offset) == json.loads(resume_check)
+            ):
+                self.resumed += 1
+                scan = scan_cls(params, json.loads(state))
+                start, lines = offset, stored_lines
+            else:
+                self.misses += 1
+                scan = scan_cls(params)
+        else:
+            self.misses += 1
+            scan = scan_cls(params)
+
+        state, offset, lines, result = _run_scan(scan, path, start, lines)
+        # Store the fingerprint taken *before* reading: if a writer appended
+        # meanwhile, the next lookup sees a different size and resumes from
+        # ``offset`` instead of trusting a result that may predate the append.
+        self._store(
+            kind, key, params_key, fingerprint.to_json(), result,
+            offset=offset, resume_check=prefix_check(path, offset),
+            lines=lines, state=state,
+        )
+        return result
+
+    def cached(
+        self,
+        kind: str,
+        key_path: Path,
+        params: dict[str, Any],
+        components: Sequence[Path],
+        compute: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Cached ``compute()`` for a summary derived from several files.
+
+        Valid while every component keeps its fingerprint (a missing component
+        counts as part of the fingerprint too). No resume: used where the
+        inputs are rewritten in place rather than appended.
+        """
+        if self._connect() is None:
+            return compute()
+        fingerprint = [
+            [os.path.abspath(path), (fp.to_json() if fp is not None else None)]
+            for path, fp in ((path, fingerprint_file(path)) for path in components)
+        ]
+        key = os.path.abspath(key_path)
+        params_key = json.dumps(params, sort_keys=True)
+        row = self._lookup(kind, key, params_key)
+        if row is not None and json.loads(row[0]) == fingerprint:
+            self.hits += 1
+            self._touch(kind, key, params_key, row[6])
+            return json.loads(row[5])
+        self.misses += 1
+        result = compute()
+        self._store(kind, key, params_key, fingerprint, result)
+        return result
+
+
+_DEFAULT: dict[Optional[Path], Optional[SessionIndex]] = {}
+
+
+def default_session_index() -> Optional[SessionIndex]:
+    """Process-wide index at ``default_index_path()`` (None when disabled)."""
+    path = default_index_path()
+    if path not in _DEFAULT:
+        index = SessionIndex(path) if path is not None else None
+        if index is not None:
+            atexit.register(index.close)
+        _DEFAULT[path] = index
+    return _DEFAULT[path]
+
+
+def session_index_for(args: Any) -> Optional[SessionIndex]:
+    """The default index unless the caller's ``args.no_index`` opts out."""
+    if getattr(args, "no_index", False):
+        return None
+    return default_session_index()
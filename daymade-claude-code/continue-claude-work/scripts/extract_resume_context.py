@@ -36,6 +36,7 @@ import re
 import subprocess
 import sys
 import time
+from array import array
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -47,6 +48,7 @@ PROJECTS_DIR = CLAUDE_DIR / "projects"  # default home only; discovery below spa
 # project whose history lives under a per-model profile home is not missed.
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from _core.homes import discover_claude_homes  # noqa: E402
+from _core.text import json_line_decoder  # noqa: E402
 
 # Message types that are noise — skip when extracting context
 NOISE_TYPES = {"progress", "queue-operation", "file-history-snapshot", "last-prompt"}
@@ -176,49 +178,54 @@ def format_session_entry(entry: Dict, file_exists: bool = True) -> str:
 
 
 def parse_session_structure(session_file: Path) -> Dict:
-    """Parse a session JSONL file and return structured data."""
+    """Parse a session JSONL file and return structured data.
+
+    One binary pass finds compact boundaries, counts lines and records where
+    each line starts; only lines carrying a compaction marker (or following
+    one) are decoded. The hot zone is then read by seeking straight to its
+    first line, so the transcript before it is never decoded or re-read.
+    """
     file_size = session_file.stat().st_size
     total_lines = 0
+    line_offsets = array("Q")
+    decode = json_line_decoder()
 
-    # First pass: find compact boundaries and count lines
+    # Find compact boundaries and line starts
     compact_boundaries = []  # (line_num, summary_text)
-    with open(session_file, encoding="utf-8") as f:
+    with open(session_file, "rb") as f:
         prev_boundary_line = None
+        offset = 0
         for i, raw_line in enumerate(f):
             total_lines += 1
+            line_offsets.append(offset)
+            offset += len(raw_line)
 
             # Detect compact summary via isCompactSummary flag (most reliable)
-            if '"isCompactSummary"' in raw_line:
-                try:
-                    obj = json.loads(raw_line)
-                    if obj.get("isCompactSummary"):
-                        content = obj.get("message", {}).get("content", "")
-                        if isinstance(content, str):
-                            boundary_line = prev_boundary_line if prev_boundary_line is not None else max(0, i - 1)
-                            compact_boundaries.append((boundary_line, content))
-                        prev_boundary_line = None
-                        continue
-                except json.JSONDecodeError:
-                    pass
+            if b'"isCompactSummary"' in raw_line:
+                obj = decode(raw_line)
+                if obj is not None and obj.get("isCompactSummary"):
+                    content = obj.get("message", {}).get("content", "")
+                    if isinstance(content, str):
+                        boundary_line = prev_boundary_line if prev_boundary_line is not None else max(0, i - 1)
+                        compact_boundaries.append((boundary_line, content))
+                    prev_boundary_line = None
+                    continue
 
             # Detect compact_boundary marker
-            if '"compact_boundary"' in raw_line and '"subtype"' in raw_line:
-                try:
-                    obj = json.loads(raw_line)
-                    if obj.get("subtype") == "compact_boundary":
-                        prev_boundary_line = i
-                        continue
-                except json.JSONDecodeError:
-                    pass
+            if b'"compact_boundary"' in raw_line and b'"subtype"' in raw_line:
+                obj = decode(raw_line)
+                if obj is not None and obj.get("subtype") == "compact_boundary":
+                    prev_boundary_line = i
+                    continue
 
             # Fallback: if prev line was boundary and this is a user message with long string content
             if prev_boundary_line is not None:
+                obj = decode(raw_line)
                 try:
-                    obj = json.loads(raw_line)
                     content = obj.get("message", {}).get("content", "")
                     if isinstance(content, str) and len(content) > 100:
                         compact_boundaries.append((prev_boundary_line, content))
-                except (json.JSONDecodeError, AttributeError):
+                except AttributeError:
                     compact_boundaries.append((prev_boundary_line, ""))
                 prev_boundary_line = None
 
@@ -235,7 +242,7 @@ def parse_session_structure(session_file: Path) -> Dict:
         else:  # >5MB: read last 15%
             hot_zone_start = max(0, int(total_lines * 0.85))
 
-    # Second pass: extract hot zone messages
+    # Seek to the hot zone and extract its messages
     messages = []
     unresolved_tool_calls = {}  # tool_use_id -> tool_use_info
     errors = []
@@ -243,13 +250,14 @@ def parse_session_structure(session_file: Path) -> Dict:
     last_message_role = None
     error_count = 0
 
-    with open(session_file, encoding="utf-8") as f:
-        for i, raw_line in enumerate(f):
-            if i < hot_zone_start:
-                continue
-            try:
-                obj = json.loads(raw_line)
-            except json.JSONDecodeError:
+    with open(session_file, "rb") as f:
+        if hot_zone_start < total_lines:
+            f.seek(line_offsets[hot_zone_start])
+        else:
+            f.seek(0, os.SEEK_END)
+        for raw_line in f:
+            obj = decode(raw_line)
+            if obj is None:
                 continue
 
             msg_type = obj.get("type", "")
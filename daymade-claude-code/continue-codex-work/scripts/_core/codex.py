@@ -20,13 +20,22 @@ import json
 import os
 import re
 import sqlite3
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, Optional
 from urllib.parse import quote
 
+from .index import IncrementalScan, SessionIndex, scan_file, session_index_for
 from .model import CodexDatabase, Conversation, ProviderResult
 from .parse import TimestampRange, parse_timestamp, workspace_matches
-from .text import extract_text, first_meaningful_title, is_automated_title, iter_jsonl
+from .text import (
+    MAX_PREFIX_BYTES,
+    MAX_PREFIX_LINES,
+    extract_text,
+    first_meaningful_title,
+    is_automated_title,
+    iter_jsonl,
+)
 
 CODEX_REQUIRED_COLUMNS = {"id", "cwd", "updated_at", "source", "archived"}
 SESSION_ID_RE = re.compile(
@@ -245,22 +254,27 @@ def codex_session_id(meta: dict[str, Any], path: Path) -> Optional[str]:
     return match.group(0) if match else None
 
 
+def codex_user_prompt(record: dict[str, Any]) -> str:
+    """User-visible prompt text carried by one rollout record (else "")."""
+    if record.get("type") == "response_item":
+        payload = record.get("payload")
+        if (
+            isinstance(payload, dict)
+            and payload.get("type") == "message"
+            and payload.get("role") == "user"
+        ):
+            return extract_text(payload.get("content"))
+    elif record.get("type") == "event_msg":
+        payload = record.get("payload")
+        if isinstance(payload, dict) and payload.get("type") == "user_message":
+            return str(payload.get("message") or "")
+    return ""
+
+
 def codex_prompt_from_rollout(path: Path, max_chars: int) -> Optional[str]:
     short_candidate: Optional[str] = None
     for record in iter_jsonl(path, bounded=True):
-        candidate = ""
-        if record.get("type") == "response_item":
-            payload = record.get("payload")
-            if (
-                isinstance(payload, dict)
-                and payload.get("type") == "message"
-                and payload.get("role") == "user"
-            ):
-                candidate = extract_text(payload.get("content"))
-        elif record.get("type") == "event_msg":
-            payload = record.get("payload")
-            if isinstance(payload, dict) and payload.get("type") == "user_message":
-                candidate = str(payload.get("message") or "")
+        candidate = codex_user_prompt(record)
         if not candidate:
             continue
         title = first_meaningful_title((candidate,), max_chars)
@@ -289,6 +303,97 @@ def codex_rollout_time_range(path: Path) -> TimestampRange:
     return timestamps
 
 
+@dataclass(frozen=True)
+class CodexRolloutSummary:
+    """What the raw-rollout inventory needs from one ``rollout-*.jsonl``."""
+
+    meta: Optional[dict[str, Any]]
+    prompt: Optional[str]
+    created_at: Optional[float]
+    updated_at: Optional[float]
+    timestamp_count: int
+
+
+class CodexRolloutScan(IncrementalScan):
+    """One pass computing ``codex_meta_from_rollout`` (id/cwd/source only),
+    ``codex_prompt_from_rollout`` and ``codex_rollout_time_range`` together.
+
+    The meta and prompt searches keep their bounded-prefix limits; the time
+    range covers the whole file and resumes as the rollout grows.
+    """
+
+    kind = "codex-rollout"
+
+    def __init__(self, params: dict[str, Any], state: Optional[dict[str, Any]] = None):
+        super().__init__(params, state)
+        state = state or {}
+        self.meta: Optional[dict[str, Any]] = state.get("meta")
+        self.prompt: Optional[str] = state.get("prompt")
+        self.short_prompt: Optional[str] = state.get("short_prompt")
+        self.prefix_done: bool = state.get("prefix_done", False)
+        self.timestamps = TimestampRange(*state.get("timestamps", (None, None, 0)))
+
+    def feed(self, record: dict[str, Any], consumed: int, lines: int) -> None:
+        self.timestamps.observe(record.get("timestamp"))
+        is_meta = record.get("type") == "session_meta" and isinstance(
+            record.get("payload"), dict
+        )
+        if is_meta:
+            self.timestamps.observe(record["payload"].get("timestamp"))
+        if self.prefix_done:
+            return
+        if consumed > MAX_PREFIX_BYTES or lines > MAX_PREFIX_LINES:
+            self.prefix_done = True
+            return
+        if self.meta is None and is_meta:
+            payload = record["payload"]
+            self.meta = {key: payload.get(key) for key in ("id", "cwd", "source")}
+        if self.prompt is None:
+            candidate = codex_user_prompt(record)
+            title = (
+                first_meaningful_title((candidate,), self.params["max_title_chars"])
+                if candidate
+                else None
+            )
+            if title and len(title) >= 4:
+                self.prompt = title
+            elif title:
+                self.short_prompt = self.short_prompt or title
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "meta": self.meta,
+            "prompt": self.prompt,
+            "short_prompt": self.short_prompt,
+            "prefix_done": self.prefix_done,
+            "timestamps": [
+                self.timestamps.earliest,
+                self.timestamps.latest,
+                self.timestamps.count,
+            ],
+        }
+
+    def result(self) -> dict[str, Any]:
+        return {
+            "meta": self.meta,
+            "prompt": self.prompt or self.short_prompt,
+            "created_at": self.timestamps.earliest,
+            "updated_at": self.timestamps.latest,
+            "timestamp_count": self.timestamps.count,
+        }
+
+
+def scan_codex_rollout(
+    path: Path, max_title_chars: int, *, index: Optional[SessionIndex] = None
+) -> CodexRolloutSummary:
+    """Summarize one rollout, through the persistent index when given."""
+    return CodexRolloutSummary(
+        **scan_file(
+            CodexRolloutScan, path, {"max_title_chars": max_title_chars}, index
+        )
+    )
+
+
 def collect_codex_from_rollouts(
     args: argparse.Namespace, home: Path, result: ProviderResult
 ) -> None:
@@ -303,8 +408,10 @@ def collect_codex_from_rollouts(
     if not files:
         result.warnings.append(f"No Codex rollout files found under {home}")
         return
+    index = session_index_for(args)
     for path, archived in files:
-        meta = codex_meta_from_rollout(path)
+        summary = scan_codex_rollout(path, args.max_title_chars, index=index)
+        meta = summary.meta
         if meta is None:
             result.warnings.append(f"Skipping rollout without session_meta: {path}")
             continue
@@ -322,28 +429,25 @@ def collect_codex_from_rollouts(
         if subagent and not args.include_subagents:
             result.excluded_subagents += 1
             continue
-        title = titles.get(session_id)
-        if not title:
-            title = codex_prompt_from_rollout(path, args.max_title_chars)
+        title = titles.get(session_id) or summary.prompt
         title = title or f"(untitled: {session_id})"
         if is_automated_title(title) and not args.include_automated:
             result.excluded_automated += 1
             continue
-        timestamps = codex_rollout_time_range(path)
         result.conversations.append(
             Conversation(
                 provider="codex",
                 session_id=session_id,
                 title=title,
                 cwd=cwd,
-                updated_at=timestamps.latest,
-                created_at=timestamps.earliest,
+                updated_at=summary.updated_at,
+                created_at=summary.created_at,
                 archived=archived,
                 kind="subagent" if subagent else "main",
                 path=str(path),
                 metadata_source="rollout-jsonl",
                 timestamp_source=(
-                    "rollout-record-minmax" if timestamps.count else "unknown"
+                    "rollout-record-minmax" if summary.timestamp_count else "unknown"
                 ),
             )
         )
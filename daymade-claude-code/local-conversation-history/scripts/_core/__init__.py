@@ -15,6 +15,7 @@ Modules:
     parse    — timestamp, timezone, and workspace normalization helpers.
     text     — semantic JSONL text/title extraction.
     model    — shared provider result data structures.
+    index    — persistent, resumable per-session metadata cache.
 """
 
 from .homes import discover_claude_homes, home_label
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
+from .index import IncrementalScan, SessionIndex, scan_file
 from .parse import TimestampRange
-from .text import extract_text, first_meaningful_title, iter_jsonl
+from .text import extract_text, first_meaningful_title
 
 
 @dataclass(frozen=True)
@@ -20,30 +21,33 @@ class ClaudeSessionSummary:
     timestamp_count: int
 
 
-def scan_claude_session(path: Path, max_title_chars: int = 120) -> ClaudeSessionSummary:
-    """Scan every valid record and return internal time bounds plus title metadata.
+class ClaudeSessionScan(IncrementalScan):
+    """Resumable state of one ``scan_claude_session`` pass."""
 
-    File mtime is deliberately absent. Copying or migrating a transcript changes
-    mtime without changing when the conversation happened; the only trustworthy
-    conversation range is the minimum and maximum valid top-level ``timestamp``
-    found across the JSONL records themselves.
-    """
-    session_id = path.stem
-    cwd = ""
-    prompt_candidates: list[str] = []
-    title: Optional[str] = None
-    timestamps = TimestampRange()
-
-    for record in iter_jsonl(path):
-        timestamps.observe(record.get("timestamp"))
+    kind = "claude-session"
+    # Everything else (toolUseResult, attachments, snapshots) is skipped, which
+    # is most of the bytes of a tool-heavy transcript.
+    fields = ("type", "timestamp", "sessionId", "cwd", "isMeta", "message")
+
+    def __init__(self, params: dict[str, Any], state: Optional[dict[str, Any]] = None):
+        super().__init__(params, state)
+        state = state or {}
+        self.session_id: Optional[str] = state.get("session_id")
+        self.cwd: str = state.get("cwd", "")
+        self.prompt_candidates: list[str] = list(state.get("prompt_candidates", []))
+        self.title: Optional[str] = state.get("title")
+        self.timestamps = TimestampRange(*state.get("timestamps", (None, None, 0)))
+
+    def feed(self, record: dict[str, Any], consumed: int = 0, lines: int = 0) -> None:
+        self.timestamps.observe(record.get("timestamp"))
         if isinstance(record.get("sessionId"), str) and record["sessionId"]:
-            session_id = record["sessionId"]
-        if not cwd and isinstance(record.get("cwd"), str):
-            cwd = record["cwd"]
-        if title is not None:
-            continue
+            self.session_id = record["sessionId"]
+        if not self.cwd and isinstance(record.get("cwd"), str):
+            self.cwd = record["cwd"]
+        if self.title is not None:
+            return
         if record.get("type") != "user" or record.get("isMeta") is True:
-            continue
+            return
         message = record.get("message")
         if isinstance(message, dict) and message.get("role") == "user":
             text = extract_text(message.get("content"))
@@ -52,21 +56,65 @@ def scan_claude_session(path: Path, max_title_chars: int = 120) -> ClaudeSession
         else:
             text = ""
         if not text:
-            continue
-        prompt_candidates.append(text)
-        candidate = first_meaningful_title(prompt_candidates, max_title_chars)
+            return
+        self.prompt_candidates.append(text)
+        candidate = first_meaningful_title(
+            self.prompt_candidates, self.params["max_title_chars"]
+        )
         if candidate and len(candidate) >= 4:
-            title = candidate
+            self.title = candidate
+            # Only needed while no title has been chosen yet.
+            self.prompt_candidates = []
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "cwd": self.cwd,
+            "prompt_candidates": list(self.prompt_candidates),
+            "title": self.title,
+            "timestamps": [
+                self.timestamps.earliest,
+                self.timestamps.latest,
+                self.timestamps.count,
+            ],
+        }
+
+    def result(self) -> dict[str, Any]:
+        session_id = self.session_id or self.params["stem"]
+        title = self.title
+        if title is None:
+            title = first_meaningful_title(
+                self.prompt_candidates, self.params["max_title_chars"]
+            )
+        if not title:
+            title = f"(untitled: {session_id})"
+        return {
+            "session_id": session_id,
+            "cwd": self.cwd,
+            "title": title,
+            "created_at": self.timestamps.earliest,
+            "updated_at": self.timestamps.latest,
+            "timestamp_count": self.timestamps.count,
+        }
 
-    if title is None:
-        title = first_meaningful_title(prompt_candidates, max_title_chars)
-    if not title:
-        title = f"(untitled: {session_id})"
+
+def scan_claude_session(
+    path: Path,
+    max_title_chars: int = 120,
+    *,
+    index: Optional[SessionIndex] = None,
+) -> ClaudeSessionSummary:
+    """Scan every valid record and return internal time bounds plus title metadata.
+
+    File mtime is deliberately absent. Copying or migrating a transcript changes
+    mtime without changing when the conversation happened; the only trustworthy
+    conversation range is the minimum and maximum valid top-level ``timestamp``
+    found across the JSONL records themselves.
+
+    With ``index``, an unchanged file is answered from the persistent session
+    index and a file that only grew is resumed from its last indexed offset.
+    """
+    params = {"max_title_chars": max_title_chars, "stem": path.stem}
     return ClaudeSessionSummary(
-        session_id=session_id,
-        cwd=cwd,
-        title=title,
-        created_at=timestamps.earliest,
-        updated_at=timestamps.latest,
-        timestamp_count=timestamps.count,
+        **scan_file(ClaudeSessionScan, path, params, index)
     )
@@ -10,6 +10,9 @@ re-deriving title/noise heuristics that would drift apart.
 
 from __future__ import annotations
 
+import functools
+import importlib
+import importlib.util
 import json
 import os
 import re
@@ -17,12 +20,13 @@ import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, Iterator, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
 
 from .parse import looks_like_windows_path
 
 MAX_PREFIX_BYTES = 2 * 1024 * 1024
 MAX_PREFIX_LINES = 5000
+REVERSE_BLOCK_BYTES = 64 * 1024
 NOISE_PREFIXES = (
     "# agents.md instructions for ",
     "<app-context",
@@ -45,6 +49,19 @@ ATTACHMENT_IMAGE_RE = re.compile(
 )
 FILE_SUFFIX_RE = re.compile(r"\.[A-Za-z0-9]{1,16}$")
 SLASH_COMMAND_RE = re.compile(r"^/[A-Za-z0-9_:-]+(?:[ \t].*)?$")
+# JSON decoder for every JSONL line. The stdlib is the default: transcripts
+# are dominated by long tool-output strings, where it measured as fast as or
+# faster than orjson (scripts/benchmark_jsonl_decode.py in the finder skill
+# reports both on your machine). "orjson" / "msgspec" opt in to one (stdlib if
+# it is not installed); "auto" takes the first importable of JSON_BACKENDS.
+JSON_BACKEND_ENV = "CONVERSATION_HISTORY_JSON"
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+# orjson turns integers beyond 64 bits into floats instead of failing, so a
+# line with a digit run that long always goes to the stdlib. Mapping every
+# byte to "0"/" " and searching for the run is several times cheaper than a
+# regex scan of a long line.
+_DIGIT_MASK = bytes(0x30 if 0x30 <= byte <= 0x39 else 0x20 for byte in range(256))
+_LONG_DIGIT_RUN = b"0" * 19
 
 
 @dataclass(frozen=True)
@@ -87,14 +104,117 @@ def strip_structural_metadata_lines(value: str) -> tuple[str, bool]:
     return "\n".join(lines).strip(), removed_attachment
 
 
+@functools.lru_cache(maxsize=None)
+def _importable(name: str) -> bool:
+    return name == "json" or importlib.util.find_spec(name) is not None
+
+
+def json_backend() -> str:
+    """Name of the JSON backend ``json_line_decoder`` uses by default."""
+    requested = os.environ.get(JSON_BACKEND_ENV, "").strip().casefold()
+    if requested == "auto":
+        return next(name for name in JSON_BACKENDS if _importable(name))
+    if requested in JSON_BACKENDS and _importable(requested):
+        return requested
+    return "json"
+
+
+def _stdlib_line(line: bytes) -> Any:
+    return json.loads(line.decode("utf-8", errors="replace"))
+
+
+def json_line_decoder(
+    fields: Optional[tuple[str, ...]] = None, backend: Optional[str] = None
+) -> Callable[[bytes], Optional[dict[str, Any]]]:
+    """Return ``decode(raw_line) -> dict | None`` for one JSONL line.
+
+    The stdlib decoder is the reference: a line yields exactly the dict
+    ``json.loads(line.decode("utf-8", errors="replace"))`` yields, or None
+    when that fails or is not an object. orjson and msgspec only take the
+    lines they accept unchanged and hand every line they reject (invalid
+    UTF-8, NaN, lone surrogates) or might read differently (integers beyond
+    64 bits) to the stdlib, so the backend never changes a result, only its
+    cost.
+
+    ``fields`` projects each record onto those top-level keys. With msgspec
+    the other values are skipped by the parser without being materialized
+    (a metadata scan then never builds a large ``toolUseResult`` or message
+    payload it does not read); other backends decode fully and drop them.
+    """
+    return _line_decoder(fields, backend or json_backend())
+
+
+@functools.lru_cache(maxsize=None)
+def _line_decoder(
+    fields: Optional[tuple[str, ...]], backend: str
+) -> Callable[[bytes], Optional[dict[str, Any]]]:
+    fast: Optional[Callable[[bytes], Any]] = None
+    errors: tuple[type[BaseException], ...] = ()
+    to_dict: Optional[Callable[[Any], dict[str, Any]]] = None
+    if backend == "orjson":
+        orjson = importlib.import_module("orjson")
+        fast, errors = orjson.loads, (orjson.JSONDecodeError,)
+    elif backend == "msgspec":
+        msgspec = importlib.import_module("msgspec")
+        errors = (msgspec.MsgspecError,)
+        if fields is not None and all(name.isidentifier() for name in fields):
+            projection = msgspec.defstruct(
+                "JsonlProjection",
+                [(name, Any, msgspec.UNSET) for name in fields],
+            )
+            fast = msgspec.json.Decoder(projection).decode
+
+            def to_dict(value: Any) -> dict[str, Any]:
+                return {
+                    name: getattr(value, name)
+                    for name in fields
+                    if getattr(value, name) is not msgspec.UNSET
+                }
+
+        else:
+            fast = msgspec.json.Decoder().decode
+
+    def decode(line: bytes) -> Optional[dict[str, Any]]:
+        value: Any = None
+        if fast is not None and _LONG_DIGIT_RUN not in line.translate(_DIGIT_MASK):
+            try:
+                value = fast(line)
+            except errors:
+                value = None
+            else:
+                if to_dict is not None:
+                    return to_dict(value)
+                if not isinstance(value, dict):
+                    # Scalars and arrays are skipped either way.
+                    return None
+        if value is None:
+            try:
+                value = _stdlib_line(line)
+            except (json.JSONDecodeError, TypeError):
+                return None
+            if not isinstance(value, dict):
+                return None
+        if fields is None:
+            return value
+        return {name: value[name] for name in fields if name in value}
+
+    return decode
+
+
 def iter_jsonl(
     path: Path,
     *,
     bounded: bool = False,
     line_keywords: Optional[list[str]] = None,
+    fields: Optional[Sequence[str]] = None,
 ) -> Iterator[dict[str, Any]]:
     """Yield each JSONL record as a dict.
 
+    The file is read in binary and split on ``\\n`` only; the bounded-prefix
+    limit counts the raw bytes consumed. Lines are decoded by
+    ``json_line_decoder`` (see ``JSON_BACKEND_ENV``), which also applies
+    ``fields`` — a projection for callers that only read a few top-level keys.
+
     ``line_keywords`` is an optional cheap pre-check: when given, a line is
     only handed to ``json.loads`` if it contains at least one of these
     strings as a raw substring (case-insensitive — callers pass already
@@ -122,34 +242,80 @@ def iter_jsonl(
     ``use_prefilter`` docstring for the specific case this codebase hit —
     date-window "excluded because untimed" counts must see every record).
     """
+    decode = json_line_decoder(None if fields is None else tuple(fields))
     consumed = 0
     lines = 0
     try:
-        with path.open("r", encoding="utf-8", errors="replace") as handle:
+        with path.open("rb") as handle:
             for line in handle:
-                consumed += len(line.encode("utf-8", errors="replace"))
+                consumed += len(line)
                 lines += 1
                 if bounded and (consumed > MAX_PREFIX_BYTES or lines > MAX_PREFIX_LINES):
                     return
                 if line_keywords is not None:
-                    haystack = line.casefold()
+                    text = line.decode("utf-8", errors="replace")
+                    haystack = text.casefold()
                     if not any(kw in haystack for kw in line_keywords) and not any(
-                        marker in line for marker in _UNSCANNABLE_MARKERS
+                        marker in text for marker in _UNSCANNABLE_MARKERS
                     ):
                         # Same over-approximation as the file-level filter: a
                         # line holding a fold-equivalent character or a \u
                         # escape may still match once parsed, so never skip it.
                         continue
-                try:
-                    value = json.loads(line)
-                except (json.JSONDecodeError, TypeError):
-                    continue
-                if isinstance(value, dict):
+                value = decode(line)
+                if value is not None:
                     yield value
     except (OSError, UnicodeError):
         return
 
 
+def iter_jsonl_reverse(
+    path: Path,
+    *,
+    block_size: int = REVERSE_BLOCK_BYTES,
+    fields: Optional[Sequence[str]] = None,
+) -> Iterator[tuple[dict[str, Any], int]]:
+    """Yield ``(record, line_offset)`` from the LAST JSONL record to the first.
+
+    Reads ``block_size`` blocks backwards from EOF, so a caller that stops as
+    soon as it has seen enough of the tail never touches the rest of the file.
+    Lines decode exactly as in ``iter_jsonl`` (same split on ``\\n``, same
+    decoder); ``line_offset`` is the byte offset where the record's line
+    starts, i.e. everything before it is still unread. A line longer than a
+    block is reassembled from its pieces once, not re-copied per block.
+    """
+    decode = json_line_decoder(None if fields is None else tuple(fields))
+    try:
+        with path.open("rb") as handle:
+            end = handle.seek(0, os.SEEK_END)
+            # Pieces of the line that runs past the current block, last first.
+            spill: list[bytes] = []
+            while end > 0:
+                start = max(0, end - block_size)
+                handle.seek(start)
+                block = handle.read(end - start)
+                end = start
+                stop = len(block)
+                cut = block.rfind(b"\n", 0, stop)
+                while cut >= 0:
+                    line = block[cut + 1 : stop]
+                    if spill:
+                        line += b"".join(reversed(spill))
+                        spill = []
+                    value = decode(line) if line.strip() else None
+                    if value is not None:
+                        yield value, start + cut + 1
+                    stop = cut
+                    cut = block.rfind(b"\n", 0, stop)
+                spill.append(block[:stop])
+            line = b"".join(reversed(spill))
+            value = decode(line) if line.strip() else None
+            if value is not None:
+                yield value, 0
+    except (OSError, UnicodeError):
+        return
+
+
 # Every character a JSON writer may store as something other than itself:
 # the two mandatory escapes (" and \), the optional one (/), and all control
 # characters. Enumerated from the JSON grammar rather than from observed
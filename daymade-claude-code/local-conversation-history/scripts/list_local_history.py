@@ -19,6 +19,7 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 from _core.claude import scan_claude_session  # noqa: E402
 from _core.homes import home_label  # noqa: E402
+from _core.index import SessionIndex, session_index_for  # noqa: E402
 from _core.parse import (  # noqa: E402
     format_timestamp,
     iso_timestamp,
@@ -75,9 +76,12 @@ def claude_session_files(project_dir: Path, include_subagents: bool) -> list[Pat
 
 
 def parse_claude_session(
-    path: Path, max_chars: int, source: HistorySource
+    path: Path,
+    max_chars: int,
+    source: HistorySource,
+    index: Optional[SessionIndex] = None,
 ) -> Conversation:
-    summary = scan_claude_session(path, max_chars)
+    summary = scan_claude_session(path, max_chars, index=index)
     return Conversation(
         provider="claude",
         session_id=summary.session_id,
@@ -170,6 +174,7 @@ def collect_claude(args: argparse.Namespace, source: HistorySource) -> ProviderR
         args.all_projects,
         result.warnings,
     )
+    index = session_index_for(args)
     for project_dir in project_dirs:
         if not args.include_subagents:
             try:
@@ -179,7 +184,9 @@ def collect_claude(args: argparse.Namespace, source: HistorySource) -> ProviderR
             except OSError:
                 pass
         for path in claude_session_files(project_dir, args.include_subagents):
-            conversation = parse_claude_session(path, args.max_title_chars, source)
+            conversation = parse_claude_session(
+                path, args.max_title_chars, source, index
+            )
             if not args.all_projects and conversation.cwd and not workspace_matches(
                 conversation.cwd, args.cwd, args.recursive
             ):
@@ -398,6 +405,14 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--max-title-chars", type=int, default=120, help="Maximum title length"
     )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help=(
+            "Re-parse every session instead of using the persistent metadata "
+            "index (also: CONVERSATION_HISTORY_INDEX=off)"
+        ),
+    )
     return parser
 
 
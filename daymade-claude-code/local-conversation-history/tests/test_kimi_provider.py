@@ -20,6 +20,7 @@ import tempfile
 import unittest
 from datetime import datetime, timezone
 from pathlib import Path
+from unittest import mock
 
 
 SKILL_DIR = Path(__file__).resolve().parents[1]
@@ -130,6 +131,11 @@ class KimiCollectTests(unittest.TestCase):
         self.workspace = self.root / "workspaces" / "demo-project"
         self.workspace.mkdir(parents=True)
         self.kimi_home = self.root / "kimi-home"
+        index_env = mock.patch.dict(
+            os.environ, {"CONVERSATION_HISTORY_INDEX": str(self.root / "index.sqlite")}
+        )
+        index_env.start()
+        self.addCleanup(index_env.stop)
 
     def tearDown(self) -> None:
         self.temp_dir.cleanup()
@@ -375,6 +381,11 @@ class KimiCliTests(unittest.TestCase):
         self.workspace = self.root / "workspaces" / "demo-project"
         self.workspace.mkdir(parents=True)
         self.kimi_home = self.root / "kimi-home"
+        index_env = mock.patch.dict(
+            os.environ, {"CONVERSATION_HISTORY_INDEX": str(self.root / "index.sqlite")}
+        )
+        index_env.start()
+        self.addCleanup(index_env.stop)
         self.claude_home = self.root / "claude-home"
         self.claude_home.mkdir()
 
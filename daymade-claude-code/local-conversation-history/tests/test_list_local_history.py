@@ -102,6 +102,7 @@ class LocalConversationHistoryTests(unittest.TestCase):
         self, *arguments: str, env: dict[str, str] | None = None
     ) -> subprocess.CompletedProcess[str]:
         process_env = os.environ.copy()
+        process_env["CONVERSATION_HISTORY_INDEX"] = str(self.root / "index.sqlite")
         if env:
             process_env.update(env)
         return subprocess.run(
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""Tests for the persistent session-metadata index in the bundled core.
+
+Every assertion compares an indexed scan with a cold scan of the same bytes:
+the index may only ever change how much is read, never what is reported.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from dataclasses import asdict
+from pathlib import Path
+from unittest import mock
+
+
+SKILL_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+from _core.claude import scan_claude_session  # noqa: E402
+from _core.codex import (  # noqa: E402
+    codex_meta_from_rollout,
+    codex_prompt_from_rollout,
+    codex_rollout_time_range,
+    scan_codex_rollout,
+)
+from _core.index import (  # noqa: E402
+    INDEX_ENV,
+    IncrementalScan,
+    SessionIndex,
+    default_index_path,
+    default_session_index,
+)
+from _core.kimi import scan_kimi_session  # noqa: E402
+
+
+def user_record(text: str, timestamp: str) -> dict[str, object]:
+    return {
+        "type": "user",
+        "sessionId": "session-1",
+        "cwd": "/work/demo",
+        "timestamp": timestamp,
+        "message": {"role": "user", "content": text},
+    }
+
+
+def append_lines(path: Path, records: list[dict[str, object]], tail: str = "") -> None:
+    with path.open("a", encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        handle.write(tail)
+
+
+class SessionIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.index = SessionIndex(self.root / "index.sqlite")
+        self.session = self.root / "session-1.jsonl"
+
+    def tearDown(self) -> None:
+        self.index.close()
+        self.temp_dir.cleanup()
+
+    def test_scan_missing_a_method_fails_on_construction(self) -> None:
+        class NoResult(IncrementalScan):
+            kind = "no-result"
+
+            def feed(self, record, consumed, lines) -> None:
+                pass
+
+            def snapshot(self):
+                return {}
+
+        with self.assertRaises(TypeError):
+            NoResult({})
+
+    def test_unchanged_file_is_served_from_the_index(self) -> None:
+        append_lines(self.session, [user_record("Fix the flaky build", "2026-01-01T00:00:00Z")])
+        first = scan_claude_session(self.session, index=self.index)
+        self.index.close()
+
+        reopened = SessionIndex(self.root / "index.sqlite")
+        with mock.patch("_core.index._run_scan", side_effect=AssertionError("re-read")):
+            second = scan_claude_session(self.session, index=reopened)
+        reopened.close()
+
+        self.assertEqual(first, second)
+        self.assertEqual(first, scan_claude_session(self.session))
+        self.assertEqual(reopened.hits, 1)
+
+    def test_appended_file_resumes_and_matches_a_cold_scan(self) -> None:
+        append_lines(self.session, [user_record("ok", "2026-01-01T00:00:00Z")])
+        scan_claude_session(self.session, index=self.index)
+        append_lines(
+            self.session,
+            [
+                user_record("Investigate the slow listing", "2026-01-02T00:00:00Z"),
+                user_record("later prompt", "2026-01-03T00:00:00Z"),
+            ],
+        )
+
+        resumed = scan_claude_session(self.session, index=self.index)
+
+        self.assertEqual(self.index.resumed, 1)
+        self.assertEqual(resumed, scan_claude_session(self.session))
+        self.assertEqual(resumed.title, "Investigate the slow listing")
+        self.assertEqual(resumed.timestamp_count, 3)
+
+    def test_partial_trailing_line_is_reread_once_complete(self) -> None:
+        complete = json.dumps(user_record("Second prompt here", "2026-01-02T00:00:00Z"))
+        append_lines(
+            self.session,
+            [user_record("First prompt here", "2026-01-01T00:00:00Z")],
+            tail=complete[:-1],
+        )
+        partial = scan_claude_session(self.session, index=self.index)
+        self.assertEqual(partial, scan_claude_session(self.session))
+
+        append_lines(self.session, [], tail=complete[-1] + "\n")
+        finished = scan_claude_session(self.session, index=self.index)
+
+        self.assertEqual(self.index.resumed, 1)
+        self.assertEqual(finished, scan_claude_session(self.session))
+        self.assertEqual(finished.timestamp_count, 2)
+
+    def test_rewritten_file_is_rescanned_from_scratch(self) -> None:
+        append_lines(self.session, [user_record("Original title", "2026-01-01T00:00:00Z")])
+        scan_claude_session(self.session, index=self.index)
+        self.session.write_text(
+            json.dumps(user_record("Replaced title!", "2026-02-01T00:00:00Z")) + "\n"
+            + json.dumps(user_record("more", "2026-02-02T00:00:00Z")) + "\n",
+            encoding="utf-8",
+        )
+
+        rescanned = scan_claude_session(self.session, index=self.index)
+
+        self.assertEqual(self.index.resumed, 0)
+        self.assertEqual(rescanned.title, "Replaced title!")
+        self.assertEqual(rescanned, scan_claude_session(self.session))
+
+    def test_codex_rollout_summary_matches_the_separate_helpers(self) -> None:
+        rollout = self.root / "rollout-2026-01-01T00-00-00-abc.jsonl"
+        append_lines(
+            rollout,
+            [
+                {
+                    "timestamp": "2026-01-01T00:00:00Z",
+                    "type": "session_meta",
+                    "payload": {"id": "thread-1", "cwd": "/work/demo", "source": "cli"},
+                },
+                {
+                    "timestamp": "2026-01-01T00:00:01Z",
+                    "type": "event_msg",
+                    "payload": {"type": "user_message", "message": "hi"},
+                },
+            ],
+        )
+        scan_codex_rollout(rollout, 120, index=self.index)
+        append_lines(
+            rollout,
+            [
+                {
+                    "timestamp": "2026-01-01T00:05:00Z",
+                    "type": "event_msg",
+                    "payload": {"type": "user_message", "message": "Refactor the parser"},
+                }
+            ],
+        )
+
+        summary = scan_codex_rollout(rollout, 120, index=self.index)
+        timestamps = codex_rollout_time_range(rollout)
+
+        self.assertEqual(self.index.resumed, 1)
+        self.assertEqual(summary.prompt, codex_prompt_from_rollout(rollout, 120))
+        self.assertEqual(summary.prompt, "Refactor the parser")
+        self.assertEqual(summary.meta["id"], codex_meta_from_rollout(rollout)["id"])
+        self.assertEqual(
+            (summary.created_at, summary.updated_at, summary.timestamp_count),
+            (timestamps.earliest, timestamps.latest, timestamps.count),
+        )
+
+    def test_kimi_summary_is_invalidated_by_any_component(self) -> None:
+        session_dir = self.root / "kimi" / "session_1"
+        wire = session_dir / "agents" / "main" / "wire.jsonl"
+        wire.parent.mkdir(parents=True)
+        append_lines(
+            wire,
+            [
+                {
+                    "type": "turn.prompt",
+                    "time": 1767225600000,
+                    "origin": {"kind": "user"},
+                    "input": "Summarize the release notes",
+                }
+            ],
+        )
+        (session_dir / "state.json").write_text(json.dumps({"id": "k-1"}), encoding="utf-8")
+        first = scan_kimi_session(session_dir, {"k-1": "/work/demo"}, index=self.index)
+        self.assertEqual(first.cwd, "/work/demo")
+        self.assertEqual(first, scan_kimi_session(session_dir, {"k-1": "/work/demo"}))
+
+        (session_dir / "state.json").write_text(
+            json.dumps({"id": "k-1", "title": "Renamed session"}), encoding="utf-8"
+        )
+        second = scan_kimi_session(session_dir, index=self.index)
+
+        self.assertEqual(second.title, "Renamed session")
+        self.assertEqual(asdict(second), asdict(scan_kimi_session(session_dir)))
+        self.assertEqual((self.index.hits, self.index.misses), (0, 2))
+
+    def test_unusable_index_falls_back_to_direct_scans(self) -> None:
+        append_lines(self.session, [user_record("Still works", "2026-01-01T00:00:00Z")])
+        blocker = self.root / "not-a-dir"
+        blocker.write_text("", encoding="utf-8")
+        broken = SessionIndex(blocker / "index.sqlite")
+
+        self.assertEqual(
+            scan_claude_session(self.session, index=broken),
+            scan_claude_session(self.session),
+        )
+
+    def test_environment_variable_disables_or_relocates_the_index(self) -> None:
+        with mock.patch.dict(os.environ, {INDEX_ENV: "off"}):
+            self.assertIsNone(default_index_path())
+            self.assertIsNone(default_session_index())
+        relocated = self.root / "elsewhere.sqlite"
+        with mock.patch.dict(os.environ, {INDEX_ENV: str(relocated)}):
+            self.assertEqual(default_index_path(), relocated)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,20 +14,25 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import html
 import json
 import logging
 import os
 import re
+import sqlite3
 import sys
+import threading
 import time
 import uuid
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +96,20 @@ _INDEX_CODES = frozenset(
 
 _MIN_NAME_LENGTH = 2
 
+# How long the on-disk akshare code→name table is trusted before a refetch.
+_NAME_CACHE_TTL = 24 * 3600.0
+
+# Characters of context segmented on each side of a name match with jieba.
+_BOUNDARY_CONTEXT = 8
+
+# Wall-clock budget for one source inside a concurrent fan-out. A source still
+# running when it expires is reported as ``timeout`` and its items are dropped.
+_SOURCE_DEADLINE = 20.0
+
+# Connections kept per host by the shared HTTP pool. Sized for every source
+# group running at once, not for hammering any single host.
+_POOL_MAXSIZE = 16
+
 _BULL_KEYWORDS: list[tuple[str, int]] = [
     ("涨停", 3),
     ("翻倍", 3),
@@ -157,6 +176,47 @@ _BEAR_KEYWORDS: list[tuple[str, int]] = [
 
 _NEGATION_PREFIXES = ["不", "未", "没有", "非", "否认", "难以"]
 
+# keyword -> (weight, is_bull), and one alternation tried longest-first so a
+# single scan yields the leftmost-longest, non-overlapping keyword matches.
+_SENTIMENT_WEIGHTS: dict[str, tuple[int, bool]] = {
+    **{kw: (weight, True) for kw, weight in _BULL_KEYWORDS},
+    **{kw: (weight, False) for kw, weight in _BEAR_KEYWORDS},
+}
+_SENTIMENT_KEYWORD_RE = re.compile(
+    "|".join(
+        re.escape(kw) for kw in sorted(_SENTIMENT_WEIGHTS, key=len, reverse=True)
+    )
+)
+_NEGATION_TRAILER_RE = re.compile(r"[\s，。！？、；：\"'（）\[\]]+$")
+
+_TOPIC_PHRASE_RE = re.compile(r"[一-鿿]{2,6}")
+_TOPIC_STOPWORDS = frozenset(
+    {
+        "大家",
+        "今天",
+        "明天",
+        "请问",
+        "怎么",
+        "什么",
+        "为什么",
+        "有没有",
+        "是不是",
+        "可以",
+        "已经",
+        "东方财富",
+        "股吧",
+        "网友",
+    }
+)
+_INSTITUTIONAL_MARKERS = ("机构", "研报", "评级", "目标价", "研究所", "券商", "分析师")
+
+# Guba politeness: long-run request rate and burst of the shared token bucket,
+# worker threads for fetch_batch, and how long per-symbol metrics are reused.
+_GUBA_RATE = 2.0
+_GUBA_BURST = 4
+_GUBA_WORKERS = 4
+_GUBA_CACHE_TTL = 60.0
+
 _POLICY_SOURCE_CONFIG: dict[str, Any] = {
     "sources": {
         "csrc": {
@@ -289,12 +349,37 @@ class InfoItem:
         }
 
 
+@dataclass
+class SourceTiming:
+    """Wall time and outcome of one source within a fetch run."""
+
+    source: str
+    group: str
+    elapsed_ms: int = 0
+    item_count: int = 0
+    status: str = "ok"  # ok / timeout / error
+    error: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "source": self.source,
+            "group": self.group,
+            "elapsed_ms": self.elapsed_ms,
+            "item_count": self.item_count,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
 # ---------------------------------------------------------------------------
 # HTTP helpers
 # ---------------------------------------------------------------------------
 
 
-def _create_session(timeout: tuple[float, float] = (5.0, 15.0)) -> requests.Session:
+def _create_session(
+    timeout: tuple[float, float] = (5.0, 15.0),
+    pool_maxsize: int = _POOL_MAXSIZE,
+) -> requests.Session:
     session = requests.Session()
     session.headers.update(
         {
@@ -318,7 +403,13 @@ def _create_session(timeout: tuple[float, float] = (5.0, 15.0)) -> requests.Sess
         allowed_methods=["HEAD", "GET", "OPTIONS"],
         raise_on_status=True,
     )
-    adapter = HTTPAdapter(max_retries=retries)
+    # One adapter serves every thread of a fan-out, so size its per-host pools
+    # for concurrent use instead of urllib3's default of 10 hosts x 10 sockets.
+    adapter = HTTPAdapter(
+        max_retries=retries,
+        pool_connections=pool_maxsize,
+        pool_maxsize=pool_maxsize,
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
 
@@ -334,6 +425,83 @@ def _create_session(timeout: tuple[float, float] = (5.0, 15.0)) -> requests.Sess
     return session
 
 
+class _HostThrottle:
+    """Minimum spacing between request starts to the same host.
+
+    Shared by every fetcher in a run so concurrent sources stay polite per host
+    while different hosts proceed in parallel. Slots are reserved under the
+    lock and slept outside it, so waiting on one host never blocks another.
+    """
+
+    def __init__(self, interval: float = 0.3) -> None:
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next_slot: dict[str, float] = {}
+
+    def wait(self, url: str, interval: float | None = None) -> None:
+        host = urlsplit(url).hostname or url
+        gap = self._interval if interval is None else interval
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + gap
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _fan_out(
+    group: str,
+    tasks: list[tuple[str, Callable[[], list[Any]]]],
+    deadline: float | None = _SOURCE_DEADLINE,
+) -> tuple[list[list[Any]], list[SourceTiming]]:
+    """Run each ``(source, fn)`` on its own thread and collect results in task order.
+
+    Every source starts at once, so each gets the full *deadline*; ``None``
+    waits for all of them. A source still running when it expires contributes
+    no items and is reported as ``timeout``. Its thread is abandoned, and the
+    session's HTTP timeouts bound how long it lingers. Exceptions become
+    ``error`` timings instead of aborting the other sources.
+    """
+    results: list[list[Any]] = [[] for _ in tasks]
+    timings: list[SourceTiming] = []
+    if not tasks:
+        return results, timings
+
+    def _timed(fn: Callable[[], list[Any]]) -> tuple[list[Any], float]:
+        start = time.monotonic()
+        items = fn()
+        return items, time.monotonic() - start
+
+    executor = ThreadPoolExecutor(
+        max_workers=len(tasks), thread_name_prefix=f"fetch-{group}"
+    )
+    try:
+        futures = [executor.submit(_timed, fn) for _, fn in tasks]
+        done, _pending = wait(futures, timeout=deadline)
+        for index, ((source, _fn), future) in enumerate(zip(tasks, futures)):
+            timing = SourceTiming(source=source, group=group)
+            if future not in done:
+                timing.status = "timeout"
+                timing.elapsed_ms = int((deadline or 0) * 1000)
+                logger.warning(
+                    "%s source '%s' missed its %.1fs deadline", group, source, deadline
+                )
+            elif future.exception() is not None:
+                exc = future.exception()
+                timing.status = "error"
+                timing.error = type(exc).__name__
+                logger.warning("%s source '%s' failed: %s", group, source, timing.error)
+            else:
+                items, elapsed = future.result()
+                results[index] = items
+                timing.elapsed_ms = int(elapsed * 1000)
+                timing.item_count = len(items)
+            timings.append(timing)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return results, timings
+
+
 def _parse_datetime(value: Any) -> datetime | None:
     """Parse a timestamp from various upstream formats.
 
@@ -389,14 +557,26 @@ def _parse_datetime(value: Any) -> datetime | None:
 class SymbolExtractor:
     """Extract A-share stock codes from text.
 
-    Uses regex by default. If ``akshare`` is available and a local cache of
-    code→name mappings exists, it also tries name-based matching.
+    Uses regex by default. If ``akshare`` is available (or a fresh on-disk copy
+    of its code→name table exists), it also matches company names. All names
+    are compiled into one Aho-Corasick automaton, so each text is scanned once
+    instead of once per name and every occurrence is reported, overlapping
+    ones included. With ``jieba`` installed, a name only counts when both of
+    its ends fall on word boundaries, which keeps short names from matching
+    inside longer words.
     """
 
-    def __init__(self, extra_names: dict[str, str] | None = None) -> None:
+    def __init__(
+        self,
+        extra_names: dict[str, str] | None = None,
+        cache_path: Path | None = None,
+        cache_ttl: float = _NAME_CACHE_TTL,
+    ) -> None:
         self._extra_names = extra_names or {}
-        self._all_names: dict[str, str] | None = None
+        self._cache_path = cache_path or _name_cache_path()
+        self._cache_ttl = cache_ttl
         self._name_to_codes: dict[str, list[str]] | None = None
+        self._name_automaton: _NameAutomaton | None = None
 
     def extract(self, text: str) -> list[str]:
         codes: set[str] = set()
@@ -407,15 +587,13 @@ class SymbolExtractor:
                 codes.add(code)
 
         name_map = self._get_name_to_codes()
-        if _HAS_JIEBA:
-            tokens = set(_jieba_tokenize(text))
-            for name, code_list in name_map.items():
-                if name in tokens:
-                    codes.update(code_list)
-        else:
-            for name, code_list in name_map.items():
-                if name in text:
-                    codes.update(code_list)
+        if self._name_automaton is not None:
+            for start, end, name in self._name_automaton.finditer(text):
+                if codes.issuperset(name_map[name]):
+                    continue
+                if _HAS_JIEBA and not _on_word_boundaries(text, start, end):
+                    continue
+                codes.update(name_map[name])
 
         return sorted(codes)
 
@@ -431,9 +609,27 @@ class SymbolExtractor:
             name_to_codes.setdefault(name, []).append(code)
 
         self._name_to_codes = name_to_codes
+        if name_to_codes:
+            self._name_automaton = _compile_names(tuple(sorted(name_to_codes)))
         return name_to_codes
 
     def _load_names(self) -> dict[str, str]:
+        cached, fresh = self._read_name_cache()
+        names: dict[str, str] = dict(cached) if fresh else {}
+        if not fresh:
+            fetched = self._fetch_names()
+            if fetched:
+                self._write_name_cache(fetched)
+                names = fetched
+            elif cached:
+                logger.debug("akshare unavailable; using stale name cache %s", self._cache_path)
+                names = dict(cached)
+        # User-provided aliases always override fetched names so tests and custom
+        # mappings remain stable regardless of corporate-action renamings.
+        names.update(self._extra_names)
+        return names
+
+    def _fetch_names(self) -> dict[str, str]:
         names: dict[str, str] = {}
         try:
             import akshare as ak
@@ -443,18 +639,123 @@ class SymbolExtractor:
                 # akshare column names vary between releases and locales.
                 code_col = _find_column(df.columns, "code")
                 name_col = _find_column(df.columns, "name")
-                for _, row in df.iterrows():
-                    code = str(row.get(code_col, ""))
-                    name = str(row.get(name_col, ""))
+                # Whole columns at once: iterrows() builds a Series per row.
+                for code, name in zip(df[code_col], df[name_col]):
+                    code, name = str(code), str(name)
                     if code and name and len(name) >= _MIN_NAME_LENGTH:
                         names[code] = name
         except Exception:
             logger.debug("akshare not available or failed; using regex-only extraction")
-        # User-provided aliases always override fetched names so tests and custom
-        # mappings remain stable regardless of corporate-action renamings.
-        names.update(self._extra_names)
         return names
 
+    def _read_name_cache(self) -> tuple[dict[str, str], bool]:
+        """Return ``(names, is_fresh)`` from the on-disk cache, or ``({}, False)``."""
+        try:
+            payload = json.loads(self._cache_path.read_text(encoding="utf-8"))
+            names = payload["names"]
+            age = time.time() - float(payload["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}, False
+        if not isinstance(names, dict):
+            return {}, False
+        return names, 0 <= age < self._cache_ttl
+
+    def _write_name_cache(self, names: dict[str, str]) -> None:
+        payload = {"fetched_at": time.time(), "names": names}
+        tmp = self._cache_path.with_name(f"{self._cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self._cache_path)
+        except OSError as exc:
+            logger.debug("Could not write name cache %s: %s", self._cache_path, exc)
+            tmp.unlink(missing_ok=True)
+
+
+def _cache_dir() -> Path:
+    """Directory for the name cache and watch store (``ASHARE_NEWS_CACHE_DIR`` overrides)."""
+    override = os.environ.get("ASHARE_NEWS_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ashare-news-fetcher"
+
+
+def _name_cache_path() -> Path:
+    return _cache_dir() / "stock_names.json"
+
+
+class _NameAutomaton:
+    """Aho-Corasick automaton that finds every occurrence of a set of names.
+
+    Each text character costs one transition plus the names ending there, so
+    a scan is linear in the text no matter how many names are loaded. Nested
+    and overlapping names are all reported: ``中国平安银行`` yields both
+    ``中国平安`` and ``平安银行``, and a longer name never hides a shorter one
+    that starts or ends at the same position.
+    """
+
+    def __init__(self, names: tuple[str, ...]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[tuple[str, ...]] = [()]
+        for name in names:
+            state = 0
+            for char in name:
+                if char not in goto[state]:
+                    goto[state][char] = len(goto)
+                    goto.append({})
+                    outputs.append(())
+                state = goto[state][char]
+            outputs[state] = (name,)
+
+        # Breadth-first, so every failure target is final before it is used.
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for char, child in goto[state].items():
+                target = fail[state]
+                while target and char not in goto[target]:
+                    target = fail[target]
+                fail[child] = goto[target].get(char, 0)
+                outputs[child] += outputs[fail[child]]
+                queue.append(child)
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def finditer(self, text: str) -> Iterator[tuple[int, int, str]]:
+        """Yield ``(start, end, name)`` for every name occurring in *text*."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for name in outputs[state]:
+                yield end - len(name), end, name
+
+
+@functools.lru_cache(maxsize=4)
+def _compile_names(names: tuple[str, ...]) -> _NameAutomaton:
+    """Build (and memoise) the automaton for one name table."""
+    return _NameAutomaton(names)
+
+
+def _on_word_boundaries(text: str, start: int, end: int) -> bool:
+    """Whether jieba segments ``text[start:end]`` as whole words.
+
+    Only a window of ``_BOUNDARY_CONTEXT`` characters around the match is
+    segmented, which keeps the check cheap for long texts with many names.
+    """
+    lo = max(0, start - _BOUNDARY_CONTEXT)
+    hi = min(len(text), end + _BOUNDARY_CONTEXT)
+    boundaries = {lo, hi}
+    for _word, word_start, word_end in jieba.tokenize(text[lo:hi]):
+        boundaries.add(lo + word_start)
+        boundaries.add(lo + word_end)
+    return start in boundaries and end in boundaries
+
 
 def _find_column(columns: Any, field: str) -> str:
     """Return the best matching English or Chinese column name."""
@@ -469,16 +770,6 @@ def _find_column(columns: Any, field: str) -> str:
     return field
 
 
-def _jieba_tokenize(text: str) -> list[str]:
-    """Segment Chinese text for whole-name matching."""
-    tokens: list[str] = []
-    for token in jieba.lcut(text):
-        token = token.strip()
-        if len(token) >= _MIN_NAME_LENGTH:
-            tokens.append(token)
-    return tokens
-
-
 # ---------------------------------------------------------------------------
 # Chinese financial news (CLS / WSCN / Jin10 / Sina / EastMoney)
 # ---------------------------------------------------------------------------
@@ -496,26 +787,41 @@ class CnNewsItem:
 
 
 class CnNewsFetcher:
-    """Direct fetcher for Chinese financial telegraph/news APIs."""
+    """Direct fetcher for Chinese financial telegraph/news APIs.
 
-    def __init__(self) -> None:
-        self._session = _create_session()
-        self._last_request_ts = 0.0
+    Pass *session* and *throttle* to share one connection pool and one set of
+    per-host intervals with other fetchers; *deadline* bounds each source in
+    :meth:`fetch_all`.
+    """
 
-    def _polite_sleep(self, interval: float = 0.3) -> None:
-        elapsed = time.monotonic() - self._last_request_ts
-        if elapsed < interval:
-            time.sleep(interval - elapsed)
-        self._last_request_ts = time.monotonic()
+    CLS_URL = "https://www.cls.cn/api/cache"
+    WSCN_URL = "https://api-one.wallstcn.com/apiv1/content/lives"
+    JIN10_URL = "https://flash-api.jin10.com/get_flash_list"
+    SINA_URL = "https://zhibo.sina.com.cn/api/zhibo/feed"
+    EASTMONEY_URL = "https://np-listapi.eastmoney.com/comm/web/getNewsByColumns"
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        throttle: _HostThrottle | None = None,
+        deadline: float = _SOURCE_DEADLINE,
+    ) -> None:
+        self._session = session if session is not None else _create_session()
+        self._throttle = throttle if throttle is not None else _HostThrottle()
+        self._deadline = deadline
+        self.timings: list[SourceTiming] = []
+
+    def _polite_sleep(self, url: str, interval: float = 0.3) -> None:
+        self._throttle.wait(url, interval)
 
     def fetch_cls(self, limit: int = 30) -> list[CnNewsItem]:
-        self._polite_sleep()
+        self._polite_sleep(self.CLS_URL)
         try:
             # The legacy v3 depth endpoint now requires a signature and returns a
             # loading placeholder. The public cache endpoint is signature-free and
             # still exposes the telegraph roll_data list.
             resp = self._session.get(
-                "https://www.cls.cn/api/cache",
+                self.CLS_URL,
                 params={
                     "app": "CailianpressWeb",
                     "name": "telegraph",
@@ -591,10 +897,10 @@ class CnNewsFetcher:
             return []
 
     def fetch_wallstreetcn(self, limit: int = 30) -> list[CnNewsItem]:
-        self._polite_sleep()
+        self._polite_sleep(self.WSCN_URL)
         try:
             resp = self._session.get(
-                "https://api-one.wallstcn.com/apiv1/content/lives",
+                self.WSCN_URL,
                 params={"channel": "global-channel", "limit": str(limit)},
                 headers={
                     "Referer": "https://wallstreetcn.com/",
@@ -633,14 +939,14 @@ class CnNewsFetcher:
             return []
 
     def fetch_jin10(self, limit: int = 30) -> list[CnNewsItem]:
-        self._polite_sleep()
+        self._polite_sleep(self.JIN10_URL)
         app_id = os.environ.get("JIN10_APP_ID")
         if not app_id:
             logger.warning("JIN10_APP_ID not set; skipping Jin10 source")
             return []
         try:
             resp = self._session.get(
-                "https://flash-api.jin10.com/get_flash_list",
+                self.JIN10_URL,
                 params={"max_time": "", "channel": "-8200"},
                 headers={
                     "Referer": "https://www.jin10.com/",
@@ -680,10 +986,10 @@ class CnNewsFetcher:
             return []
 
     def fetch_sina_7x24(self, limit: int = 30) -> list[CnNewsItem]:
-        self._polite_sleep()
+        self._polite_sleep(self.SINA_URL)
         try:
             resp = self._session.get(
-                "https://zhibo.sina.com.cn/api/zhibo/feed",
+                self.SINA_URL,
                 params={
                     "page": "1",
                     "page_size": str(limit),
@@ -728,9 +1034,8 @@ class CnNewsFetcher:
             return []
 
     def fetch_eastmoney_kuaixun(self, limit: int = 30) -> list[CnNewsItem]:
-        self._polite_sleep()
+        self._polite_sleep(self.EASTMONEY_URL)
         try:
-            url = "https://np-listapi.eastmoney.com/comm/web/getNewsByColumns"
             params = {
                 "client": "web",
                 "biz": "web_home_channel",
@@ -742,7 +1047,7 @@ class CnNewsFetcher:
                 # EastMoney now requires a trace id; any UUID works.
                 "req_trace": str(uuid.uuid4()),
             }
-            resp = self._session.get(url, params=params)
+            resp = self._session.get(self.EASTMONEY_URL, params=params)
             resp.raise_for_status()
             data = _safe_json(resp, ("data",))
             if data is None:
@@ -782,24 +1087,28 @@ class CnNewsFetcher:
             return []
 
     def fetch_all(self, limit: int = 50) -> list[CnNewsItem]:
-        """Fetch from all CN sources and return merged results up to *limit*.
+        """Fetch from all CN sources concurrently and return merged results up to *limit*.
 
-        The *limit* is applied to the merged result set, not per source.
+        The *limit* is applied to the merged result set, not per source. Per-source
+        outcomes and wall times are left in :attr:`timings`.
         """
         sources = [
-            self.fetch_eastmoney_kuaixun,
-            self.fetch_sina_7x24,
-            self.fetch_wallstreetcn,
-            self.fetch_jin10,
-            self.fetch_cls,
+            ("eastmoney", self.fetch_eastmoney_kuaixun),
+            ("sina", self.fetch_sina_7x24),
+            ("wallstreetcn", self.fetch_wallstreetcn),
+            ("jin10", self.fetch_jin10),
+            ("cls", self.fetch_cls),
         ]
         per_source_cap = limit // len(sources) + 1
-        all_items: list[CnNewsItem] = []
-        for fetcher in sources:
-            try:
-                all_items.extend(fetcher(per_source_cap))
-            except Exception:
-                continue
+        results, self.timings = _fan_out(
+            "cn",
+            [
+                (name, lambda fetch=fetch: fetch(per_source_cap))
+                for name, fetch in sources
+            ],
+            self._deadline,
+        )
+        all_items: list[CnNewsItem] = [it for items in results for it in items]
         all_items.sort(key=lambda x: x.publish_time, reverse=True)
         return all_items[:limit]
 
@@ -823,14 +1132,24 @@ class PolicyItem:
 class PolicyNewsFetcher:
     """Fetch policy/regulatory news from official Chinese sources."""
 
-    def __init__(self, config: dict[str, Any] | None = None) -> None:
+    def __init__(
+        self,
+        config: dict[str, Any] | None = None,
+        session: requests.Session | None = None,
+        throttle: _HostThrottle | None = None,
+        deadline: float = _SOURCE_DEADLINE,
+    ) -> None:
         self._config = config or _POLICY_SOURCE_CONFIG
         self._sources = self._config.get("sources", {})
         self._high_impact_keywords = self._config.get("high_impact_keywords", {})
-        self._session = _create_session()
+        self._session = session if session is not None else _create_session()
+        self._throttle = throttle if throttle is not None else _HostThrottle()
+        self._deadline = deadline
+        self.timings: list[SourceTiming] = []
 
     def fetch_all(self) -> list[PolicyItem]:
-        all_items: list[PolicyItem] = []
+        """Fetch every enabled source concurrently; timings land in :attr:`timings`."""
+        tasks: list[tuple[str, Callable[[], list[Any]]]] = []
         for source_id, source_cfg in self._sources.items():
             if not source_cfg.get("enabled", True):
                 continue
@@ -841,16 +1160,29 @@ class PolicyNewsFetcher:
                     source_id,
                 )
                 continue
-            try:
-                items = self._fetch_source(source_id, source_cfg)
-                for item in items:
-                    item.is_high_impact = self._check_high_impact(item)
-                all_items.extend(items)
-            except Exception as exc:
-                logger.warning("Policy source '%s' failed: %s", source_id, type(exc).__name__)
+            tasks.append(
+                (
+                    source_id,
+                    lambda sid=source_id, cfg=source_cfg: self._fetch_scored(sid, cfg),
+                )
+            )
+        results, self.timings = _fan_out("policy", tasks, self._deadline)
+        all_items: list[PolicyItem] = [it for items in results for it in items]
         all_items.sort(key=lambda x: x.date, reverse=True)
         return all_items
 
+    def _fetch_scored(
+        self, source_id: str, source_cfg: dict[str, Any]
+    ) -> list[PolicyItem]:
+        try:
+            items = self._fetch_source(source_id, source_cfg)
+        except Exception as exc:
+            logger.warning("Policy source '%s' failed: %s", source_id, type(exc).__name__)
+            return []
+        for item in items:
+            item.is_high_impact = self._check_high_impact(item)
+        return items
+
     def _fetch_source(
         self, source_id: str, source_cfg: dict[str, Any]
     ) -> list[PolicyItem]:
@@ -867,6 +1199,7 @@ class PolicyNewsFetcher:
             )
             return []
 
+        self._throttle.wait(url)
         resp = self._session.get(url)
         resp.raise_for_status()
         resp.encoding = resp.apparent_encoding or "utf-8"
@@ -910,6 +1243,7 @@ class PolicyNewsFetcher:
         self, source_id: str, source_cfg: dict[str, Any]
     ) -> list[PolicyItem]:
         url = source_cfg["url"]
+        self._throttle.wait(url)
         resp = self._session.get(url)
         resp.raise_for_status()
         data = _safe_json(resp)
@@ -999,21 +1333,35 @@ class GubaMetrics:
 
 
 class GubaFetcher:
-    """Fetch retail sentiment from EastMoney Guba (股吧)."""
+    """Fetch retail sentiment from EastMoney Guba (股吧).
+
+    *deadline* bounds each :meth:`fetch_batch` call as a whole.
+    """
 
     API_URL = "https://gbapi.eastmoney.com/stkpost/api/v1/post/listbystock"
     BASE_URL = "https://guba.eastmoney.com"
 
-    def __init__(self, timeout: float = 10.0) -> None:
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        session: requests.Session | None = None,
+        rate: float = _GUBA_RATE,
+        max_workers: int = _GUBA_WORKERS,
+        cache_ttl: float = _GUBA_CACHE_TTL,
+        deadline: float | None = _SOURCE_DEADLINE,
+    ) -> None:
         self._timeout = timeout
-        self._session = _create_session()
-        self._last_request_ts = 0.0
-
-    def _rate_limit(self, interval: float = 0.5) -> None:
-        elapsed = time.monotonic() - self._last_request_ts
-        if elapsed < interval:
-            time.sleep(interval - elapsed)
-        self._last_request_ts = time.monotonic()
+        self._deadline = deadline
+        self._session = session if session is not None else _create_session()
+        self._bucket = _TokenBucket(rate, _GUBA_BURST)
+        self._max_workers = max(1, max_workers)
+        self._cache_ttl = cache_ttl
+        self._cache: dict[str, tuple[float, GubaMetrics]] = {}
+        self._cache_lock = threading.Lock()
+        self.timings: list[SourceTiming] = []
+
+    def _rate_limit(self) -> None:
+        self._bucket.acquire()
 
     def _convert_symbol(self, symbol: str) -> str:
         symbol = symbol.strip()
@@ -1024,23 +1372,96 @@ class GubaFetcher:
 
     def fetch(self, symbol: str) -> GubaMetrics | None:
         symbol_code = self._convert_symbol(symbol)
+        with self._cache_lock:
+            cached = self._cache.get(symbol_code)
+        if cached is not None and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
         try:
             posts = self._fetch_posts(symbol_code)
         except Exception as exc:
             logger.warning("Guba fetch failed for %s: %s", symbol_code, type(exc).__name__)
             return None
 
+        metrics = self._summarize(symbol_code, posts)
+        with self._cache_lock:
+            self._cache[symbol_code] = (time.monotonic(), metrics)
+        return metrics
+
+    def fetch_batch(self, symbols: list[str]) -> list[GubaMetrics]:
+        """Fetch every symbol on a bounded worker pool, returning results in input order.
+
+        All workers draw from one token bucket, so the request rate to Guba
+        stays at ``rate`` however many symbols are in flight. Repeated
+        symbols are fetched once.
+
+        The whole batch shares one *deadline*, including time spent queued
+        behind the token bucket. A symbol still pending when it expires is
+        reported as ``timeout`` and left out, like a slow ``cn`` source.
+        """
+        codes = [self._convert_symbol(symbol) for symbol in symbols]
+        unique = list(dict.fromkeys(codes))
+
+        def _timed(code: str) -> tuple[GubaMetrics | None, float]:
+            start = time.monotonic()
+            metrics = self.fetch(code)
+            return metrics, time.monotonic() - start
+
+        workers = min(self._max_workers, len(unique)) or 1
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch-guba")
+        try:
+            futures = {code: pool.submit(_timed, code) for code in unique}
+            done, _pending = wait(futures.values(), timeout=self._deadline)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        results: list[GubaMetrics] = []
+        self.timings = []
+        for code in codes:
+            future = futures[code]
+            timing = SourceTiming(source=code, group="guba")
+            if future not in done:
+                timing.status = "timeout"
+                timing.elapsed_ms = int((self._deadline or 0) * 1000)
+                logger.warning(
+                    "guba symbol '%s' missed its %.1fs deadline", code, self._deadline
+                )
+                self.timings.append(timing)
+                continue
+            metrics, elapsed = future.result()
+            timing.elapsed_ms = int(elapsed * 1000)
+            if metrics is None:
+                timing.status = "error"
+            else:
+                timing.item_count = 1
+                results.append(metrics)
+            self.timings.append(timing)
+        return results
+
+    def _summarize(self, symbol_code: str, posts: list[dict[str, Any]]) -> GubaMetrics:
+        """Derive every metric from one pass over *posts*."""
         if not posts:
             return GubaMetrics(symbol=symbol_code)
 
-        total_reads = sum(int(p.get("read_count", 0) or 0) for p in posts)
-        total_comments = sum(int(p.get("comment_count", 0) or 0) for p in posts)
-        post_count = len(posts)
-
-        sentiment, score = self._extract_sentiment(posts)
-        topics = self._extract_topics(posts)
-        inst_count = self._count_institutional(posts)
+        total_reads = 0
+        total_comments = 0
+        bull_score = 0
+        bear_score = 0
+        phrase_counts: dict[str, int] = {}
+        inst_count = 0
+        for post in posts:
+            total_reads += int(post.get("read_count", 0) or 0)
+            total_comments += int(post.get("comment_count", 0) or 0)
+            title = _post_title(post)
+            bull_delta, bear_delta = self._score_text(_post_text(post, title))
+            bull_score += bull_delta
+            bear_score += bear_delta
+            _count_topic_phrases(title, phrase_counts)
+            if _is_institutional_post(post, title):
+                inst_count += 1
 
+        post_count = len(posts)
+        sentiment, score = _sentiment_label(bull_score, bear_score)
         return GubaMetrics(
             symbol=symbol_code,
             post_count_24h=post_count,
@@ -1048,18 +1469,10 @@ class GubaFetcher:
             comment_count_avg=round(total_comments / post_count, 1),
             sentiment=sentiment,
             sentiment_score=score,
-            hot_topics=topics,
+            hot_topics=_top_phrases(phrase_counts),
             institutional_post_count=inst_count,
         )
 
-    def fetch_batch(self, symbols: list[str]) -> list[GubaMetrics]:
-        results: list[GubaMetrics] = []
-        for symbol in symbols:
-            metrics = self.fetch(symbol)
-            if metrics is not None:
-                results.append(metrics)
-        return results
-
     def _fetch_posts(self, symbol_code: str) -> list[dict[str, Any]]:
         def _do_fetch() -> list[dict[str, Any]]:
             self._rate_limit()
@@ -1159,123 +1572,99 @@ class GubaFetcher:
             )
         return posts
 
-    def _extract_sentiment(self, posts: list[dict[str, Any]]) -> tuple[str, float]:
-        bull_score = 0
-        bear_score = 0
-        for post in posts:
-            text = post.get("title", "") or post.get("post_title", "") or ""
-            content = post.get("post_content", "") or post.get("content", "") or ""
-            text = _strip_html(f"{text} {content}")
-            b_delta, br_delta = self._score_text(text)
-            bull_score += b_delta
-            bear_score += br_delta
-
-        total = bull_score + bear_score
-        if total == 0:
-            return "neutral", 0.0
-        raw_score = max(-1.0, min(1.0, (bull_score - bear_score) / total))
-        if raw_score > 0.15:
-            return "bullish", round(raw_score, 3)
-        if raw_score < -0.15:
-            return "bearish", round(raw_score, 3)
-        return "neutral", round(raw_score, 3)
-
     def _score_text(self, text: str) -> tuple[int, int]:
         """Score all keyword occurrences, preferring longer matches and flipping on negation.
 
         A naïve scan would double-count overlapping keywords such as ``跌`` inside
-        ``跌停`` or ``利好`` inside ``重大利好``. We collect all candidate matches,
-        sort by length descending, and mark matched character ranges so only the
-        longest non-overlapping keyword counts at each position.
+        ``跌停`` or ``利好`` inside ``重大利好``. ``_SENTIMENT_KEYWORD_RE`` tries
+        keywords longest-first and never overlaps its own matches, so only the
+        longest keyword at the leftmost position counts.
         """
-        keywords = [
-            (kw, weight, True) for kw, weight in _BULL_KEYWORDS
-        ] + [(kw, weight, False) for kw, weight in _BEAR_KEYWORDS]
-        # Longest-first avoids sub-keyword double counting.
-        keywords.sort(key=lambda x: len(x[0]), reverse=True)
-
-        matches: list[tuple[int, int, str, int, bool]] = []
-        for kw, weight, is_bull in keywords:
-            start = 0
-            while True:
-                idx = text.find(kw, start)
-                if idx < 0:
-                    break
-                matches.append((idx, idx + len(kw), kw, weight, is_bull))
-                start = idx + len(kw)
-
-        # Process left-to-right so the first/longest match wins at overlaps.
-        matches.sort(key=lambda x: (x[0], -(x[1] - x[0])))
-        covered = [False] * len(text)
         bull_delta = 0
         bear_delta = 0
-        for start, end, _kw, weight, is_bull in matches:
-            if any(covered[start:end]):
-                continue
-            for i in range(start, end):
-                covered[i] = True
+        for match in _SENTIMENT_KEYWORD_RE.finditer(text):
+            weight, is_bull = _SENTIMENT_WEIGHTS[match.group()]
+            start = match.start()
             prefix = text[max(0, start - 6) : start]
             # Strip trailing whitespace/punctuation so "不 涨停" and "不，涨停"
             # are treated the same as "不涨停".
-            prefix = re.sub(r"[\s，。！？、；：\"'（）\[\]]+$", "", prefix)
+            prefix = _NEGATION_TRAILER_RE.sub("", prefix)
             negated = any(prefix.endswith(neg) for neg in _NEGATION_PREFIXES)
-            if is_bull:
-                if negated:
-                    bear_delta += weight
-                else:
-                    bull_delta += weight
+            if is_bull != negated:
+                bull_delta += weight
             else:
-                if negated:
-                    bull_delta += weight
-                else:
-                    bear_delta += weight
+                bear_delta += weight
         return bull_delta, bear_delta
 
-    def _extract_topics(self, posts: list[dict[str, Any]]) -> list[str]:
-        titles: list[str] = []
-        for post in posts:
-            title = post.get("title", "") or post.get("post_title", "") or ""
-            title = _strip_html(title).strip()
-            if title and len(title) >= 4:
-                titles.append(title)
-        if not titles:
-            return []
-        phrase_counts: dict[str, int] = {}
-        for title in titles:
-            for phrase in re.findall(r"[一-鿿]{2,6}", title):
-                if phrase in (
-                    "大家",
-                    "今天",
-                    "明天",
-                    "请问",
-                    "怎么",
-                    "什么",
-                    "为什么",
-                    "有没有",
-                    "是不是",
-                    "可以",
-                    "已经",
-                    "东方财富",
-                    "股吧",
-                    "网友",
-                ):
-                    continue
-                phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
-        sorted_phrases = sorted(phrase_counts.items(), key=lambda x: x[1], reverse=True)
-        return [phrase for phrase, _ in sorted_phrases[:3]]
 
-    def _count_institutional(self, posts: list[dict[str, Any]]) -> int:
-        count = 0
-        markers = ["机构", "研报", "评级", "目标价", "研究所", "券商", "分析师"]
-        for post in posts:
-            user_type = post.get("user_type", "") or post.get("source_type", "")
-            if "机构" in str(user_type) or "研报" in str(user_type):
-                count += 1
-                continue
-            title = post.get("title", "") or post.get("post_title", "") or ""
-            if any(marker in title for marker in markers):
-                count += 1
-        return count
+class _TokenBucket:
+    """Thread-safe token bucket: *rate* tokens per second, at most *capacity* banked.
+
+    A caller reserves its token under the lock (the balance may go negative)
+    and sleeps outside it, so waiters are served in arrival order without
+    holding the lock while asleep.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _post_title(post: dict[str, Any]) -> str:
+    return post.get("title", "") or post.get("post_title", "") or ""
+
+
+def _post_text(post: dict[str, Any], title: str) -> str:
+    content = post.get("post_content", "") or post.get("content", "") or ""
+    return _strip_html(f"{title} {content}")
+
+
+def _count_topic_phrases(title: str, phrase_counts: dict[str, int]) -> None:
+    title = _strip_html(title).strip()
+    if len(title) < 4:
+        return
+    for phrase in _TOPIC_PHRASE_RE.findall(title):
+        if phrase not in _TOPIC_STOPWORDS:
+            phrase_counts[phrase] = phrase_counts.get(phrase, 0) + 1
+
+
+def _top_phrases(phrase_counts: dict[str, int]) -> list[str]:
+    sorted_phrases = sorted(phrase_counts.items(), key=lambda x: x[1], reverse=True)
+    return [phrase for phrase, _ in sorted_phrases[:3]]
+
+
+def _is_institutional_post(post: dict[str, Any], title: str) -> bool:
+    user_type = str(post.get("user_type", "") or post.get("source_type", ""))
+    if "机构" in user_type or "研报" in user_type:
+        return True
+    return any(marker in title for marker in _INSTITUTIONAL_MARKERS)
+
+
+def _sentiment_label(bull_score: int, bear_score: int) -> tuple[str, float]:
+    total = bull_score + bear_score
+    if total == 0:
+        return "neutral", 0.0
+    raw_score = max(-1.0, min(1.0, (bull_score - bear_score) / total))
+    if raw_score > 0.15:
+        return "bullish", round(raw_score, 3)
+    if raw_score < -0.15:
+        return "bearish", round(raw_score, 3)
+    return "neutral", round(raw_score, 3)
 
 
 # ---------------------------------------------------------------------------
@@ -1425,63 +1814,324 @@ def _to_markdown(items: list[InfoItem]) -> str:
     return "\n".join(lines)
 
 
+def _timings_to_markdown(timings: list[SourceTiming]) -> str:
+    lines = [
+        "## 来源耗时\n",
+        "| 来源组 | 来源 | 耗时 (ms) | 条数 | 状态 |",
+        "|---|---|---|---|---|",
+    ]
+    for t in timings:
+        status = f"{t.status} ({t.error})" if t.error else t.status
+        lines.append(
+            f"| {t.group} | {t.source} | {t.elapsed_ms} | {t.item_count} | {status} |"
+        )
+    return "\n".join(lines)
+
+
 # ---------------------------------------------------------------------------
 # Main fetch dispatcher
 # ---------------------------------------------------------------------------
 
 
+@dataclass
+class _SourceGroup:
+    name: str
+    fetcher: CnNewsFetcher | PolicyNewsFetcher | GubaFetcher
+    fetch: Callable[[], list[Any]]
+
+
+_GROUP_CONVERTERS: dict[str, Callable[[Any, SymbolExtractor], InfoItem]] = {
+    "cn": _cn_item_to_info,
+    "policy": _policy_item_to_info,
+    "guba": _guba_to_info,
+}
+
+
+def _source_groups(
+    sources: list[str],
+    symbols: list[str] | None,
+    limit: int,
+    deadline: float,
+    session: requests.Session,
+    throttle: _HostThrottle,
+    guba_rate: float = _GUBA_RATE,
+) -> list[_SourceGroup]:
+    """Build one fetcher per selected group, all sharing *session* and *throttle*."""
+    groups: list[_SourceGroup] = []
+
+    if "cn" in sources:
+        fetcher = CnNewsFetcher(session=session, throttle=throttle, deadline=deadline)
+        groups.append(_SourceGroup("cn", fetcher, lambda: fetcher.fetch_all(limit)))
+
+    if "policy" in sources:
+        policy_fetcher = PolicyNewsFetcher(
+            session=session, throttle=throttle, deadline=deadline
+        )
+        groups.append(
+            _SourceGroup(
+                "policy", policy_fetcher, lambda: policy_fetcher.fetch_all()[:limit]
+            )
+        )
+
+    if "guba" in sources:
+        if not symbols:
+            logger.warning("guba source selected but no --symbols provided; skipped")
+        else:
+            guba = GubaFetcher(session=session, rate=guba_rate, deadline=deadline)
+            groups.append(_SourceGroup("guba", guba, lambda: guba.fetch_batch(symbols)))
+
+    return groups
+
+
+def _matches_keywords(item: InfoItem, keyword_list: list[str]) -> bool:
+    """Case-insensitive keyword test; *keyword_list* must already be lowercase."""
+    text = f"{item.title} {item.summary} {' '.join(item.tags)}".lower()
+    return any(kw in text for kw in keyword_list)
+
+
 def fetch_intel(
     sources: list[str],
     symbols: list[str] | None = None,
     keywords: list[str] | None = None,
     limit: int = 30,
+    deadline: float = _SOURCE_DEADLINE,
+    timings: list[SourceTiming] | None = None,
+    guba_rate: float = _GUBA_RATE,
 ) -> list[InfoItem]:
     """Fetch A-share intelligence from selected sources.
 
+    Source groups run concurrently over one shared HTTP pool and per-host
+    throttle; within ``cn`` and ``policy`` every source runs concurrently too.
+
     Args:
         sources: List of source groups. Supported: ``cn``, ``policy``, ``guba``.
         symbols: Stock codes for ``guba`` source.
         keywords: Optional keywords to filter items by title/summary.
         limit: Max items applied to the merged result set, not per source.
+        deadline: Seconds each ``cn``/``policy`` source, and the ``guba``
+            batch as a whole, may take before the unfinished ones are dropped
+            from the report as ``timeout``.
+        timings: If given, one :class:`SourceTiming` per source is appended.
+        guba_rate: Requests per second shared by all ``guba`` workers.
 
     Returns:
         List of InfoItem, sorted by published time descending.
     """
     extractor = SymbolExtractor()
     items: list[InfoItem] = []
+    groups = _source_groups(
+        sources, symbols, limit, deadline, _create_session(), _HostThrottle(), guba_rate
+    )
 
-    if "cn" in sources:
-        fetcher = CnNewsFetcher()
-        cn_items = fetcher.fetch_all(limit)
-        for it in cn_items:
-            items.append(_cn_item_to_info(it, extractor))
-
-    if "policy" in sources:
-        policy_fetcher = PolicyNewsFetcher()
-        for it in policy_fetcher.fetch_all()[:limit]:
-            items.append(_policy_item_to_info(it, extractor))
-
-    if "guba" in sources:
-        if not symbols:
-            logger.warning("guba source selected but no --symbols provided; skipped")
-        else:
-            guba = GubaFetcher()
-            for metrics in guba.fetch_batch(symbols):
-                items.append(_guba_to_info(metrics, extractor))
+    # Group threads only wait on their own sources' deadlines, so no outer one.
+    results, _group_timings = _fan_out(
+        "intel", [(group.name, group.fetch) for group in groups], deadline=None
+    )
+    # Convert on this thread: the extractor loads its name table lazily.
+    for group, raw_items in zip(groups, results):
+        convert = _GROUP_CONVERTERS[group.name]
+        items.extend(convert(it, extractor) for it in raw_items)
+        if timings is not None:
+            timings.extend(group.fetcher.timings)
 
     if keywords:
         keyword_list = [k.lower() for k in keywords]
-        filtered: list[InfoItem] = []
-        for item in items:
-            text = f"{item.title} {item.summary} {' '.join(item.tags)}".lower()
-            if any(kw in text for kw in keyword_list):
-                filtered.append(item)
-        items = filtered
+        items = [item for item in items if _matches_keywords(item, keyword_list)]
 
     items.sort(key=lambda x: x.published_at, reverse=True)
     return items
 
 
+# ---------------------------------------------------------------------------
+# Watch mode
+# ---------------------------------------------------------------------------
+
+# Slow-moving groups are polled less often than the flash-news feeds.
+_WATCH_GROUP_MIN_INTERVAL: dict[str, float] = {"policy": 600.0, "guba": 300.0}
+
+# Seen IDs older than this are pruned; per-source cursors still reject the
+# items they covered, so the store stays bounded on a long-running watch.
+_WATCH_RETENTION = 7 * 24 * 3600.0
+
+
+class IntelStore:
+    """SQLite record of emitted item IDs and per-source publish-time cursors.
+
+    The cursor for a source is the newest ``published_at`` seen from it. Items
+    strictly older than the cursor are dropped before conversion; items at or
+    after it are checked against the seen IDs, which settles same-second ties
+    and sources that publish slightly out of order.
+    """
+
+    _IN_CHUNK = 500
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS seen (
+                item_id TEXT PRIMARY KEY,
+                source_id TEXT NOT NULL,
+                seen_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS seen_by_time ON seen (seen_at);
+            CREATE TABLE IF NOT EXISTS cursors (
+                source_id TEXT PRIMARY KEY,
+                published_at TEXT NOT NULL
+            );
+            """
+        )
+        self._cursors: dict[str, str] = dict(
+            self._conn.execute("SELECT source_id, published_at FROM cursors")
+        )
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def cursor(self, source_id: str) -> str:
+        return self._cursors.get(source_id, "")
+
+    def unseen(self, items: list[InfoItem]) -> list[InfoItem]:
+        """Return the items whose IDs are not in the store, in input order."""
+        ids = [item.item_id for item in items]
+        known: set[str] = set()
+        for start in range(0, len(ids), self._IN_CHUNK):
+            chunk = ids[start : start + self._IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(
+                row[0]
+                for row in self._conn.execute(
+                    f"SELECT item_id FROM seen WHERE item_id IN ({placeholders})", chunk
+                )
+            )
+        fresh: list[InfoItem] = []
+        for item in items:
+            if item.item_id not in known:
+                known.add(item.item_id)
+                fresh.append(item)
+        return fresh
+
+    def record(self, items: list[InfoItem], now: float | None = None) -> None:
+        """Mark *items* seen and advance each source's cursor."""
+        now = time.time() if now is None else now
+        advanced: dict[str, str] = {}
+        for item in items:
+            if item.published_at > advanced.get(item.source_id, self.cursor(item.source_id)):
+                advanced[item.source_id] = item.published_at
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen (item_id, source_id, seen_at) VALUES (?, ?, ?)",
+                [(item.item_id, item.source_id, now) for item in items],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO cursors (source_id, published_at) VALUES (?, ?)",
+                advanced.items(),
+            )
+        self._cursors.update(advanced)
+
+    def prune(self, older_than: float) -> int:
+        with self._conn:
+            return self._conn.execute(
+                "DELETE FROM seen WHERE seen_at < ?", (older_than,)
+            ).rowcount
+
+
+def _raw_source_and_time(group: str, raw: Any) -> tuple[str, str]:
+    """``(source_id, published_at)`` of a raw item, as its InfoItem would carry them.
+
+    Guba snapshots are stamped at fetch time, so they never fall behind a cursor.
+    """
+    if group == "cn":
+        return f"cn_{raw.source}", raw.publish_time.strftime("%Y-%m-%d %H:%M:%S")
+    if group == "policy":
+        return f"policy_{raw.source}", raw.date
+    return "", ""
+
+
+def watch_intel(
+    sources: list[str],
+    store: IntelStore,
+    symbols: list[str] | None = None,
+    keywords: list[str] | None = None,
+    limit: int = 30,
+    deadline: float = _SOURCE_DEADLINE,
+    interval: float = 60.0,
+    out: Any = None,
+    max_cycles: int | None = None,
+    guba_rate: float = _GUBA_RATE,
+) -> None:
+    """Poll the selected groups forever, writing newly seen items to *out* as JSONL.
+
+    Fetchers, the HTTP session and the symbol extractor live for the whole
+    watch, so each cycle reuses warm connections and the compiled name
+    pattern. Raw items older than their source's cursor are dropped before
+    they are converted, and only unseen IDs that pass the keyword filter are
+    written. Every fetched item is recorded, so a non-matching item is not
+    evaluated again. ``policy`` and ``guba`` are polled at most every
+    ``_WATCH_GROUP_MIN_INTERVAL`` seconds.
+    """
+    out = sys.stdout if out is None else out
+    extractor = SymbolExtractor()
+    groups = _source_groups(
+        sources, symbols, limit, deadline, _create_session(), _HostThrottle(), guba_rate
+    )
+    keyword_list = [k.lower() for k in keywords] if keywords else []
+    last_polled: dict[str, float] = {}
+    cycle = 0
+    while max_cycles is None or cycle < max_cycles:
+        cycle += 1
+        started = time.monotonic()
+        due = [
+            group
+            for group in groups
+            if started - last_polled.get(group.name, float("-inf"))
+            >= max(interval, _WATCH_GROUP_MIN_INTERVAL.get(group.name, 0.0))
+        ]
+        for group in due:
+            last_polled[group.name] = started
+        results, _group_timings = _fan_out(
+            "watch", [(group.name, group.fetch) for group in due], deadline=None
+        )
+
+        fetched: list[InfoItem] = []
+        skipped = 0
+        for group, raw_items in zip(due, results):
+            convert = _GROUP_CONVERTERS[group.name]
+            for raw in raw_items:
+                source_id, published_at = _raw_source_and_time(group.name, raw)
+                if published_at and published_at < store.cursor(source_id):
+                    skipped += 1
+                    continue
+                fetched.append(convert(raw, extractor))
+
+        fresh = store.unseen(fetched)
+        fresh.sort(key=lambda x: x.published_at)
+        emitted = 0
+        for item in fresh:
+            if keyword_list and not _matches_keywords(item, keyword_list):
+                continue
+            out.write(json.dumps(item.to_dict(), ensure_ascii=False) + "\n")
+            emitted += 1
+        out.flush()
+        store.record(fresh)
+        store.prune(time.time() - _WATCH_RETENTION)
+        logger.info(
+            "watch cycle %d: polled %s, %d new, %d emitted, %d behind cursor (%.1fs)",
+            cycle,
+            ",".join(group.name for group in due) or "-",
+            len(fresh),
+            emitted,
+            skipped,
+            time.monotonic() - started,
+        )
+
+        if max_cycles is not None and cycle >= max_cycles:
+            break
+        time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -1497,7 +2147,17 @@ def _positive_int(value: str) -> int:
     return ivalue
 
 
-def _parse_args() -> argparse.Namespace:
+def _positive_float(value: str) -> float:
+    try:
+        fvalue = float(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid float value: {value!r}") from exc
+    if fvalue <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got {value!r}")
+    return fvalue
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Fetch A-share market intelligence from public sources."
     )
@@ -1522,6 +2182,30 @@ def _parse_args() -> argparse.Namespace:
         default=30,
         help="Max items per source group (default: 30)",
     )
+    parser.add_argument(
+        "--deadline",
+        type=_positive_float,
+        default=_SOURCE_DEADLINE,
+        help=(
+            "Seconds each cn/policy source, and the whole guba batch, may "
+            "take before unfinished sources are dropped "
+            f"(default: {_SOURCE_DEADLINE:g})"
+        ),
+    )
+    parser.add_argument(
+        "--guba-rate",
+        type=_positive_float,
+        default=_GUBA_RATE,
+        help=(
+            "Guba requests per second, shared by all symbols fetched in "
+            f"parallel (default: {_GUBA_RATE:g})"
+        ),
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Include per-source wall time and status in the output",
+    )
     parser.add_argument(
         "--format",
         choices=["json", "markdown"],
@@ -1538,7 +2222,32 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Enable debug logging",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=(
+            "Poll until interrupted and emit only newly seen items as JSONL "
+            "(appended to --output if given)"
+        ),
+    )
+    parser.add_argument(
+        "--interval",
+        type=_positive_float,
+        default=60.0,
+        help="Seconds between --watch cycles (default: 60)",
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        help=(
+            "SQLite file of seen item IDs and source cursors for --watch "
+            "(default: watch.sqlite3 in the cache directory)"
+        ),
+    )
+    args = parser.parse_args(argv)
+    if args.watch and (args.format != "json" or args.timings):
+        parser.error("--watch always emits JSONL; drop --format markdown / --timings")
+    return args
 
 
 def main() -> int:
@@ -1552,19 +2261,29 @@ def main() -> int:
     symbol_list = [s.strip() for s in args.symbols.split(",") if s.strip()] or None
     keyword_list = [k.strip() for k in args.keywords.split(",") if k.strip()] or None
 
+    if args.watch:
+        return _run_watch(args, source_list, symbol_list, keyword_list)
+
+    timings: list[SourceTiming] = []
     items = fetch_intel(
         sources=source_list,
         symbols=symbol_list,
         keywords=keyword_list,
         limit=args.limit,
+        deadline=args.deadline,
+        timings=timings,
+        guba_rate=args.guba_rate,
     )
 
     if args.format == "json":
-        output = json.dumps(
-            [it.to_dict() for it in items], ensure_ascii=False, indent=2
-        )
+        payload: Any = [it.to_dict() for it in items]
+        if args.timings:
+            payload = {"items": payload, "timings": [t.to_dict() for t in timings]}
+        output = json.dumps(payload, ensure_ascii=False, indent=2)
     else:
         output = _to_markdown(items)
+        if args.timings:
+            output += "\n" + _timings_to_markdown(timings)
 
     if args.output:
         args.output.write_text(output, encoding="utf-8")
@@ -1575,5 +2294,34 @@ def main() -> int:
     return 0
 
 
+def _run_watch(
+    args: argparse.Namespace,
+    source_list: list[str],
+    symbol_list: list[str] | None,
+    keyword_list: list[str] | None,
+) -> int:
+    store = IntelStore(args.store or _cache_dir() / "watch.sqlite3")
+    out = args.output.open("a", encoding="utf-8") if args.output else sys.stdout
+    try:
+        watch_intel(
+            source_list,
+            store,
+            symbols=symbol_list,
+            keywords=keyword_list,
+            limit=args.limit,
+            deadline=args.deadline,
+            interval=args.interval,
+            out=out,
+            guba_rate=args.guba_rate,
+        )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
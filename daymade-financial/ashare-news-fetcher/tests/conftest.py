@@ -0,0 +1,13 @@
+"""Shared pytest fixtures for the ashare-news-fetcher tests."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """Keep the akshare name cache out of the real user cache directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("ASHARE_NEWS_CACHE_DIR", str(cache_dir))
+    return cache_dir
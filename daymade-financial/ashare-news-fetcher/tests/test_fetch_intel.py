@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 import sys
+import threading
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -13,6 +15,7 @@ SCRIPT_DIR = Path(__file__).resolve().parent.parent / "scripts"
 sys.path.insert(0, str(SCRIPT_DIR))
 
 from fetch_intel import (  # noqa: E402
+    _GUBA_BURST,
     CnNewsItem,
     InfoItem,
     SymbolExtractor,
@@ -93,6 +96,9 @@ class TestSymbolExtractor:
                 yield (0, {"代码": "600519", "名称": "贵州茅台"})
                 yield (1, {"代码": "000001", "名称": "平安银行"})
 
+            def __getitem__(self, column):
+                return [row[column] for _, row in self.iterrows()]
+
         class FakeAK:
             @staticmethod
             def stock_info_a_code_name():
@@ -113,28 +119,32 @@ class TestSentimentScoring:
     def test_bullish_simple(self):
         fetcher = GubaFetcher()
         posts = [{"title": "涨停了，翻倍预期", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         assert sentiment == "bullish"
         assert score > 0.15
 
     def test_bearish_simple(self):
         fetcher = GubaFetcher()
         posts = [{"title": "跌停，暴雷了", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         assert sentiment == "bearish"
         assert score < -0.15
 
     def test_neutral_no_keywords(self):
         fetcher = GubaFetcher()
         posts = [{"title": "今天天气不错", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         assert sentiment == "neutral"
         assert score == 0.0
 
     def test_neutral_balanced(self):
         fetcher = GubaFetcher()
         posts = [{"title": "涨停但也跌停", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         # equal bull/bear weights → neutral
         assert sentiment == "neutral"
         assert score == 0.0
@@ -142,40 +152,46 @@ class TestSentimentScoring:
     def test_negation_flips_bull_to_bear(self):
         fetcher = GubaFetcher()
         posts = [{"title": "不涨停就废了", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         # "不" is a negation prefix before "涨停"
         assert sentiment == "bearish"
 
     def test_negation_flips_bear_to_bull(self):
         fetcher = GubaFetcher()
         posts = [{"title": "未跌停说明稳住", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         # "未" negates "跌停"
         assert sentiment == "bullish"
 
     def test_sentiment_score_bounds(self):
         fetcher = GubaFetcher()
         posts = [{"title": "涨停涨停涨停", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         assert sentiment == "bullish"
         assert -1.0 <= score <= 1.0
 
     def test_multi_char_negation(self):
         fetcher = GubaFetcher()
         posts = [{"title": "没有涨停", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         assert sentiment == "bearish"
 
     def test_negation_with_punctuation(self):
         fetcher = GubaFetcher()
         posts = [{"title": "不，涨停了", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         assert sentiment == "bearish"
 
     def test_multiple_occurrences_counted(self):
         fetcher = GubaFetcher()
         posts = [{"title": "涨停涨停", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         # Two occurrences of 涨停 (weight 3 each) → bullish and score above single occurrence.
         assert sentiment == "bullish"
         assert score > 0.15
@@ -185,7 +201,8 @@ class TestSentimentScoring:
         # "涨停" (bull 3) and "跌停" (bear 3) are adjacent; a naïve scan would also
         # count the sub-keyword "跌" (bear 1) inside "跌停", skewing toward bearish.
         posts = [{"title": "涨停跌停", "post_content": ""}]
-        sentiment, score = fetcher._extract_sentiment(posts)
+        metrics = fetcher._summarize("600519", posts)
+        sentiment, score = metrics.sentiment, metrics.sentiment_score
         assert sentiment == "neutral"
         assert score == 0.0
 
@@ -400,6 +417,92 @@ class TestGubaFetcher:
         monkeypatch.setattr(fetcher, "_fetch_posts", lambda _code: [])
         assert fetcher.fetch_batch(["600519", "000001"]) == []
 
+    def test_fetch_batch_overlaps_symbols_and_keeps_input_order(self, monkeypatch):
+        fetcher = GubaFetcher(rate=1000.0, max_workers=4)
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_posts(code):
+            with lock:
+                in_flight.append(code)
+                peak.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.remove(code)
+            return [{"title": f"{code} 利好", "read_count": 1}]
+
+        monkeypatch.setattr(fetcher, "_fetch_posts", slow_posts)
+        symbols = ["600519", "SZ000002", "300750", "688981", "600036", "000858"]
+        results = fetcher.fetch_batch(symbols)
+        assert [m.symbol for m in results] == [
+            "600519", "000002", "300750", "688981", "600036", "000858"
+        ]
+        assert max(peak) == 4
+        assert [t.source for t in fetcher.timings] == [m.symbol for m in results]
+
+    def test_fetch_batch_fetches_repeated_symbols_once_and_caches(self, monkeypatch):
+        fetcher = GubaFetcher(rate=1000.0)
+        calls = []
+        monkeypatch.setattr(
+            fetcher, "_fetch_posts", lambda code: calls.append(code) or [{"title": "x"}]
+        )
+        results = fetcher.fetch_batch(["600519", "SH600519", "000002"])
+        assert [m.symbol for m in results] == ["600519", "600519", "000002"]
+        assert sorted(calls) == ["000002", "600519"]
+
+        fetcher.fetch_batch(["600519"])
+        assert len(calls) == 2
+        fetcher._cache_ttl = 0
+        fetcher.fetch_batch(["600519"])
+        assert len(calls) == 3
+
+    def test_stuck_symbol_misses_the_batch_deadline(self, monkeypatch):
+        fetcher = GubaFetcher(rate=1000.0, deadline=0.2)
+        release = threading.Event()
+
+        def posts(code):
+            if code == "000002":
+                release.wait(2.0)
+            return [{"title": f"{code} 利好"}]
+
+        monkeypatch.setattr(fetcher, "_fetch_posts", posts)
+        start = time.monotonic()
+        results = fetcher.fetch_batch(["600519", "000002"])
+        release.set()
+        assert time.monotonic() - start < 1.0
+        assert [m.symbol for m in results] == ["600519"]
+        assert [(t.source, t.status) for t in fetcher.timings] == [
+            ("600519", "ok"), ("000002", "timeout")
+        ]
+        assert fetcher.timings[1].elapsed_ms == 200
+
+    def test_fetch_intel_applies_its_deadline_to_guba(self, monkeypatch):
+        release = threading.Event()
+
+        def posts(_self, _code):
+            release.wait(2.0)
+            return []
+
+        monkeypatch.setattr(GubaFetcher, "_fetch_posts", posts)
+        timings = []
+        start = time.monotonic()
+        items = fetch_intel(["guba"], symbols=["600519"], deadline=0.2, timings=timings)
+        release.set()
+        assert time.monotonic() - start < 1.0
+        assert items == []
+        assert [(t.group, t.status) for t in timings] == [("guba", "timeout")]
+
+    def test_token_bucket_bounds_the_rate_across_workers(self, monkeypatch):
+        fetcher = GubaFetcher(rate=20.0, max_workers=8)
+        monkeypatch.setattr(
+            fetcher, "_fetch_posts", lambda _code: fetcher._rate_limit() or []
+        )
+        start = time.monotonic()
+        fetcher.fetch_batch([f"6000{n:02d}" for n in range(_GUBA_BURST + 6)])
+        # Burst tokens are free; the remaining six wait 1/20s each.
+        assert time.monotonic() - start >= 0.25
+
 
 # ---------------------------------------------------------------------------
 # Keyword filtering
@@ -630,33 +733,35 @@ class TestGubaFetcherHelpers:
         assert fetcher._convert_symbol("600519") == "600519"
 
     def test_rate_limit_enforces_interval(self):
-        fetcher = GubaFetcher()
-        fetcher._last_request_ts = time.monotonic()
+        fetcher = GubaFetcher(rate=10.0)
+        # Drain the burst allowance; the next token is 0.1s away.
+        for _ in range(_GUBA_BURST):
+            fetcher._rate_limit()
         start = time.monotonic()
-        fetcher._rate_limit(interval=0.1)
+        fetcher._rate_limit()
         elapsed = time.monotonic() - start
         assert elapsed >= 0.09  # allow small tolerance
 
-    def test_extract_topics_returns_top_phrases(self):
+    def test_summary_hot_topics_are_top_phrases(self):
         fetcher = GubaFetcher()
         posts = [
             {"title": "宁德时代业绩大涨，新能源板块爆发", "post_content": ""},
             {"title": "新能源政策利好，宁德时代再涨", "post_content": ""},
             {"title": "大盘震荡，宁德时代走势分析", "post_content": ""},
         ]
-        topics = fetcher._extract_topics(posts)
+        topics = fetcher._summarize("300750", posts).hot_topics
         assert isinstance(topics, list)
         assert len(topics) <= 3
         assert "宁德时代" in topics  # appears in all 3 titles
 
-    def test_count_institutional_counts_markers(self):
+    def test_summary_counts_institutional_markers(self):
         fetcher = GubaFetcher()
         posts = [
             {"title": "机构调研：目标价上调", "post_content": "", "user_type": "个人"},
             {"title": "券商研报：买入评级", "post_content": "", "source_type": "机构"},
             {"title": "散户讨论", "post_content": ""},
         ]
-        count = fetcher._count_institutional(posts)
+        count = fetcher._summarize("600519", posts).institutional_post_count
         # "机构" in user_type (post 2 via source_type), "研报" in title (post 1), "评级" in title (post 1)
         # user_type "机构" in post 2 → +1
         # title "券商研报" in post 2 → +1 (but continue skips second check for post 2)
@@ -905,6 +1010,9 @@ class TestSymbolExtractorCaching:
             def iterrows(self):
                 yield (0, {"代码": "600519", "名称": "贵州茅台"})
 
+            def __getitem__(self, column):
+                return [row[column] for _, row in self.iterrows()]
+
         class FakeAK:
             @staticmethod
             def stock_info_a_code_name():
@@ -939,6 +1047,85 @@ class TestSymbolExtractorCaching:
         assert _find_column(cols, "code") == "code"
 
 
+class _CountingAK:
+    """Fake akshare whose code→name table records how often it is fetched."""
+
+    def __init__(self, rows: dict[str, str]) -> None:
+        self.rows = rows
+        self.calls = 0
+
+    def stock_info_a_code_name(self):
+        self.calls += 1
+        rows = self.rows
+
+        class FakeDF:
+            columns = ["code", "name"]
+            empty = not rows
+
+            def __getitem__(self, column):
+                return list(rows) if column == "code" else list(rows.values())
+
+        return FakeDF()
+
+
+class TestSymbolExtractorNameCache:
+    def test_name_table_is_cached_on_disk_within_ttl(self, monkeypatch, isolated_cache_dir):
+        ak = _CountingAK({"600519": "贵州茅台"})
+        monkeypatch.setitem(sys.modules, "akshare", ak)
+
+        assert SymbolExtractor().extract("贵州茅台发布公告") == ["600519"]
+        assert (isolated_cache_dir / "stock_names.json").exists()
+        assert SymbolExtractor().extract("贵州茅台发布公告") == ["600519"]
+        assert ak.calls == 1
+
+        SymbolExtractor(cache_ttl=0).extract("贵州茅台")
+        assert ak.calls == 2
+
+    def test_stale_cache_is_used_when_akshare_fails(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "akshare", _CountingAK({"600519": "贵州茅台"}))
+        SymbolExtractor().extract("")
+        monkeypatch.setitem(sys.modules, "akshare", _CountingAK({}))
+        assert SymbolExtractor(cache_ttl=0).extract("贵州茅台发布公告") == ["600519"]
+
+    def test_overlapping_names_are_all_reported(self, monkeypatch):
+        monkeypatch.setattr("fetch_intel._HAS_JIEBA", False)
+        extractor = SymbolExtractor(
+            extra_names={
+                "601318": "中国平安",
+                "000001": "平安银行",
+                "600036": "招商银行",
+                "999999": "招商",
+            }
+        )
+        assert extractor.extract("中国平安银行业务") == ["000001", "601318"]
+        assert extractor.extract("招商银行") == ["600036", "999999"]
+
+    def test_rejected_longest_name_does_not_hide_shorter_ones(self, monkeypatch):
+        # Word boundaries that accept 招商 but not 招商银行 at the same start.
+        monkeypatch.setattr("fetch_intel._HAS_JIEBA", True)
+        monkeypatch.setattr(
+            "fetch_intel._on_word_boundaries", lambda _text, start, end: (start, end) == (0, 2)
+        )
+        extractor = SymbolExtractor(extra_names={"600036": "招商银行", "999999": "招商"})
+        assert extractor.extract("招商银行") == ["999999"]
+
+    def test_compiled_names_match_like_a_scan_of_every_name(self):
+        from fetch_intel import _compile_names
+
+        names = ("中国", "中国平安", "中国平安银行", "平安", "平安银行", "银行", "A+B", "(ST)")
+        automaton = _compile_names(names)
+        text = "中国平安银行和中国银行，A+B 与 (ST) 平安"
+        expected = {
+            (start, start + len(name), name)
+            for name in names
+            for start in range(len(text))
+            if text.startswith(name, start)
+        }
+        found = list(automaton.finditer(text))
+        assert len(found) == len(expected)
+        assert set(found) == expected
+
+
 # ---------------------------------------------------------------------------
 # GubaFetcher exception handling and mixed fetch_batch (F49)
 # ---------------------------------------------------------------------------
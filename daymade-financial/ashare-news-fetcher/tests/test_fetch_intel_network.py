@@ -7,6 +7,8 @@ servers by replacing ``_create_session`` with a fake session.
 from __future__ import annotations
 
 import sys
+import time
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
@@ -16,9 +18,14 @@ sys.path.insert(0, str(SCRIPT_DIR))
 
 from fetch_intel import (  # noqa: E402
     CnNewsFetcher,
+    CnNewsItem,
+    GubaFetcher,
     PolicyNewsFetcher,
+    SourceTiming,
     _HAS_BS4,
     _POLICY_SOURCE_CONFIG,
+    _HostThrottle,
+    fetch_intel,
 )
 
 
@@ -64,10 +71,27 @@ class FakeSession:
         return self.responses.pop(0)
 
 
+class RoutingSession(FakeSession):
+    """Answers by URL instead of call order, for fetchers that fan out."""
+
+    def __init__(self, routes: dict[str, FakeResponse]) -> None:
+        super().__init__([])
+        self.routes = routes
+
+    def get(self, url: str, **kwargs: object) -> FakeResponse:
+        self.calls.append((url, kwargs))
+        if url not in self.routes:
+            raise RuntimeError("unexpected request")
+        return self.routes.pop(url)
+
+
 @pytest.fixture
 def patch_session(monkeypatch: pytest.MonkeyPatch):
-    def _patch(responses: list[FakeResponse]) -> FakeSession:
-        session = FakeSession(responses)
+    def _patch(responses: list[FakeResponse] | dict[str, FakeResponse]) -> FakeSession:
+        if isinstance(responses, dict):
+            session = RoutingSession(responses)
+        else:
+            session = FakeSession(responses)
         monkeypatch.setattr("fetch_intel._create_session", lambda **kw: session)
         return session
 
@@ -373,28 +397,32 @@ class TestCnNewsNetwork:
     def test_cn_fetcher_aggregates_sources(self, monkeypatch, patch_session):
         monkeypatch.setenv("JIN10_APP_ID", "test-app-id")
         session = patch_session(
-            [
-                FakeResponse(json_data={"data": {"list": []}}),  # eastmoney
-                FakeResponse(
+            {
+                CnNewsFetcher.EASTMONEY_URL: FakeResponse(json_data={"data": {"list": []}}),
+                CnNewsFetcher.SINA_URL: FakeResponse(
                     json_data={"result": {"data": {"feed": {"list": []}}}}
-                ),  # sina
-                FakeResponse(json_data={"data": {"items": []}}),  # wallstreetcn
-                FakeResponse(json_data={"data": []}),  # jin10
-                FakeResponse(json_data={"data": {"roll_data": []}}),  # cls
-            ]
+                ),
+                CnNewsFetcher.WSCN_URL: FakeResponse(json_data={"data": {"items": []}}),
+                CnNewsFetcher.JIN10_URL: FakeResponse(json_data={"data": []}),
+                CnNewsFetcher.CLS_URL: FakeResponse(json_data={"data": {"roll_data": []}}),
+            }
         )
         fetcher = CnNewsFetcher()
         items = fetcher.fetch_all(20)
         assert items == []
         assert len(session.calls) == 5
+        assert [t.source for t in fetcher.timings] == [
+            "eastmoney", "sina", "wallstreetcn", "jin10", "cls"
+        ]
+        assert {t.status for t in fetcher.timings} == {"ok"}
 
     def test_cn_fetcher_fetch_all_sorting_and_limit(self, monkeypatch, patch_session):
         """fetch_all merges and sorts items from multiple sources in descending chronological order."""
         monkeypatch.setenv("JIN10_APP_ID", "test-app-id")
         session = patch_session(
-            [
+            {
                 # eastmoney — 1 item
-                FakeResponse(
+                CnNewsFetcher.EASTMONEY_URL: FakeResponse(
                     json_data={
                         "data": {
                             "list": [
@@ -410,7 +438,7 @@ class TestCnNewsNetwork:
                     }
                 ),
                 # sina — 1 item
-                FakeResponse(
+                CnNewsFetcher.SINA_URL: FakeResponse(
                     json_data={
                         "result": {
                             "data": {
@@ -429,7 +457,7 @@ class TestCnNewsNetwork:
                     }
                 ),
                 # wallstreetcn — 1 item
-                FakeResponse(
+                CnNewsFetcher.WSCN_URL: FakeResponse(
                     json_data={
                         "data": {
                             "items": [
@@ -444,10 +472,10 @@ class TestCnNewsNetwork:
                     }
                 ),
                 # jin10 — empty
-                FakeResponse(json_data={"data": []}),
+                CnNewsFetcher.JIN10_URL: FakeResponse(json_data={"data": []}),
                 # cls — empty
-                FakeResponse(json_data={"data": {"roll_data": []}}),
-            ]
+                CnNewsFetcher.CLS_URL: FakeResponse(json_data={"data": {"roll_data": []}}),
+            }
         )
         fetcher = CnNewsFetcher()
         items = fetcher.fetch_all(2)
@@ -458,3 +486,144 @@ class TestCnNewsNetwork:
         assert items[1].title == "Sina middle"
         # Limit respected.
         assert len(items) == 2
+
+
+# ---------------------------------------------------------------------------
+# Concurrent fan-out
+# ---------------------------------------------------------------------------
+
+
+def _sleepy(seconds: float, items: list | None = None):
+    def _fetch(_limit: int) -> list:
+        time.sleep(seconds)
+        return list(items or [])
+
+    return _fetch
+
+
+class TestConcurrentFanOut:
+    def test_sources_overlap_instead_of_summing(self, monkeypatch, patch_session):
+        patch_session([])
+        fetcher = CnNewsFetcher()
+        for name in (
+            "fetch_eastmoney_kuaixun",
+            "fetch_sina_7x24",
+            "fetch_wallstreetcn",
+            "fetch_jin10",
+            "fetch_cls",
+        ):
+            monkeypatch.setattr(fetcher, name, _sleepy(0.2))
+        start = time.monotonic()
+        fetcher.fetch_all(10)
+        assert time.monotonic() - start < 0.6
+        assert all(t.elapsed_ms >= 190 for t in fetcher.timings)
+
+    def test_slow_source_misses_deadline_without_stalling_others(
+        self, monkeypatch, patch_session
+    ):
+        patch_session([])
+        fetcher = CnNewsFetcher(deadline=0.2)
+        fast = CnNewsItem(
+            title="fast",
+            content="",
+            source="sina",
+            publish_time=datetime(2026, 6, 26, tzinfo=UTC),
+        )
+        monkeypatch.setattr(fetcher, "fetch_eastmoney_kuaixun", _sleepy(0))
+        monkeypatch.setattr(fetcher, "fetch_sina_7x24", _sleepy(0, [fast]))
+        monkeypatch.setattr(fetcher, "fetch_wallstreetcn", _sleepy(0))
+        monkeypatch.setattr(fetcher, "fetch_jin10", _sleepy(0))
+        monkeypatch.setattr(fetcher, "fetch_cls", _sleepy(1.0))
+        start = time.monotonic()
+        items = fetcher.fetch_all(10)
+        assert time.monotonic() - start < 0.8
+        assert [it.title for it in items] == ["fast"]
+        by_source = {t.source: t for t in fetcher.timings}
+        assert by_source["cls"].status == "timeout"
+        assert by_source["sina"].status == "ok"
+        assert by_source["sina"].item_count == 1
+
+    def test_raising_source_is_reported_as_error(self, monkeypatch, patch_session):
+        patch_session([])
+        fetcher = CnNewsFetcher()
+
+        def _boom(_limit: int) -> list:
+            raise ConnectionError("reset")
+
+        for name in (
+            "fetch_eastmoney_kuaixun",
+            "fetch_sina_7x24",
+            "fetch_wallstreetcn",
+            "fetch_jin10",
+        ):
+            monkeypatch.setattr(fetcher, name, _sleepy(0))
+        monkeypatch.setattr(fetcher, "fetch_cls", _boom)
+        assert fetcher.fetch_all(10) == []
+        cls = fetcher.timings[-1]
+        assert (cls.source, cls.status, cls.error) == ("cls", "error", "ConnectionError")
+
+    def test_policy_sources_fan_out_and_time_each_source(self, patch_session):
+        csrc = _POLICY_SOURCE_CONFIG["sources"]["csrc"]
+        config = {
+            "sources": {
+                "csrc": csrc,
+                "csrc_copy": {**csrc, "url": csrc["url"].replace("page=1", "page=2")},
+            },
+            "high_impact_keywords": _POLICY_SOURCE_CONFIG["high_impact_keywords"],
+        }
+        payload = {
+            "data": {"results": [{"title": "IPO 新规", "url": "", "publishedTimeStr": ""}]}
+        }
+        patch_session(
+            {
+                csrc["url"]: FakeResponse(json_data=payload),
+                config["sources"]["csrc_copy"]["url"]: FakeResponse(json_data=payload),
+            }
+        )
+        fetcher = PolicyNewsFetcher(config=config)
+        items = fetcher.fetch_all()
+        assert len(items) == 2
+        assert all(it.is_high_impact for it in items)
+        assert [(t.source, t.item_count) for t in fetcher.timings] == [
+            ("csrc", 1),
+            ("csrc_copy", 1),
+        ]
+
+    def test_fetch_intel_shares_one_session_and_reports_every_group(
+        self, monkeypatch, patch_session
+    ):
+        session = patch_session([])
+        sessions = []
+
+        def _cn_fetch_all(fetcher, _limit):
+            sessions.append(fetcher._session)
+            fetcher.timings = [SourceTiming(source="cls", group="cn")]
+            return []
+
+        def _guba_posts(fetcher, _code):
+            sessions.append(fetcher._session)
+            return []
+
+        monkeypatch.setattr(CnNewsFetcher, "fetch_all", _cn_fetch_all)
+        monkeypatch.setattr(GubaFetcher, "_fetch_posts", _guba_posts)
+
+        timings: list[SourceTiming] = []
+        fetch_intel(["cn", "guba"], symbols=["SH600519", "000002"], timings=timings)
+
+        assert [(t.group, t.source) for t in timings] == [
+            ("cn", "cls"),
+            ("guba", "600519"),
+            ("guba", "000002"),
+        ]
+        assert all(s is session for s in sessions) and len(sessions) == 3
+
+
+class TestHostThrottle:
+    def test_same_host_is_spaced_other_hosts_are_not(self):
+        throttle = _HostThrottle(interval=0.15)
+        start = time.monotonic()
+        throttle.wait("https://a.example.com/one")
+        throttle.wait("https://b.example.com/one")
+        assert time.monotonic() - start < 0.1
+        throttle.wait("https://a.example.com/two")
+        assert time.monotonic() - start >= 0.14
@@ -0,0 +1,146 @@
+"""Tests for ``fetch_intel.py --watch``: the seen-ID store and delta polling.
+
+Fetchers are monkeypatched to return scripted batches per cycle, so no
+network is touched.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+SCRIPT_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from fetch_intel import (  # noqa: E402
+    CnNewsFetcher,
+    CnNewsItem,
+    InfoItem,
+    IntelStore,
+    PolicyItem,
+    PolicyNewsFetcher,
+    _parse_args,
+    watch_intel,
+)
+
+
+def cn(title: str, minute: int, source: str = "cls") -> CnNewsItem:
+    return CnNewsItem(
+        title=title,
+        content="",
+        source=source,
+        publish_time=datetime(2026, 6, 26, 9, minute, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = IntelStore(tmp_path / "watch.sqlite3")
+    yield store
+    store.close()
+
+
+def scripted(monkeypatch, cls, method, batches):
+    """Make ``cls.method`` return the next batch on each call; returns the call log."""
+    calls = []
+
+    def _fetch(_self, *_args):
+        calls.append(len(calls))
+        return list(batches[min(len(calls) - 1, len(batches) - 1)])
+
+    monkeypatch.setattr(cls, method, _fetch)
+    return calls
+
+
+def run(store, cycles, **kwargs):
+    out = io.StringIO()
+    sources = kwargs.pop("sources", ["cn"])
+    watch_intel(sources, store, interval=0.01, out=out, max_cycles=cycles, **kwargs)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+class TestWatch:
+    def test_second_cycle_emits_only_new_items(self, monkeypatch, store):
+        scripted(
+            monkeypatch,
+            CnNewsFetcher,
+            "fetch_all",
+            [
+                [cn("A", 1), cn("B", 2)],
+                [cn("A", 1), cn("B", 2), cn("C", 3)],
+            ],
+        )
+        emitted = run(store, 2)
+        assert [item["title"] for item in emitted] == ["A", "B", "C"]
+
+    def test_items_behind_the_cursor_are_not_converted_again(self, monkeypatch, store):
+        old = [cn(f"old {n}", n) for n in range(10)]
+        scripted(monkeypatch, CnNewsFetcher, "fetch_all", [old, old + [cn("new", 30)]])
+        run(store, 1)
+
+        generated = []
+        original = InfoItem._generate_id
+
+        def counting(self):
+            generated.append(self.title)
+            return original(self)
+
+        monkeypatch.setattr(InfoItem, "_generate_id", counting)
+        emitted = run(store, 1)
+        assert [item["title"] for item in emitted] == ["new"]
+        # Only the cursor item itself (a same-second tie) and the new one.
+        assert sorted(generated) == ["new", "old 9"]
+
+    def test_keyword_filter_applies_to_new_items_only(self, monkeypatch, store):
+        scripted(
+            monkeypatch,
+            CnNewsFetcher,
+            "fetch_all",
+            [
+                [cn("央行降准", 1), cn("天气", 2)],
+                [cn("央行降准", 1), cn("天气", 2), cn("降准落地", 3)],
+            ],
+        )
+        emitted = run(store, 2, keywords=["降准"])
+        assert [item["title"] for item in emitted] == ["央行降准", "降准落地"]
+
+    def test_restart_resumes_from_the_store(self, monkeypatch, tmp_path):
+        batch = [cn("A", 1), cn("B", 2, source="sina")]
+        scripted(monkeypatch, CnNewsFetcher, "fetch_all", [batch])
+        first = IntelStore(tmp_path / "watch.sqlite3")
+        assert len(run(first, 1)) == 2
+        first.close()
+
+        second = IntelStore(tmp_path / "watch.sqlite3")
+        try:
+            assert run(second, 2) == []
+            assert second.cursor("cn_sina") == "2026-06-26 09:02:00"
+        finally:
+            second.close()
+
+    def test_slow_groups_are_polled_less_often(self, monkeypatch, store):
+        cn_calls = scripted(monkeypatch, CnNewsFetcher, "fetch_all", [[]])
+        rule = PolicyItem(
+            title="IPO 新规", source="csrc", source_name="证监会", date="2026-06-26"
+        )
+        policy_calls = scripted(monkeypatch, PolicyNewsFetcher, "fetch_all", [[rule]])
+        emitted = run(store, 3, sources=["cn", "policy"])
+        assert len(cn_calls) == 3
+        assert len(policy_calls) == 1
+        assert [item["source_id"] for item in emitted] == ["policy_csrc"]
+
+    def test_prune_forgets_old_ids(self, store):
+        items = [InfoItem(source_id="cn_cls", source_name="cls", title="x")]
+        store.record(items, now=100.0)
+        assert store.unseen(items) == []
+        assert store.prune(older_than=200.0) == 1
+        assert store.unseen(items) == items
+
+    def test_watch_rejects_markdown_output(self):
+        with pytest.raises(SystemExit):
+            _parse_args(["--watch", "--format", "markdown"])
@@ -2,8 +2,11 @@
 """Generate and serve a review page for eval results.
 
 Reads the workspace directory, discovers runs (directories with outputs/),
-embeds all output data into a self-contained HTML page, and serves it via
-a tiny HTTP server. Feedback auto-saves to feedback.json in the workspace.
+and serves a review page via a tiny HTTP server. The page carries a manifest
+of output files keyed by content hash; the files themselves are streamed from
+/files/<hash> on demand (with Range and ETag support), so large workspaces
+open immediately. Only --static mode embeds every file into a self-contained
+HTML page. Feedback auto-saves to feedback.json in the workspace.
 
 Usage:
     python generate_review.py <workspace-path> [--port PORT] [--skill-name NAME]
@@ -14,6 +17,7 @@ No dependencies beyond the Python stdlib are required.
 
 import argparse
 import base64
+import hashlib
 import json
 import mimetypes
 import os
@@ -21,11 +25,13 @@ import re
 import signal
 import subprocess
 import sys
+import threading
 import time
 import webbrowser
 from functools import partial
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Callable
 
 # Files to exclude from output listings
 METADATA_FILES = {"transcript.md", "user_notes.md", "metrics.json"}
@@ -57,21 +63,27 @@ def get_mime_type(path: Path) -> str:
     return mime or "application/octet-stream"
 
 
-def find_runs(workspace: Path) -> list[dict]:
-    """Recursively find directories that contain an outputs/ subdirectory."""
+def find_runs(workspace: Path, describe: Callable[[Path], dict] | None = None) -> list[dict]:
+    """Recursively find directories that contain an outputs/ subdirectory.
+
+    ``describe`` turns each output file into its viewer entry; it defaults to
+    ``embed_file`` (static export) and is ``FileIndex.describe`` when serving.
+    """
     runs: list[dict] = []
-    _find_runs_recursive(workspace, workspace, runs)
+    _find_runs_recursive(workspace, workspace, runs, describe or embed_file)
     runs.sort(key=lambda r: (r.get("eval_id", float("inf")), r["id"]))
     return runs
 
 
-def _find_runs_recursive(root: Path, current: Path, runs: list[dict]) -> None:
+def _find_runs_recursive(
+    root: Path, current: Path, runs: list[dict], describe: Callable[[Path], dict]
+) -> None:
     if not current.is_dir():
         return
 
     outputs_dir = current / "outputs"
     if outputs_dir.is_dir():
-        run = build_run(root, current)
+        run = build_run(root, current, describe)
         if run:
             runs.append(run)
         return
@@ -79,10 +91,12 @@ def _find_runs_recursive(root: Path, current: Path, runs: list[dict]) -> None:
     skip = {"node_modules", ".git", "__pycache__", "skill", "inputs"}
     for child in sorted(current.iterdir()):
         if child.is_dir() and child.name not in skip:
-            _find_runs_recursive(root, child, runs)
+            _find_runs_recursive(root, child, runs, describe)
 
 
-def build_run(root: Path, run_dir: Path) -> dict | None:
+def build_run(
+    root: Path, run_dir: Path, describe: Callable[[Path], dict] | None = None
+) -> dict | None:
     """Build a run dict with prompt, outputs, and grading data."""
     prompt = ""
     eval_id = None
@@ -124,7 +138,7 @@ def build_run(root: Path, run_dir: Path) -> dict | None:
     if outputs_dir.is_dir():
         for f in sorted(outputs_dir.iterdir()):
             if f.is_file() and f.name not in METADATA_FILES:
-                output_files.append(embed_file(f))
+                output_files.append((describe or embed_file)(f))
 
     # Load grading if present
     grading = None
@@ -210,7 +224,94 @@ def embed_file(path: Path) -> dict:
         }
 
 
-def load_previous_iteration(workspace: Path) -> dict[str, dict]:
+def _file_type(path: Path) -> str:
+    ext = path.suffix.lower()
+    if ext in TEXT_EXTENSIONS:
+        return "text"
+    if ext in IMAGE_EXTENSIONS:
+        return "image"
+    if ext in (".pdf", ".xlsx"):
+        return ext[1:]
+    return "binary"
+
+
+class FileIndex:
+    """Content-hash index of output files for the review server.
+
+    ``describe`` returns a manifest entry pointing at ``/files/<hash>`` instead
+    of the file's bytes. Hashes are cached per (size, mtime_ns), so reloading
+    the page only re-reads files that changed since the last scan.
+    """
+
+    _BLOCK = 1 << 20
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_path: dict[Path, tuple[tuple[int, int], str]] = {}
+        self._by_hash: dict[str, Path] = {}
+
+    @staticmethod
+    def _fingerprint(stat: os.stat_result) -> tuple[int, int]:
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def _hash(self, path: Path) -> str:
+        digest = hashlib.sha256()
+        with path.open("rb") as handle:
+            while block := handle.read(self._BLOCK):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def register(self, path: Path) -> tuple[str, int]:
+        """Hash ``path`` (or reuse its cached hash) and return (hash, size)."""
+        path = path.resolve()
+        stat = path.stat()
+        fingerprint = self._fingerprint(stat)
+        with self._lock:
+            cached = self._by_path.get(path)
+        if cached and cached[0] == fingerprint:
+            content_hash = cached[1]
+        else:
+            content_hash = self._hash(path)
+        with self._lock:
+            self._by_path[path] = (fingerprint, content_hash)
+            self._by_hash[content_hash] = path
+        return content_hash, stat.st_size
+
+    def lookup(self, content_hash: str) -> Path | None:
+        """Return a file whose current content still has ``content_hash``."""
+        with self._lock:
+            path = self._by_hash.get(content_hash)
+        if path is None:
+            return None
+        try:
+            if self.register(path)[0] == content_hash:
+                return path
+        except OSError:
+            pass
+        with self._lock:
+            if self._by_hash.get(content_hash) == path:
+                del self._by_hash[content_hash]
+        return None
+
+    def describe(self, path: Path) -> dict:
+        """Manifest entry for ``path``: metadata plus a ``/files/<hash>`` URL."""
+        try:
+            content_hash, size = self.register(path)
+        except OSError:
+            return {"name": path.name, "type": "error", "content": "(Error reading file)"}
+        return {
+            "name": path.name,
+            "type": _file_type(path),
+            "mime": get_mime_type(path),
+            "size": size,
+            "hash": content_hash,
+            "url": f"/files/{content_hash}",
+        }
+
+
+def load_previous_iteration(
+    workspace: Path, describe: Callable[[Path], dict] | None = None
+) -> dict[str, dict]:
     """Load previous iteration's feedback and outputs.
 
     Returns a map of run_id -> {"feedback": str, "outputs": list[dict]}.
@@ -232,7 +333,7 @@ def load_previous_iteration(workspace: Path) -> dict[str, dict]:
             pass
 
     # Load runs (to get outputs)
-    prev_runs = find_runs(workspace)
+    prev_runs = find_runs(workspace, describe)
     for run in prev_runs:
         result[run["id"]] = {
             "feedback": feedback_map.get(run["id"], ""),
@@ -253,7 +354,7 @@ def generate_html(
     previous: dict[str, dict] | None = None,
     benchmark: dict | None = None,
 ) -> str:
-    """Generate the complete standalone HTML page with embedded data."""
+    """Generate the HTML page with the run data (or manifest) embedded."""
     template_path = Path(__file__).parent / "viewer.html"
     template = template_path.read_text()
 
@@ -305,13 +406,42 @@ def _kill_port(port: int) -> None:
     except FileNotFoundError:
         print("Note: lsof not found, cannot check if port is in use", file=sys.stderr)
 
+def parse_range(header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single-range ``Range`` header into an inclusive (start, end).
+
+    Returns None when the whole file should be sent: no header, a malformed
+    one, a unit other than bytes, or a multi-range request (RFC 9110 lets
+    servers ignore those). Raises ValueError when the range is unsatisfiable.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            start, end = size - int(last), size - 1
+    except ValueError:
+        return None
+    if start >= size or start > end:
+        raise ValueError(f"range {header!r} not satisfiable for {size} bytes")
+    return max(start, 0), min(end, size - 1)
+
+
 class ReviewHandler(BaseHTTPRequestHandler):
-    """Serves the review HTML and handles feedback saves.
+    """Serves the review HTML, output files, and handles feedback saves.
 
-    Regenerates the HTML on each page load so that refreshing the browser
-    picks up new eval outputs without restarting the server.
+    Regenerates the page on each load so that refreshing the browser picks
+    up new eval outputs without restarting the server. The page only embeds
+    a manifest; output files are streamed from ``/files/<hash>``.
     """
 
+    _STREAM_BLOCK = 64 * 1024
+
     def __init__(
         self,
         workspace: Path,
@@ -319,6 +449,7 @@ class ReviewHandler(BaseHTTPRequestHandler):
         feedback_path: Path,
         previous: dict[str, dict],
         benchmark_path: Path | None,
+        file_index: FileIndex,
         *args,
         **kwargs,
     ):
@@ -327,25 +458,94 @@ class ReviewHandler(BaseHTTPRequestHandler):
         self.feedback_path = feedback_path
         self.previous = previous
         self.benchmark_path = benchmark_path
+        self.file_index = file_index
         super().__init__(*args, **kwargs)
 
+    def _send_bytes(self, data: bytes, content_type: str) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _manifest(self) -> tuple[list[dict], dict | None]:
+        # Re-scan on every request so new eval outputs show up on refresh
+        runs = find_runs(self.workspace, self.file_index.describe)
+        benchmark = None
+        if self.benchmark_path and self.benchmark_path.exists():
+            try:
+                benchmark = json.loads(self.benchmark_path.read_text())
+            except (json.JSONDecodeError, OSError):
+                pass
+        return runs, benchmark
+
+    def _send_file(self, content_hash: str, head: bool = False) -> None:
+        path = self.file_index.lookup(content_hash)
+        if path is None:
+            self.send_error(404)
+            return
+        etag = f'"{content_hash}"'
+        size = path.stat().st_size
+        if etag in {tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")}:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        if_range = self.headers.get("If-Range")
+        try:
+            byte_range = parse_range(self.headers.get("Range"), size)
+        except ValueError:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if if_range is not None and if_range.strip() != etag:
+            byte_range = None
+
+        start, end = byte_range or (0, size - 1)
+        self.send_response(206 if byte_range else 200)
+        self.send_header("Content-Type", get_mime_type(path))
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        # The URL is the content hash, so a cached copy can never go stale
+        self.send_header("Cache-Control", "private, max-age=31536000, immutable")
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        if head:
+            return
+        with path.open("rb") as handle:
+            handle.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                block = handle.read(min(self._STREAM_BLOCK, remaining))
+                if not block:
+                    break
+                self.wfile.write(block)
+                remaining -= len(block)
+
+    def do_HEAD(self) -> None:
+        if self.path.startswith("/files/"):
+            self._send_file(self.path[len("/files/"):], head=True)
+        else:
+            self.send_error(404)
+
     def do_GET(self) -> None:
         if self.path == "/" or self.path == "/index.html":
-            # Regenerate HTML on each request (re-scans workspace for new outputs)
-            runs = find_runs(self.workspace)
-            benchmark = None
-            if self.benchmark_path and self.benchmark_path.exists():
-                try:
-                    benchmark = json.loads(self.benchmark_path.read_text())
-                except (json.JSONDecodeError, OSError):
-                    pass
+            runs, benchmark = self._manifest()
             html = generate_html(runs, self.skill_name, self.previous, benchmark)
-            content = html.encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(content)))
-            self.end_headers()
-            self.wfile.write(content)
+            self._send_bytes(html.encode("utf-8"), "text/html; charset=utf-8")
+        elif self.path == "/api/manifest":
+            runs, benchmark = self._manifest()
+            manifest = {"skill_name": self.skill_name, "runs": runs}
+            if benchmark:
+                manifest["benchmark"] = benchmark
+            self._send_bytes(json.dumps(manifest).encode("utf-8"), "application/json")
+        elif self.path.startswith("/files/"):
+            self._send_file(self.path[len("/files/"):])
         elif self.path == "/api/feedback":
             data = b"{}"
             if self.feedback_path.exists():
@@ -408,7 +608,12 @@ def main() -> None:
         print(f"Error: {workspace} is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    runs = find_runs(workspace)
+    # Served pages reference output files by content hash; only the static
+    # export has to inline them. Scanning here also primes the hash cache.
+    file_index = FileIndex()
+    describe = embed_file if args.static else file_index.describe
+
+    runs = find_runs(workspace, describe)
     if not runs:
         print(f"No runs found in {workspace}", file=sys.stderr)
         sys.exit(1)
@@ -418,7 +623,7 @@ def main() -> None:
 
     previous: dict[str, dict] = {}
     if args.previous_workspace:
-        previous = load_previous_iteration(args.previous_workspace.resolve())
+        previous = load_previous_iteration(args.previous_workspace.resolve(), describe)
 
     benchmark_path = args.benchmark.resolve() if args.benchmark else None
     benchmark = None
@@ -438,12 +643,14 @@ def main() -> None:
     # Kill any existing process on the target port
     port = args.port
     _kill_port(port)
-    handler = partial(ReviewHandler, workspace, skill_name, feedback_path, previous, benchmark_path)
+    handler = partial(
+        ReviewHandler, workspace, skill_name, feedback_path, previous, benchmark_path, file_index,
+    )
     try:
-        server = HTTPServer(("127.0.0.1", port), handler)
+        server = ThreadingHTTPServer(("127.0.0.1", port), handler)
     except OSError:
         # Port still in use after kill attempt — find a free one
-        server = HTTPServer(("127.0.0.1", 0), handler)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
         port = server.server_address[1]
 
     url = f"http://localhost:{port}"
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmark mine_conversation's token-budget chunking on a synthetic export.
+
+Writes a deterministic Claude Code project session (default ~10 MB) of short
+user/assistant turns interleaved with multi-hundred-KB pasted logs, parses it
+the way mine_conversation does, then times:
+
+1. the previous chunker, which re-tokenizes every message and binary-searches
+   each oversized message's cut points over ever-shrinking prefixes
+2. the current ``_chunk_messages``, which encodes each message once and cuts
+   on token byte offsets
+
+Both must produce identical chunks; the run aborts if they diverge.
+
+Usage:
+    uv run --with tiktoken python scripts/benchmark_chunking.py
+    uv run --with tiktoken python scripts/benchmark_chunking.py --size-mb 2 --chunk-tokens 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR))
+
+from mine_conversation import (  # noqa: E402
+    _chunk_messages,
+    _make_chunk,
+    _parse_claude_project_jsonl,
+    get_token_counter,
+)
+
+_WORDS = (
+    "refactor the parser cache index session deploy budget retry timeout "
+    "会议 纪要 预算 测试 部署 修复 构建 日志 ✅ 🚀"
+).split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _pasted_log(rng: random.Random, size_bytes: int) -> str:
+    lines = []
+    written = 0
+    while written < size_bytes:
+        line = (
+            f"2026-05-0{rng.randint(1, 9)}T10:{rng.randint(10, 59)}:{rng.randint(10, 59)}Z "
+            f"{rng.choice(['INFO', 'WARN', 'ERROR'])} worker-{rng.randint(1, 64)} "
+            f"{_sentence(rng, rng.randint(4, 24))} id={rng.getrandbits(48):012x}"
+        )
+        lines.append(line)
+        written += len(line.encode("utf-8")) + 1
+    return "\n".join(lines)
+
+
+def build_export(path: Path, size_bytes: int, log_kb: int, seed: int) -> None:
+    """Write a session JSONL of roughly ``size_bytes``, about half of it pasted logs."""
+    rng = random.Random(seed)
+    written = 0
+    turn = 0
+    with path.open("w", encoding="utf-8") as handle:
+        while written < size_bytes:
+            if turn % 40 == 39:
+                content = "Here is the log:\n" + _pasted_log(rng, log_kb * 1024)
+            else:
+                content = _sentence(rng, rng.randint(5, 80))
+            for role, text in (("user", content), ("assistant", _sentence(rng, rng.randint(20, 300)))):
+                record = {
+                    "type": role,
+                    "timestamp": f"2026-05-01T10:00:{turn % 60:02d}Z",
+                    "message": {"role": role, "content": text},
+                }
+                line = json.dumps(record, ensure_ascii=False) + "\n"
+                handle.write(line)
+                written += len(line.encode("utf-8"))
+            turn += 1
+
+
+def legacy_split_text_by_token_budget(text: str, chunk_tokens: int, counter) -> list[str]:
+    """The prefix binary search ``_split_counted`` replaced."""
+    parts: list[str] = []
+    start = 0
+    while start < len(text):
+        remaining = text[start:]
+        if counter(remaining) <= chunk_tokens:
+            parts.append(remaining)
+            break
+        low, high, best = 1, len(remaining), 0
+        while low <= high:
+            mid = (low + high) // 2
+            if counter(remaining[:mid]) <= chunk_tokens:
+                best = mid
+                low = mid + 1
+            else:
+                high = mid - 1
+        if best == 0:
+            raise ValueError("partitioning.chunk_tokens is too small to encode one character losslessly")
+        parts.append(remaining[:best])
+        start += best
+    return parts
+
+
+def legacy_chunk_messages(messages: list[dict], chunk_tokens: int, counter) -> list[dict]:
+    """The previous ``_chunk_messages``: counts, splits, then re-counts every part."""
+    chunks: list[dict] = []
+    current: list[dict] = []
+    current_tokens = 0
+    current_sources: set[str] = set()
+    start_idx = 0
+    for idx, msg in enumerate(messages):
+        msg_tokens = counter(msg["text"])
+        if msg_tokens > chunk_tokens:
+            if current:
+                chunks.append(_make_chunk(current, start_idx, idx - 1, current_tokens, current_sources))
+                current, current_tokens, current_sources, start_idx = [], 0, set(), idx
+            for part in legacy_split_text_by_token_budget(msg["text"], chunk_tokens, counter):
+                part_msg = {**msg, "text": part, "chunk_part": True}
+                chunks.append(_make_chunk([part_msg], idx, idx, counter(part), {msg["source"]}))
+            continue
+        if current_tokens + msg_tokens > chunk_tokens and current:
+            chunks.append(_make_chunk(current, start_idx, idx - 1, current_tokens, current_sources))
+            current, current_tokens, current_sources, start_idx = [], 0, set(), idx
+        current.append(msg)
+        current_tokens += msg_tokens
+        current_sources.add(msg["source"])
+    if current:
+        chunks.append(_make_chunk(current, start_idx, len(messages) - 1, current_tokens, current_sources))
+    return chunks
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--size-mb", type=float, default=10.0, help="Export size in MB (default: 10)")
+    parser.add_argument("--log-kb", type=int, default=400, help="Size of each pasted log in KB (default: 400)")
+    parser.add_argument("--chunk-tokens", type=int, default=12000, help="Token budget per chunk (default: 12000)")
+    parser.add_argument("--encoding", default="cl100k_base", help="tiktoken encoding (default: cl100k_base)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    counter = get_token_counter(args.encoding)
+    plain_counter = lambda text: counter(text)  # noqa: E731 - hides encode(), as before
+
+    with tempfile.TemporaryDirectory(prefix="chunk-bench-") as tmp:
+        path = Path(tmp) / "session.jsonl"
+        build_export(path, int(args.size_mb * 1024 * 1024), args.log_kb, args.seed)
+        messages = [{**msg, "source": "bench"} for msg in _parse_claude_project_jsonl(path)]
+        print(f"export: {path.stat().st_size / 1e6:.1f} MB, {len(messages)} messages")
+
+        legacy, legacy_s = _timed(lambda: legacy_chunk_messages(messages, args.chunk_tokens, plain_counter))
+        current, current_s = _timed(lambda: _chunk_messages(messages, args.chunk_tokens, counter))
+        if current != legacy:
+            print("error: chunk output diverged from the previous implementation", file=sys.stderr)
+            return 1
+
+    split = {chunk["start_idx"] for chunk in current if chunk["messages"][0].get("chunk_part")}
+    print(f"{len(split)} messages exceeded {args.chunk_tokens} tokens and were split\n")
+    print(f"{'prefix binary search':<28}{legacy_s:8.2f}s   {len(legacy)} chunks")
+    print(f"{'token-offset cuts':<28}{current_s:8.2f}s   {legacy_s / current_s:5.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
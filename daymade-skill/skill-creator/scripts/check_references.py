@@ -18,7 +18,9 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import random
 import re
 import sys
 from collections import defaultdict
@@ -98,6 +100,129 @@ def _jaccard(a: set, b: set) -> float:
     return len(a & b) / len(a | b)
 
 
+# ---------------------------------------------------------------------------
+# MinHash / LSH candidate search
+# ---------------------------------------------------------------------------
+
+_NUM_PERM = 128
+_SIGNATURE_SCHEME = "oph-v1"
+# A pair exactly at the overlap threshold is missed by banding with at most
+# this probability; anything the bands surface is verified with exact Jaccard.
+_LSH_MISS_RATE = 1e-4
+
+
+def _make_probe_orders(bins: int, seed: int) -> list[list[int]]:
+    """Fixed per-bin visiting order used to fill empty bins, shared by every file."""
+    rng = random.Random(seed)
+    return [rng.sample(range(bins), bins) for _ in range(bins)]
+
+
+_PROBE_ORDERS = _make_probe_orders(_NUM_PERM, 20260501)
+
+
+def _minhash(tokens: set[str]) -> list[int]:
+    """Return the MinHash signature of a non-empty token set.
+
+    One-permutation hashing: each token is hashed once and lands in one of
+    _NUM_PERM bins, which keep their minimum. An empty bin borrows from the
+    first filled bin in its fixed probe order, so two files with equal sets
+    always get equal signatures and each position still collides with
+    probability close to their Jaccard similarity.
+    """
+    bins: list[Optional[int]] = [None] * _NUM_PERM
+    for token in tokens:
+        h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+        index, value = h % _NUM_PERM, h // _NUM_PERM
+        current = bins[index]
+        if current is None or value < current:
+            bins[index] = value
+    filled = list(bins)
+    for index, value in enumerate(filled):
+        if value is None:
+            bins[index] = next(filled[j] for j in _PROBE_ORDERS[index] if filled[j] is not None)
+    return bins
+
+
+def _band_rows(threshold: float, num_perm: int = _NUM_PERM) -> int:
+    """Widest band whose chance of missing a pair at *threshold* stays under _LSH_MISS_RATE."""
+    best = 1
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if (1 - threshold ** rows) ** bands <= _LSH_MISS_RATE:
+            best = rows
+    return best
+
+
+class SignatureCache:
+    """MinHash signatures on disk, keyed by resolved path and (size, mtime_ns).
+
+    Unchanged files are neither read nor tokenized again. An empty token set
+    is stored as ``None``.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.computed = 0
+        self._entries: dict[str, dict] = {}
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            scheme = data.get("scheme") if isinstance(data, dict) else None
+            if scheme == [_SIGNATURE_SCHEME, _NUM_PERM] and isinstance(data.get("entries"), dict):
+                self._entries = data["entries"]
+
+    def signature(self, path: Path) -> Optional[list[int]]:
+        stat = path.stat()
+        key = str(path.resolve())
+        fingerprint = [stat.st_size, stat.st_mtime_ns]
+        entry = self._entries.get(key)
+        if entry is not None and entry.get("fingerprint") == fingerprint:
+            return entry["signature"]
+        tokens = _tokenize(path.read_text(encoding="utf-8"))
+        signature = _minhash(tokens) if tokens else None
+        self._entries[key] = {"fingerprint": fingerprint, "signature": signature}
+        self.computed += 1
+        return signature
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps({"scheme": [_SIGNATURE_SCHEME, _NUM_PERM], "entries": self._entries}), encoding="utf-8")
+        tmp.replace(self.path)
+
+
+def _lsh_candidates(
+    existing_refs: dict[str, Path],
+    candidates: dict[str, Path],
+    threshold: float,
+    cache: SignatureCache,
+) -> dict[str, set[str]]:
+    """Map each candidate to the existing references sharing at least one LSH band."""
+    rows = _band_rows(threshold)
+    bands = _NUM_PERM // rows
+
+    def band_keys(signature: list[int]) -> list[tuple]:
+        return [(band, *signature[band * rows:(band + 1) * rows]) for band in range(bands)]
+
+    buckets: dict[tuple, list[str]] = defaultdict(list)
+    for name, path in existing_refs.items():
+        signature = cache.signature(path)
+        if signature is not None:
+            for key in band_keys(signature):
+                buckets[key].append(name)
+
+    matches: dict[str, set[str]] = {}
+    for name, path in candidates.items():
+        signature = cache.signature(path)
+        if signature is not None:
+            matches[name] = {e for key in band_keys(signature) for e in buckets.get(key, ())}
+    return matches
+
+
 # ---------------------------------------------------------------------------
 # Checks
 # ---------------------------------------------------------------------------
@@ -141,14 +266,38 @@ def check_broken_links(skill_dir: Path, enrich_dir: Path, candidates: dict[str,
     return issues
 
 
-def check_overlaps(existing_refs: dict[str, Path], candidates: dict[str, Path], threshold: float = 0.6) -> list[dict]:
-    issues = []
-    existing_tokens = {name: _tokenize(path.read_text(encoding="utf-8")) for name, path in existing_refs.items()}
-    candidate_tokens = {name: _tokenize(path.read_text(encoding="utf-8")) for name, path in candidates.items()}
+def check_overlaps(
+    existing_refs: dict[str, Path],
+    candidates: dict[str, Path],
+    threshold: float = 0.6,
+    signature_cache: Optional[SignatureCache] = None,
+) -> list[dict]:
+    """Report candidate/existing pairs whose token Jaccard reaches *threshold*.
 
-    for c_name, c_tokens in candidate_tokens.items():
-        for e_name, e_tokens in existing_tokens.items():
-            overlap = _jaccard(c_tokens, e_tokens)
+    MinHash/LSH narrows the pairs to those likely to qualify; only those are
+    tokenized and scored with the exact Jaccard.
+    """
+    issues = []
+    if threshold <= 0:
+        # Every pair qualifies, so there is nothing for LSH to prune.
+        pairs = {c_name: set(existing_refs) for c_name in candidates}
+    else:
+        cache = signature_cache if signature_cache is not None else SignatureCache()
+        pairs = _lsh_candidates(existing_refs, candidates, threshold, cache)
+
+    token_sets: dict[Path, set[str]] = {}
+
+    def tokens_of(path: Path) -> set[str]:
+        if path not in token_sets:
+            token_sets[path] = _tokenize(path.read_text(encoding="utf-8"))
+        return token_sets[path]
+
+    for c_name, c_path in candidates.items():
+        matched = pairs.get(c_name, set())
+        for e_name, e_path in existing_refs.items():
+            if e_name not in matched:
+                continue
+            overlap = _jaccard(tokens_of(c_path), tokens_of(e_path))
             if overlap >= threshold:
                 severity = "blocking" if overlap >= 0.8 else "warning"
                 issues.append({
@@ -255,6 +404,11 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser.add_argument("--skill", required=True, type=Path, help="Path to target skill directory")
     parser.add_argument("--enrich", required=True, type=Path, help="Path to .enrich/<timestamp> directory")
     parser.add_argument("--overlap-threshold", type=float, default=0.6, help="Jaccard overlap threshold for duplicate warnings")
+    parser.add_argument(
+        "--signature-cache",
+        type=Path,
+        help="MinHash signature cache file (default: <enrich>/minhash-signatures.json)",
+    )
     parser.add_argument("--output", type=Path, help="Write JSON report to this file")
     parser.add_argument("--verbose", action="store_true", help="Show details")
     args = parser.parse_args(argv)
@@ -286,7 +440,11 @@ def main(argv: Optional[list[str]] = None) -> int:
     issues: list[dict] = []
     issues.extend(check_duplicates(existing_refs, candidates))
     issues.extend(check_broken_links(skill_dir, args.enrich, candidates))
-    issues.extend(check_overlaps(existing_refs, candidates, threshold=args.overlap_threshold))
+    signature_cache = SignatureCache(args.signature_cache or args.enrich / "minhash-signatures.json")
+    issues.extend(check_overlaps(
+        existing_refs, candidates, threshold=args.overlap_threshold, signature_cache=signature_cache
+    ))
+    signature_cache.save()
     issues.extend(check_missing_crosslinks(skill_dir, args.enrich, existing_refs, candidates))
 
     report = {
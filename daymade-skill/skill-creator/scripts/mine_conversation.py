@@ -19,12 +19,14 @@ full orchestration.
 from __future__ import annotations
 
 import argparse
+import gzip
 import hashlib
 import json
 import os
 import re
 import sys
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Iterator, Optional
@@ -41,8 +43,39 @@ from utils import parse_skill_md  # noqa: E402
 # Token counting
 # ---------------------------------------------------------------------------
 
-def get_token_counter(encoding_model: str):
-    """Return a function that counts tokens in a string.
+class TokenCounter:
+    """Count tokens with a tiktoken encoding; calling it returns the count.
+
+    Also exposes the token ids and their byte offsets, so oversized messages
+    can be cut on token boundaries without re-tokenizing prefixes.
+    """
+
+    def __init__(self, encoding) -> None:
+        self._enc = encoding
+        self._token_bytes: dict[int, int] = {}
+
+    def __call__(self, text: str) -> int:
+        return len(self._enc.encode(text))
+
+    def encode(self, text: str) -> list[int]:
+        return self._enc.encode(text)
+
+    def token_byte_offsets(self, tokens: list[int]) -> list[int]:
+        """Return the UTF-8 byte offset where each token starts, plus the end offset."""
+        sizes = self._token_bytes
+        offsets = [0]
+        position = 0
+        for token in tokens:
+            size = sizes.get(token)
+            if size is None:
+                size = sizes[token] = len(self._enc.decode_single_token_bytes(token))
+            position += size
+            offsets.append(position)
+        return offsets
+
+
+def get_token_counter(encoding_model: str) -> TokenCounter:
+    """Return a callable that counts tokens in a string.
 
     Fail closed if tiktoken or the requested encoding is unavailable.
     """
@@ -53,8 +86,7 @@ def get_token_counter(encoding_model: str):
             "tiktoken is required for deterministic conversation chunking; "
             "run with `uv run --with tiktoken ...`"
         ) from exc
-    enc = tiktoken.get_encoding(encoding_model)
-    return lambda text: len(enc.encode(text))
+    return TokenCounter(tiktoken.get_encoding(encoding_model))
 
 
 # ---------------------------------------------------------------------------
@@ -231,9 +263,9 @@ def _parse_iso_timestamp(ts: Any) -> Optional[str]:
     return None
 
 
-def _parse_claude_project_jsonl(path: Path) -> Iterator[dict]:
+def _parse_claude_project_jsonl(path: Path, content: Optional[str] = None) -> Iterator[dict]:
     """Parse a Claude Code project session JSONL file."""
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = path.read_text(encoding="utf-8", errors="replace") if content is None else content
     for line_no, raw_line in enumerate(text.splitlines(), start=1):
         line = raw_line.strip()
         if not line:
@@ -269,9 +301,9 @@ def _parse_claude_project_jsonl(path: Path) -> Iterator[dict]:
         }
 
 
-def _parse_claude_command_history_jsonl(path: Path) -> Iterator[dict]:
+def _parse_claude_command_history_jsonl(path: Path, content: Optional[str] = None) -> Iterator[dict]:
     """Parse ~/.claude/history.jsonl — each line is a user prompt."""
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = path.read_text(encoding="utf-8", errors="replace") if content is None else content
     for line_no, raw_line in enumerate(text.splitlines(), start=1):
         line = raw_line.strip()
         if not line:
@@ -295,9 +327,9 @@ def _parse_claude_command_history_jsonl(path: Path) -> Iterator[dict]:
         }
 
 
-def _parse_codex_transcription_jsonl(path: Path) -> Iterator[dict]:
+def _parse_codex_transcription_jsonl(path: Path, content: Optional[str] = None) -> Iterator[dict]:
     """Parse ~/.codex/transcription-history.jsonl — each line is a user text."""
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = path.read_text(encoding="utf-8", errors="replace") if content is None else content
     for line_no, raw_line in enumerate(text.splitlines(), start=1):
         line = raw_line.strip()
         if not line:
@@ -321,9 +353,9 @@ def _parse_codex_transcription_jsonl(path: Path) -> Iterator[dict]:
         }
 
 
-def _parse_codex_history_jsonl(path: Path) -> Iterator[dict]:
+def _parse_codex_history_jsonl(path: Path, content: Optional[str] = None) -> Iterator[dict]:
     """Parse ~/.codex/history.jsonl — each line is a user prompt with session_id/ts/text."""
-    text = path.read_text(encoding="utf-8", errors="replace")
+    text = path.read_text(encoding="utf-8", errors="replace") if content is None else content
     for line_no, raw_line in enumerate(text.splitlines(), start=1):
         line = raw_line.strip()
         if not line:
@@ -347,10 +379,10 @@ def _parse_codex_history_jsonl(path: Path) -> Iterator[dict]:
         }
 
 
-def _parse_manual_export(path: Path) -> Iterator[dict]:
+def _parse_manual_export(path: Path, content: Optional[str] = None) -> Iterator[dict]:
     """Best-effort parser for a user-provided JSONL or text file."""
     if path.suffix == ".jsonl":
-        text = path.read_text(encoding="utf-8", errors="replace")
+        text = path.read_text(encoding="utf-8", errors="replace") if content is None else content
         for line_no, raw_line in enumerate(text.splitlines(), start=1):
             line = raw_line.strip()
             if not line:
@@ -379,7 +411,7 @@ def _parse_manual_export(path: Path) -> Iterator[dict]:
             }
     else:
         # Plain text: one message per paragraph, all user.
-        text = path.read_text(encoding="utf-8", errors="replace")
+        text = path.read_text(encoding="utf-8", errors="replace") if content is None else content
         for idx, paragraph in enumerate(text.split("\n\n"), start=1):
             if paragraph.strip():
                 yield {
@@ -390,6 +422,82 @@ def _parse_manual_export(path: Path) -> Iterator[dict]:
                 }
 
 
+# ---------------------------------------------------------------------------
+# Parallel parsing and the parse cache
+# ---------------------------------------------------------------------------
+
+_PARSERS = {
+    "claude_project_session": _parse_claude_project_jsonl,
+    "claude_command_history": _parse_claude_command_history_jsonl,
+    "codex_transcription": _parse_codex_transcription_jsonl,
+    "codex_history": _parse_codex_history_jsonl,
+    "manual_export": _parse_manual_export,
+}
+
+# Bump whenever a parser's output changes, so stale cache entries are ignored.
+_PARSE_CACHE_VERSION = 1
+_MESSAGE_FIELDS = ("role", "timestamp", "text", "source_line")
+
+
+def _parse_cache_path(cache_dir: Path, source_type: str, path: Path, digest: str) -> Path:
+    # Manual exports parse differently by suffix, so the flavour is part of the key.
+    flavour = ("-jsonl" if path.suffix == ".jsonl" else "-text") if source_type == "manual_export" else ""
+    return cache_dir / f"v{_PARSE_CACHE_VERSION}-{source_type}{flavour}-{digest}.json.gz"
+
+
+def _load_source(source_type: str, path_str: str, cache_dir_str: Optional[str]) -> dict:
+    """Read, hash and parse one source file in a single pass over its bytes.
+
+    The parsed messages are stored column-wise in a gzip file named after the
+    content hash, so an unchanged file is never parsed twice. Returns
+    ``sha256``, ``size_bytes``, ``messages`` and ``cached``, or ``error``.
+    Runs in pool workers, hence plain arguments and no raised exceptions.
+    """
+    path = Path(path_str)
+    try:
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        cache_path = None
+        if cache_dir_str is not None:
+            cache_path = _parse_cache_path(Path(cache_dir_str), source_type, path, digest)
+            try:
+                with gzip.open(cache_path, "rt", encoding="utf-8") as handle:
+                    columns = json.load(handle)
+                messages = [dict(zip(_MESSAGE_FIELDS, row)) for row in zip(*columns)]
+                return {"sha256": digest, "size_bytes": len(data), "messages": messages, "cached": True}
+            except (OSError, EOFError, ValueError, TypeError):
+                pass
+
+        # Same decoding as Path.read_text(errors="replace"), newline translation included.
+        text = data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+        messages = list(_PARSERS[source_type](path, text))
+        if cache_path is not None:
+            columns = [[msg[field] for msg in messages] for field in _MESSAGE_FIELDS]
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=1) as handle:
+                json.dump(columns, handle, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, cache_path)
+        return {"sha256": digest, "size_bytes": len(data), "messages": messages, "cached": False}
+    except Exception as exc:
+        return {"error": str(exc)}
+
+
+def _load_sources(sources: list[dict], cache_dir: Optional[Path], jobs: int) -> list[dict]:
+    """Run _load_source for every source, on a process pool when jobs > 1."""
+    cache_arg = str(cache_dir) if cache_dir is not None else None
+    args = (
+        [source["type"] for source in sources],
+        [source["path"] for source in sources],
+        [cache_arg] * len(sources),
+    )
+    workers = min(jobs, len(sources))
+    if workers <= 1:
+        return list(map(_load_source, *args))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_load_source, *args))
+
+
 # ---------------------------------------------------------------------------
 # Source discovery
 # ---------------------------------------------------------------------------
@@ -547,9 +655,11 @@ def _chunk_messages(messages: list[dict], chunk_tokens: int, counter) -> list[di
     current_tokens = 0
     current_sources: set[str] = set()
     start_idx = 0
+    encode = getattr(counter, "encode", None)
 
     for idx, msg in enumerate(messages):
-        msg_tokens = counter(msg["text"])
+        tokens = encode(msg["text"]) if encode is not None else None
+        msg_tokens = len(tokens) if tokens is not None else counter(msg["text"])
         # If a single message exceeds the chunk, split it.
         if msg_tokens > chunk_tokens:
             if current:
@@ -559,9 +669,8 @@ def _chunk_messages(messages: list[dict], chunk_tokens: int, counter) -> list[di
                 current_sources = set()
                 start_idx = idx
 
-            for part in _split_text_by_token_budget(msg["text"], chunk_tokens, counter):
+            for part, part_tokens in _split_counted(msg["text"], chunk_tokens, counter, tokens):
                 part_msg = {**msg, "text": part, "chunk_part": True}
-                part_tokens = counter(part)
                 chunks.append(_make_chunk([part_msg], idx, idx, part_tokens, {msg["source"]}))
             continue
 
@@ -584,6 +693,96 @@ def _chunk_messages(messages: list[dict], chunk_tokens: int, counter) -> list[di
 
 def _split_text_by_token_budget(text: str, chunk_tokens: int, counter) -> list[str]:
     """Split text losslessly so every part satisfies the real token counter."""
+    return [part for part, _ in _split_counted(text, chunk_tokens, counter)]
+
+
+def _split_counted(
+    text: str, chunk_tokens: int, counter, tokens: Optional[list[int]] = None
+) -> list[tuple[str, int]]:
+    """Split text losslessly into (part, token count) pairs within chunk_tokens.
+
+    With a TokenCounter the text is encoded once (or *tokens* is reused) and
+    each cut is placed on a token byte offset, backed off to a UTF-8
+    character boundary. Re-encoding a part can differ from its token slice
+    near the edges, so every part is still counted once with the real
+    counter and trimmed by the overshoot until it fits. Other counters fall
+    back to a binary search over prefixes.
+    """
+    offsets_of = getattr(counter, "token_byte_offsets", None)
+    try:
+        data = text.encode("utf-8")
+    except UnicodeEncodeError:
+        offsets_of = None
+    if offsets_of is None:
+        return [(part, counter(part)) for part in _split_by_prefix_search(text, chunk_tokens, counter)]
+
+    if tokens is None:
+        tokens = counter.encode(text)
+    offsets = offsets_of(tokens)
+    size = len(data)
+
+    def is_continuation(position: int) -> bool:
+        return position < size and (data[position] & 0xC0) == 0x80
+
+    parts: list[tuple[str, int]] = []
+    start = 0
+    first_token = 0
+    while start < size:
+        # First token that ends after `start`; a cut may have landed mid-token.
+        while offsets[first_token + 1] <= start:
+            first_token += 1
+        end_token = min(len(tokens), first_token + chunk_tokens)
+        while True:
+            end = max(start, offsets[end_token])
+            while end > start and is_continuation(end):
+                end -= 1
+            single_char = end == start
+            if single_char:
+                end = start + 1
+                while is_continuation(end):
+                    end += 1
+            part = data[start:end].decode("utf-8")
+            part_tokens = counter(part)
+            if part_tokens <= chunk_tokens:
+                break
+            if single_char:
+                raise ValueError(
+                    "partitioning.chunk_tokens is too small to encode one character losslessly"
+                )
+            end_token = max(first_token, end_token - (part_tokens - chunk_tokens))
+
+        # Grow to the longest prefix that fits, as the prefix search would:
+        # jump by the token shortfall while there is one, then step by
+        # single characters.
+        jump = True
+        while end < size:
+            char_end = end + 1
+            while is_continuation(char_end):
+                char_end += 1
+            next_end = char_end
+            if jump and part_tokens < chunk_tokens - 1:
+                while offsets[end_token] < char_end:
+                    end_token += 1
+                ahead = offsets[min(len(tokens), end_token + chunk_tokens - part_tokens - 1)]
+                while ahead > char_end and is_continuation(ahead):
+                    ahead -= 1
+                next_end = max(char_end, ahead)
+            candidate = data[start:next_end].decode("utf-8")
+            candidate_tokens = counter(candidate)
+            if candidate_tokens > chunk_tokens:
+                if next_end == char_end:
+                    break
+                jump = False
+                continue
+            part, part_tokens, end = candidate, candidate_tokens, next_end
+        parts.append((part, part_tokens))
+        start = end
+
+    return parts
+
+
+def _split_by_prefix_search(text: str, chunk_tokens: int, counter) -> list[str]:
+    """Split text by binary-searching the longest prefix that fits the counter."""
     parts: list[str] = []
     start = 0
     while start < len(text):
@@ -680,6 +879,13 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser.add_argument("--manifest", required=True, type=Path, help="Path to conversation_history_manifest.json")
     parser.add_argument("--output", required=True, type=Path, help="Enrichment output directory (e.g. <skill>/.enrich/<timestamp>)")
     parser.add_argument("--discover-only", action="store_true", help="Only discover sources and write manifest, no chunks")
+    parser.add_argument(
+        "--parse-cache",
+        type=Path,
+        help="Directory for per-file parsed messages keyed by content hash; "
+        "holds unredacted text, so keep it as private as the transcripts",
+    )
+    parser.add_argument("--jobs", type=int, default=0, help="Parser processes (default: one per CPU)")
     parser.add_argument("--verbose", action="store_true", help="Print progress")
     args = parser.parse_args(argv)
 
@@ -737,16 +943,16 @@ def main(argv: Optional[list[str]] = None) -> int:
     if args.verbose:
         print(f"Discovered {len(sources)} source files")
 
-    # Hash sources and enrich descriptors
-    for index, s in enumerate(sources, start=1):
-        p = Path(s["path"])
-        s["source_id"] = f"source-{index:03d}"
-        s["sha256"] = _hash_file(p)
-        s["size_bytes"] = p.stat().st_size
-    public_sources = [_public_source_descriptor(source) for source in sources]
+    for index, source in enumerate(sources, start=1):
+        source["source_id"] = f"source-{index:03d}"
     manifest_hash = _hash_file(args.manifest)
 
     if args.discover_only:
+        for source in sources:
+            p = Path(source["path"])
+            source["sha256"] = _hash_file(p)
+            source["size_bytes"] = p.stat().st_size
+        public_sources = [_public_source_descriptor(source) for source in sources]
         discovery_manifest = {
             "version": "1.0",
             "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -770,29 +976,32 @@ def main(argv: Optional[list[str]] = None) -> int:
     logs_dir = output_dir / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
 
+    # Hash and parse each source in one read; unchanged files come from the cache.
+    if args.parse_cache is not None:
+        args.parse_cache.mkdir(parents=True, exist_ok=True)
+        _protect_enrichment_artifacts(args.parse_cache)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    loaded = _load_sources(sources, args.parse_cache, jobs)
+
     all_messages: list[dict] = []
-    parser_map = {
-        "claude_project_session": _parse_claude_project_jsonl,
-        "claude_command_history": _parse_claude_command_history_jsonl,
-        "codex_transcription": _parse_codex_transcription_jsonl,
-        "codex_history": _parse_codex_history_jsonl,
-        "manual_export": _parse_manual_export,
-    }
-    for source in sources:
-        parser = parser_map[source["type"]]
-        path = Path(source["path"])
-        try:
-            for msg in parser(path):
-                msg["source_type"] = source["type"]
-                msg["source"] = source["source_id"]
-                if source["type"] == "claude_project_session" and not _message_in_window(
-                    msg, since_dt, until_dt
-                ):
-                    continue
-                all_messages.append(msg)
-        except Exception as e:
-            print(f"Failed to parse declared source {source['source_id']}: {e}", file=sys.stderr)
+    for source, result in zip(sources, loaded):
+        if "error" in result:
+            print(f"Failed to parse declared source {source['source_id']}: {result['error']}", file=sys.stderr)
             return 1
+        source["sha256"] = result["sha256"]
+        source["size_bytes"] = result["size_bytes"]
+        for msg in result["messages"]:
+            msg["source_type"] = source["type"]
+            msg["source"] = source["source_id"]
+            if source["type"] == "claude_project_session" and not _message_in_window(
+                msg, since_dt, until_dt
+            ):
+                continue
+            all_messages.append(msg)
+    public_sources = [_public_source_descriptor(source) for source in sources]
+    if args.verbose:
+        cached = sum(1 for result in loaded if result["cached"])
+        print(f"Parsed {len(sources) - cached} source files; {cached} from the parse cache")
 
     # Sort by timestamp if available; otherwise keep source order
     all_messages.sort(key=lambda m: (m.get("timestamp") or "", m.get("source_line", 0)))
@@ -6,6 +6,7 @@ for a set of queries. Outputs results as JSON.
 """
 
 import argparse
+import hashlib
 import json
 import os
 import select
@@ -13,7 +14,9 @@ import subprocess
 import sys
 import time
 import uuid
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
 from pathlib import Path
 
 from scripts.utils import parse_skill_md
@@ -32,24 +35,15 @@ def find_project_root() -> Path:
     return current
 
 
-def run_single_query(
-    query: str,
-    skill_name: str,
-    skill_description: str,
-    timeout: int,
-    project_root: str,
-    model: str | None = None,
-) -> bool:
-    """Run a single query and return whether the skill was triggered.
+@contextmanager
+def skill_command_file(project_root: str, skill_name: str, skill_description: str):
+    """Write a uniquely named command file for the description; yield its name.
 
-    Creates a command file in .claude/commands/ so it appears in Claude's
-    available_skills list, then runs `claude -p` with the raw query.
-    Uses --include-partial-messages to detect triggering early from
-    stream events (content_block_start) rather than waiting for the
-    full assistant message, which only arrives after tool execution.
+    The file lives in .claude/commands/ so it appears in Claude's
+    available_skills list, and is removed on exit. One file can serve any
+    number of concurrent queries against the same description.
     """
-    unique_id = uuid.uuid4().hex[:8]
-    clean_name = f"{skill_name}-skill-{unique_id}"
+    clean_name = f"{skill_name}-skill-{uuid.uuid4().hex[:8]}"
     project_commands_dir = Path(project_root) / ".claude" / "commands"
     command_file = project_commands_dir / f"{clean_name}.md"
 
@@ -66,119 +60,202 @@ def run_single_query(
             f"This skill handles: {skill_description}\n"
         )
         command_file.write_text(command_content)
+        yield clean_name
+    finally:
+        if command_file.exists():
+            command_file.unlink()
 
-        cmd = [
-            "claude",
-            "-p", query,
-            "--output-format", "stream-json",
-            "--verbose",
-            "--include-partial-messages",
-        ]
-        if model:
-            cmd.extend(["--model", model])
-
-        # Remove CLAUDECODE env var to allow nesting claude -p inside a
-        # Claude Code session. The guard is for interactive terminal conflicts;
-        # programmatic subprocess usage is safe.
-        env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
-
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.DEVNULL,
-            cwd=project_root,
-            env=env,
-        )
 
-        triggered = False
-        start_time = time.time()
-        buffer = ""
-        # Track state for stream event detection
-        pending_tool_name = None
-        accumulated_json = ""
-
-        try:
-            while time.time() - start_time < timeout:
-                if process.poll() is not None:
-                    remaining = process.stdout.read()
-                    if remaining:
-                        buffer += remaining.decode("utf-8", errors="replace")
-                    break
+def run_single_query(
+    query: str,
+    skill_name: str,
+    skill_description: str,
+    timeout: int,
+    project_root: str,
+    model: str | None = None,
+    command_name: str | None = None,
+) -> bool:
+    """Run a single query and return whether the skill was triggered.
 
-                ready, _, _ = select.select([process.stdout], [], [], 1.0)
-                if not ready:
-                    continue
+    Runs `claude -p` with the raw query against the command file named
+    *command_name* (see skill_command_file); without one, a file is
+    created for this query alone. Uses --include-partial-messages to
+    detect triggering early from stream events (content_block_start)
+    rather than waiting for the full assistant message, which only
+    arrives after tool execution.
+    """
+    if command_name is None:
+        with skill_command_file(project_root, skill_name, skill_description) as name:
+            return run_single_query(
+                query, skill_name, skill_description, timeout, project_root, model, name
+            )
+
+    clean_name = command_name
+    cmd = [
+        "claude",
+        "-p", query,
+        "--output-format", "stream-json",
+        "--verbose",
+        "--include-partial-messages",
+    ]
+    if model:
+        cmd.extend(["--model", model])
+
+    # Remove CLAUDECODE env var to allow nesting claude -p inside a
+    # Claude Code session. The guard is for interactive terminal conflicts;
+    # programmatic subprocess usage is safe.
+    env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        cwd=project_root,
+        env=env,
+    )
 
-                chunk = os.read(process.stdout.fileno(), 8192)
-                if not chunk:
-                    break
-                buffer += chunk.decode("utf-8", errors="replace")
+    triggered = False
+    start_time = time.time()
+    buffer = ""
+    # Track state for stream event detection
+    pending_tool_name = None
+    accumulated_json = ""
 
-                while "\n" in buffer:
-                    line, buffer = buffer.split("\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
+    try:
+        while time.time() - start_time < timeout:
+            if process.poll() is not None:
+                remaining = process.stdout.read()
+                if remaining:
+                    buffer += remaining.decode("utf-8", errors="replace")
+                break
+
+            ready, _, _ = select.select([process.stdout], [], [], 1.0)
+            if not ready:
+                continue
+
+            chunk = os.read(process.stdout.fileno(), 8192)
+            if not chunk:
+                break
+            buffer += chunk.decode("utf-8", errors="replace")
+
+            while "\n" in buffer:
+                line, buffer = buffer.split("\n", 1)
+                line = line.strip()
+                if not line:
+                    continue
 
-                    try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
 
-                    # Early detection via stream events
-                    if event.get("type") == "stream_event":
-                        se = event.get("event", {})
-                        se_type = se.get("type", "")
-
-                        if se_type == "content_block_start":
-                            cb = se.get("content_block", {})
-                            if cb.get("type") == "tool_use":
-                                tool_name = cb.get("name", "")
-                                if tool_name in ("Skill", "Read"):
-                                    pending_tool_name = tool_name
-                                    accumulated_json = ""
-                                else:
-                                    return False
-
-                        elif se_type == "content_block_delta" and pending_tool_name:
-                            delta = se.get("delta", {})
-                            if delta.get("type") == "input_json_delta":
-                                accumulated_json += delta.get("partial_json", "")
-                                if clean_name in accumulated_json:
-                                    return True
-
-                        elif se_type in ("content_block_stop", "message_stop"):
-                            if pending_tool_name:
-                                return clean_name in accumulated_json
-                            if se_type == "message_stop":
+                # Early detection via stream events
+                if event.get("type") == "stream_event":
+                    se = event.get("event", {})
+                    se_type = se.get("type", "")
+
+                    if se_type == "content_block_start":
+                        cb = se.get("content_block", {})
+                        if cb.get("type") == "tool_use":
+                            tool_name = cb.get("name", "")
+                            if tool_name in ("Skill", "Read"):
+                                pending_tool_name = tool_name
+                                accumulated_json = ""
+                            else:
                                 return False
 
-                    # Fallback: full assistant message
-                    elif event.get("type") == "assistant":
-                        message = event.get("message", {})
-                        for content_item in message.get("content", []):
-                            if content_item.get("type") != "tool_use":
-                                continue
-                            tool_name = content_item.get("name", "")
-                            tool_input = content_item.get("input", {})
-                            if tool_name == "Skill" and clean_name in tool_input.get("skill", ""):
-                                triggered = True
-                            elif tool_name == "Read" and clean_name in tool_input.get("file_path", ""):
-                                triggered = True
-                            return triggered
-
-                    elif event.get("type") == "result":
+                    elif se_type == "content_block_delta" and pending_tool_name:
+                        delta = se.get("delta", {})
+                        if delta.get("type") == "input_json_delta":
+                            accumulated_json += delta.get("partial_json", "")
+                            if clean_name in accumulated_json:
+                                return True
+
+                    elif se_type in ("content_block_stop", "message_stop"):
+                        if pending_tool_name:
+                            return clean_name in accumulated_json
+                        if se_type == "message_stop":
+                            return False
+
+                # Fallback: full assistant message
+                elif event.get("type") == "assistant":
+                    message = event.get("message", {})
+                    for content_item in message.get("content", []):
+                        if content_item.get("type") != "tool_use":
+                            continue
+                        tool_name = content_item.get("name", "")
+                        tool_input = content_item.get("input", {})
+                        if tool_name == "Skill" and clean_name in tool_input.get("skill", ""):
+                            triggered = True
+                        elif tool_name == "Read" and clean_name in tool_input.get("file_path", ""):
+                            triggered = True
                         return triggered
-        finally:
-            # Clean up process on any exit path (return, exception, timeout)
-            if process.poll() is None:
-                process.kill()
-                process.wait()
 
-        return triggered
+                elif event.get("type") == "result":
+                    return triggered
     finally:
-        if command_file.exists():
-            command_file.unlink()
+        # Clean up process on any exit path (return, exception, timeout)
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+    return triggered
+
+
+class TriggerCache:
+    """Outcomes of finished runs, keyed by (description hash, query, model, run index).
+
+    A description that comes back in a later iteration -- or in a later
+    invocation, when *path* is given -- reuses every run already measured
+    for it instead of paying for another `claude -p` call. Errored runs are
+    never stored, so they are retried.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self._entries: dict[str, bool] = {}
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, json.JSONDecodeError):
+                data = {}
+            if isinstance(data, dict):
+                self._entries = {k: v for k, v in data.items() if isinstance(v, bool)}
+
+    @staticmethod
+    def key(skill_name: str, description: str, query: str, model: str | None, run_idx: int) -> str:
+        digest = hashlib.sha256(f"{skill_name}\n{description}".encode("utf-8")).hexdigest()[:16]
+        return json.dumps([digest, query, model or "", run_idx], ensure_ascii=False)
+
+    def get(self, key: str) -> bool | None:
+        return self._entries.get(key)
+
+    def put(self, key: str, triggered: bool) -> None:
+        self._entries[key] = triggered
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(self._entries, ensure_ascii=False))
+        tmp.replace(self.path)
+
+
+def outcome_settled(triggers: int, runs: int, runs_per_query: int, trigger_threshold: float) -> bool:
+    """True once the remaining runs can no longer move the trigger rate across the threshold.
+
+    The final rate lies between triggers/N (every remaining run misses) and
+    (triggers + remaining)/N (every one fires); pass/fail is fixed when both
+    bounds fall on the same side of *trigger_threshold*.
+    """
+    if runs == 0:
+        return False
+    remaining = runs_per_query - runs
+    return (
+        triggers / runs_per_query >= trigger_threshold
+        or (triggers + remaining) / runs_per_query < trigger_threshold
+    )
 
 
 def run_eval(
@@ -191,44 +268,91 @@ def run_eval(
     runs_per_query: int = 1,
     trigger_threshold: float = 0.5,
     model: str | None = None,
+    cache: TriggerCache | None = None,
+    early_stop: bool = True,
 ) -> dict:
-    """Run the full eval set and return results."""
-    results = []
+    """Run the full eval set and return results.
 
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
-        future_to_info = {}
-        for item in eval_set:
-            for run_idx in range(runs_per_query):
-                future = executor.submit(
-                    run_single_query,
-                    item["query"],
-                    skill_name,
-                    description,
-                    timeout,
-                    str(project_root),
-                    model,
-                )
-                future_to_info[future] = (item, run_idx)
-
-        query_triggers: dict[str, list[bool]] = {}
-        query_errors: dict[str, int] = {}
-        query_items: dict[str, dict] = {}
-        error_count = 0
-        for future in as_completed(future_to_info):
-            item, _ = future_to_info[future]
-            query = item["query"]
-            query_items[query] = item
-            if query not in query_triggers:
-                query_triggers[query] = []
-                query_errors[query] = 0
-            try:
-                query_triggers[query].append(future.result())
-            except Exception as e:
-                print(f"Warning: query failed: {e}", file=sys.stderr)
-                query_triggers[query].append(False)
-                query_errors[query] += 1
-                error_count += 1
+    Runs are scheduled run-index-major with at most *num_workers* in flight,
+    so a query's later runs only start once its earlier ones are known. With
+    *early_stop*, runs that could no longer flip a query's pass/fail are
+    skipped; runs found in *cache* are not repeated. ``stats`` in the result
+    reports the calls made and saved.
+    """
+    start = time.time()
+    query_items: dict[str, dict] = {}
+    for item in eval_set:
+        query_items.setdefault(item["query"], item)
+    query_triggers: dict[str, list[bool]] = {query: [] for query in query_items}
+    query_errors: dict[str, int] = {query: 0 for query in query_items}
+    error_count = 0
+    cached = 0
+    skipped = 0
+    calls = 0
+
+    pending: deque[tuple[str, int]] = deque()
+    for run_idx in range(runs_per_query):
+        for query in query_items:
+            hit = None
+            if cache is not None:
+                hit = cache.get(TriggerCache.key(skill_name, description, query, model, run_idx))
+            if hit is None:
+                pending.append((query, run_idx))
+            else:
+                query_triggers[query].append(hit)
+                cached += 1
+
+    def settled(query: str) -> bool:
+        triggers = query_triggers[query]
+        return early_stop and outcome_settled(
+            sum(triggers), len(triggers), runs_per_query, trigger_threshold
+        )
+
+    if pending:
+        with skill_command_file(str(project_root), skill_name, description) as command_name, \
+                ProcessPoolExecutor(max_workers=num_workers) as executor:
+            running = {}
+            while pending or running:
+                while pending and len(running) < num_workers:
+                    query, run_idx = pending.popleft()
+                    if settled(query):
+                        skipped += 1
+                        continue
+                    future = executor.submit(
+                        run_single_query,
+                        query,
+                        skill_name,
+                        description,
+                        timeout,
+                        str(project_root),
+                        model,
+                        command_name,
+                    )
+                    running[future] = (query, run_idx)
+                    calls += 1
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    query, run_idx = running.pop(future)
+                    try:
+                        triggered = future.result()
+                    except Exception as e:
+                        print(f"Warning: query failed: {e}", file=sys.stderr)
+                        triggered = False
+                        query_errors[query] += 1
+                        error_count += 1
+                    else:
+                        if cache is not None:
+                            key = TriggerCache.key(skill_name, description, query, model, run_idx)
+                            cache.put(key, triggered)
+                    query_triggers[query].append(triggered)
+
+    if cache is not None:
+        cache.save()
 
+    results = []
     for query, triggers in query_triggers.items():
         item = query_items[query]
         trigger_rate = sum(triggers) / len(triggers)
@@ -260,6 +384,14 @@ def run_eval(
             "passed": passed,
             "failed": total - passed,
         },
+        "stats": {
+            "runs_planned": total * runs_per_query,
+            "calls": calls,
+            "cached": cached,
+            "skipped_settled": skipped,
+            "calls_saved": cached + skipped,
+            "wall_seconds": round(time.time() - start, 1),
+        },
     }
 
 
@@ -273,6 +405,8 @@ def main():
     parser.add_argument("--runs-per-query", type=int, default=3, help="Number of runs per query")
     parser.add_argument("--trigger-threshold", type=float, default=0.5, help="Trigger rate threshold")
     parser.add_argument("--model", default=None, help="Model to use for claude -p (default: user's configured model)")
+    parser.add_argument("--cache", default=None, help="JSON file of finished runs to reuse and extend (keyed by description, query, model, run index)")
+    parser.add_argument("--no-early-stop", action="store_true", help="Always make every run, even once a query's pass/fail can no longer change")
     parser.add_argument("--verbose", action="store_true", help="Print progress to stderr")
     args = parser.parse_args()
 
@@ -300,11 +434,19 @@ def main():
         runs_per_query=args.runs_per_query,
         trigger_threshold=args.trigger_threshold,
         model=args.model,
+        cache=TriggerCache(Path(args.cache)) if args.cache else None,
+        early_stop=not args.no_early_stop,
     )
 
     if args.verbose:
         summary = output["summary"]
+        stats = output["stats"]
         print(f"Results: {summary['passed']}/{summary['total']} passed", file=sys.stderr)
+        print(
+            f"Calls: {stats['calls']}/{stats['runs_planned']} made, {stats['cached']} cached, "
+            f"{stats['skipped_settled']} skipped as settled ({stats['wall_seconds']}s)",
+            file=sys.stderr,
+        )
         for r in output["results"]:
             status = "PASS" if r["pass"] else "FAIL"
             rate_str = f"{r['triggers']}/{r['runs']}"
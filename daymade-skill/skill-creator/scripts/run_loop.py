@@ -17,7 +17,7 @@ from pathlib import Path
 
 from scripts.generate_report import generate_html
 from scripts.improve_description import improve_description
-from scripts.run_eval import find_project_root, run_eval
+from scripts.run_eval import TriggerCache, find_project_root, run_eval
 from scripts.utils import parse_skill_md
 
 
@@ -58,9 +58,15 @@ def run_loop(
     verbose: bool,
     live_report_path: Path | None = None,
     log_dir: Path | None = None,
+    eval_cache_path: Path | None = None,
 ) -> dict:
-    """Run the eval + improvement loop."""
+    """Run the eval + improvement loop.
+
+    One TriggerCache spans every iteration, so a description that comes back
+    is not re-measured; *eval_cache_path* extends that across invocations.
+    """
     project_root = find_project_root()
+    eval_cache = TriggerCache(eval_cache_path)
     name, original_description, content = parse_skill_md(skill_path)
     current_description = description_override or original_description
 
@@ -96,8 +102,14 @@ def run_loop(
             runs_per_query=runs_per_query,
             trigger_threshold=trigger_threshold,
             model=model,
+            cache=eval_cache,
+            # Iteration 1 makes every run: the degenerate-harness guard below
+            # reads "zero triggers across all runs_per_query repeats" as its
+            # signal, and stopping a silent query after two misses weakens it.
+            early_stop=iteration > 1,
         )
         eval_elapsed = time.time() - t0
+        eval_stats = all_results.get("stats", {})
 
         # Split results back into train/test by matching queries
         train_queries_set = {q["query"] for q in train_set}
@@ -134,6 +146,9 @@ def run_loop(
             "failed": train_summary["failed"],
             "total": train_summary["total"],
             "results": train_results["results"],
+            "eval_seconds": round(eval_elapsed, 1),
+            "eval_calls": eval_stats.get("calls"),
+            "eval_calls_saved": eval_stats.get("calls_saved"),
         })
 
         # Write live report if path provided
@@ -173,6 +188,13 @@ def run_loop(
             print_eval_stats("Train", train_results["results"], eval_elapsed)
             if test_summary:
                 print_eval_stats("Test ", test_results["results"], 0)
+            if eval_stats:
+                print(
+                    f"Calls: {eval_stats['calls']}/{eval_stats['runs_planned']} made, "
+                    f"{eval_stats['calls_saved']} saved ({eval_stats['cached']} cached, "
+                    f"{eval_stats['skipped_settled']} settled early)",
+                    file=sys.stderr,
+                )
 
         # Degenerate-harness / infra-error guard: iteration 1 is the cheapest
         # point to catch "this run measured nothing" before paying for 2-5.
@@ -296,6 +318,8 @@ def run_loop(
         "holdout": holdout,
         "train_size": len(train_set),
         "test_size": len(test_set),
+        "eval_calls": sum(h["eval_calls"] or 0 for h in history),
+        "eval_calls_saved": sum(h["eval_calls_saved"] or 0 for h in history),
         "history": history,
     }
 
@@ -315,6 +339,7 @@ def main():
     parser.add_argument("--verbose", action="store_true", help="Print progress to stderr")
     parser.add_argument("--report", default="auto", help="Generate HTML report at this path (default: 'auto' for temp file, 'none' to disable)")
     parser.add_argument("--results-dir", default=None, help="Save all outputs (results.json, report.html, log.txt) to a timestamped subdirectory here")
+    parser.add_argument("--eval-cache", default=None, help="JSON file of finished trigger runs to reuse and extend across invocations")
     args = parser.parse_args()
 
     eval_set = json.loads(Path(args.eval_set).read_text())
@@ -363,6 +388,7 @@ def main():
         verbose=args.verbose,
         live_report_path=live_report_path,
         log_dir=log_dir,
+        eval_cache_path=Path(args.eval_cache) if args.eval_cache else None,
     )
 
     # Save JSON output
@@ -0,0 +1,162 @@
+"""Tests for the eval-viewer review server's manifest and /files/<hash> streaming.
+
+A real ThreadingHTTPServer runs on an ephemeral port against a temporary
+workspace, so the handler's headers, Range handling, and ETag revalidation
+are exercised end to end. Static export is checked to still embed everything.
+
+Run with:
+    uv run --with pytest python -m pytest tests/test_generate_review.py -q
+"""
+
+import base64
+import hashlib
+import importlib.util
+import json
+import threading
+import urllib.error
+import urllib.request
+from functools import partial
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "eval-viewer" / "generate_review.py"
+_spec = importlib.util.spec_from_file_location("generate_review", MODULE_PATH)
+generate_review = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(generate_review)
+
+IMAGE = bytes(range(256)) * 40
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    outputs = tmp_path / "ws" / "eval-1" / "with_skill" / "outputs"
+    outputs.mkdir(parents=True)
+    (outputs / "notes.md").write_text("# hello\n", encoding="utf-8")
+    (outputs / "chart.png").write_bytes(IMAGE)
+    (outputs / "metrics.json").write_text("{}", encoding="utf-8")
+    (outputs.parent / "eval_metadata.json").write_text(
+        json.dumps({"prompt": "draw a chart", "eval_id": 1}), encoding="utf-8"
+    )
+    return tmp_path / "ws"
+
+
+@pytest.fixture
+def server(workspace):
+    index = generate_review.FileIndex()
+    handler = partial(
+        generate_review.ReviewHandler, workspace, "demo", workspace / "feedback.json",
+        {}, None, index,
+    )
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}", index
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _get(url, method="GET", **headers):
+    request = urllib.request.Request(url, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(request) as resp:
+            return resp.status, resp.headers, resp.read()
+    except urllib.error.HTTPError as err:
+        return err.code, err.headers, err.read()
+
+
+def _manifest_outputs(base):
+    status, _, body = _get(base + "/api/manifest")
+    assert status == 200
+    (run,) = json.loads(body)["runs"]
+    return {entry["name"]: entry for entry in run["outputs"]}
+
+
+def test_manifest_lists_hashes_instead_of_file_bytes(server):
+    base, _ = server
+    outputs = _manifest_outputs(base)
+    assert set(outputs) == {"chart.png", "notes.md"}
+    chart = outputs["chart.png"]
+    digest = hashlib.sha256(IMAGE).hexdigest()
+    assert chart == {
+        "name": "chart.png", "type": "image", "mime": "image/png", "size": len(IMAGE),
+        "hash": digest, "url": f"/files/{digest}",
+    }
+    assert outputs["notes.md"]["type"] == "text" and "content" not in outputs["notes.md"]
+
+    status, _, page = _get(base + "/")
+    assert status == 200 and len(page) < 200_000
+    assert base64.b64encode(IMAGE[:300]) not in page
+
+
+def test_files_stream_with_ranges_and_etags(server):
+    base, _ = server
+    chart = _manifest_outputs(base)["chart.png"]
+    url = base + chart["url"]
+
+    status, headers, body = _get(url)
+    assert (status, body) == (200, IMAGE)
+    assert headers["ETag"] == f'"{chart["hash"]}"'
+    assert headers["Accept-Ranges"] == "bytes"
+    assert headers["Content-Type"] == "image/png"
+
+    status, headers, body = _get(url, Range="bytes=100-199")
+    assert (status, body) == (206, IMAGE[100:200])
+    assert headers["Content-Range"] == f"bytes 100-199/{len(IMAGE)}"
+    assert _get(url, Range="bytes=-10")[2] == IMAGE[-10:]
+    assert _get(url, Range="bytes=10000-")[2] == IMAGE[10000:]
+
+    status, headers, _ = _get(url, Range=f"bytes={len(IMAGE)}-")
+    assert status == 416 and headers["Content-Range"] == f"bytes */{len(IMAGE)}"
+    assert _get(url, Range="bytes=0-9", **{"If-Range": '"stale"'})[0] == 200
+
+    status, _, body = _get(url, **{"If-None-Match": f'"{chart["hash"]}"'})
+    assert (status, body) == (304, b"")
+    status, headers, body = _get(url, method="HEAD")
+    assert status == 200 and body == b"" and headers["Content-Length"] == str(len(IMAGE))
+
+
+def test_changed_files_get_a_new_hash_and_old_urls_stop_resolving(server, workspace):
+    base, index = server
+    old = _manifest_outputs(base)["chart.png"]
+    chart = workspace / "eval-1" / "with_skill" / "outputs" / "chart.png"
+    chart.write_bytes(b"new image bytes")
+
+    new = _manifest_outputs(base)["chart.png"]
+    assert new["hash"] != old["hash"]
+    assert _get(base + new["url"])[2] == b"new image bytes"
+    assert _get(base + old["url"])[0] == 404
+    assert _get(base + "/files/" + "0" * 64)[0] == 404
+    assert index.lookup(new["hash"]) == chart.resolve()
+
+
+def test_unchanged_files_are_not_rehashed(workspace, monkeypatch):
+    index = generate_review.FileIndex()
+    generate_review.find_runs(workspace, index.describe)
+    monkeypatch.setattr(index, "_hash", lambda path: pytest.fail(f"rehashed {path}"))
+    runs = generate_review.find_runs(workspace, index.describe)
+    assert {entry["name"] for entry in runs[0]["outputs"]} == {"chart.png", "notes.md"}
+
+
+def test_static_export_still_embeds_files(workspace):
+    runs = generate_review.find_runs(workspace)
+    outputs = {entry["name"]: entry for entry in runs[0]["outputs"]}
+    assert outputs["notes.md"]["content"] == "# hello\n"
+    assert outputs["chart.png"]["data_uri"].endswith(base64.b64encode(IMAGE).decode())
+    assert "url" not in outputs["chart.png"]
+
+
+def test_parse_range():
+    parse = generate_review.parse_range
+    assert parse(None, 10) is None
+    assert parse("bytes=2-4", 10) == (2, 4)
+    assert parse("bytes=5-", 10) == (5, 9)
+    assert parse("bytes=-3", 10) == (7, 9)
+    assert parse("bytes=0-99", 10) == (0, 9)
+    assert parse("bytes=-99", 10) == (0, 9)
+    for ignored in ("bytes=0-1,4-5", "items=0-1", "bytes=x-y"):
+        assert parse(ignored, 10) is None
+    for unsatisfiable in ("bytes=10-", "bytes=5-3", "bytes=-0"):
+        with pytest.raises(ValueError):
+            parse(unsatisfiable, 10)
@@ -568,3 +568,149 @@ def test_nested_subagent_transcript_is_discovered(tmp_path: Path) -> None:
     assert rc == 0
     run_manifest = json.loads((output / "manifest.json").read_text(encoding="utf-8"))
     assert run_manifest["message_counts"]["parsed"] == 1
+
+
+def _toy_token_counter():
+    """A tiny offline BPE whose merges include a token spanning two CJK characters."""
+    tiktoken = pytest.importorskip("tiktoken")
+    ranks = {bytes([i]): i for i in range(256)}
+    for word in [" word", "word", "漢字", "😀漢", "漢".encode()[2:] + "字".encode()[:1]]:
+        word = word.encode() if isinstance(word, str) else word
+        for end in range(2, len(word) + 1):
+            ranks.setdefault(word[:end], len(ranks))
+    encoding = tiktoken.Encoding(
+        name="toy",
+        pat_str=r""" ?\p{L}+| ?\p{N}+| ?[^\s\p{L}\p{N}]+|\s+(?!\S)|\s+""",
+        mergeable_ranks=ranks,
+        special_tokens={},
+    )
+    return mine_conversation.TokenCounter(encoding)
+
+
+def test_token_offset_split_matches_prefix_search() -> None:
+    counter = _toy_token_counter()
+    plain = lambda text: counter(text)  # noqa: E731 - no encode(): takes the prefix search
+    text = ("word 漢字😀漢 字\n" * 300) + "😀" * 50 + " word" * 400
+    for split_counter in (counter, plain):
+        with pytest.raises(ValueError, match="too small to encode one character"):
+            mine_conversation._split_text_by_token_budget(text, 2, split_counter)
+    for budget in (4, 7, 64, 500):
+        parts = mine_conversation._split_text_by_token_budget(text, budget, counter)
+        assert parts == mine_conversation._split_text_by_token_budget(text, budget, plain)
+        assert "".join(parts) == text
+        assert all(counter(part) <= budget for part in parts)
+
+    chunks = mine_conversation._chunk_messages(
+        [{"role": "user", "timestamp": None, "text": text, "source": "s", "source_line": 1}],
+        64,
+        counter,
+    )
+    assert [chunk["tokens"] for chunk in chunks] == [counter(c["messages"][0]["text"]) for c in chunks]
+
+
+def _fixture_sources(tmp_path: Path) -> list[dict]:
+    transcripts = FIXTURES / "transcripts"
+    notes = tmp_path / "notes.txt"
+    notes.write_bytes("first note\r\n\r\nsecond note about examplehub\r\n".encode("utf-8"))
+    return [
+        {"type": "claude_project_session", "path": str(transcripts / "claude_session.jsonl")},
+        {"type": "claude_command_history", "path": str(transcripts / "history.jsonl")},
+        {"type": "manual_export", "path": str(transcripts / "codex_history.jsonl")},
+        {"type": "manual_export", "path": str(notes)},
+    ]
+
+
+def test_load_sources_fuses_hashing_with_a_direct_parse(tmp_path: Path) -> None:
+    sources = _fixture_sources(tmp_path)
+    loaded = mine_conversation._load_sources(sources, None, jobs=1)
+    for source, result in zip(sources, loaded):
+        path = Path(source["path"])
+        assert result["sha256"] == mine_conversation._hash_file(path)
+        assert result["size_bytes"] == path.stat().st_size
+        assert result["messages"] == list(mine_conversation._PARSERS[source["type"]](path))
+        assert result["cached"] is False
+    assert [m["text"] for m in loaded[3]["messages"]] == ["first note", "second note about examplehub"]
+    assert mine_conversation._load_sources(sources, None, jobs=2) == loaded
+
+
+def test_parse_cache_skips_unchanged_files_and_reparses_edits(tmp_path: Path, monkeypatch) -> None:
+    sources = _fixture_sources(tmp_path)
+    cache_dir = tmp_path / "parse-cache"
+    fresh = mine_conversation._load_sources(sources, cache_dir, jobs=2)
+
+    def _must_not_parse(*_args, **_kwargs):
+        raise AssertionError("an unchanged source was parsed again")
+
+    monkeypatch.setattr(
+        mine_conversation, "_PARSERS", {name: _must_not_parse for name in mine_conversation._PARSERS}
+    )
+    cached = mine_conversation._load_sources(sources, cache_dir, jobs=1)
+    assert [r["messages"] for r in cached] == [r["messages"] for r in fresh]
+    assert all(r["cached"] for r in cached)
+
+    # An edited file misses the cache and reaches the (disabled) parser.
+    Path(sources[3]["path"]).write_text("edited note\n", encoding="utf-8")
+    edited = mine_conversation._load_sources(sources[3:], cache_dir, jobs=1)
+    assert "error" in edited[0]
+
+
+def _overlap_corpus(tmp_path: Path) -> tuple[dict[str, Path], dict[str, Path]]:
+    import random
+
+    rng = random.Random(3)
+    vocab = [f"term{i}" for i in range(5000)]
+    existing: dict[str, Path] = {}
+    candidates: dict[str, Path] = {}
+    bases = [rng.sample(vocab, rng.randint(2, 600)) for _ in range(60)]
+    for index, words in enumerate(bases):
+        existing[f"ref-{index}"] = tmp_path / f"ref-{index}.md"
+        existing[f"ref-{index}"].write_text(" ".join(words), encoding="utf-8")
+    for index in range(40):
+        words = rng.choice(bases)
+        keep = rng.uniform(0.5, 1.0)
+        text = " ".join([w for w in words if rng.random() < keep] + rng.sample(vocab, rng.randint(0, 60)))
+        candidates[f"cand-{index}.md"] = tmp_path / f"cand-{index}.md"
+        candidates[f"cand-{index}.md"].write_text(text, encoding="utf-8")
+    (tmp_path / "empty.md").write_text("---\n", encoding="utf-8")
+    candidates["empty.md"] = tmp_path / "empty.md"
+    return existing, candidates
+
+
+def _exact_overlaps(existing: dict[str, Path], candidates: dict[str, Path], threshold: float) -> list[tuple]:
+    tokens = {p: check_references._tokenize(p.read_text(encoding="utf-8")) for p in [*existing.values(), *candidates.values()]}
+    pairs = []
+    for c_name, c_path in candidates.items():
+        for e_name, e_path in existing.items():
+            overlap = check_references._jaccard(tokens[c_path], tokens[e_path])
+            if overlap >= threshold:
+                pairs.append((c_name, e_name, round(overlap, 3)))
+    return pairs
+
+
+def test_lsh_overlaps_match_the_exact_pairwise_scan(tmp_path: Path) -> None:
+    existing, candidates = _overlap_corpus(tmp_path)
+    for threshold in (0.0, 0.4, 0.6, 0.8, 1.0):
+        issues = check_references.check_overlaps(existing, candidates, threshold=threshold)
+        found = [(i["candidate"], i["existing"], i["overlap"]) for i in issues]
+        assert found == _exact_overlaps(existing, candidates, threshold), threshold
+    assert any(i["severity"] == "blocking" for i in check_references.check_overlaps(existing, candidates))
+
+
+def test_signature_cache_skips_unchanged_files(tmp_path: Path, monkeypatch) -> None:
+    existing, candidates = _overlap_corpus(tmp_path)
+    cache_path = tmp_path / "cache" / "signatures.json"
+    first = check_references.SignatureCache(cache_path)
+    expected = check_references.check_overlaps(existing, candidates, signature_cache=first)
+    first.save()
+    assert first.computed == len(existing) + len(candidates)
+
+    second = check_references.SignatureCache(cache_path)
+    monkeypatch.setattr(check_references, "_minhash", lambda tokens: pytest.fail("signature recomputed"))
+    assert check_references.check_overlaps(existing, candidates, signature_cache=second) == expected
+    assert second.computed == 0
+
+    monkeypatch.undo()
+    candidates["cand-0.md"].write_text("entirely rewritten candidate text", encoding="utf-8")
+    third = check_references.SignatureCache(cache_path)
+    check_references.check_overlaps(existing, candidates, signature_cache=third)
+    assert third.computed == 1
@@ -0,0 +1,115 @@
+"""Tests for run_eval's scheduler: early stop, the trigger cache, and call accounting.
+
+A fake `claude` executable on PATH stands in for the real CLI, so the real
+subprocess/stream-parsing path runs without any API calls. It triggers the
+skill for queries containing "yes" and logs every invocation, which is what
+the call counts below are checked against.
+
+Run with:
+    uv run --with pytest python -m pytest tests/test_run_eval_scheduler.py -q
+"""
+
+import os
+import sys
+import textwrap
+
+import pytest
+
+from scripts.run_eval import TriggerCache, outcome_settled, run_eval
+
+EVAL_SET = [
+    {"query": "yes please use the skill", "should_trigger": True},
+    {"query": "no thanks, unrelated", "should_trigger": False},
+]
+
+FAKE_CLAUDE = textwrap.dedent(
+    """\
+    #!{python}
+    import json, os, pathlib, sys
+
+    query = sys.argv[sys.argv.index("-p") + 1]
+    with open(os.environ["FAKE_CLAUDE_LOG"], "a") as log:
+        log.write(query + "\\n")
+    names = [p.stem for p in pathlib.Path(".claude/commands").glob("*.md")]
+    content = []
+    if "yes" in query and names:
+        content = [{{"type": "tool_use", "name": "Skill", "input": {{"skill": names[0]}}}}]
+    print(json.dumps({{"type": "assistant", "message": {{"content": content}}}}))
+    print(json.dumps({{"type": "result"}}))
+    """
+)
+
+
+@pytest.fixture
+def fake_claude(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "claude"
+    script.write_text(FAKE_CLAUDE.format(python=sys.executable))
+    script.chmod(0o755)
+    log = tmp_path / "calls.log"
+    log.touch()
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_CLAUDE_LOG", str(log))
+    project = tmp_path / "project"
+    project.mkdir()
+    return project, lambda: log.read_text().splitlines()
+
+
+def _eval(project, description="handles yes queries", **kwargs):
+    kwargs.setdefault("runs_per_query", 3)
+    return run_eval(
+        eval_set=EVAL_SET, skill_name="demo", description=description,
+        num_workers=1, timeout=20, project_root=project, trigger_threshold=0.5,
+        **kwargs,
+    )
+
+
+def test_settled_queries_skip_their_remaining_runs(fake_claude):
+    project, calls = fake_claude
+    output = _eval(project)
+    assert [(r["triggers"], r["runs"], r["pass"]) for r in output["results"]] == [
+        (2, 2, True), (0, 2, True),
+    ]
+    assert len(calls()) == 4
+    stats = output["stats"]
+    assert (stats["runs_planned"], stats["calls"], stats["cached"]) == (6, 4, 0)
+    assert stats["skipped_settled"] == stats["calls_saved"] == 2
+    assert list((project / ".claude" / "commands").iterdir()) == []
+
+
+def test_early_stop_can_be_disabled(fake_claude):
+    project, calls = fake_claude
+    output = _eval(project, early_stop=False)
+    assert [r["runs"] for r in output["results"]] == [3, 3]
+    assert len(calls()) == 6
+
+
+def test_cache_reuses_runs_per_description_and_persists(fake_claude, tmp_path):
+    project, calls = fake_claude
+    path = tmp_path / "cache" / "runs.json"
+    cache = TriggerCache(path)
+    first = _eval(project, cache=cache)
+    again = _eval(project, cache=cache)
+    assert again["results"] == first["results"]
+    assert again["stats"]["calls"] == 0 and again["stats"]["cached"] == 4
+    assert len(calls()) == 4
+
+    _eval(project, description="a different description", cache=cache)
+    assert len(calls()) == 8
+
+    reloaded = _eval(project, cache=TriggerCache(path))
+    assert reloaded["stats"]["calls"] == 0
+    _eval(project, cache=TriggerCache(path), model="other-model")
+    assert len(calls()) == 12
+
+
+def test_outcome_settles_only_when_remaining_runs_cannot_flip_it():
+    # 3 runs at threshold 0.5: two hits pass for sure, two misses fail for sure.
+    assert outcome_settled(2, 2, 3, 0.5)
+    assert outcome_settled(0, 2, 3, 0.5)
+    assert not outcome_settled(1, 2, 3, 0.5)
+    assert not outcome_settled(1, 1, 3, 0.5)
+    assert not outcome_settled(0, 0, 3, 0.0)
+    for triggers in range(4):
+        assert outcome_settled(triggers, 3, 3, 0.5)
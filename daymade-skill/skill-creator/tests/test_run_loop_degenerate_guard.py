@@ -31,7 +31,8 @@ def _fake_run_eval(pos_triggers=0, neg_triggers=0, pos_errors=0, neg_errors=0):
     uniformly across all should_trigger=True queries and all should_trigger=False queries."""
 
     def _fake(eval_set, skill_name, description, num_workers, timeout,
-              project_root, runs_per_query=1, trigger_threshold=0.5, model=None):
+              project_root, runs_per_query=1, trigger_threshold=0.5, model=None,
+              cache=None, early_stop=True):
         results = []
         for item in eval_set:
             if item["should_trigger"]: